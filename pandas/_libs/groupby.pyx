@@ -118,6 +118,45 @@ def group_last_object(ndarray[object, ndim=2] out,
                 out[i, j] = resx[i, j]
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_masked_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[uint8_t, ndim=2] mask,
+                           ndarray[int64_t] labels,
+                           ndarray[int64_t, ndim=2] nobs):
+    """
+    Only aggregates on axis=0
+
+    Exact integer sums of the values where the mask is 0, the number of
+    values summed is written to nobs
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        for i in range(len(counts)):
+            for j in range(K):
+                out[i, j] = 0
+
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                if not mask[i, j]:
+                    nobs[lab, j] += 1
+                    out[lab, j] += values[i, j]
+
+
 cdef inline float64_t median_linear(float64_t* a, int n) nogil:
     cdef int i, j, na_count = 0
     cdef float64_t result
@@ -239,4 +239,23 @@ def ffill_indexer(ndarray[int64_t] indexer):
     return result
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+cdef inline int _compare_others(int64_t[:, :] lcodes, Py_ssize_t i,
+                                int64_t[:, :] rcodes, Py_ssize_t j) nogil:
+    """
+    Lexicographic comparison of the row ``i`` of the codes ``lcodes`` of the
+    other key columns with the row ``j`` of ``rcodes``: -1, 0 or 1.
+    """
+    cdef:
+        Py_ssize_t k
+
+    for k in range(lcodes.shape[1]):
+        if lcodes[i, k] < rcodes[j, k]:
+            return -1
+        elif lcodes[i, k] > rcodes[j, k]:
+            return 1
+    return 0
+
+
 include "join_helper.pxi"
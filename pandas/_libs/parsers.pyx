@@ -8,7 +8,7 @@ import warnings
 from csv import QUOTE_MINIMAL, QUOTE_NONNUMERIC, QUOTE_NONE
 
 from libc.stdlib cimport free
-from libc.string cimport strncpy, strlen, strcasecmp
+from libc.string cimport strncpy, strlen, strcasecmp, memcpy
 
 cimport cython
 from cython cimport Py_ssize_t
@@ -47,11 +47,14 @@ from khash cimport (
 import pandas.compat as compat
 from pandas.core.dtypes.common import (
     is_categorical_dtype,
+    is_extension_array_dtype,
     is_integer_dtype, is_float_dtype,
     is_bool_dtype, is_object_dtype,
     is_datetime64_dtype,
     pandas_dtype)
-from pandas.core.arrays import Categorical
+from pandas.core.dtypes.dtypes import StringDtype, IntegerDtype, BooleanDtype
+from pandas.core.arrays import (Categorical, StringArray, IntegerArray,
+                                BooleanArray)
 from pandas.core.dtypes.concat import union_categoricals
 import pandas.io.common as com
 
@@ -1099,7 +1102,8 @@ cdef class TextReader:
             if na_filter:
                 self._free_na_set(na_hashset)
 
-            if upcast_na and na_count > 0:
+            if upcast_na and na_count > 0 and \
+                    not is_extension_array_dtype(col_res):
                 col_res = _maybe_upcast(col_res)
 
             if col_res is None:
@@ -1178,7 +1182,32 @@ cdef class TextReader:
                              bint user_dtype,
                              kh_str_t *na_hashset,
                              object na_flist):
-        if is_integer_dtype(dtype):
+        if isinstance(dtype, IntegerDtype):
+            # the missing values go in a mask, the column stays integer
+            try:
+                result, mask, na_count = _try_int64_masked(
+                    self.parser, i, start, end, na_filter, na_hashset)
+            except OverflowError:
+                result = _try_uint64(self.parser, i, start, end,
+                                     na_filter, na_hashset)
+                mask = np.zeros(end - start, dtype=np.bool_)
+                na_count = 0
+            if result is None:
+                raise ValueError("Unable to parse column {column} as "
+                                 "{dtype}".format(column=i, dtype=dtype))
+            return IntegerArray(result, mask, dtype=dtype), na_count
+
+        elif isinstance(dtype, BooleanDtype):
+            result, na_count = _try_bool_flex(self.parser, i, start, end,
+                                              na_filter, na_hashset,
+                                              self.true_set, self.false_set)
+            if result is None:
+                raise ValueError("Unable to parse column {column} as "
+                                 "{dtype}".format(column=i, dtype=dtype))
+            mask = result.view(np.uint8) == na_values[np.bool_]
+            return BooleanArray(result, mask), na_count
+
+        elif is_integer_dtype(dtype):
             try:
                 result, na_count = _try_int64(self.parser, i, start,
                                               end, na_filter, na_hashset)
@@ -1209,6 +1238,15 @@ cdef class TextReader:
                                               na_filter, na_hashset,
                                               self.true_set, self.false_set)
             return result, na_count
+        elif isinstance(dtype, StringDtype):
+            if _string_path(self.c_encoding) == ENCODED:
+                result, na_count = self._string_convert(i, start, end,
+                                                        na_filter, na_hashset)
+                return StringArray(result), na_count
+
+            # copy the tokens into the buffers, without boxing them
+            return _string_array_convert(self.parser, i, start, end,
+                                         na_filter, na_hashset)
         elif dtype.kind == 'S':
             # TODO: na handling
             width = dtype.itemsize
@@ -1504,6 +1542,58 @@ cdef _string_box_utf8(parser_t *parser, int64_t col,
     return result, na_count
 
 
+cdef _string_array_convert(parser_t *parser, int64_t col,
+                           int64_t line_start, int64_t line_end,
+                           bint na_filter, kh_str_t *na_hashset):
+    "Convert column data into the offsets and data buffers of a StringArray"
+    cdef:
+        int na_count = 0
+        Py_ssize_t i, lines
+        int64_t size, total = 0
+        coliter_t it
+        const char *word = NULL
+        ndarray[int64_t] offsets
+        ndarray[uint8_t] data, mask
+
+        khiter_t k
+
+    lines = line_end - line_start
+    offsets = np.empty(lines + 1, dtype=np.int64)
+    mask = np.zeros(lines, dtype=np.uint8)
+
+    # first pass: the size of every string
+    offsets[0] = 0
+    coliter_setup(&it, parser, col, line_start)
+    for i in range(lines):
+        COLITER_NEXT(it, word)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count += 1
+                mask[i] = 1
+                offsets[i + 1] = total
+                continue
+
+        total += strlen(word)
+        offsets[i + 1] = total
+
+    # second pass: copy the bytes
+    data = np.empty(total, dtype=np.uint8)
+    coliter_setup(&it, parser, col, line_start)
+    for i in range(lines):
+        COLITER_NEXT(it, word)
+
+        size = offsets[i + 1] - offsets[i]
+        if size > 0:
+            memcpy(&data[offsets[i]], word, size)
+
+    result = StringArray._from_buffers(offsets, data,
+                                       mask.view(np.bool_))
+    return result, na_count
+
+
 cdef _string_box_decode(parser_t *parser, int64_t col,
                         int64_t line_start, int64_t line_end,
                         bint na_filter, kh_str_t *na_hashset,
@@ -1880,7 +1970,8 @@ cdef _try_int64(parser_t *parser, int64_t col,
     coliter_setup(&it, parser, col, line_start)
     with nogil:
         error = _try_int64_nogil(parser, col, line_start, line_end,
-                                 na_filter, na_hashset, NA, data, &na_count)
+                                 na_filter, na_hashset, NA, data, NULL,
+                                 &na_count)
     if error != 0:
         if error == ERROR_OVERFLOW:
             # Can't get the word variable
@@ -1890,11 +1981,46 @@ cdef _try_int64(parser_t *parser, int64_t col,
     return result, na_count
 
 
+cdef _try_int64_masked(parser_t *parser, int64_t col,
+                       int64_t line_start, int64_t line_end,
+                       bint na_filter, kh_str_t *na_hashset):
+    """
+    Parse an int64 column, returning the values, a boolean mask of the
+    missing values (set to 0 in the values) and the number of missing values
+    """
+    cdef:
+        int error, na_count = 0
+        Py_ssize_t lines
+        int64_t *data
+        uint8_t *mask_data
+        ndarray result, mask
+
+        int64_t NA = na_values[np.int64]
+
+    lines = line_end - line_start
+    result = np.empty(lines, dtype=np.int64)
+    mask = np.zeros(lines, dtype=np.uint8)
+    data = <int64_t *> result.data
+    mask_data = <uint8_t *> mask.data
+    with nogil:
+        error = _try_int64_nogil(parser, col, line_start, line_end,
+                                 na_filter, na_hashset, NA, data, mask_data,
+                                 &na_count)
+    if error != 0:
+        if error == ERROR_OVERFLOW:
+            # Can't get the word variable
+            raise OverflowError('Overflow')
+        return None, None, None
+
+    return result, mask.view(np.bool_), na_count
+
+
 cdef inline int _try_int64_nogil(parser_t *parser, int64_t col,
                                  int64_t line_start,
                                  int64_t line_end, bint na_filter,
                                  const kh_str_t *na_hashset, int64_t NA,
-                                 int64_t *data, int *na_count) nogil:
+                                 int64_t *data, uint8_t *mask,
+                                 int *na_count) nogil:
     cdef:
         int error
         Py_ssize_t i, lines = line_end - line_start
@@ -1912,7 +2038,11 @@ cdef inline int _try_int64_nogil(parser_t *parser, int64_t col,
             # in the hash table
             if k != na_hashset.n_buckets:
                 na_count[0] += 1
-                data[i] = NA
+                if mask != NULL:
+                    mask[i] = 1
+                    data[i] = 0
+                else:
+                    data[i] = NA
                 continue
 
             data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
@@ -2127,7 +2257,9 @@ def _concatenate_chunks(list chunks):
         arrs = [chunk.pop(name) for chunk in chunks]
         # Check each arr for consistent types.
         dtypes = {a.dtype for a in arrs}
-        numpy_dtypes = {x for x in dtypes if not is_categorical_dtype(x)}
+        numpy_dtypes = {x for x in dtypes
+                        if not is_categorical_dtype(x) and
+                        not is_extension_array_dtype(x)}
         if len(numpy_dtypes) > 1:
             common_type = np.find_common_type(numpy_dtypes, [])
             if common_type == np.object:
@@ -2138,6 +2270,8 @@ def _concatenate_chunks(list chunks):
             sort_categories = isinstance(dtype, str)
             result[name] = union_categoricals(arrs,
                                               sort_categories=sort_categories)
+        elif is_extension_array_dtype(dtype):
+            result[name] = type(arrs[0])._concat_same_type(arrs)
         else:
             result[name] = np.concatenate(arrs)
 
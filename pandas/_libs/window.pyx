@@ -19,8 +19,7 @@ cdef extern from "../src/headers/math.h":
 cimport util
 from util cimport numeric
 
-from skiplist cimport (IndexableSkiplist,
-                       node_t, skiplist_t,
+from skiplist cimport (node_t, skiplist_t,
                        skiplist_init, skiplist_destroy,
                        skiplist_get, skiplist_insert, skiplist_remove)
 
@@ -292,6 +291,202 @@ cdef class VariableWindowIndexer(WindowIndexer):
                     end[i] -= 1
 
 
+cdef class BoundsWindowIndexer(WindowIndexer):
+    """
+    create a window indexer object from the start & end bounds
+    of the windows computed by the caller, e.g. the windows of
+    each group of a groupby-rolling
+
+    Parameters
+    ----------
+    input: ndarray
+        input data array
+    win: int64_t
+        window size
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    start: ndarray
+        start of the window of each element (including)
+    end: ndarray
+        end of the window of each element (not including)
+    floor: optional
+        unit for flooring the unit
+    """
+    def __init__(self, ndarray input, int64_t win, int64_t minp,
+                 ndarray start, ndarray end, object floor=None):
+
+        self.is_variable = 1
+        self.N = len(input)
+        self.minp = _check_minp(win, minp, self.N, floor=floor)
+        self.start = start
+        self.end = end
+
+        # max window size
+        self.win = (end - start).max() if self.N else 0
+
+
+def get_grouped_window_bounds(ndarray[int64_t] group_start,
+                              ndarray[int64_t] group_end, int64_t win,
+                              object index, object closed):
+    """
+    return the start & end bounds of the windows of data sorted
+    by group, a window only covers the rows of its own group
+
+    Parameters
+    ----------
+    group_start: 1d int64 ndarray
+        first row of each group
+    group_end: 1d int64 ndarray
+        end of the rows of each group (not including)
+    win: integer, number of rows of a window, or the window size in
+        units of index if index is not None
+    index: 1d int64 ndarray, optional
+        index to the data, monotonic within each group
+    closed: string, default None
+        {'right', 'left', 'both', 'neither'}, only used with an index,
+        defaults to 'right'
+
+    Returns
+    -------
+    tuple of 1d int64 ndarrays of the start & end of the windows, to be
+    passed as the index of the rolling functions
+    """
+
+    cdef:
+        ndarray[int64_t] start, end, idx
+        int64_t gs, ge, start_bound, end_bound, N
+        Py_ssize_t i, j, k, ngroups
+        bint left_closed = False
+        bint right_closed = False
+        bint is_variable = index is not None
+
+    N = group_end.max() if len(group_end) else 0
+    ngroups = len(group_start)
+    start = np.zeros(N, dtype='int64')
+    end = np.zeros(N, dtype='int64')
+
+    if is_variable:
+        idx = index
+        if closed is None:
+            closed = 'right'
+        left_closed = closed in ['left', 'both']
+        right_closed = closed in ['right', 'both']
+    else:
+        idx = np.empty(0, dtype='int64')
+
+    with nogil:
+
+        for k in range(ngroups):
+            gs = group_start[k]
+            ge = group_end[k]
+
+            if not is_variable:
+                for i in range(gs, ge):
+                    start[i] = i - win + 1 if i - win + 1 > gs else gs
+                    end[i] = i + 1
+                continue
+
+            if gs == ge:
+                continue
+
+            # as VariableWindowIndexer.build, restarting at each group
+            start[gs] = gs
+            if right_closed:
+                end[gs] = gs + 1
+            else:
+                end[gs] = gs
+
+            for i in range(gs + 1, ge):
+                end_bound = idx[i]
+                start_bound = idx[i] - win
+
+                # left endpoint is closed
+                if left_closed:
+                    start_bound -= 1
+
+                # advance the start bound until we are
+                # within the constraint
+                start[i] = i
+                for j in range(start[i - 1], i):
+                    if idx[j] > start_bound:
+                        start[i] = j
+                        break
+
+                # end bound is previous end
+                # or current index
+                if idx[end[i - 1]] <= end_bound:
+                    end[i] = i + 1
+                else:
+                    end[i] = end[i - 1]
+
+                # right endpoint is open
+                if not right_closed:
+                    end[i] -= 1
+
+    return start, end
+
+
+def get_centered_window_bounds(ndarray[int64_t] index, int64_t win,
+                               object closed):
+    """
+    return the start & end bounds of the windows of size win centered
+    on each value of a monotonic index, from index - win / 2 to
+    index + win / 2
+
+    Parameters
+    ----------
+    index: 1d int64 ndarray
+        monotonic index to the data
+    win: window size in units of index
+    closed: string, default None
+        {'right', 'left', 'both', 'neither'}, defaults to 'right'
+
+    Returns
+    -------
+    tuple of 1d int64 ndarrays of the start & end of the windows, to be
+    passed as the index of the rolling functions
+    """
+
+    cdef:
+        ndarray[int64_t] start, end
+        int64_t s = 0, e = 0, N = len(index)
+        Py_ssize_t i
+        bint left_closed = False
+        bint right_closed = False
+
+    if closed is None:
+        closed = 'right'
+    left_closed = closed in ['left', 'both']
+    right_closed = closed in ['right', 'both']
+
+    start = np.empty(N, dtype='int64')
+    end = np.empty(N, dtype='int64')
+
+    # compare twice the distances to the center of the window, so that
+    # odd window sizes stay integers
+    with nogil:
+        for i in range(N):
+
+            # advance the start while before the left endpoint
+            while s < N and (2 * (index[i] - index[s]) > win or
+                             (not left_closed and
+                              2 * (index[i] - index[s]) == win)):
+                s += 1
+
+            # advance the end while within the right endpoint
+            if e < s:
+                e = s
+            while e < N and (2 * (index[e] - index[i]) < win or
+                             (right_closed and
+                              2 * (index[e] - index[i]) == win)):
+                e += 1
+
+            start[i] = s
+            end[i] = e
+
+    return start, end
+
+
 def get_window_indexer(input, win, minp, index, closed,
                        floor=None, use_mock=True):
     """
@@ -302,8 +497,9 @@ def get_window_indexer(input, win, minp, index, closed,
     input: 1d ndarray
     win: integer, window size
     minp: integer, minimum periods
-    index: 1d ndarray, optional
-        index to the input array
+    index: 1d ndarray or tuple, optional
+        index to the input array, or a tuple of the start & end
+        bounds of the windows, see get_grouped_window_bounds
     closed: string, default None
         {'right', 'left', 'both', 'neither'}
         window endpoint closedness. Defaults to 'right' in
@@ -339,7 +535,10 @@ def get_window_indexer(input, win, minp, index, closed,
     if closed in ['left', 'both']:
         left_closed = True
 
-    if index is not None:
+    if isinstance(index, tuple):
+        indexer = BoundsWindowIndexer(input, win, minp, index[0], index[1],
+                                      floor)
+    elif index is not None:
         indexer = VariableWindowIndexer(input, win, minp, left_closed,
                                         right_closed, index, floor)
     elif use_mock:
@@ -465,7 +664,9 @@ def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
                 s = start[i]
                 e = end[i]
 
-                if i == 0:
+                # the first window, or a window not overlapping the
+                # previous one, e.g. the first window of a group
+                if i == 0 or s >= end[i - 1]:
 
                     # setup
                     sum_x = 0.0
@@ -582,11 +783,14 @@ def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
                 s = start[i]
                 e = end[i]
 
-                if i == 0:
+                # the first window, or a window not overlapping the
+                # previous one, e.g. the first window of a group
+                if i == 0 or s >= end[i - 1]:
 
                     # setup
                     sum_x = 0.0
                     nobs = 0
+                    neg_ct = 0
                     for j in range(s, e):
                         val = input[j]
                         add_mean(val, &nobs, &sum_x, &neg_ct)
@@ -719,9 +923,11 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed, as over a window not overlapping the
+                # previous one, e.g. the first window of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    mean_x = ssqdm_x = nobs = 0
                     for j in range(s, e):
                         add_var(input[j], &nobs, &mean_x, &ssqdm_x)
 
@@ -781,6 +987,164 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
     return output
 
 
+# ----------------------------------------------------------------------
+# Rolling covariance & correlation matrices
+
+
+cdef inline void add_cov(double x, double y, double *nobs, double *mean_x,
+                         double *mean_y, double *comoment, double *ssqdm_x,
+                         double *ssqdm_y) nogil:
+    """ add a pair of values to the cov calc """
+    cdef double dx, dy
+
+    nobs[0] = nobs[0] + 1
+
+    # Welford's method for the online co-moment calculation
+    dx = x - mean_x[0]
+    dy = y - mean_y[0]
+    mean_x[0] = mean_x[0] + dx / nobs[0]
+    mean_y[0] = mean_y[0] + dy / nobs[0]
+    comoment[0] = comoment[0] + dx * (y - mean_y[0])
+    ssqdm_x[0] = ssqdm_x[0] + dx * (x - mean_x[0])
+    ssqdm_y[0] = ssqdm_y[0] + dy * (y - mean_y[0])
+
+
+cdef inline void remove_cov(double x, double y, double *nobs, double *mean_x,
+                            double *mean_y, double *comoment,
+                            double *ssqdm_x, double *ssqdm_y) nogil:
+    """ remove a pair of values from the cov calc """
+    cdef double dx, dy
+
+    nobs[0] = nobs[0] - 1
+    if nobs[0]:
+        dx = x - mean_x[0]
+        dy = y - mean_y[0]
+        mean_x[0] = mean_x[0] - dx / nobs[0]
+        mean_y[0] = mean_y[0] - dy / nobs[0]
+        comoment[0] = comoment[0] - dx * (y - mean_y[0])
+        ssqdm_x[0] = ssqdm_x[0] - dx * (x - mean_x[0])
+        ssqdm_y[0] = ssqdm_y[0] - dy * (y - mean_y[0])
+    else:
+        mean_x[0] = mean_y[0] = comoment[0] = ssqdm_x[0] = ssqdm_y[0] = 0
+
+
+cdef inline double calc_cov(int64_t minp, int ddof, bint corr, double nobs,
+                            double comoment, double ssqdm_x,
+                            double ssqdm_y) nogil:
+    cdef double denom
+
+    if nobs >= minp and nobs > ddof:
+        if not corr:
+            return comoment / (nobs - <double>ddof)
+        denom = ssqdm_x * ssqdm_y
+        if denom > 0:
+            return comoment / sqrt(denom)
+    return NaN
+
+
+def roll_cov_matrix(ndarray[double_t, ndim=2] input_x,
+                    ndarray[double_t, ndim=2] input_y,
+                    int64_t win, int64_t minp, object index, object closed,
+                    int ddof=1, bint corr=False):
+    """
+    Moving covariance, or correlation, of every column of input_x with every
+    column of input_y, over the complete pairs of observations of each
+    window, in a single pass updating all of the co-moments as the window
+    slides.
+
+    If input_x is input_y, only half of the symmetric matrix is computed.
+
+    Returns
+    -------
+    3d ndarray of shape (N, number of columns of input_x,
+    number of columns of input_y)
+    """
+    cdef:
+        double x, y
+        int64_t s, e
+        bint is_variable, symmetric
+        Py_ssize_t i, j, p, q, q0, first, N, K, L
+        ndarray[int64_t] start, end
+        float64_t[:, ::1] nobs, mean_x, mean_y, comoment, ssqdm_x, ssqdm_y
+        ndarray[double_t, ndim=3] output
+
+    symmetric = input_x is input_y
+    start, end, N, win, minp, is_variable = get_window_indexer(
+        input_x, win, minp, index, closed, use_mock=False)
+    if not is_variable:
+        # a fixed window longer than the input has more bounds than rows
+        start, end = start[:N], end[:N]
+
+    K = input_x.shape[1]
+    L = input_y.shape[1]
+    output = np.empty((N, K, L), dtype=float)
+    nobs = np.zeros((K, L), dtype=float)
+    mean_x = np.zeros((K, L), dtype=float)
+    mean_y = np.zeros((K, L), dtype=float)
+    comoment = np.zeros((K, L), dtype=float)
+    ssqdm_x = np.zeros((K, L), dtype=float)
+    ssqdm_y = np.zeros((K, L), dtype=float)
+
+    with nogil:
+
+        for i in range(0, N):
+
+            s = start[i]
+            e = end[i]
+
+            # Over the first window, or a window not overlapping the
+            # previous one, observations can only be added
+            if i == 0 or s >= end[i - 1]:
+
+                for p in range(K):
+                    for q in range(L):
+                        nobs[p, q] = mean_x[p, q] = mean_y[p, q] = 0
+                        comoment[p, q] = ssqdm_x[p, q] = ssqdm_y[p, q] = 0
+                first = s
+
+            else:
+
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    for p in range(K):
+                        x = input_x[j, p]
+                        if x != x:
+                            continue
+                        q0 = p if symmetric else 0
+                        for q in range(q0, L):
+                            y = input_y[j, q]
+                            if y == y:
+                                remove_cov(x, y, &nobs[p, q], &mean_x[p, q],
+                                           &mean_y[p, q], &comoment[p, q],
+                                           &ssqdm_x[p, q], &ssqdm_y[p, q])
+                first = end[i - 1]
+
+            # calculate adds
+            for j in range(first, e):
+                for p in range(K):
+                    x = input_x[j, p]
+                    if x != x:
+                        continue
+                    q0 = p if symmetric else 0
+                    for q in range(q0, L):
+                        y = input_y[j, q]
+                        if y == y:
+                            add_cov(x, y, &nobs[p, q], &mean_x[p, q],
+                                    &mean_y[p, q], &comoment[p, q],
+                                    &ssqdm_x[p, q], &ssqdm_y[p, q])
+
+            for p in range(K):
+                q0 = p if symmetric else 0
+                for q in range(q0, L):
+                    output[i, p, q] = calc_cov(minp, ddof, corr, nobs[p, q],
+                                               comoment[p, q],
+                                               ssqdm_x[p, q], ssqdm_y[p, q])
+                    if symmetric:
+                        output[i, q, p] = output[i, p, q]
+
+    return output
+
+
 # ----------------------------------------------------------------------
 # Rolling skewness
 
@@ -868,9 +1232,12 @@ def roll_skew(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed, as over a window not overlapping the
+                # previous one, e.g. the first window of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    x = xx = xxx = 0
+                    nobs = 0
                     for j in range(s, e):
                         val = input[j]
                         add_skew(val, &nobs, &x, &xx, &xxx)
@@ -1005,9 +1372,12 @@ def roll_kurt(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed, as over a window not overlapping the
+                # previous one, e.g. the first window of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    x = xx = xxx = xxxx = 0
+                    nobs = 0
                     for j in range(s, e):
                         add_kurt(input[j], &nobs, &x, &xx, &xxx, &xxxx)
 
@@ -1080,15 +1450,24 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
             s = start[i]
             e = end[i]
 
-            if i == 0:
+            if i == 0 or s >= end[i - 1]:
 
-                # setup
-                val = input[i]
-                if val == val:
-                    nobs += 1
-                    err = skiplist_insert(sl, val) != 1
-                    if err:
-                        break
+                # setup, the first window or a window not overlapping the
+                # previous one, e.g. the first window of a group
+                if i != 0:
+                    for j in range(start[i - 1], end[i - 1]):
+                        val = input[j]
+                        if val == val:
+                            skiplist_remove(sl, val)
+                            nobs -= 1
+
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
             else:
 
@@ -1108,6 +1487,9 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
                         if err:
                             break
 
+            if err:
+                break
+
             if nobs >= minp:
                 midpoint = <int>(nobs / 2)
                 if nobs % 2:
@@ -1222,9 +1604,9 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
     cdef:
         numeric ai
         bint is_variable, should_replace
-        int64_t s, e, N, i, j, removed
+        int64_t s, e, N, i, j, removed, head, tail
         Py_ssize_t nobs = 0
-        ndarray[int64_t] starti, endi
+        ndarray[int64_t] starti, endi, deque
         ndarray[numeric, ndim=1] output
     cdef:
         int64_t* death
@@ -1244,27 +1626,65 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
 
     if is_variable:
 
+        # monotonic deque, deque[head:tail], of the positions of the
+        # candidates for the extremum of the window, the extremum being at
+        # the head; the starts & ends of the windows never decrease so
+        # each position is pushed and popped at most once
+        deque = np.empty(N, dtype='int64')
+        head = tail = 0
+
         with nogil:
 
             for i in range(N):
                 s = starti[i]
                 e = endi[i]
 
-                r = input[s]
-                nobs = 0
-                for j in range(s, e):
+                if i == 0 or s >= endi[i - 1]:
 
-                    # adds, death at the i offset
-                    ai = init_mm(input[j], &nobs, is_max)
+                    # setup, the first window or a window not overlapping
+                    # the previous one, e.g. the first window of a group
+                    head = tail = 0
+                    nobs = 0
+                    j = s
 
-                    if is_max:
-                        if ai > r:
-                            r = ai
-                    else:
-                        if ai < r:
-                            r = ai
+                else:
+
+                    # calculate deletes
+                    for j in range(starti[i - 1], s):
+                        remove_mm(input[j], &nobs)
+                    j = endi[i - 1]
+
+                # calculate adds
+                while j < e:
+                    ai = input[j]
+                    if numeric in cython.floating and ai != ai:
+                        j += 1
+                        continue
+                    nobs += 1
 
-                output[i] = calc_mm(minp, nobs, r)
+                    # pop the candidates dominated by the new value
+                    while tail > head:
+                        if is_max:
+                            should_replace = input[deque[tail - 1]] <= ai
+                        else:
+                            should_replace = input[deque[tail - 1]] >= ai
+                        if not should_replace:
+                            break
+                        tail -= 1
+                    deque[tail] = j
+                    tail += 1
+                    j += 1
+
+                # pop the candidates which left the window
+                while head < tail and deque[head] < s:
+                    head += 1
+
+                if head < tail:
+                    output[i] = calc_mm(minp, nobs, input[deque[head]])
+                elif numeric in cython.floating:
+                    output[i] = NaN
+                else:
+                    output[i] = 0
 
     else:
 
@@ -1343,17 +1763,17 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
                   int64_t minp, object index, object closed,
                   double quantile):
     """
-    O(N log(window)) implementation using skip list
+    O(N log(window)) implementation using skip list, without the GIL
     """
     cdef:
-        double val, prev, midpoint
-        IndexableSkiplist skiplist
+        double val, vlow, vhigh
+        bint err = 0, is_variable
+        int ret = 0
+        skiplist_t *sl
         int64_t nobs = 0, i, j, s, e, N
-        Py_ssize_t idx
-        bint is_variable
+        int idx
         ndarray[int64_t] start, end
         ndarray[double_t] output
-        double vlow, vhigh
 
     if quantile <= 0.0 or quantile >= 1.0:
         raise ValueError("quantile value {0} not in [0, 1]".format(quantile))
@@ -1365,52 +1785,76 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
         minp, index, closed,
         use_mock=False)
     output = np.empty(N, dtype=float)
-    skiplist = IndexableSkiplist(win)
 
-    for i in range(0, N):
-        s = start[i]
-        e = end[i]
+    sl = skiplist_init(<int>win)
+    if sl == NULL:
+        raise MemoryError("skiplist_init failed")
 
-        if i == 0:
+    with nogil:
 
-            # setup
-            val = input[i]
-            if val == val:
-                nobs += 1
-                skiplist.insert(val)
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-        else:
+            if i == 0 or s >= end[i - 1]:
 
-            # calculate deletes
-            for j in range(start[i - 1], s):
-                val = input[j]
-                if val == val:
-                    skiplist.remove(val)
-                    nobs -= 1
+                # setup, the first window or a window not overlapping the
+                # previous one, e.g. the first window of a group
+                if i != 0:
+                    for j in range(start[i - 1], end[i - 1]):
+                        val = input[j]
+                        if val == val:
+                            skiplist_remove(sl, val)
+                            nobs -= 1
 
-            # calculate adds
-            for j in range(end[i - 1], e):
-                val = input[j]
-                if val == val:
-                    nobs += 1
-                    skiplist.insert(val)
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
-        if nobs >= minp:
-            idx = int(quantile * <double>(nobs - 1))
+            else:
 
-            # Single value in skip list
-            if nobs == 1:
-                output[i] = skiplist.get(0)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = input[j]
+                    if val == val:
+                        skiplist_remove(sl, val)
+                        nobs -= 1
 
-            # Interpolated quantile
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
+
+            if err:
+                break
+
+            if nobs >= minp:
+                idx = <int>(quantile * <double>(nobs - 1))
+
+                # Single value in skip list
+                if nobs == 1:
+                    output[i] = skiplist_get(sl, 0, &ret)
+
+                # Interpolated quantile
+                else:
+                    vlow = skiplist_get(sl, idx, &ret)
+                    vhigh = skiplist_get(sl, idx + 1, &ret)
+                    output[i] = ((vlow + (vhigh - vlow) *
+                                 (quantile * (nobs - 1) - idx)))
             else:
-                vlow = skiplist.get(idx)
-                vhigh = skiplist.get(idx + 1)
-                output[i] = ((vlow + (vhigh - vlow) *
-                             (quantile * (nobs - 1) - idx)))
-        else:
-            output[i] = NaN
+                output[i] = NaN
 
+    skiplist_destroy(sl)
+    if err:
+        raise MemoryError("skiplist_insert failed")
     return output
 
 
@@ -1557,12 +2001,90 @@ def roll_window(ndarray[float64_t, ndim=1, cast=True] input,
 
     return output
 
+
+def roll_window_2d(ndarray[float64_t, ndim=2, cast=True] input,
+                   ndarray[float64_t, ndim=1, cast=True] weights,
+                   int minp, bint avg=True):
+    """
+    roll_window of all the columns of input at once, the windows running
+    along axis 0; the rows are processed in blocks so that the output
+    block stays in cache while the weights are applied
+
+    Assume len(weights) << len(input)
+    """
+    cdef:
+        ndarray[double_t, ndim=2] output, tot_wgt, counts
+        Py_ssize_t in_n, ncols, win_n, win_i, lag, out_i, k
+        Py_ssize_t block, block_start, block_end
+        float64_t val_in, val_win, w
+
+    in_n = input.shape[0]
+    ncols = input.shape[1]
+    win_n = len(weights)
+    output = np.zeros((in_n, ncols), dtype=float)
+    counts = np.zeros((in_n, ncols), dtype=float)
+    if avg:
+        tot_wgt = np.zeros((in_n, ncols), dtype=float)
+    else:
+        tot_wgt = np.zeros((0, ncols), dtype=float)
+
+    minp = _check_minp(win_n, minp, in_n)
+
+    # about 32KB of each of output, counts and tot_wgt per block
+    block = max(4096 // max(ncols, 1), 1)
+
+    with nogil:
+
+        for block_start in range(0, in_n, block):
+            block_end = block_start + block
+            if block_end > in_n:
+                block_end = in_n
+
+            for win_i in range(win_n):
+                val_win = weights[win_i]
+                if val_win != val_win:
+                    continue
+
+                # the output at out_i weighs the input at out_i - lag
+                lag = win_n - win_i - 1
+                out_i = block_start if block_start > lag else lag
+                while out_i < block_end:
+                    for k in range(ncols):
+                        val_in = input[out_i - lag, k]
+                        if val_in == val_in:
+                            output[out_i, k] += val_in * val_win
+                            counts[out_i, k] += 1
+                            if avg:
+                                tot_wgt[out_i, k] += val_win
+                    out_i += 1
+
+            for out_i in range(block_start, block_end):
+                for k in range(ncols):
+                    if counts[out_i, k] < minp:
+                        output[out_i, k] = NaN
+                    elif avg:
+                        w = tot_wgt[out_i, k]
+                        if w == 0:
+                            output[out_i, k] = NaN
+                        else:
+                            output[out_i, k] /= w
+
+    return output
+
 # ----------------------------------------------------------------------
 # Exponentially weighted moving average
 
 
+def ewma_state():
+    """
+    The state of ewma before the first value: the weighted average, the
+    weight of the previous observations and the number of observations.
+    """
+    return np.array([NaN, 1., 0.])
+
+
 def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
-         int minp):
+         int minp, ndarray[double_t] state=None):
     """
     Compute exponentially-weighted moving average using center-of-mass.
 
@@ -1573,6 +2095,9 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
     adjust: int
     ignore_na: int
     minp: int
+    state: ndarray (float64 type), optional
+        the state after the values preceding input, as from ewma_state,
+        updated in place to resume from the end of input
 
     Returns
     -------
@@ -1593,13 +2118,13 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    weighted_avg = input[0]
-    is_observation = (weighted_avg == weighted_avg)
-    nobs = int(is_observation)
-    output[0] = weighted_avg if (nobs >= minp) else NaN
-    old_wt = 1.
+    if state is None:
+        state = ewma_state()
+    weighted_avg = state[0]
+    old_wt = state[1]
+    nobs = <Py_ssize_t>state[2]
 
-    for i from 1 <= i < N:
+    for i from 0 <= i < N:
         cur = input[i]
         is_observation = (cur == cur)
         nobs += int(is_observation)
@@ -1623,14 +2148,28 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 
         output[i] = weighted_avg if (nobs >= minp) else NaN
 
+    state[0] = weighted_avg
+    state[1] = old_wt
+    state[2] = nobs
     return output
 
 # ----------------------------------------------------------------------
 # Exponentially weighted moving covariance
 
 
+def ewmcov_state():
+    """
+    The state of ewmcov before the first values: the weighted means of x
+    and y, the covariance, the sums of the weights and of their squares,
+    the weight of the previous observations and the number of
+    observations.
+    """
+    return np.array([NaN, NaN, 0., 1., 1., 1., 0.])
+
+
 def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
-           double_t com, int adjust, int ignore_na, int minp, int bias):
+           double_t com, int adjust, int ignore_na, int minp, int bias,
+           ndarray[double_t] state=None):
     """
     Compute exponentially-weighted moving variance using center-of-mass.
 
@@ -1643,6 +2182,9 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
     ignore_na: int
     minp: int
     bias: int
+    state: ndarray (float64 type), optional
+        the state after the values preceding input_x and input_y, as from
+        ewmcov_state, updated in place to resume from their end
 
     Returns
     -------
@@ -1667,20 +2209,17 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    mean_x = input_x[0]
-    mean_y = input_y[0]
-    is_observation = ((mean_x == mean_x) and (mean_y == mean_y))
-    nobs = int(is_observation)
-    if not is_observation:
-        mean_x = NaN
-        mean_y = NaN
-    output[0] = (0. if bias else NaN) if (nobs >= minp) else NaN
-    cov = 0.
-    sum_wt = 1.
-    sum_wt2 = 1.
-    old_wt = 1.
-
-    for i from 1 <= i < N:
+    if state is None:
+        state = ewmcov_state()
+    mean_x = state[0]
+    mean_y = state[1]
+    cov = state[2]
+    sum_wt = state[3]
+    sum_wt2 = state[4]
+    old_wt = state[5]
+    nobs = <Py_ssize_t>state[6]
+
+    for i from 0 <= i < N:
         cur_x = input_x[i]
         cur_y = input_y[i]
         is_observation = ((cur_x == cur_x) and (cur_y == cur_y))
@@ -1731,4 +2270,11 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
         else:
             output[i] = NaN
 
+    state[0] = mean_x
+    state[1] = mean_y
+    state[2] = cov
+    state[3] = sum_wt
+    state[4] = sum_wt2
+    state[5] = old_wt
+    state[6] = nobs
     return output
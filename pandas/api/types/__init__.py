@@ -4,6 +4,12 @@ from pandas.core.dtypes.api import *  # noqa
 from pandas.core.dtypes.dtypes import (CategoricalDtype,  # noqa
                                        DatetimeTZDtype,
                                        PeriodDtype,
-                                       IntervalDtype)
+                                       IntervalDtype,
+                                       StringDtype,
+                                       Int8Dtype, Int16Dtype,
+                                       Int32Dtype, Int64Dtype,
+                                       UInt8Dtype, UInt16Dtype,
+                                       UInt32Dtype, UInt64Dtype,
+                                       BooleanDtype)
 from pandas.core.dtypes.concat import union_categoricals  # noqa
 from pandas._libs.lib import infer_dtype  # noqa
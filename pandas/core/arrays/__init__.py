@@ -1,2 +1,4 @@
 from .base import ExtensionArray  # noqa
 from .categorical import Categorical  # noqa
+from .string_ import StringArray  # noqa
+from .masked import IntegerArray, BooleanArray  # noqa
@@ -0,0 +1,373 @@
+"""Arrays of numpy values paired with a mask of the missing values."""
+import numpy as np
+
+from pandas._libs import lib
+from pandas.compat import range
+from pandas.core.arrays.base import ExtensionArray
+from pandas.core.dtypes.common import (
+    is_bool_dtype, is_float_dtype, is_integer, is_integer_dtype,
+    is_object_dtype, is_list_like, is_scalar, pandas_dtype)
+from pandas.core.dtypes.dtypes import IntegerDtype, BooleanDtype
+from pandas.core.dtypes.missing import isna
+from pandas.errors import AbstractMethodError
+import pandas.core.ops as ops
+
+# the reductions that nanops can compute on the values with a mask
+_masked_reductions = frozenset(['sum', 'prod', 'mean', 'median', 'var',
+                                'std', 'min', 'max', 'any', 'all'])
+
+
+class _MaskedArray(ExtensionArray):
+    """
+    Base class for IntegerArray and BooleanArray: a numpy array of values
+    and a boolean mask that is True for the missing values. The values under
+    the mask are arbitrary.
+    """
+    # take precedence over numpy arrays in binary operations
+    __array_priority__ = 1000
+
+    def __init__(self, values, mask=None, dtype=None, copy=False):
+        if isinstance(values, _MaskedArray):
+            if mask is None:
+                mask = values._mask
+            values = values._data
+        elif isinstance(values, list) and not values:
+            values = np.array([], dtype=np.int64)
+
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError("{name} must be 1-dimensional".format(
+                name=type(self).__name__))
+        if mask is None:
+            if is_float_dtype(values) or is_object_dtype(values):
+                mask = np.asarray(isna(values), dtype=bool)
+            else:
+                mask = np.zeros(len(values), dtype=bool)
+        else:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != values.shape:
+                raise ValueError("values and mask must have the same length")
+
+        data = self._coerce_values(values, mask, dtype)
+        if copy:
+            data = data.copy()
+            mask = mask.copy()
+        self._data = data
+        self._mask = mask
+
+    @classmethod
+    def _simple_new(cls, data, mask):
+        """ Construct from validated values and mask without copying """
+        result = cls.__new__(cls)
+        result._data = data
+        result._mask = mask
+        return result
+
+    @classmethod
+    def _coerce_values(cls, values, mask, dtype):
+        """ Return the values as an ndarray of the dtype of the array """
+        raise AbstractMethodError(cls)
+
+    @staticmethod
+    def _valid_values(values, mask):
+        """ The unmasked values, with objects converted to a numpy dtype """
+        valid = values[~mask]
+        if is_object_dtype(valid):
+            valid = lib.maybe_convert_objects(valid)
+        return valid
+
+    # ------------------------------------------------------------------------
+    # ExtensionArray interface
+    # ------------------------------------------------------------------------
+    def __getitem__(self, item):
+        if is_integer(item):
+            if self._mask[item]:
+                return self._fill_value
+            return self._data[item]
+
+        if isinstance(item, BooleanArray):
+            # missing values do not select
+            item = item._data & ~item._mask
+        return self._simple_new(self._data[item], self._mask[item])
+
+    def __setitem__(self, key, value):
+        if is_scalar(value):
+            if isna(value):
+                self._mask[key] = True
+                return
+            value = [value]
+        value = type(self)(value, dtype=self.dtype)
+        self._data[key] = value._data
+        self._mask[key] = value._mask
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype=None):
+        if self._mask.any():
+            result = self._data.astype(object)
+            result[self._mask] = self._fill_value
+        else:
+            result = self._data
+        if dtype is not None:
+            result = result.astype(dtype)
+        return result
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._mask.nbytes
+
+    def isna(self):
+        return self._mask.copy()
+
+    def take(self, indexer, allow_fill=True, fill_value=None):
+        n = len(self)
+        indexer = np.asarray(indexer, dtype=np.int64)
+        if allow_fill:
+            fill = indexer == -1
+        else:
+            fill = np.zeros(len(indexer), dtype=bool)
+            indexer = np.where(indexer < 0, indexer + n, indexer)
+        if ((indexer < -1) | (indexer >= n) | ((indexer == -1) & ~fill)).any():
+            raise IndexError("index out of bounds for {name} of length "
+                             "{n}".format(name=type(self).__name__, n=n))
+
+        if n:
+            indexer = np.where(fill, 0, indexer)
+            data = self._data.take(indexer)
+            mask = self._mask.take(indexer) | fill
+        else:
+            data = np.zeros(len(indexer), dtype=self._data.dtype)
+            mask = fill
+        result = self._simple_new(data, mask)
+
+        if fill_value is not None and not isna(fill_value) and fill.any():
+            result[fill] = fill_value
+        return result
+
+    def copy(self, deep=False):
+        # the values can be set in place, so never share them
+        return self._simple_new(self._data.copy(), self._mask.copy())
+
+    @property
+    def _fill_value(self):
+        return np.nan
+
+    def _formatting_values(self):
+        return np.asarray(self)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        data = np.concatenate([array._data for array in to_concat])
+        mask = np.concatenate([array._mask for array in to_concat])
+        return cls._simple_new(data, mask)
+
+    # ------------------------------------------------------------------------
+    # Conversion and reductions
+    # ------------------------------------------------------------------------
+    def astype(self, dtype, copy=True):
+        """
+        Cast to an IntegerDtype, BooleanDtype or numpy dtype. Missing values
+        become NaN when casting to a float or object dtype, and raise for
+        the other numpy dtypes.
+        """
+        dtype = pandas_dtype(dtype)
+        if isinstance(dtype, IntegerDtype):
+            return IntegerArray(self, dtype=dtype, copy=copy)
+        elif isinstance(dtype, BooleanDtype):
+            return BooleanArray(self, copy=copy)
+        elif is_float_dtype(dtype):
+            result = self._data.astype(dtype)
+            result[self._mask] = np.nan
+            return result
+        elif self._mask.any() and not is_object_dtype(dtype):
+            raise ValueError("cannot convert {name} with missing values to "
+                             "{dtype}".format(name=type(self).__name__,
+                                              dtype=dtype))
+        return np.array(self, dtype=dtype, copy=copy)
+
+    def _reduce(self, op, name, axis=0, skipna=True, numeric_only=None,
+                filter_type=None, **kwds):
+        """
+        Reduce the array with the nanops function ``op``, passing the mask
+        of the missing values so that the values keep their dtype (e.g. the
+        sum of an Int64 array is an exact integer).
+        """
+        if name not in _masked_reductions:
+            return op(self.astype(np.float64), skipna=skipna, **kwds)
+
+        if not skipna and self._mask.any() and name not in ['any', 'all']:
+            return np.nan
+        return op(self._data, skipna=True, mask=self._mask, **kwds)
+
+
+class IntegerArray(_MaskedArray):
+    """
+    An array of integers that can hold missing values, stored as a numpy
+    integer array and a boolean mask of the missing values. Unlike an
+    integer Series with missing values, which is upcast to float64, the
+    values keep their width and stay exact.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    values : array-like of integers or IntegerArray
+        Integral floats are accepted. NaN and None are missing values.
+    mask : array-like of bool, optional
+        True for the missing values. Inferred from ``values`` by default.
+    dtype : IntegerDtype, numpy integer dtype or str, optional
+        'Int8' ... 'Int64', 'UInt8' ... 'UInt64'. Inferred from the values
+        by default.
+    copy : boolean, default False
+        Copy the values and mask.
+    """
+    _typ = 'integerarray'
+
+    @classmethod
+    def _coerce_values(cls, values, mask, dtype):
+        if dtype is not None:
+            dtype = pandas_dtype(dtype)
+            if not isinstance(dtype, IntegerDtype):
+                dtype = IntegerDtype.from_numpy_dtype(dtype)
+
+        if is_integer_dtype(values) or is_bool_dtype(values):
+            data = values
+        else:
+            valid = cls._valid_values(values, mask)
+            if is_float_dtype(valid) and len(valid):
+                if not (np.isfinite(valid).all() and
+                        (valid == np.floor(valid)).all()):
+                    raise TypeError("IntegerArray values must be integers")
+            elif not (is_integer_dtype(valid) or is_bool_dtype(valid) or
+                      not len(valid)):
+                raise TypeError("IntegerArray values must be integers, got "
+                                "{dtype}".format(dtype=valid.dtype))
+            data = np.zeros(len(values), dtype=(
+                valid.dtype if is_integer_dtype(valid) else np.int64))
+            data[~mask] = valid
+
+        if dtype is None:
+            if is_bool_dtype(data):
+                data = data.astype(np.int64)
+            dtype = IntegerDtype.from_numpy_dtype(data.dtype)
+        if data.dtype != dtype.numpy_dtype:
+            casted = data.astype(dtype.numpy_dtype)
+            if (casted != data)[~mask].any():
+                raise TypeError("cannot safely cast values to "
+                                "{dtype}".format(dtype=dtype))
+            data = casted
+        return data
+
+    @property
+    def dtype(self):
+        return IntegerDtype.from_numpy_dtype(self._data.dtype)
+
+
+class BooleanArray(_MaskedArray):
+    """
+    An array of booleans that can hold missing values, stored as a numpy
+    boolean array and a boolean mask of the missing values.
+
+    Comparisons of IntegerArrays return a BooleanArray that is missing where
+    either operand is missing. ``&`` and ``|`` follow three-valued logic:
+    ``False & NA`` is False and ``True | NA`` is True.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    values : array-like of booleans or BooleanArray
+        0 and 1 are accepted. NaN and None are missing values.
+    mask : array-like of bool, optional
+        True for the missing values. Inferred from ``values`` by default.
+    dtype : BooleanDtype or 'boolean', optional
+    copy : boolean, default False
+        Copy the values and mask.
+    """
+    _typ = 'booleanarray'
+    _dtype = BooleanDtype()
+
+    @classmethod
+    def _coerce_values(cls, values, mask, dtype):
+        if dtype is not None and not BooleanDtype.is_dtype(dtype):
+            raise TypeError("BooleanArray dtype must be 'boolean', got "
+                            "{dtype}".format(dtype=dtype))
+
+        if is_bool_dtype(values):
+            return values
+
+        valid = cls._valid_values(values, mask)
+        if not is_bool_dtype(valid) and len(valid):
+            if not (is_integer_dtype(valid) or is_float_dtype(valid)) or (
+                    (valid != 0) & (valid != 1)).any():
+                raise TypeError("BooleanArray values must be booleans")
+        data = np.zeros(len(values), dtype=bool)
+        data[~mask] = valid
+        return data
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    def __invert__(self):
+        return self._simple_new(~self._data, self._mask.copy())
+
+
+def _masked_operand(other, length, fill):
+    """
+    Return the values and the missing value mask of the operand ``other``
+    of a binary operation with a masked array of ``length``. Missing values
+    are replaced by ``fill``.
+    """
+    if isinstance(other, _MaskedArray):
+        values, mask = other._data, other._mask
+    elif is_list_like(other):
+        other = np.asarray(other)
+        if is_object_dtype(other):
+            try:
+                other = IntegerArray(other)
+            except TypeError:
+                other = BooleanArray(other)
+            values, mask = other._data, other._mask
+        else:
+            values = other
+            mask = np.asarray(isna(other), dtype=bool)
+            if mask.any():
+                values = np.where(mask, fill, other)
+    elif isna(other):
+        return np.asarray(fill), np.ones(length, dtype=bool)
+    else:
+        return np.asarray(other), np.zeros(length, dtype=bool)
+
+    if len(values) != length:
+        raise ValueError("Lengths must match")
+    return values, mask
+
+
+def _wrap_masked_result(result, mask):
+    """
+    Box the result of an operation on the values of masked arrays: integer
+    and boolean results become masked arrays, floats get NaN where missing.
+    """
+    if is_bool_dtype(result):
+        return BooleanArray._simple_new(result, mask)
+    elif is_integer_dtype(result):
+        return IntegerArray._simple_new(result, mask)
+    result = np.asarray(result, dtype=np.float64)
+    result[mask] = np.nan
+    return result
+
+
+ops.add_special_arithmetic_methods(
+    IntegerArray, arith_method=ops._arith_method_MASKED_ARRAY,
+    comp_method=ops._comp_method_MASKED_ARRAY,
+    bool_method=ops._bool_method_MASKED_ARRAY)
+ops.add_special_arithmetic_methods(
+    BooleanArray, arith_method=ops._arith_method_MASKED_ARRAY,
+    comp_method=ops._comp_method_MASKED_ARRAY,
+    bool_method=ops._bool_method_MASKED_ARRAY)
@@ -0,0 +1,420 @@
+"""A variable-width string array stored in contiguous buffers."""
+import numpy as np
+
+from pandas import compat
+from pandas.compat import range, zip
+from pandas.core.arrays.base import ExtensionArray
+from pandas.core.dtypes.common import (
+    is_bool, is_bool_dtype, is_integer, is_integer_dtype)
+from pandas.core.dtypes.dtypes import StringDtype
+from pandas.core.dtypes.missing import isna
+
+
+def _to_utf8(value):
+    if isinstance(value, compat.text_type):
+        return value.encode('utf-8')
+    elif isinstance(value, compat.string_types):
+        # a py2 byte string
+        return value
+    raise TypeError("StringArray can only hold strings, got "
+                    "{typ}".format(typ=type(value).__name__))
+
+
+def _gather(data, starts, lengths):
+    """
+    Concatenate the byte ranges ``data[starts[i]:starts[i] + lengths[i]]``,
+    returning the offsets of the ranges in the result and the result.
+    """
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    positions = (np.repeat(starts - offsets[:-1], lengths) +
+                 np.arange(offsets[-1]))
+    return offsets, data.take(positions)
+
+
+def _find(data, start, stop, pattern):
+    """
+    Positions in ``data[start:stop]`` where the byte string ``pattern``
+    starts, including overlapping matches.
+    """
+    pattern = np.frombuffer(pattern, dtype=np.uint8)
+    positions = np.flatnonzero(data[start:stop] == pattern[0]) + start
+    positions = positions[positions + len(pattern) <= stop]
+    for k in range(1, len(pattern)):
+        positions = positions[data.take(positions + k) == pattern[k]]
+    return positions
+
+
+class StringArray(ExtensionArray):
+    """
+    An array of strings stored in Arrow's variable-width binary layout.
+
+    The UTF-8 encoded strings are concatenated in a single ``uint8`` data
+    buffer, string ``i`` being ``data[offsets[i]:offsets[i + 1]]``; missing
+    values are tracked in a boolean mask. Slicing the array shares the
+    buffers, and common ``.str`` methods run vectorized over the buffers
+    instead of looping over Python string objects.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    values : sequence of strings or StringArray
+        None and NaN are treated as missing values.
+    copy : boolean, default False
+        Copy the buffers if ``values`` is a StringArray.
+    """
+    _dtype = StringDtype()
+
+    def __init__(self, values, copy=False):
+        if isinstance(values, StringArray):
+            if copy:
+                values = values.copy(deep=True)
+            offsets, data, mask = values._offsets, values._data, values._mask
+        else:
+            values = np.asarray(values, dtype=object)
+            if values.ndim != 1:
+                raise ValueError("StringArray must be 1-dimensional")
+            mask = np.asarray(isna(values), dtype=bool)
+            encoded = [b'' if na else _to_utf8(value)
+                       for value, na in zip(values, mask)]
+            lengths = np.array([len(value) for value in encoded],
+                               dtype=np.int64)
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            data = np.frombuffer(b''.join(encoded) or b'\0',
+                                 dtype=np.uint8)[:offsets[-1]]
+
+        self._offsets = offsets
+        self._data = data
+        self._mask = mask
+
+    @classmethod
+    def _from_buffers(cls, offsets, data, mask=None):
+        """
+        Construct a StringArray from its buffers without copying them.
+
+        Parameters
+        ----------
+        offsets : ndarray of integers
+            ``len(array) + 1`` positions of the strings in ``data``
+        data : ndarray of uint8
+            The UTF-8 encoded strings
+        mask : ndarray of bool, optional
+            True for missing values
+        """
+        result = cls.__new__(cls)
+        result._offsets = offsets
+        result._data = data
+        if mask is None:
+            mask = np.zeros(len(offsets) - 1, dtype=bool)
+        result._mask = mask
+        return result
+
+    @classmethod
+    def _from_arrow(cls, array):
+        """
+        Construct a StringArray from a ``pyarrow`` string Array, sharing its
+        offsets and data buffers. The chunks of a ChunkedArray are
+        concatenated.
+        """
+        if hasattr(array, 'chunks'):
+            chunks = [cls._from_arrow(chunk) for chunk in array.chunks]
+            if len(chunks) == 1:
+                return chunks[0]
+            return cls._concat_same_type(chunks) if chunks else cls([])
+
+        n, offset = len(array), array.offset
+        validity, offsets, data = array.buffers()
+        offsets = np.frombuffer(offsets, dtype=np.int32)[offset:offset + n + 1]
+        if data is None:
+            data = np.empty(0, dtype=np.uint8)
+        else:
+            data = np.frombuffer(data, dtype=np.uint8)
+
+        mask = None
+        if validity is not None and array.null_count:
+            # least significant bit first
+            bits = np.unpackbits(np.frombuffer(validity, dtype=np.uint8))
+            bits = bits.reshape(-1, 8)[:, ::-1].ravel()
+            mask = bits[offset:offset + n] == 0
+        return cls._from_buffers(offsets, data, mask)
+
+    # ------------------------------------------------------------------------
+    # ExtensionArray interface
+    # ------------------------------------------------------------------------
+    def __getitem__(self, item):
+        if is_integer(item):
+            if item < 0:
+                item += len(self)
+            if self._mask[item]:
+                return self._fill_value
+            start, stop = self._offsets[item], self._offsets[item + 1]
+            return self._data[start:stop].tobytes().decode('utf-8')
+
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                stop = max(start, stop)
+                return self._from_buffers(self._offsets[start:stop + 1],
+                                          self._data, self._mask[start:stop])
+            item = np.arange(start, stop, step)
+
+        item = np.asarray(item)
+        if is_bool_dtype(item):
+            item = np.flatnonzero(item)
+        return self.take(item, allow_fill=False)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype=None):
+        result = np.empty(len(self), dtype=object)
+        if len(self):
+            base = self._offsets[0]
+            buffer = self._data[base:self._offsets[-1]].tobytes()
+            bounds = (self._offsets - base).tolist()
+            result[:] = [buffer[start:stop].decode('utf-8')
+                         for start, stop in zip(bounds[:-1], bounds[1:])]
+            result[self._mask] = self._fill_value
+        if dtype is not None:
+            result = result.astype(dtype)
+        return result
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def nbytes(self):
+        return (self._offsets.nbytes + self._mask.nbytes +
+                int(self._offsets[-1] - self._offsets[0]))
+
+    def isna(self):
+        return self._mask.copy()
+
+    def take(self, indexer, allow_fill=True, fill_value=None):
+        n = len(self)
+        indexer = np.asarray(indexer, dtype=np.int64)
+        if allow_fill:
+            fill = indexer == -1
+        else:
+            fill = np.zeros(len(indexer), dtype=bool)
+            indexer = np.where(indexer < 0, indexer + n, indexer)
+        if ((indexer < -1) | (indexer >= n) | ((indexer == -1) & ~fill)).any():
+            raise IndexError("index out of bounds for StringArray of "
+                             "length {n}".format(n=n))
+
+        if n:
+            indexer = np.where(fill, 0, indexer)
+            starts = self._offsets[:-1].take(indexer)
+            lengths = self._offsets[1:].take(indexer) - starts
+            lengths[fill] = 0
+            mask = self._mask.take(indexer) | fill
+        else:
+            starts = lengths = np.zeros(len(indexer), dtype=np.int64)
+            mask = fill
+        offsets, data = _gather(self._data, starts, lengths)
+        result = self._from_buffers(offsets, data, mask)
+
+        if fill_value is not None and not isna(fill_value) and fill.any():
+            values = np.asarray(result)
+            values[fill] = fill_value
+            result = type(self)(values)
+        return result
+
+    def copy(self, deep=False):
+        if deep:
+            # compacts the data buffer of a slice
+            return self.take(np.arange(len(self)), allow_fill=False)
+        return self._from_buffers(self._offsets, self._data, self._mask)
+
+    @property
+    def _fill_value(self):
+        return np.nan
+
+    def _formatting_values(self):
+        return np.asarray(self)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        lengths = [np.diff(array._offsets) for array in to_concat]
+        offsets = np.zeros(sum(len(x) for x in lengths) + 1, dtype=np.int64)
+        np.cumsum(np.concatenate(lengths), out=offsets[1:])
+        data = np.concatenate([
+            array._data[array._offsets[0]:array._offsets[-1]]
+            for array in to_concat])
+        mask = np.concatenate([array._mask for array in to_concat])
+        return cls._from_buffers(offsets, data, mask)
+
+    # ------------------------------------------------------------------------
+    # Vectorized string methods
+    # ------------------------------------------------------------------------
+    def _bytes(self):
+        """ The part of the data buffer holding the strings """
+        return self._data[self._offsets[0]:self._offsets[-1]]
+
+    def _is_ascii(self):
+        return not (self._bytes() >= 0x80).any()
+
+    def _with_na(self, result, na=np.nan):
+        """ Set the missing values of a vectorized result to ``na`` """
+        if self._mask.any():
+            if is_bool_dtype(result) and not is_bool(na):
+                result = result.astype(object)
+            elif is_integer_dtype(result) and not is_integer(na):
+                result = result.astype(object if not isna(na) else
+                                       np.float64)
+            result[self._mask] = na
+        return result
+
+    def _map(self, f, na=np.nan):
+        """ Map ``f`` over the non-missing strings """
+        values = np.asarray(self)
+        valid = ~self._mask
+        result = np.empty(len(self), dtype=object)
+        result[valid] = [f(value) for value in values[valid]]
+        result[self._mask] = na
+        return result
+
+    def _str_len(self):
+        # count the bytes that start a character
+        starts = (self._bytes() & 0xC0) != 0x80
+        counts = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(starts, out=counts[1:])
+        result = np.diff(counts.take(self._offsets - self._offsets[0]))
+        return self._with_na(result)
+
+    def _str_startswith(self, pat, na=np.nan):
+        return self._str_match_at(pat, na, end=False)
+
+    def _str_endswith(self, pat, na=np.nan):
+        return self._str_match_at(pat, na, end=True)
+
+    def _str_match_at(self, pat, na, end):
+        pattern = bytearray(_to_utf8(pat))
+        lengths = np.diff(self._offsets)
+        rows = np.flatnonzero(lengths >= len(pattern))
+        if end:
+            positions = self._offsets[1:].take(rows) - len(pattern)
+        else:
+            positions = self._offsets[:-1].take(rows)
+        for k, byte in enumerate(pattern):
+            found = self._data.take(positions + k) == byte
+            rows, positions = rows[found], positions[found]
+
+        result = np.zeros(len(self), dtype=bool)
+        result[rows] = True
+        return self._with_na(result, na)
+
+    def _str_contains(self, pat, case=True, na=np.nan):
+        """ Literal substring search """
+        if not case:
+            if not (self._is_ascii() and
+                    all(ord(c) < 0x80 for c in pat)):
+                upper = pat.upper()
+                return self._with_na(
+                    self._map(lambda x: upper in x.upper(),
+                              na=False).astype(bool), na)
+            return self._str_lower()._str_contains(pat.lower(), na=na)
+
+        pattern = _to_utf8(pat)
+        if not pattern:
+            return self._with_na(np.ones(len(self), dtype=bool), na)
+
+        positions = _find(self._data, self._offsets[0], self._offsets[-1],
+                          pattern)
+        rows = self._offsets.searchsorted(positions, side='right') - 1
+        rows = rows[positions + len(pattern) <= self._offsets.take(rows + 1)]
+
+        result = np.zeros(len(self), dtype=bool)
+        result[rows] = True
+        return self._with_na(result, na)
+
+    def _convert_case(self, lower):
+        data = self._bytes()
+        if not self._is_ascii():
+            if lower:
+                return type(self)(self._map(lambda x: x.lower()))
+            return type(self)(self._map(lambda x: x.upper()))
+
+        first, last = ('A', 'Z') if lower else ('a', 'z')
+        convert = (data >= ord(first)) & (data <= ord(last))
+        if lower:
+            data = data + (convert * 0x20).astype(np.uint8)
+        else:
+            data = data - (convert * 0x20).astype(np.uint8)
+        return self._from_buffers(self._offsets - self._offsets[0], data,
+                                  self._mask.copy())
+
+    def _str_lower(self):
+        return self._convert_case(lower=True)
+
+    def _str_upper(self):
+        return self._convert_case(lower=False)
+
+    def _str_slice(self, start=None, stop=None, step=None):
+        if step not in (None, 1) or not self._is_ascii():
+            obj = slice(start, stop, step)
+            return type(self)(self._map(lambda x: x[obj]))
+
+        # ASCII: characters are bytes
+        lengths = np.diff(self._offsets)
+
+        def _position(pos, default):
+            if pos is None:
+                return default
+            elif pos < 0:
+                return np.maximum(lengths + pos, 0)
+            return np.minimum(pos, lengths)
+
+        start = _position(start, 0)
+        stop = _position(stop, lengths)
+        offsets, data = _gather(self._data, self._offsets[:-1] + start,
+                                np.maximum(stop - start, 0))
+        return self._from_buffers(offsets, data, self._mask.copy())
+
+    def _str_split(self, pat, n=-1):
+        """
+        Split on the single character ``pat``, returning a list of
+        StringArrays, one for each part (the columns of an expanded split).
+        """
+        if n is None or n <= 0:
+            n = len(self._data)
+        pattern = _to_utf8(pat)
+
+        positions = _find(self._data, self._offsets[0], self._offsets[-1],
+                          pattern)
+        rows = self._offsets.searchsorted(positions, side='right') - 1
+        if len(positions):
+            # at most n splits per string
+            first = np.r_[0, np.flatnonzero(np.diff(rows)) + 1]
+            rank = np.arange(len(rows)) - np.repeat(
+                first, np.diff(np.r_[first, len(rows)]))
+            keep = (rank < n) & ~self._mask.take(rows)
+            positions, rows = positions[keep], rows[keep]
+
+        nparts = np.bincount(rows, minlength=len(self)) + 1
+        # the part number of every separator
+        part = np.arange(len(rows)) - np.repeat(
+            np.cumsum(nparts - 1) - (nparts - 1), nparts - 1)
+
+        result = []
+        for i in range(nparts.max() if len(self) else 1):
+            # part i starts after separator i - 1 and ends at separator i
+            starts = np.where(nparts > i, self._offsets[:-1], 0)
+            stops = np.where(nparts > i, self._offsets[1:], 0)
+            if i > 0:
+                sel = part == i - 1
+                starts[rows[sel]] = positions[sel] + len(pattern)
+            sel = part == i
+            stops[rows[sel]] = positions[sel]
+
+            offsets, data = _gather(self._data, starts, stops - starts)
+            result.append(self._from_buffers(offsets, data,
+                                             self._mask | (nparts <= i)))
+        return result
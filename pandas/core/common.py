@@ -660,6 +660,40 @@ def _get_distinct_objs(objs):
     return res
 
 
+def _thread_map(func, iterable, nthreads):
+    """
+    Return ``[func(item) for item in iterable]``, with the calls distributed
+    over a pool of at most ``nthreads`` threads; meant for functions that
+    release the GIL. The calls are made in the calling thread when
+    ``nthreads`` is 1 or there is a single item.
+
+    Parameters
+    ----------
+    func : callable
+    iterable : iterable
+    nthreads : int
+        Maximum number of threads, e.g. the value of a
+        ``compute.*_nthreads`` option.
+
+    Returns
+    -------
+    list : the results of ``func``, in the order of ``iterable``
+    """
+    items = list(iterable)
+    nthreads = min(nthreads, len(items))
+    if nthreads <= 1:
+        return [func(item) for item in items]
+
+    from multiprocessing.pool import ThreadPool
+
+    pool = ThreadPool(processes=nthreads)
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
 def _pipe(obj, func, *args, **kwargs):
     """
     Apply a function ``func`` to object ``obj`` either by passing obj as the
@@ -3,14 +3,21 @@ Engine classes for :func:`~pandas.eval`
 """
 
 import abc
+import operator
+
+import numpy as np
 
 from pandas import compat
-from pandas.compat import map
+from pandas.compat import map, range
+from pandas.core.dtypes.common import is_list_like
+from pandas.core.dtypes.generic import ABCSeries, ABCDataFrame
+from pandas.core.dtypes.missing import isna
+import pandas.core.common as com
 import pandas.io.formats.printing as printing
 from pandas.core.computation.align import _align, _reconstruct_object
 from pandas.core.computation.ops import (
-    UndefinedVariableError,
-    _mathops, _reductions)
+    UndefinedVariableError, BinOp, MathCall, is_term,
+    _mathops, _reductions, _cmp_ops_syms)
 
 
 _ne_builtins = frozenset(_mathops + _reductions)
@@ -38,6 +45,29 @@ def _check_ne_builtin_clash(expr):
                                      .format(expr=expr, s=s))
 
 
+def _rename_temps(s, env):
+    """Give the temporaries in the numexpr expression ``s`` names that do
+    not depend on their scope, so that numexpr can reuse the compiled
+    expression when the same expression is evaluated again.
+
+    Returns
+    -------
+    s : str
+        The expression with the temporaries renamed.
+    temps : dict
+        The renamed temporaries.
+    """
+    names = sorted((name for name in env.temps if name in s), key=s.index)
+    renamed = [(name, '__pd_eval_tmp_{i}'.format(i=i))
+               for i, name in enumerate(names)]
+
+    temps = {}
+    for name, new_name in sorted(renamed, key=lambda x: -len(x[0])):
+        s = s.replace(name, new_name)
+        temps[new_name] = env.temps[name]
+    return s, temps
+
+
 class AbstractEngine(object):
 
     """Object serving as a base class for all engines."""
@@ -120,6 +150,9 @@ class NumExprEngine(AbstractEngine):
             scope = env.full_scope
             truediv = scope['truediv']
             _check_ne_builtin_clash(self.expr)
+            s, temps = _rename_temps(s, env)
+            if temps:
+                scope = scope.new_child(temps)
             return ne.evaluate(s, local_dict=scope, truediv=truediv)
         except KeyError as e:
             # python 3 compat kludge
@@ -148,4 +181,147 @@ class PythonEngine(AbstractEngine):
         pass
 
 
-_engines = {'numexpr': NumExprEngine, 'python': PythonEngine}
+# number of bytes of the operands evaluated at a time by the blocked engine,
+# so that the temporaries of the expression stay in the cache
+_BLOCK_BYTES = 1 << 18
+
+
+def _is_array(value):
+    return getattr(value, 'ndim', 0) >= 1
+
+
+def _membership(node, left, right):
+    """ vectorized ``left in right``, elementwise over the values of left """
+    from pandas.core.algorithms import isin
+
+    if not is_list_like(left):
+        return node.func(left, right)
+    left = com._values_from_object(left)
+    if not is_list_like(right):
+        right = [right]
+    elif getattr(right, 'ndim', 1) > 1:
+        right = right.ravel()
+
+    if getattr(left, 'ndim', 1) > 1:
+        result = isin(left.ravel(), right).reshape(left.shape)
+    else:
+        result = isin(left, right)
+    return ~result if node.op == 'not in' else result
+
+
+def _evaluate_node(node, blocks, truediv):
+    """
+    Evaluate the expression tree ``node`` with numpy, the arrays of the
+    terms are taken from the ``blocks`` dict keyed by the id of the term
+    """
+    if is_term(node):
+        return blocks.get(id(node), node.value)
+
+    operands = [_evaluate_node(operand, blocks, truediv)
+                for operand in node.operands]
+
+    if isinstance(node, MathCall):
+        with np.errstate(all='ignore'):
+            return node.func.func(*operands)
+    elif not isinstance(node, BinOp):
+        return node.func(*operands)
+
+    left, right = operands
+    if node.op in ('in', 'not in'):
+        return _membership(node, left, right)
+
+    func = operator.truediv if node.op == '/' and truediv else node.func
+    with np.errstate(all='ignore'):
+        result = func(left, right)
+
+    # NaT compares like NaN, numpy compares its integer value
+    if (node.op in _cmp_ops_syms and isinstance(result, np.ndarray) and
+            any(getattr(operand, 'dtype', None) is not None and
+                operand.dtype.kind in 'mM' for operand in operands)):
+        mask = isna(left) | isna(right)
+        result[mask] = node.op == '!='
+    return result
+
+
+def _is_blockable(node):
+    """
+    Whether the tree can be evaluated over blocks of rows: the right side of
+    a membership test is used as a whole
+    """
+    if is_term(node):
+        return True
+    if node.op in ('in', 'not in'):
+        rhs = node.operands[1]
+        rhs_terms = [rhs] if is_term(rhs) else com.flatten(rhs)
+        if any(_is_array(term.value) for term in rhs_terms):
+            return False
+    return all(_is_blockable(operand) for operand in node.operands)
+
+
+class BlockedEngine(AbstractEngine):
+
+    """Evaluate the expression tree with numpy, over blocks of rows.
+
+    The arrays of the operands are cut in blocks of rows small enough for the
+    temporaries of the expression to stay in the cache, the blocks can be
+    evaluated on several threads (``compute.eval_nthreads``). Unlike numexpr
+    any dtype is supported: datetime64 and timedelta64 arithmetic,
+    comparisons against string and categorical columns, ``in`` and
+    ``not in``.
+    """
+    has_neg_frac = False
+
+    def __init__(self, expr):
+        super(BlockedEngine, self).__init__(expr)
+
+    def evaluate(self):
+        if is_term(self.expr.terms):
+            return self.expr()
+
+        if not self._is_aligned:
+            self.result_type, self.aligned_axes = _align(self.expr.terms)
+
+        res = self._evaluate()
+        if not hasattr(res, 'dtype'):
+            res = np.asarray(res)
+        return _reconstruct_object(self.result_type, res, self.aligned_axes,
+                                   res.dtype)
+
+    def _evaluate(self):
+        from pandas.core.config import get_option
+
+        terms = self.expr.terms
+        truediv = self.expr.env.scope['truediv']
+
+        arrays = []
+        for term in com.flatten(terms):
+            if isinstance(term.value, (ABCSeries, ABCDataFrame)):
+                term.update(term.value.values)
+            if _is_array(term.value):
+                arrays.append(term)
+
+        # arrays of a lower dimension are broadcast along the columns
+        shapes = set((term.value.ndim, len(term.value)) for term in arrays)
+        if len(shapes) != 1 or not _is_blockable(terms):
+            return _evaluate_node(terms, {}, truediv)
+
+        nrows = shapes.pop()[1]
+        row_bytes = sum(term.value.nbytes // max(nrows, 1)
+                        for term in arrays)
+        block_rows = max(_BLOCK_BYTES // max(row_bytes, 1), 1)
+        if nrows <= block_rows:
+            return _evaluate_node(terms, {}, truediv)
+
+        def evaluate_block(start):
+            sl = slice(start, start + block_rows)
+            blocks = dict((id(term), term.value[sl]) for term in arrays)
+            return _evaluate_node(terms, blocks, truediv)
+
+        starts = range(0, nrows, block_rows)
+        results = com._thread_map(evaluate_block, starts,
+                                  get_option('compute.eval_nthreads'))
+        return np.concatenate(results)
+
+
+_engines = {'numexpr': NumExprEngine, 'python': PythonEngine,
+            'blocked': BlockedEngine}
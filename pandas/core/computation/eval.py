@@ -179,7 +179,7 @@ def eval(expr, parser='pandas', engine=None, truediv=True,
         ``'python'`` parser to retain strict Python semantics.  See the
         :ref:`enhancing performance <enhancingperf.eval>` documentation for
         more details.
-    engine : string or None, default 'numexpr', {'python', 'numexpr'}
+    engine : {'numexpr', 'python', 'blocked'} or None, default 'numexpr'
 
         The engine used to evaluate the expression. Supported engines are
 
@@ -189,6 +189,11 @@ def eval(expr, parser='pandas', engine=None, truediv=True,
                          with large frames.
         - ``'python'``: Performs operations as if you had ``eval``'d in top
                         level python. This engine is generally not that useful.
+        - ``'blocked'``: Evaluates the expression with numpy over blocks of
+                         rows that fit in the cache, possibly on several
+                         threads (``compute.eval_nthreads``). Supports the
+                         dtypes numexpr does not, such as datetimes, strings
+                         and categoricals.
 
         More backends may be available in the future.
 
@@ -260,7 +265,10 @@ def eval(expr, parser='pandas', engine=None, truediv=True,
 
     inplace = validate_bool_kwarg(inplace, "inplace")
 
-    if isinstance(expr, string_types):
+    # only the parses of expression strings are cached, the terms and
+    # operations of nested evaluations refer to temporaries of their scope
+    cache = isinstance(expr, string_types)
+    if cache:
         _check_expression(expr)
         exprs = [e.strip() for e in expr.splitlines() if e.strip() != '']
     else:
@@ -288,7 +296,7 @@ def eval(expr, parser='pandas', engine=None, truediv=True,
                             target=target)
 
         parsed_expr = Expr(expr, engine=engine, parser=parser, env=env,
-                           truediv=truediv)
+                           truediv=truediv, cache=cache)
 
         # construct the engine and evaluate the parsed expression
         eng = _engines[engine]
@@ -2,14 +2,17 @@
 """
 
 import ast
+import threading
 import tokenize
 
+from collections import namedtuple
 from functools import partial
 import numpy as np
 
 import pandas as pd
 from pandas import compat
-from pandas.compat import StringIO, lmap, zip, reduce, string_types
+from pandas.compat import (StringIO, lmap, zip, reduce, string_types,
+                           OrderedDict)
 from pandas.core.base import StringMixin
 from pandas.core import common as com
 import pandas.io.formats.printing as printing
@@ -19,6 +22,7 @@ from pandas.core.computation.ops import (
     _arith_ops_syms, _unary_ops_syms, is_term)
 from pandas.core.computation.ops import _reductions, _mathops, _LOCAL_TAG
 from pandas.core.computation.ops import Op, BinOp, UnaryOp, Term, Constant, Div
+from pandas.core.computation.ops import MathCall
 from pandas.core.computation.ops import UndefinedVariableError, FuncNode
 from pandas.core.computation.scope import Scope
 
@@ -304,6 +308,22 @@ class BaseExprVisitor(ast.NodeVisitor):
         self.preparser = preparser
         self.assigner = None
 
+        # bookkeeping for the plan cache: the temporaries that hold
+        # literals, the pre-evaluated operations and the resolved names
+        self._cacheable = True
+        self._constant_tmps = set()
+        self._evaluated = {}
+        self._names = {}
+
+    def _is_constant(self, term):
+        return (isinstance(term, Constant) or
+                is_term(term) and term.name in self._constant_tmps)
+
+    def _add_constant_tmp(self, value):
+        name = self.env.add_tmp(value)
+        self._constant_tmps.add(name)
+        return self.term_type(name, self.env)
+
     def visit(self, node, **kwargs):
         if isinstance(node, string_types):
             clean = self.preparser(node)
@@ -347,16 +367,20 @@ class BaseExprVisitor(ast.NodeVisitor):
             # pop the string variable out of locals and replace it with a list
             # of one string, kind of a hack
             if right_str:
-                name = self.env.add_tmp([right.value])
-                right = self.term_type(name, self.env)
+                right = self._rewrite_str(right)
 
             if left_str:
-                name = self.env.add_tmp([left.value])
-                left = self.term_type(name, self.env)
+                left = self._rewrite_str(left)
 
         op = self.visit(op_instance)
         return op, op_instance, left, right
 
+    def _rewrite_str(self, term):
+        if self._is_constant(term):
+            return self._add_constant_tmp([term.value])
+        name = self.env.add_tmp([term.value])
+        return self.term_type(name, self.env)
+
     def _maybe_transform_eq_ne(self, node, left=None, right=None):
         if left is None:
             left = self.visit(node.left, side='left')
@@ -370,15 +394,19 @@ class BaseExprVisitor(ast.NodeVisitor):
         f32 = np.dtype(np.float32)
         if left.is_scalar and not right.is_scalar and right.return_type == f32:
             # right is a float32 array, left is a scalar
-            name = self.env.add_tmp(np.float32(left.value))
-            left = self.term_type(name, self.env)
+            left = self._downcast(left)
         if right.is_scalar and not left.is_scalar and left.return_type == f32:
             # left is a float32 array, right is a scalar
-            name = self.env.add_tmp(np.float32(right.value))
-            right = self.term_type(name, self.env)
+            right = self._downcast(right)
 
         return left, right
 
+    def _downcast(self, term):
+        if self._is_constant(term):
+            return self._add_constant_tmp(np.float32(term.value))
+        name = self.env.add_tmp(np.float32(term.value))
+        return self.term_type(name, self.env)
+
     def _maybe_eval(self, binop, eval_in_python):
         # eval `in` and `not in` (for now) in "partial" python space
         # things that can be evaluated in "eval" space will be turned into
@@ -386,8 +414,10 @@ class BaseExprVisitor(ast.NodeVisitor):
         # [1,2] in a + 2 * b
         # in that case a + 2 * b will be evaluated using numexpr, and the "in"
         # call will be evaluated using isin (in python space)
-        return binop.evaluate(self.env, self.engine, self.parser,
-                              self.term_type, eval_in_python)
+        res = binop.evaluate(self.env, self.engine, self.parser,
+                             self.term_type, eval_in_python)
+        self._evaluated[res.name] = binop, eval_in_python
+        return res
 
     def _maybe_evaluate_binop(self, op, op_class, lhs, rhs,
                               eval_in_python=('in', 'not in'),
@@ -401,6 +431,10 @@ class BaseExprVisitor(ast.NodeVisitor):
                                                           lhs=lhs.type,
                                                           rhs=rhs.type))
 
+        if self.engine == 'blocked':
+            # the blocked engine evaluates all the operations of the tree
+            return res
+
         if self.engine != 'pytables':
             if (res.op in _cmp_ops_syms and
                     getattr(lhs, 'is_datetime', False) or
@@ -436,7 +470,9 @@ class BaseExprVisitor(ast.NodeVisitor):
         return op(operand)
 
     def visit_Name(self, node, **kwargs):
-        return self.term_type(node.id, self.env, **kwargs)
+        term = self.term_type(node.id, self.env, **kwargs)
+        self._names[id(term)] = term, _term_signature(term.value)
+        return term
 
     def visit_NameConstant(self, node, **kwargs):
         return self.const_type(node.value, self.env)
@@ -445,11 +481,14 @@ class BaseExprVisitor(ast.NodeVisitor):
         return self.const_type(node.n, self.env)
 
     def visit_Str(self, node, **kwargs):
-        name = self.env.add_tmp(node.s)
-        return self.term_type(name, self.env)
+        return self._add_constant_tmp(node.s)
 
     def visit_List(self, node, **kwargs):
-        name = self.env.add_tmp([self.visit(e)(self.env) for e in node.elts])
+        elts = [self.visit(e) for e in node.elts]
+        value = [e(self.env) for e in elts]
+        if all(self._is_constant(e) for e in elts):
+            return self._add_constant_tmp(value)
+        name = self.env.add_tmp(value)
         return self.term_type(name, self.env)
 
     visit_Tuple = visit_List
@@ -588,6 +627,7 @@ class BaseExprVisitor(ast.NodeVisitor):
                     kwargs.append(ast.keyword(
                         keyword.arg, self.visit(keyword.value)))  # noqa
 
+            self._cacheable = False
             return self.const_type(res(*new_args, **kwargs), self.env)
 
     def visit_Call_legacy(self, node, side=None, **kwargs):
@@ -640,6 +680,7 @@ class BaseExprVisitor(ast.NodeVisitor):
             if node.kwargs is not None:
                 keywords.update(self.visit(node.kwargs).value)
 
+            self._cacheable = False
             return self.const_type(res(*args, **keywords), self.env)
 
     def translate_In(self, op):
@@ -714,6 +755,174 @@ class PythonExprVisitor(BaseExprVisitor):
                                                 preparser=preparser)
 
 
+def _term_signature(value):
+    """The type and dtype(s) of the value of a name, these determine how an
+    expression referencing the name is parsed.
+    """
+    dtype = getattr(value, 'dtype', None)
+    if dtype is None and isinstance(value, pd.DataFrame):
+        dtype = tuple(value.dtypes)
+    return type(value), dtype
+
+
+class _PlanMismatch(Exception):
+    pass
+
+
+def _make_plan(node, visitor):
+    """Record the structure of the parsed terms of ``visitor``, raises
+    _PlanMismatch if they depend on the data in a way that the plan cannot
+    reproduce.
+    """
+    if isinstance(node, Constant):
+        return 'const', node.value
+    elif is_term(node):
+        name = node.name
+        if name in visitor._constant_tmps:
+            return 'tmp', node.value
+        elif name in visitor._evaluated:
+            binop, eval_in_python = visitor._evaluated[name]
+            return 'eval', eval_in_python, _make_plan(binop, visitor)
+
+        term, signature = visitor._names.get(id(node), (None, None))
+        if term is not node:
+            # a temporary holding data, e.g. the result of a subscript
+            raise _PlanMismatch(name)
+        return 'name', name, node.side, node.encoding, signature
+    elif isinstance(node, Div):
+        return ('div', _make_plan(node.lhs, visitor),
+                _make_plan(node.rhs, visitor))
+    elif isinstance(node, BinOp):
+        return ('binop', node.op, _make_plan(node.lhs, visitor),
+                _make_plan(node.rhs, visitor))
+    elif isinstance(node, UnaryOp):
+        return 'unary', node.op, _make_plan(node.operand, visitor)
+    elif isinstance(node, MathCall):
+        return ('call', node.func,
+                [_make_plan(operand, visitor) for operand in node.operands])
+    raise _PlanMismatch(node)
+
+
+def _bind_plan(plan, visitor):
+    """Rebuild the terms of a plan in the scope of ``visitor``, raises
+    _PlanMismatch if a name resolves to a value of another type or dtype.
+    """
+    kind, env = plan[0], visitor.env
+    if kind == 'const':
+        return visitor.const_type(plan[1], env)
+    elif kind == 'tmp':
+        return visitor.term_type(env.add_tmp(plan[1]), env)
+    elif kind == 'name':
+        _, name, side, encoding, signature = plan
+        term = visitor.term_type(name, env, side=side, encoding=encoding)
+        if _term_signature(term.value) != signature:
+            raise _PlanMismatch(name)
+        return term
+    elif kind == 'eval':
+        binop = _bind_plan(plan[2], visitor)
+        return binop.evaluate(env, visitor.engine, visitor.parser,
+                              visitor.term_type, plan[1])
+    elif kind == 'div':
+        return Div(_bind_plan(plan[1], visitor), _bind_plan(plan[2], visitor),
+                   env.scope['truediv'])
+    elif kind == 'binop':
+        return BinOp(plan[1], _bind_plan(plan[2], visitor),
+                     _bind_plan(plan[3], visitor))
+    elif kind == 'unary':
+        return UnaryOp(plan[1], _bind_plan(plan[2], visitor))
+    return plan[1](*[_bind_plan(operand, visitor) for operand in plan[2]])
+
+
+class _ExprPlan(object):
+    """The parsed form of an expression, independent of the scope it was
+    parsed in.
+    """
+
+    def __init__(self, terms, visitor):
+        self.tree = _make_plan(terms, visitor)
+        self.assigner = visitor.assigner
+
+    def bind(self, visitor):
+        if self.assigner is not None:
+            if visitor.env.target is None:
+                raise ValueError('cannot assign without a target object')
+            visitor.assigner = self.assigner
+        return _bind_plan(self.tree, visitor)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize',
+                                     'currsize'])
+
+
+class _PlanCache(object):
+    """A thread safe LRU cache of expression plans."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            plan = self._plans.pop(key, None)
+            if plan is not None:
+                self._plans[key] = plan
+            return plan
+
+    def put(self, key, plan):
+        with self._lock:
+            self._plans.pop(key, None)
+            self._plans[key] = plan
+            self._evict()
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._plans))
+
+    def _evict(self):
+        while self._plans and len(self._plans) > max(self.maxsize, 0):
+            self._plans.popitem(last=False)
+
+
+# matches the default of the compute.eval_cache_size option
+_plan_cache = _PlanCache(128)
+
+
+def cache_info():
+    """Statistics of the cache of parsed expressions used by eval and query.
+
+    Returns
+    -------
+    CacheInfo
+        namedtuple of the hits, misses, maximum and current size of the cache
+    """
+    return _plan_cache.info()
+
+
+def cache_clear():
+    """Clear the cache of parsed expressions and its statistics."""
+    _plan_cache.clear()
+
+
 class Expr(StringMixin):
 
     """Object encapsulating an expression.
@@ -726,17 +935,20 @@ class Expr(StringMixin):
     env : Scope, optional, default None
     truediv : bool, optional, default True
     level : int, optional, default 2
+    cache : bool, optional, default False
+        Whether to reuse the parse of a previous identical expression, see
+        the ``compute.eval_cache_size`` option.
     """
 
     def __init__(self, expr, engine='numexpr', parser='pandas', env=None,
-                 truediv=True, level=0):
+                 truediv=True, level=0, cache=False):
         self.expr = expr
         self.env = env or Scope(level=level + 1)
         self.engine = engine
         self.parser = parser
         self.env.scope['truediv'] = truediv
         self._visitor = _parsers[parser](self.env, self.engine, self.parser)
-        self.terms = self.parse()
+        self.terms = self._parse_cached() if cache else self.parse()
 
     @property
     def assigner(self):
@@ -755,6 +967,34 @@ class Expr(StringMixin):
         """Parse an expression"""
         return self._visitor.visit(self.expr)
 
+    def _parse_cached(self):
+        """Parse an expression, rebinding the plan of a previous parse of the
+        same expression to the current scope if there is one.
+        """
+        if _plan_cache.maxsize <= 0:
+            return self.parse()
+
+        key = self.expr, self.engine, self.parser
+        plan = _plan_cache.get(key)
+        if plan is not None:
+            try:
+                terms = plan.bind(self._visitor)
+            except _PlanMismatch:
+                # the names resolve to data of other dtypes, parse again
+                pass
+            else:
+                _plan_cache.record(hit=True)
+                return terms
+
+        _plan_cache.record(hit=False)
+        terms = self.parse()
+        if self._visitor._cacheable:
+            try:
+                _plan_cache.put(key, _ExprPlan(terms, self._visitor))
+            except _PlanMismatch:
+                pass
+        return terms
+
     @property
     def names(self):
         """Get the names in an expression"""
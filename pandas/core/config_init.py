@@ -9,6 +9,8 @@ If you need to make sure options are available even before a certain
 module is imported, register them here rather then in the module.
 
 """
+import textwrap
+
 import pandas.core.config as cf
 from pandas.core.config import (is_int, is_bool, is_text, is_instance_factory,
                                 is_one_of_factory, is_callable)
@@ -42,11 +44,60 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+def nthreads_doc(used_by, split):
+    """ The doc of a compute.*_nthreads option """
+    text = ('Number of threads used by {used_by}. {split} distributed over '
+            'the threads, the kernels run without the GIL. The default is 1 '
+            '(serial).'.format(used_by=used_by, split=split))
+    return '\n: int\n{text}\n'.format(
+        text=textwrap.fill(text, 79, initial_indent='    ',
+                           subsequent_indent='    '))
+
+
+groupby_nthreads_doc = nthreads_doc(
+    'the cython groupby aggregations (sum, mean, var, min, max, ...)',
+    'The columns of a block are')
+
+eval_nthreads_doc = nthreads_doc("the 'blocked' engine of eval and query",
+                                 'The blocks of rows of the operands are')
+
+window_nthreads_doc = nthreads_doc(
+    "the rolling, expanding and ewm functions of a DataFrame, including "
+    "apply(engine='numba')", 'The columns are')
+
+merge_asof_nthreads_doc = nthreads_doc(
+    "merge_asof with 'by' columns",
+    "The 'by' groups are joined separately and")
+
+eval_cache_size_doc = """
+: int
+    Maximum number of parsed expressions cached by eval and query. Evaluating
+    an expression that was parsed before only resolves its names again, as
+    long as they refer to data of the same dtypes. Set to 0 to disable the
+    cache. The default is 128.
+"""
+
+
+def eval_cache_size_cb(key):
+    from pandas.core.computation import expr
+    expr._plan_cache.resize(cf.get_option(key))
+
+
 with cf.config_prefix('compute'):
     cf.register_option('use_bottleneck', True, use_bottleneck_doc,
                        validator=is_bool, cb=use_bottleneck_cb)
     cf.register_option('use_numexpr', True, use_numexpr_doc,
                        validator=is_bool, cb=use_numexpr_cb)
+    cf.register_option('groupby_nthreads', 1, groupby_nthreads_doc,
+                       validator=is_int)
+    cf.register_option('merge_asof_nthreads', 1, merge_asof_nthreads_doc,
+                       validator=is_int)
+    cf.register_option('eval_nthreads', 1, eval_nthreads_doc,
+                       validator=is_int)
+    cf.register_option('eval_cache_size', 128, eval_cache_size_doc,
+                       validator=is_int, cb=eval_cache_size_cb)
+    cf.register_option('window_nthreads', 1, window_nthreads_doc,
+                       validator=is_int)
 #
 # options from the "display" namespace
 
@@ -418,6 +469,24 @@ with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
+
+copy_on_write_doc = """
+: bool
+    Use copy-on-write for the copies of numpy-backed data: copies and
+    column selections share their values with the original until either is
+    modified, instead of copying them eagerly. The default is False
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core.internals import set_copy_on_write
+    set_copy_on_write(cf.get_option(key))
+
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
 : string
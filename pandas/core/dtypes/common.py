@@ -9,7 +9,7 @@ from .dtypes import (CategoricalDtype, CategoricalDtypeType,
                      DatetimeTZDtype, DatetimeTZDtypeType,
                      PeriodDtype, PeriodDtypeType,
                      IntervalDtype, IntervalDtypeType,
-                     ExtensionDtype)
+                     ExtensionDtype, StringDtype, _MaskedDtype)
 from .generic import (ABCCategorical, ABCPeriodIndex,
                       ABCDatetimeIndex, ABCSeries,
                       ABCSparseArray, ABCSparseSeries, ABCCategoricalIndex,
@@ -1829,6 +1829,8 @@ def _get_dtype(arr_or_dtype):
 
     if hasattr(arr_or_dtype, 'dtype'):
         arr_or_dtype = arr_or_dtype.dtype
+    if isinstance(arr_or_dtype, _MaskedDtype):
+        return arr_or_dtype
     return np.dtype(arr_or_dtype)
 
 
@@ -1860,6 +1862,8 @@ def _get_dtype_type(arr_or_dtype):
         return IntervalDtypeType
     elif isinstance(arr_or_dtype, PeriodDtype):
         return PeriodDtypeType
+    elif isinstance(arr_or_dtype, _MaskedDtype):
+        return arr_or_dtype.type
     elif isinstance(arr_or_dtype, string_types):
         if is_categorical_dtype(arr_or_dtype):
             return CategoricalDtypeType
@@ -2006,6 +2010,16 @@ def pandas_dtype(dtype):
             return CategoricalDtype.construct_from_string(dtype)
         except TypeError:
             pass
+
+        try:
+            return _MaskedDtype.construct_from_string(dtype)
+        except TypeError:
+            pass
+
+        try:
+            return StringDtype.construct_from_string(dtype)
+        except TypeError:
+            pass
     elif isinstance(dtype, ExtensionDtype):
         return dtype
 
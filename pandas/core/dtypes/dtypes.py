@@ -730,3 +730,189 @@ class IntervalDtype(PandasExtensionDtype):
             else:
                 return False
         return super(IntervalDtype, cls).is_dtype(dtype)
+
+
+class StringDtype(ExtensionDtype):
+    """
+    The dtype of a :class:`~pandas.core.arrays.StringArray`: variable-width
+    UTF-8 strings stored in contiguous buffers.
+
+    THIS IS NOT A REAL NUMPY DTYPE
+    """
+    name = 'string'
+    type = compat.text_type
+    kind = 'O'
+
+    @classmethod
+    def construct_from_string(cls, string):
+        """
+        attempt to construct this type from a string, raise a TypeError
+        if its not possible
+        """
+        if string == cls.name:
+            return cls()
+        raise TypeError("cannot construct a '{name}' from "
+                        "'{string}'".format(name=cls.__name__,
+                                            string=string))
+
+    @classmethod
+    def is_dtype(cls, dtype):
+        """
+        Return a boolean if the passed type is an actual dtype that we
+        can match (via string or type)
+        """
+        dtype = getattr(dtype, 'dtype', dtype)
+        if isinstance(dtype, compat.string_types):
+            return dtype == cls.name
+        return isinstance(dtype, cls) or (isinstance(dtype, type) and
+                                          issubclass(dtype, cls))
+
+    def __eq__(self, other):
+        if isinstance(other, compat.string_types):
+            return other == self.name
+        return isinstance(other, StringDtype)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return 'StringDtype()'
+
+
+class _MaskedDtype(ExtensionDtype):
+    """
+    Base class for the dtypes of the masked arrays: a numpy dtype for the
+    values paired with a boolean mask for the missing values.
+
+    THIS IS NOT A REAL NUMPY DTYPE
+    """
+    numpy_dtype = None
+
+    @property
+    def type(self):
+        return self.numpy_dtype.type
+
+    @property
+    def kind(self):
+        return self.numpy_dtype.kind
+
+    @property
+    def itemsize(self):
+        return self.numpy_dtype.itemsize
+
+    @classmethod
+    def construct_from_string(cls, string):
+        """
+        attempt to construct this type from a string, raise a TypeError
+        if its not possible
+        """
+        dtype = _masked_dtypes.get(string)
+        if dtype is not None and issubclass(dtype, cls):
+            return dtype()
+        raise TypeError("cannot construct a '{name}' from "
+                        "'{string}'".format(name=cls.__name__,
+                                            string=string))
+
+    @classmethod
+    def is_dtype(cls, dtype):
+        """
+        Return a boolean if the passed type is an actual dtype that we
+        can match (via string or type)
+        """
+        dtype = getattr(dtype, 'dtype', dtype)
+        if isinstance(dtype, compat.string_types):
+            try:
+                cls.construct_from_string(dtype)
+                return True
+            except TypeError:
+                return False
+        return isinstance(dtype, cls) or (isinstance(dtype, type) and
+                                          issubclass(dtype, cls))
+
+    def __eq__(self, other):
+        if isinstance(other, compat.string_types):
+            return other == self.name
+        return type(other) is type(self)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '{name}()'.format(name=type(self).__name__)
+
+
+class IntegerDtype(_MaskedDtype):
+    """
+    The dtype of a :class:`~pandas.core.arrays.IntegerArray`: integers
+    of the width of ``numpy_dtype`` that can hold missing values.
+    """
+
+    @classmethod
+    def from_numpy_dtype(cls, dtype):
+        """ The IntegerDtype holding values of the numpy ``dtype`` """
+        dtype = np.dtype(dtype)
+        for klass in _masked_dtypes.values():
+            if issubclass(klass, cls) and klass.numpy_dtype == dtype:
+                return klass()
+        raise TypeError("no integer extension dtype for "
+                        "'{dtype}'".format(dtype=dtype))
+
+
+class Int8Dtype(IntegerDtype):
+    name = 'Int8'
+    numpy_dtype = np.dtype('int8')
+
+
+class Int16Dtype(IntegerDtype):
+    name = 'Int16'
+    numpy_dtype = np.dtype('int16')
+
+
+class Int32Dtype(IntegerDtype):
+    name = 'Int32'
+    numpy_dtype = np.dtype('int32')
+
+
+class Int64Dtype(IntegerDtype):
+    name = 'Int64'
+    numpy_dtype = np.dtype('int64')
+
+
+class UInt8Dtype(IntegerDtype):
+    name = 'UInt8'
+    numpy_dtype = np.dtype('uint8')
+
+
+class UInt16Dtype(IntegerDtype):
+    name = 'UInt16'
+    numpy_dtype = np.dtype('uint16')
+
+
+class UInt32Dtype(IntegerDtype):
+    name = 'UInt32'
+    numpy_dtype = np.dtype('uint32')
+
+
+class UInt64Dtype(IntegerDtype):
+    name = 'UInt64'
+    numpy_dtype = np.dtype('uint64')
+
+
+class BooleanDtype(_MaskedDtype):
+    """
+    The dtype of a :class:`~pandas.core.arrays.BooleanArray`: booleans
+    that can hold missing values.
+    """
+    name = 'boolean'
+    numpy_dtype = np.dtype('bool')
+
+
+_masked_dtypes = dict((klass.name, klass) for klass in [
+    Int8Dtype, Int16Dtype, Int32Dtype, Int64Dtype, UInt8Dtype, UInt16Dtype,
+    UInt32Dtype, UInt64Dtype, BooleanDtype])
@@ -18,6 +18,7 @@ from .common import (is_string_dtype, is_datetimelike,
                      is_scalar,
                      is_object_dtype,
                      is_integer,
+                     is_extension_array_dtype,
                      _TD_DTYPE,
                      _NS_DTYPE)
 from .inference import is_list_like
@@ -59,6 +60,8 @@ def _isna_new(obj):
         raise NotImplementedError("isna is not defined for MultiIndex")
     elif isinstance(obj, (ABCSeries, np.ndarray, ABCIndexClass)):
         return _isna_ndarraylike(obj)
+    elif is_extension_array_dtype(obj):
+        return obj.isna()
     elif isinstance(obj, ABCGeneric):
         return obj._constructor(obj._data.isna(func=isna))
     elif isinstance(obj, list) or hasattr(obj, '__array__'):
@@ -85,6 +88,8 @@ def _isna_old(obj):
         raise NotImplementedError("isna is not defined for MultiIndex")
     elif isinstance(obj, (ABCSeries, np.ndarray, ABCIndexClass)):
         return _isna_ndarraylike_old(obj)
+    elif is_extension_array_dtype(obj):
+        return obj.isna()
     elif isinstance(obj, ABCGeneric):
         return obj._constructor(obj._data.isna(func=_isna_old))
     elif isinstance(obj, list) or hasattr(obj, '__array__'):
@@ -128,7 +133,9 @@ def _isna_ndarraylike(obj):
     values = getattr(obj, 'values', obj)
     dtype = values.dtype
 
-    if is_string_dtype(dtype):
+    if is_extension_array_dtype(values) and not is_categorical_dtype(values):
+        result = values.isna()
+    elif is_string_dtype(dtype):
         if is_categorical_dtype(values):
             from pandas import Categorical
             if not isinstance(values, Categorical):
@@ -167,7 +174,9 @@ def _isna_ndarraylike_old(obj):
     values = getattr(obj, 'values', obj)
     dtype = values.dtype
 
-    if is_string_dtype(dtype):
+    if is_extension_array_dtype(values) and not is_categorical_dtype(values):
+        result = values.isna()
+    elif is_string_dtype(dtype):
         # Working around NumPy ticket 1542
         shape = values.shape
 
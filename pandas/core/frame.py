@@ -39,6 +39,7 @@ from pandas.core.dtypes.common import (
     is_categorical_dtype,
     is_object_dtype,
     is_extension_type,
+    is_extension_array_dtype,
     is_datetimetz,
     is_datetime64_any_dtype,
     is_datetime64tz_dtype,
@@ -71,7 +72,7 @@ from pandas.core.internals import (BlockManager,
                                    create_block_manager_from_arrays,
                                    create_block_manager_from_blocks)
 from pandas.core.series import Series
-from pandas.core.arrays import Categorical
+from pandas.core.arrays import Categorical, ExtensionArray
 import pandas.core.algorithms as algorithms
 from pandas.compat import (range, map, zip, lrange, lmap, lzip, StringIO, u,
                            OrderedDict, raise_with_traceback)
@@ -199,6 +200,29 @@ validate : string, default None
 
     .. versionadded:: 0.21.0
 
+algorithm : {'hash', 'radix'}, default 'hash'
+    Algorithm used to compute the join of the key columns.
+
+    * 'hash': factorize all the keys of both frames into a single hash
+      table.
+    * 'radix': partition both frames on the high bits of the key hashes
+      first, so that the hash table of every partition fits in the CPU
+      cache, and join the partitions one at a time. This is faster for
+      very large frames and gives the same result. Only numeric, datetime
+      and string keys are partitioned, other keys use 'hash'.
+
+    .. versionadded:: 0.23.0
+
+assume_sorted : boolean, default False
+    If True, and the keys of both frames are sorted in ascending
+    (lexicographic) order, join them with a linear merge of the sorted
+    keys instead of hash tables, which requires much less memory. The
+    order of the keys is verified; if they are not sorted or have missing
+    values, the default algorithm is used. The result is the same in both
+    cases.
+
+    .. versionadded:: 0.23.0
+
 Notes
 -----
 Support for specifying index levels as the `on`, `left_on`, and
@@ -2057,6 +2081,12 @@ class DataFrame(NDFrame):
         return self._set_value(index, col, value, takeable=takeable)
 
     def _set_value(self, index, col, value, takeable=False):
+        if self._data.is_shared or self._data._is_read_only:
+            # copy-on-write: the cached columns are views of shared or
+            # read-only values
+            self._data._ensure_own_values()
+            self._clear_item_cache()
+
         try:
             if takeable is True:
                 series = self._iget_item_cache(col)
@@ -2401,6 +2431,42 @@ class DataFrame(NDFrame):
         kwargs['resolvers'] = kwargs.get('resolvers', ()) + tuple(resolvers)
         return _eval(expr, inplace=inplace, **kwargs)
 
+    def lazy(self):
+        """
+        Start a lazily evaluated pipeline on this DataFrame.
+
+        Operations on the returned ``LazyFrame`` (selecting columns,
+        filtering with expressions of the columns, ``assign``,
+        ``sort_values``, ``head``, ``groupby`` aggregations, ``merge``) are
+        recorded instead of executed. ``collect`` optimizes the recorded
+        plan, fusing the filters, pushing them down and keeping only the
+        columns that are needed, and returns the resulting DataFrame.
+
+        .. versionadded:: 0.23.0
+
+        Returns
+        -------
+        LazyFrame
+
+        See Also
+        --------
+        pandas.core.lazy.LazyFrame.from_csv
+        pandas.core.lazy.LazyFrame.from_parquet
+        pandas.core.lazy.LazyFrame.from_hdf
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'a': [1, -1, 2], 'b': ['x', 'y', 'x'],
+        ...                    'c': [1., 2., 3.], 'd': [0, 0, 0]})
+        >>> lf = df.lazy()
+        >>> lf[lf.a > 0][['b', 'c']].groupby('b').sum().collect()
+             c
+        b
+        x  4.0
+        """
+        from pandas.core.lazy import LazyFrame
+        return LazyFrame(self)
+
     def select_dtypes(self, include=None, exclude=None):
         """Return a subset of a DataFrame including/excluding columns based on
         their ``dtype``.
@@ -2799,6 +2865,9 @@ class DataFrame(NDFrame):
         elif isinstance(value, Categorical):
             value = value.copy()
 
+        elif isinstance(value, ExtensionArray):
+            value = value.copy()
+
         elif isinstance(value, Index) or is_sequence(value):
             from pandas.core.series import _sanitize_index
 
@@ -2826,7 +2895,7 @@ class DataFrame(NDFrame):
             value = maybe_cast_to_datetime(value, value.dtype)
 
         # return internal types directly
-        if is_extension_type(value):
+        if is_extension_type(value) or is_extension_array_dtype(value):
             return value
 
         # broadcast across multiple columns if necessary
@@ -5239,12 +5308,13 @@ class DataFrame(NDFrame):
     def merge(self, right, how='inner', on=None, left_on=None, right_on=None,
               left_index=False, right_index=False, sort=False,
               suffixes=('_x', '_y'), copy=True, indicator=False,
-              validate=None):
+              validate=None, algorithm='hash', assume_sorted=False):
         from pandas.core.reshape.merge import merge
         return merge(self, right, how=how, on=on, left_on=left_on,
                      right_on=right_on, left_index=left_index,
                      right_index=right_index, sort=sort, suffixes=suffixes,
-                     copy=copy, indicator=indicator, validate=validate)
+                     copy=copy, indicator=indicator, validate=validate,
+                     algorithm=algorithm, assume_sorted=assume_sorted)
 
     def round(self, decimals=0, *args, **kwargs):
         """
@@ -880,7 +880,7 @@ class NDFrame(PandasObject, SelectionMixin):
 
             return f
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         result = self if inplace else self.copy(deep=copy)
 
         # start in the axis order to eliminate too many copies
@@ -1839,7 +1839,7 @@ class NDFrame(PandasObject, SelectionMixin):
                                   **kwargs)
 
     def to_sql(self, name, con, schema=None, if_exists='fail', index=True,
-               index_label=None, chunksize=None, dtype=None):
+               index_label=None, chunksize=None, dtype=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1869,12 +1869,24 @@ class NDFrame(PandasObject, SelectionMixin):
         dtype : dict of column name to SQL type, default None
             Optional specifying the datatype for columns. The SQL type should
             be a SQLAlchemy type, or a string for sqlite3 fallback connection.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            - None : Uses standard SQL ``INSERT`` clause (one per row).
+            - 'multi': Pass multiple values in a single ``INSERT`` clause.
+            - callable with signature ``(pd_table, conn, keys, data_iter)``,
+              e.g. to load the rows with a bulk loader of the database.
+
+            Details and a sample callable implementation can be found in the
+            section :ref:`insert method <io.sql.method>`.
+
+            .. versionadded:: 0.23.0
 
         """
         from pandas.io import sql
         sql.to_sql(self, name, con, schema=schema, if_exists=if_exists,
                    index=index, index_label=index_label, chunksize=chunksize,
-                   dtype=dtype)
+                   dtype=dtype, method=method)
 
     def to_pickle(self, path, compression='infer',
                   protocol=pkl.HIGHEST_PROTOCOL):
@@ -2471,7 +2483,7 @@ class NDFrame(PandasObject, SelectionMixin):
 
     @Appender(_shared_docs['_take'])
     def _take(self, indices, axis=0, convert=True, is_copy=True):
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         if convert:
             indices = maybe_convert_indices(indices, len(self._get_axis(axis)))
@@ -3336,7 +3348,7 @@ class NDFrame(PandasObject, SelectionMixin):
             raise TypeError('reindex() got an unexpected keyword '
                             'argument "{0}"'.format(list(kwargs.keys())[0]))
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # if all axes that are requested to reindex are equal, then only copy
         # if indicated must have index names equal here as well as values
@@ -3444,7 +3456,7 @@ class NDFrame(PandasObject, SelectionMixin):
                      limit=None, fill_value=np.nan):
         msg = ("'.reindex_axis' is deprecated and will be removed in a future "
                "version. Use '.reindex' instead.")
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         axis_name = self._get_axis_name(axis)
         axis_values = self._get_axis(axis_name)
@@ -4086,6 +4098,15 @@ class NDFrame(PandasObject, SelectionMixin):
 
         self._protect_consolidate(f)
 
+    def _maybe_consolidate_inplace(self):
+        """Consolidate data in place if it pays off and return None"""
+
+        def f():
+            if self._data._should_consolidate():
+                self._data = self._data.consolidate()
+
+        self._protect_consolidate(f)
+
     def _consolidate(self, inplace=False):
         """
         Compute NDFrame with "consolidated" internals (data of each dtype
@@ -4679,7 +4700,7 @@ class NDFrame(PandasObject, SelectionMixin):
         if isinstance(value, (list, tuple)):
             raise TypeError('"value" parameter must be a scalar or dict, but '
                             'you passed a "{0}"'.format(type(value).__name__))
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # set the default here, so functions examining the signaure
         # can detect if something was set (e.g. in groupby) (GH9221)
@@ -4898,7 +4919,7 @@ class NDFrame(PandasObject, SelectionMixin):
                           'and will be removed in'
                           'v0.13; this argument has no effect')
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         if value is None:
             # passing a single value that is scalar like
@@ -38,12 +38,13 @@ from pandas.core.dtypes.common import (
     _ensure_float)
 from pandas.core.dtypes.cast import maybe_downcast_to_dtype
 from pandas.core.dtypes.missing import isna, notna, _maybe_fill
+from pandas.core.dtypes.generic import ABCMaskedArray
 
 from pandas.core.base import (PandasObject, SelectionMixin, GroupByError,
                               DataError, SpecificationError)
 from pandas.core.index import (Index, MultiIndex,
                                CategoricalIndex, _ensure_index)
-from pandas.core.arrays import Categorical
+from pandas.core.arrays import Categorical, IntegerArray
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame, _shared_docs
 from pandas.core.internals import BlockManager, make_block
@@ -59,7 +60,8 @@ from pandas.util._validators import validate_kwargs
 
 import pandas.core.common as com
 import pandas.core.algorithms as algorithms
-from pandas.core.config import option_context
+from pandas.core.config import option_context, get_option
+from pandas.core.util import numba_
 
 from pandas.plotting._core import boxplot_frame_groupby
 
@@ -253,6 +255,17 @@ Parameters
 ----------
 f : function
     Function to apply to each group
+engine : {'cython', 'numba'}, default 'cython'
+    With ``'numba'``, ``f`` is compiled with numba and applied to the
+    float64 values of each group of the numeric columns. Extra arguments
+    of ``f`` must then be positional.
+
+    .. versionadded:: 0.23.0
+engine_kwargs : dict, default None
+    The ``nopython``, ``nogil`` and ``parallel`` arguments passed to
+    ``numba.jit``. Only valid for the numba engine.
+
+    .. versionadded:: 0.23.0
 
 Notes
 -----
@@ -1052,6 +1065,55 @@ b  2""")
 
         return self._wrap_aggregated_output(output)
 
+    def _numba_agg_general(self, func, args, engine_kwargs, transform=False):
+        """
+        Aggregate or transform the float64 values of each group of the
+        numeric columns with the numba compiled ``func``. The groups are
+        made contiguous by sorting the values, the kernels then iterate
+        over the slices of the groups.
+        """
+        if self.axis != 0:
+            raise NotImplementedError("engine='numba' is only supported "
+                                      "with axis=0")
+        if transform:
+            kernel = numba_.generate_transform_kernel(func, engine_kwargs)
+        else:
+            kernel = numba_.generate_apply_kernel(func, engine_kwargs)
+
+        ids, _, ngroups = self.grouper.group_info
+        sorter = get_group_index_sorter(ids, ngroups)
+        sorted_ids = ids.take(sorter)
+        groups = np.arange(ngroups)
+        begin = sorted_ids.searchsorted(groups, side='left').astype(np.int64)
+        end = sorted_ids.searchsorted(groups, side='right').astype(np.int64)
+
+        obj = self._obj_with_exclusions
+        if obj.ndim == 1:
+            if not is_numeric_dtype(obj.dtype):
+                raise TypeError("engine='numba' requires numeric values")
+            columns = [obj.values]
+        else:
+            obj = obj._get_numeric_data()
+            columns = [obj.iloc[:, i].values for i in range(obj.shape[1])]
+            if not columns:
+                raise DataError('No numeric types to aggregate')
+
+        results = []
+        for values in columns:
+            values = _ensure_float64(values).take(sorter)
+            if transform:
+                result = np.empty(len(values))
+                result[sorter] = kernel(values, begin, end, *args)
+            else:
+                result = kernel(values, begin, end, 0, *args)
+            results.append(result)
+
+        index = obj.index if transform else self.grouper.result_index
+        if obj.ndim == 1:
+            return Series(results[0], index=index, name=obj.name)
+        return DataFrame(np.column_stack(results), index=index,
+                         columns=obj.columns)
+
     def _wrap_applied_output(self, *args, **kwargs):
         raise com.AbstractMethodError(self)
 
@@ -1911,6 +1973,27 @@ def _is_indexed_like(obj, axes):
     return False
 
 
+def _aggregate_columns_parallel(result, counts, values, comp_ids, agg_func,
+                                min_count, nthreads):
+    """
+    Run a 2-d cython aggregation kernel over column partitions of ``values``
+    on a thread pool. The kernels release the GIL and only write to their
+    own columns of ``result``; the group counts are identical for every
+    partition, so only the first one writes to ``counts``.
+    """
+    ncols = values.shape[1]
+    nchunks = min(nthreads, ncols)
+    bounds = np.linspace(0, ncols, nchunks + 1).astype(np.intp)
+
+    def _agg_chunk(i):
+        sl = slice(bounds[i], bounds[i + 1])
+        chunk_counts = counts if i == 0 else np.zeros_like(counts)
+        agg_func(result[:, sl], chunk_counts, values[:, sl], comp_ids,
+                 min_count)
+
+    com._thread_map(_agg_chunk, range(nchunks), nchunks)
+
+
 class BaseGrouper(object):
     """
     This is an internal Grouper class, which actually holds
@@ -2233,6 +2316,10 @@ class BaseGrouper(object):
     def _cython_operation(self, kind, values, how, axis, min_count=-1):
         assert kind in ['transform', 'aggregate']
 
+        if isinstance(values, ABCMaskedArray):
+            return self._masked_cython_operation(kind, values, how, axis,
+                                                 min_count=min_count)
+
         # can we do this operation with our cython functions
         # if not raise NotImplementedError
 
@@ -2357,6 +2444,59 @@ class BaseGrouper(object):
 
         return result, names
 
+    def _masked_cython_operation(self, kind, values, how, axis,
+                                 min_count=-1):
+        """
+        Aggregate an IntegerArray or BooleanArray, keeping its dtype for
+        min, max, first and last and returning Int64 for sum. The other
+        operations are computed on float64 values with NaN for the missing
+        values.
+        """
+        is_int = values._data.dtype.kind in ['i', 'b']
+        if kind != 'aggregate' or not is_int or \
+                how not in ['add', 'min', 'max', 'first', 'last']:
+            return self._cython_operation(kind, values.astype(np.float64),
+                                          how, axis, min_count=min_count)
+
+        data = values._data.astype(np.int64)[:, None]
+        mask = values._mask
+        labels, _, _ = self.group_info
+        counts = np.zeros(self.ngroups, dtype=np.int64)
+        result = np.empty((self.ngroups, 1), dtype=np.int64)
+
+        if how == 'add':
+            nobs = np.zeros((self.ngroups, 1), dtype=np.int64)
+            libgroupby.group_add_masked_int64(
+                result, counts, data, mask[:, None].view(np.uint8), labels,
+                nobs)
+            result_mask = nobs[:, 0] < max(min_count, 1)
+            if min_count <= 0:
+                # the sum of an empty group is 0
+                result_mask[:] = False
+        else:
+            # the int64 kernels use iNaT for the missing values
+            if (data[~mask] == iNaT).any():
+                return self._cython_operation(kind,
+                                              values.astype(np.float64),
+                                              how, axis, min_count=min_count)
+            data[mask] = iNaT
+            func, _ = self._get_cython_function(kind, how, data, True)
+            result = self._aggregate(result, counts, data, labels, func,
+                                     True, False, min_count)
+            result_mask = result[:, 0] == iNaT
+
+        result = result[:, 0]
+        if self._filter_empty_groups and not counts.all():
+            result = result[counts > 0]
+            result_mask = result_mask[counts > 0]
+
+        if how == 'add':
+            # sums are kept as Int64 so that narrow dtypes don't overflow,
+            # and the sum of booleans counts them
+            return IntegerArray._simple_new(result, result_mask), None
+        result = result.astype(values._data.dtype)
+        return type(values)._simple_new(result, result_mask), None
+
     def aggregate(self, values, how, axis=0, min_count=-1):
         return self._cython_operation('aggregate', values, how, axis,
                                       min_count=min_count)
@@ -2377,7 +2517,12 @@ class BaseGrouper(object):
                 agg_func(result[:, :, i], counts, chunk, comp_ids,
                          min_count)
         else:
-            agg_func(result, counts, values, comp_ids, min_count)
+            nthreads = get_option('compute.groupby_nthreads')
+            if is_numeric and nthreads > 1 and values.shape[1] > 1:
+                _aggregate_columns_parallel(result, counts, values, comp_ids,
+                                            agg_func, min_count, nthreads)
+            else:
+                agg_func(result, counts, values, comp_ids, min_count)
 
         return result
 
@@ -3181,6 +3326,11 @@ class SeriesGroupBy(GroupBy):
         versionadded=''))
     def aggregate(self, func_or_funcs, *args, **kwargs):
         _level = kwargs.pop('_level', None)
+        engine = kwargs.pop('engine', None)
+        engine_kwargs = kwargs.pop('engine_kwargs', None)
+        if numba_.validate_engine(engine, engine_kwargs, kwargs) == 'numba':
+            return self._numba_agg_general(func_or_funcs, args, engine_kwargs)
+
         if isinstance(func_or_funcs, compat.string_types):
             return getattr(self, func_or_funcs)(*args, **kwargs)
 
@@ -3340,6 +3490,12 @@ class SeriesGroupBy(GroupBy):
     @Substitution(klass='Series', selected='A.')
     @Appender(_transform_template)
     def transform(self, func, *args, **kwargs):
+        engine = kwargs.pop('engine', None)
+        engine_kwargs = kwargs.pop('engine_kwargs', None)
+        if numba_.validate_engine(engine, engine_kwargs, kwargs) == 'numba':
+            return self._numba_agg_general(func, args, engine_kwargs,
+                                           transform=True)
+
         func = self._is_cython_func(func) or func
 
         # if string function
@@ -3787,7 +3943,14 @@ class NDFrameGroupBy(GroupBy):
     def aggregate(self, arg, *args, **kwargs):
 
         _level = kwargs.pop('_level', None)
-        result, how = self._aggregate(arg, _level=_level, *args, **kwargs)
+        engine = kwargs.pop('engine', None)
+        engine_kwargs = kwargs.pop('engine_kwargs', None)
+        if numba_.validate_engine(engine, engine_kwargs, kwargs) == 'numba':
+            result = self._numba_agg_general(arg, args, engine_kwargs)
+            how = 'numba'
+        else:
+            result, how = self._aggregate(arg, _level=_level, *args,
+                                          **kwargs)
         if how is None:
             return result
 
@@ -4122,6 +4285,11 @@ class NDFrameGroupBy(GroupBy):
     @Substitution(klass='DataFrame', selected='')
     @Appender(_transform_template)
     def transform(self, func, *args, **kwargs):
+        engine = kwargs.pop('engine', None)
+        engine_kwargs = kwargs.pop('engine_kwargs', None)
+        if numba_.validate_engine(engine, engine_kwargs, kwargs) == 'numba':
+            return self._numba_agg_general(func, args, engine_kwargs,
+                                           transform=True)
 
         # optimized transforms
         func = self._is_cython_func(func) or func
@@ -1,5 +1,6 @@
 import warnings
 import copy
+import weakref
 from warnings import catch_warnings
 import inspect
 import itertools
@@ -17,7 +18,7 @@ from pandas.core.base import PandasObject
 
 from pandas.core.dtypes.dtypes import (
     ExtensionDtype, DatetimeTZDtype,
-    CategoricalDtype)
+    CategoricalDtype, StringDtype, IntegerDtype, _MaskedDtype)
 from pandas.core.dtypes.common import (
     _TD_DTYPE, _NS_DTYPE,
     _ensure_int64, _ensure_platform_int,
@@ -38,6 +39,7 @@ from pandas.core.dtypes.common import (
     is_re,
     is_re_compilable,
     is_scalar,
+    pandas_dtype,
     _get_dtype)
 from pandas.core.dtypes.cast import (
     maybe_downcast_to_dtype,
@@ -56,13 +58,15 @@ from pandas.core.dtypes.missing import (
     is_null_datelike_scalar)
 import pandas.core.dtypes.concat as _concat
 
-from pandas.core.dtypes.generic import ABCSeries, ABCDatetimeIndex
+from pandas.core.dtypes.generic import (ABCSeries, ABCDatetimeIndex,
+                                        ABCMaskedArray)
 import pandas.core.common as com
 import pandas.core.algorithms as algos
 
 from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import maybe_convert_indices, length_of_indexer
-from pandas.core.arrays import Categorical
+from pandas.core.arrays import (Categorical, StringArray, IntegerArray,
+                                BooleanArray)
 from pandas.core.indexes.datetimes import DatetimeIndex
 from pandas.core.indexes.timedeltas import TimedeltaIndex
 from pandas.io.formats.printing import pprint_thing
@@ -80,6 +84,50 @@ from pandas import compat
 from pandas.compat import range, map, zip, u
 
 
+# copy-on-write, set by the 'mode.copy_on_write' option
+_COPY_ON_WRITE = False
+
+
+def set_copy_on_write(v=True):
+    global _COPY_ON_WRITE
+    _COPY_ON_WRITE = v
+
+
+# consolidation copies the values of the blocks it merges; the overhead of
+# operating on a block is counted as the cost of copying this many values
+_BLOCK_OVERHEAD_SIZE = 100000
+
+
+class _BlockValuesRefs(object):
+    """
+    Copy-on-write bookkeeping of the blocks sharing one array of values.
+
+    The owners are blocks that are copies of each other: a deep copy shares
+    the values of the copied block instead of copying them. Views (a column
+    Series, a slice of rows) reference the group and their owner. Before
+    modifying its values in place, a block copies them if an owner other
+    than itself (or than the owner of a view) is alive. Blocks are
+    referenced weakly, so that values are no longer shared once the other
+    blocks are garbage collected.
+    """
+
+    def __init__(self, block):
+        self.owners = [weakref.ref(block)]
+
+    def live_owners(self):
+        owners = [ref() for ref in self.owners]
+        self.owners = [ref for ref, owner in zip(self.owners, owners)
+                       if owner is not None]
+        return [owner for owner in owners if owner is not None]
+
+    def add_owner(self, block):
+        self.live_owners()
+        self.owners.append(weakref.ref(block))
+
+    def remove_owner(self, block):
+        self.owners = [ref for ref in self.owners if ref() is not block]
+
+
 class Block(PandasObject):
     """
     Canonical n-dimensional unit of homogeneous dtype contained in a pandas
@@ -107,6 +155,11 @@ class Block(PandasObject):
     _ftype = 'dense'
     _concatenator = staticmethod(np.concatenate)
 
+    # copy-on-write: the _BlockValuesRefs of the shared values and, for a
+    # view, a weak reference to the block it is a view of
+    _refs = None
+    _owner = None
+
     def __init__(self, values, placement, ndim=None):
         self.ndim = self._check_ndim(values, ndim)
         self.mgr_locs = placement
@@ -305,6 +358,71 @@ class Block(PandasObject):
         """ return a slice of my values """
         return self.values[slicer]
 
+    @property
+    def _can_share_values(self):
+        """ whether copies share the values under copy-on-write """
+        return (_COPY_ON_WRITE and self._can_consolidate and
+                type(self.values) is np.ndarray)
+
+    @property
+    def is_shared(self):
+        """
+        Whether the values are shared with another copy (copy-on-write);
+        they must then be copied before modifying them in place
+        """
+        refs = self._refs
+        if refs is None:
+            return False
+        owner = self if self._owner is None else self._owner()
+        return any(block is not owner for block in refs.live_owners())
+
+    @property
+    def _is_read_only(self):
+        """ whether the values are read-only, e.g. from a zero-copy read """
+        values = self.values
+        return isinstance(values, np.ndarray) and not values.flags.writeable
+
+    def _ensure_own_values(self):
+        """
+        copy the values if they are shared or read-only, before modifying
+        them
+        """
+        if self.is_shared:
+            if self._owner is None:
+                self._refs.remove_owner(self)
+            self._refs = None
+            self._owner = None
+            self.values = self.values.copy()
+        elif self._is_read_only:
+            self.values = self.values.copy()
+
+    def _track_copy(self, block):
+        """ register block, a copy sharing our values, as an owner """
+        if self._refs is None:
+            self._refs = _BlockValuesRefs(self)
+        self._refs.add_owner(block)
+        block._refs = self._refs
+        block._owner = None
+        return block
+
+    def _track_view(self, block):
+        """ register block as a view of our values """
+        if self._refs is None:
+            self._refs = _BlockValuesRefs(self)
+        block._refs = self._refs
+        block._owner = (self._owner if self._owner is not None
+                        else weakref.ref(self))
+        return block
+
+    def _take_shared(self, slicer, new_mgr_locs):
+        """
+        A copy of the items in slicer that shares our values until either
+        is modified (copy-on-write)
+        """
+        block = self.make_block_same_class(self._slice(slicer),
+                                           new_mgr_locs)
+        return self._track_copy(block)
+
     def reshape_nd(self, labels, shape, ref_items, mgr=None):
         """
         Parameters
@@ -337,7 +455,10 @@ class Block(PandasObject):
         if self._validate_ndim and new_values.ndim != self.ndim:
             raise ValueError("Only same dim slicing is allowed")
 
-        return self.make_block_same_class(new_values, new_mgr_locs)
+        block = self.make_block_same_class(new_values, new_mgr_locs)
+        if self._can_share_values:
+            self._track_view(block)
+        return block
 
     @property
     def shape(self):
@@ -374,6 +495,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._ensure_own_values()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -625,6 +747,17 @@ class Block(PandasObject):
 
             return self.make_block(Categorical(self.values, dtype=dtype))
 
+        # may need to convert to a masked or string array
+        try:
+            array_dtype = pandas_dtype(dtype)
+        except TypeError:
+            array_dtype = None
+        if isinstance(array_dtype, (StringDtype, _MaskedDtype)):
+            if is_dtype_equal(self.dtype, array_dtype):
+                return self.copy() if copy else self
+            if not is_extension_array_dtype(self.values):
+                return self._astype_array(array_dtype, values=values)
+
         # astype processing
         dtype = np.dtype(dtype)
         if self.dtype == dtype:
@@ -675,6 +808,30 @@ class Block(PandasObject):
                         newb_size=newb.itemsize))
         return newb
 
+    def _astype_array(self, dtype, values=None):
+        """
+        Convert to a StringArray, IntegerArray or BooleanArray, as one block
+        per column
+        """
+        if values is None:
+            values = self.values
+
+        def to_array(column):
+            if isinstance(dtype, StringDtype):
+                if not self.is_object:
+                    column = np.where(isna(column), None,
+                                      column.astype(compat.text_type))
+                return StringArray(column)
+            elif isinstance(dtype, IntegerDtype):
+                return IntegerArray(column, dtype=dtype)
+            return BooleanArray(column)
+
+        if self.ndim == 1:
+            return make_block(to_array(values), placement=self.mgr_locs,
+                              ndim=1)
+        return [make_block(to_array(column), placement=[loc], ndim=2)
+                for loc, column in zip(self.mgr_locs.as_array, values)]
+
     def convert(self, copy=True, **kwargs):
         """ attempt to coerce any object types to better types return a copy
         of the block (if copy = True) by definition we are not an ObjectBlock
@@ -767,9 +924,16 @@ class Block(PandasObject):
     def copy(self, deep=True, mgr=None):
         """ copy constructor """
         values = self.values
+        if not self._can_share_values:
+            if deep:
+                values = values.copy()
+            return self.make_block_same_class(values)
+
+        # copy-on-write: the values are copied when either is modified
+        block = self.make_block_same_class(values)
         if deep:
-            values = values.copy()
-        return self.make_block_same_class(values)
+            return self._track_copy(block)
+        return self._track_view(block)
 
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False, convert=True, mgr=None):
@@ -822,6 +986,7 @@ class Block(PandasObject):
                 value = np.nan
 
         # coerce if block dtype can store value
+        self._ensure_own_values()
         values = self.values
         try:
             values, _, value, _ = self._try_coerce_args(values, value)
@@ -961,11 +1126,16 @@ class Block(PandasObject):
         a list of new blocks, the result of the putmask
         """
 
-        new_values = self.values if inplace else self.values.copy()
-
         new = getattr(new, 'values', new)
         mask = getattr(mask, 'values', mask)
 
+        if inplace:
+            self._ensure_own_values()
+        elif self._can_share_values and not np.any(mask):
+            # nothing to set, share the values until they are modified
+            return [self.copy()]
+        new_values = self.values if inplace else self.values.copy()
+
         # if we are passed a scalar None, convert it here
         if not is_list_like(new) and isna(new) and not self.is_object:
             new = self.fill_value
@@ -1178,6 +1348,8 @@ class Block(PandasObject):
                 else:
                     return [self.copy()]
 
+        if inplace:
+            self._ensure_own_values()
         values = self.values if inplace else self.values.copy()
         values, _, fill_value, _ = self._try_coerce_args(values, fill_value)
         values = missing.interpolate_2d(values, method=method, axis=axis,
@@ -1195,6 +1367,8 @@ class Block(PandasObject):
         """ interpolate using scipy wrappers """
 
         inplace = validate_bool_kwarg(inplace, 'inplace')
+        if inplace:
+            self._ensure_own_values()
         data = self.values if inplace else self.values.copy()
 
         # only deal with floats
@@ -2289,6 +2463,7 @@ class ObjectBlock(Block):
                     return
             except:
                 pass
+        self._ensure_own_values()
         try:
             self.values[locs] = values
         except (ValueError):
@@ -2414,6 +2589,8 @@ class ObjectBlock(Block):
                                                     filter=filter, regex=regex,
                                                     mgr=mgr)
 
+        if inplace:
+            self._ensure_own_values()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -2702,6 +2879,7 @@ class DatetimeBlock(DatetimeLikeBlockMixin, Block):
             # Workaround for numpy 1.6 bug
             values = conversion.ensure_datetime64ns(values)
 
+        self._ensure_own_values()
         self.values[locs] = values
 
 
@@ -3058,6 +3236,9 @@ def get_block_type(values, dtype=None):
 
     if is_sparse(values):
         cls = SparseBlock
+    elif isinstance(values, ABCMaskedArray):
+        # before the numpy checks, the dtype has a numpy scalar type
+        cls = ExtensionBlock
     elif issubclass(vtype, np.floating):
         cls = FloatBlock
     elif issubclass(vtype, np.timedelta64):
@@ -3426,7 +3607,7 @@ class BlockManager(PandasObject):
                 kwargs['filter'] = filter_locs
 
         if consolidate:
-            self._consolidate_inplace()
+            self._maybe_consolidate_inplace()
 
         if f == 'where':
             align_copy = True
@@ -3477,7 +3658,7 @@ class BlockManager(PandasObject):
             return self.make_empty(axes or self.axes)
         bm = self.__class__(result_blocks, axes or self.axes,
                             do_integrity_check=do_integrity_check)
-        bm._consolidate_inplace()
+        bm._maybe_consolidate_inplace()
         return bm
 
     def reduction(self, f, axis=0, consolidate=True, transposed=False,
@@ -3503,7 +3684,7 @@ class BlockManager(PandasObject):
         """
 
         if consolidate:
-            self._consolidate_inplace()
+            self._maybe_consolidate_inplace()
 
         axes, blocks = [], []
         for b in self.blocks:
@@ -3678,22 +3859,30 @@ class BlockManager(PandasObject):
         self._is_consolidated = len(ftypes) == len(set(ftypes))
         self._known_consolidated = True
 
+    def _nblocks_consolidated(self):
+        """ the number of blocks once consolidated, without consolidating """
+        if self.is_consolidated():
+            return len(self.blocks)
+        keys = set(blk._consolidate_key for blk in self.blocks
+                   if blk._can_consolidate)
+        return len(keys) + sum(not blk._can_consolidate
+                               for blk in self.blocks)
+
     @property
     def is_mixed_type(self):
-        # Warning, consolidation needs to get checked upstairs
+        if self._nblocks_consolidated() > 1:
+            return True
+        # callers take the single block path, e.g. unpacking
+        # ``blk, = mgr.blocks``, so the blocks of one dtype are merged
         self._consolidate_inplace()
-        return len(self.blocks) > 1
+        return False
 
     @property
     def is_numeric_mixed_type(self):
-        # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
         return all(block.is_numeric for block in self.blocks)
 
     @property
     def is_datelike_mixed_type(self):
-        # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
         return any(block.is_datelike for block in self.blocks)
 
     @property
@@ -3711,6 +3900,24 @@ class BlockManager(PandasObject):
 
         return False
 
+    @property
+    def is_shared(self):
+        """ whether a block shares its values with a copy (copy-on-write) """
+        return any(blk.is_shared for blk in self.blocks)
+
+    @property
+    def _is_read_only(self):
+        """ whether a block has read-only values """
+        return any(blk._is_read_only for blk in self.blocks)
+
+    def _ensure_own_values(self):
+        """
+        copy the shared or read-only values of the blocks before modifying
+        them
+        """
+        for blk in self.blocks:
+            blk._ensure_own_values()
+
     def get_bool_data(self, copy=False):
         """
         Parameters
@@ -3831,6 +4038,8 @@ class BlockManager(PandasObject):
             mgr = self
 
         if self._is_single_block or not self.is_mixed_type:
+            # a single dtype, the values of the consolidated block
+            mgr._consolidate_inplace()
             arr = mgr.blocks[0].get_values()
         else:
             arr = mgr._interleave()
@@ -3946,7 +4155,11 @@ class BlockManager(PandasObject):
         single block
         """
         if len(self.blocks) == 1:
-            return self.blocks[0].iget((slice(None), loc))
+            values = self.blocks[0].iget((slice(None), loc))
+            if self.blocks[0]._can_share_values:
+                # copy-on-write: the cross section is not tracked
+                values = values.copy()
+            return values
 
         items = self.items
 
@@ -3992,6 +4205,30 @@ class BlockManager(PandasObject):
             self._known_consolidated = True
             self._rebuild_blknos_and_blklocs()
 
+    def _should_consolidate(self):
+        """
+        Whether consolidating pays off: it copies the values of the blocks
+        it merges, which is worth it when the overhead of operating on the
+        blocks it saves is larger (wide frames with few rows). Tall frames
+        keep their blocks separate.
+        """
+        if self.is_consolidated():
+            return False
+        counts, sizes = {}, {}
+        for blk in self.blocks:
+            if blk._can_consolidate:
+                key = blk._consolidate_key
+                counts[key] = counts.get(key, 0) + 1
+                sizes[key] = sizes.get(key, 0) + blk.values.size
+        merged = sum(count - 1 for count in counts.values())
+        size = sum(sizes[key] for key, count in compat.iteritems(counts)
+                   if count > 1)
+        return merged * _BLOCK_OVERHEAD_SIZE >= size
+
+    def _maybe_consolidate_inplace(self):
+        if self._should_consolidate():
+            self._consolidate_inplace()
+
     def get(self, item, fastpath=True):
         """
         Return values for selected item (ndarray or BlockManager).
@@ -4033,11 +4270,11 @@ class BlockManager(PandasObject):
             return values
 
         # fastpath shortcut for select a single-dim from a 2-dim BM
-        return SingleBlockManager(
-            [block.make_block_same_class(values,
-                                         placement=slice(0, len(values)),
-                                         ndim=1)],
-            self.axes[1])
+        new_block = block.make_block_same_class(
+            values, placement=slice(0, len(values)), ndim=1)
+        if block._can_share_values:
+            block._track_view(new_block)
+        return SingleBlockManager([new_block], self.axes[1])
 
     def get_scalar(self, tup):
         """
@@ -4101,7 +4338,8 @@ class BlockManager(PandasObject):
         # FIXME: refactor, clearly separate broadcasting & zip-like assignment
         #        can prob also fix the various if tests for sparse/categorical
 
-        value_is_extension_type = is_extension_type(value)
+        value_is_extension_type = (is_extension_type(value) or
+                                   is_extension_array_dtype(value))
 
         # categorical/spares/datetimetz
         if value_is_extension_type:
@@ -4254,7 +4492,10 @@ class BlockManager(PandasObject):
 
         self._known_consolidated = False
 
-        if len(self.blocks) > 100:
+        # consolidate when the frame has grown by half since the last
+        # consolidation, so that inserting items one at a time copies each
+        # of them a constant number of times
+        if len(self.blocks) > max(100, len(self.items) // 2):
             self._consolidate_inplace()
 
     def reindex_axis(self, new_index, axis, method=None, limit=None,
@@ -4291,7 +4532,7 @@ class BlockManager(PandasObject):
             result.axes[axis] = new_axis
             return result
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # some axes don't allow reindexing with dups
         if not allow_dups:
@@ -4380,9 +4621,17 @@ class BlockManager(PandasObject):
                         blocks.append(newblk)
 
                 else:
-                    blocks.append(blk.take_nd(blklocs[mgr_locs.indexer],
-                                              axis=0, new_mgr_locs=mgr_locs,
-                                              fill_tuple=None))
+                    taker = blklocs[mgr_locs.indexer]
+                    if blk._can_share_values:
+                        # copy-on-write: share a slice of the values
+                        taker = lib.maybe_indices_to_slice(
+                            _ensure_int64(taker), len(blk.mgr_locs))
+                    if isinstance(taker, slice):
+                        blocks.append(blk._take_shared(taker, mgr_locs))
+                    else:
+                        blocks.append(blk.take_nd(taker, axis=0,
+                                                  new_mgr_locs=mgr_locs,
+                                                  fill_tuple=None))
 
         return blocks
 
@@ -4587,8 +4836,12 @@ class SingleBlockManager(BlockManager):
         if axis >= self.ndim:
             raise IndexError("Requested axis not found in manager")
 
-        return self.__class__(self._block._slice(slobj),
-                              self.index[slobj], fastpath=True)
+        block = self._block
+        new_mgr = self.__class__(block._slice(slobj), self.index[slobj],
+                                 fastpath=True)
+        if block._can_share_values:
+            block._track_view(new_mgr._block)
+        return new_mgr
 
     @property
     def index(self):
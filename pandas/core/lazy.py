@@ -0,0 +1,1111 @@
+"""
+Lazy DataFrame pipelines
+
+A ``LazyFrame`` records the operations of a pipeline (selections, filters,
+new columns, sorting, groupby aggregations, merges) into a logical plan
+instead of materializing every intermediate frame. ``collect`` first
+rewrites the plan:
+
+- consecutive filters are fused into a single mask
+- predicates are pushed below projections, new columns and sorts, into the
+  source
+- only the columns needed downstream are kept, and are read from the source
+- ``head`` is pushed into the source when nothing in between drops rows
+
+and then executes it with the regular eager operations. Sub-expressions
+and sub-plans that occur more than once are computed once.
+
+When the source is a file (``LazyFrame.from_csv``, ``from_parquet``,
+``from_hdf``), the needed columns are passed to the reader as ``usecols`` /
+``columns``, and simple comparisons on the data columns of an HDF table
+are passed as ``where``.
+"""
+
+import operator
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import PY36
+from pandas.core.dtypes.common import is_list_like, is_scalar
+from pandas.core.dtypes.missing import isna
+from pandas.core.index import Index
+import pandas.core.common as com
+
+
+# ----------------------------------------------------------------------
+# Expressions
+
+class Expr(object):
+    """
+    An elementwise expression over the columns of a ``LazyFrame``, built
+    from ``lf['a']`` or ``lf.a`` with the arithmetic, comparison and
+    logical operators. Used as a filter (``lf[lf.a > 0]``) or as a new
+    column (``lf.assign(c=lf.a + lf.b)``).
+    """
+
+    def columns(self):
+        """ The names of the columns referenced by the expression """
+        raise com.AbstractMethodError(self)
+
+    def key(self):
+        """ A hashable key, equal for structurally identical expressions """
+        raise com.AbstractMethodError(self)
+
+    def _evaluate(self, frame, cache):
+        raise com.AbstractMethodError(self)
+
+    def evaluate(self, frame, cache=None):
+        """
+        Evaluate the expression on ``frame``. Sub-expressions that occur
+        more than once are evaluated once per ``cache``.
+        """
+        if cache is None:
+            cache = {}
+        key = self.key()
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = self._evaluate(frame, cache)
+            return result
+        except TypeError:
+            # unhashable literal
+            return self._evaluate(frame, cache)
+
+    def to_where(self, data_columns):
+        """
+        Render the expression as an HDFStore ``where`` term, or return None
+        if it references other columns than ``data_columns`` or cannot be
+        expressed as a term.
+        """
+        return None
+
+    @property
+    def is_rowwise(self):
+        """ Whether each result row only depends on the same input row """
+        return True
+
+    def isin(self, values):
+        return _IsIn(self, values)
+
+    def isna(self):
+        return _UnaryOp('isna', self)
+
+    def notna(self):
+        return _UnaryOp('notna', self)
+
+    def __invert__(self):
+        return _UnaryOp('invert', self)
+
+    def __neg__(self):
+        return _UnaryOp('neg', self)
+
+    def __abs__(self):
+        return _UnaryOp('abs', self)
+
+    def __nonzero__(self):
+        raise TypeError("the truth value of a lazy expression is ambiguous, "
+                        "use '&' and '|' to combine conditions")
+
+    __bool__ = __nonzero__
+
+    # __eq__ is an expression
+    __hash__ = None
+
+    def __repr__(self):
+        return self._describe()
+
+
+def _add_binary_op(name, symbol, op, reverse=False):
+    def method(self, other):
+        other = _as_expr(other)
+        if reverse:
+            return _BinOp(symbol, op, other, self)
+        return _BinOp(symbol, op, self, other)
+    method.__name__ = ('__r%s__' if reverse else '__%s__') % name
+    return method
+
+
+_comparison_ops = {'eq': ('==', operator.eq), 'ne': ('!=', operator.ne),
+                   'lt': ('<', operator.lt), 'le': ('<=', operator.le),
+                   'gt': ('>', operator.gt), 'ge': ('>=', operator.ge)}
+_arithmetic_ops = {'add': ('+', operator.add), 'sub': ('-', operator.sub),
+                   'mul': ('*', operator.mul),
+                   'truediv': ('/', operator.truediv),
+                   'floordiv': ('//', operator.floordiv),
+                   'mod': ('%', operator.mod), 'pow': ('**', operator.pow)}
+_logical_ops = {'and': ('&', operator.and_), 'or': ('|', operator.or_),
+                'xor': ('^', operator.xor)}
+
+for _name, (_symbol, _op) in compat.iteritems(_comparison_ops):
+    setattr(Expr, '__%s__' % _name, _add_binary_op(_name, _symbol, _op))
+for _ops in [_arithmetic_ops, _logical_ops]:
+    for _name, (_symbol, _op) in compat.iteritems(_ops):
+        setattr(Expr, '__%s__' % _name, _add_binary_op(_name, _symbol, _op))
+        setattr(Expr, '__r%s__' % _name,
+                _add_binary_op(_name, _symbol, _op, reverse=True))
+if not compat.PY3:
+    Expr.__div__ = Expr.__truediv__
+    Expr.__rdiv__ = Expr.__rtruediv__
+
+
+class _Col(Expr):
+
+    def __init__(self, name):
+        self.name = name
+
+    def columns(self):
+        return [self.name]
+
+    def key(self):
+        return ('col', self.name)
+
+    def _evaluate(self, frame, cache):
+        return frame[self.name]
+
+    def to_where(self, data_columns):
+        if self.name in data_columns and \
+                isinstance(self.name, compat.string_types):
+            return self.name
+        return None
+
+    def _describe(self):
+        return 'col(%r)' % (self.name,)
+
+
+class _Lit(Expr):
+
+    def __init__(self, value):
+        self.value = value
+
+    def columns(self):
+        return []
+
+    def key(self):
+        if is_scalar(self.value):
+            return ('lit', type(self.value), self.value)
+        return ('lit', id(self.value))
+
+    def _evaluate(self, frame, cache):
+        return self.value
+
+    def to_where(self, data_columns):
+        if isinstance(self.value, (bool, np.bool_)) or isna(self.value):
+            return None
+        if isinstance(self.value, (compat.string_types, float) +
+                      compat.integer_types):
+            return repr(self.value)
+        return None
+
+    @property
+    def is_rowwise(self):
+        return is_scalar(self.value)
+
+    def _describe(self):
+        return repr(self.value)
+
+
+class _UnaryOp(Expr):
+
+    def __init__(self, name, operand):
+        self.name = name
+        self.operand = operand
+
+    def columns(self):
+        return self.operand.columns()
+
+    def key(self):
+        return (self.name, self.operand.key())
+
+    def _evaluate(self, frame, cache):
+        value = self.operand.evaluate(frame, cache)
+        if self.name == 'isna':
+            return isna(value)
+        elif self.name == 'notna':
+            return ~isna(value)
+        elif self.name == 'invert':
+            return ~value
+        elif self.name == 'neg':
+            return -value
+        return abs(value)
+
+    @property
+    def is_rowwise(self):
+        return self.operand.is_rowwise
+
+    def _describe(self):
+        if self.name in ['isna', 'notna']:
+            return '%r.%s()' % (self.operand, self.name)
+        symbol = {'invert': '~', 'neg': '-', 'abs': 'abs'}[self.name]
+        return '%s(%r)' % (symbol, self.operand)
+
+
+class _BinOp(Expr):
+
+    def __init__(self, symbol, op, left, right):
+        self.symbol = symbol
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def columns(self):
+        return _unique(self.left.columns() + self.right.columns())
+
+    def key(self):
+        return (self.symbol, self.left.key(), self.right.key())
+
+    def _evaluate(self, frame, cache):
+        return self.op(self.left.evaluate(frame, cache),
+                       self.right.evaluate(frame, cache))
+
+    def to_where(self, data_columns):
+        if self.symbol not in ['==', '!=', '<', '<=', '>', '>=', '&', '|']:
+            return None
+        left = self.left.to_where(data_columns)
+        right = self.right.to_where(data_columns)
+        if left is None or right is None:
+            return None
+        return '(%s %s %s)' % (left, self.symbol, right)
+
+    @property
+    def is_rowwise(self):
+        return self.left.is_rowwise and self.right.is_rowwise
+
+    def _describe(self):
+        return '(%r %s %r)' % (self.left, self.symbol, self.right)
+
+
+class _IsIn(Expr):
+
+    def __init__(self, operand, values):
+        self.operand = operand
+        self.values = list(values)
+
+    def columns(self):
+        return self.operand.columns()
+
+    def key(self):
+        return ('isin', self.operand.key(), id(self.values))
+
+    def _evaluate(self, frame, cache):
+        return self.operand.evaluate(frame, cache).isin(self.values)
+
+    @property
+    def is_rowwise(self):
+        return self.operand.is_rowwise
+
+    def _describe(self):
+        return '%r.isin(%r)' % (self.operand, self.values)
+
+
+def _as_expr(value):
+    if isinstance(value, Expr):
+        return value
+    return _Lit(value)
+
+
+def col(name):
+    """
+    Reference the column ``name`` in a ``LazyFrame`` expression, e.g.
+    ``lf[col('a') > 0]``.
+    """
+    return _Col(name)
+
+
+def _unique(values):
+    seen = set()
+    result = []
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            result.append(value)
+    return result
+
+
+def _grouper_key(by):
+    """
+    Key the groupers of an aggregation: labels by value, arrays, Series and
+    functions by identity (the node keeps a reference to them, so that the
+    id is not reused while the plan is alive)
+    """
+    if isinstance(by, list):
+        return tuple(_grouper_key(b) for b in by)
+    if is_scalar(by):
+        return repr(by)
+    return ('id', id(by))
+
+
+def _conjuncts(expr):
+    """ Split an expression into the terms of its top-level ``&`` """
+    if isinstance(expr, _BinOp) and expr.symbol == '&':
+        return _conjuncts(expr.left) + _conjuncts(expr.right)
+    return [expr]
+
+
+def _predicate_columns(predicate):
+    return _unique([c for expr in predicate for c in expr.columns()])
+
+
+def _as_bool_mask(result, length):
+    """ The boolean ndarray of a predicate, missing values are False """
+    if is_scalar(result):
+        return np.repeat(bool(result), length)
+    values = np.asarray(getattr(result, 'values', result))
+    if values.dtype == np.object_:
+        values = np.where(isna(values), False, values)
+    return values.astype(bool)
+
+
+def _evaluate_mask(frame, predicate, cache=None):
+    if cache is None:
+        cache = {}
+    mask = None
+    for expr in predicate:
+        result = _as_bool_mask(expr.evaluate(frame, cache), len(frame))
+        mask = result if mask is None else mask & result
+    return mask
+
+
+def _take(frame, mask=None, columns=None):
+    """
+    Select the rows where ``mask`` is True and the ``columns`` of
+    ``frame``, copying the selected columns once.
+    """
+    if columns is not None and list(frame.columns) != list(columns):
+        indexer = frame.columns.get_indexer(columns)
+        if (indexer == -1).any():
+            missing = [c for c, i in zip(columns, indexer) if i == -1]
+            raise KeyError('%s not in index' % missing)
+        # select the columns first, so that only these rows are taken
+        frame = frame._reindex_with_indexers(
+            {1: [Index(columns), indexer]}, copy=mask is None,
+            allow_dups=True)
+    if mask is not None:
+        indexer = mask.nonzero()[0]
+        frame = frame._reindex_with_indexers(
+            {0: [frame.index.take(indexer), indexer]}, copy=True,
+            allow_dups=True)
+    return frame
+
+
+# ----------------------------------------------------------------------
+# Logical plan
+
+class _Node(object):
+    """ A node of the logical plan; nodes are immutable """
+
+    children = ()
+
+    def key(self):
+        raise com.AbstractMethodError(self)
+
+    def _describe(self):
+        raise com.AbstractMethodError(self)
+
+    def explain(self, indent=0):
+        lines = ['  ' * indent + self._describe()]
+        for child in self.children:
+            lines.append(child.explain(indent + 1))
+        return '\n'.join(lines)
+
+
+def _describe_predicate(predicate):
+    return ' & '.join(repr(expr) for expr in predicate)
+
+
+class _Scan(_Node):
+    """
+    Read the source. ``columns``, ``predicate`` and ``limit`` are pushed
+    down by the optimizer.
+    """
+
+    def __init__(self, kind, source, kwargs=None, columns=None,
+                 predicate=(), limit=None):
+        self.kind = kind
+        self.source = source
+        self.kwargs = kwargs or {}
+        self.columns = columns
+        self.predicate = tuple(predicate)
+        self.limit = limit
+
+    def replace(self, **kwargs):
+        attrs = dict(kind=self.kind, source=self.source, kwargs=self.kwargs,
+                     columns=self.columns, predicate=self.predicate,
+                     limit=self.limit)
+        attrs.update(kwargs)
+        return _Scan(**attrs)
+
+    def key(self):
+        source = id(self.source) if self.kind == 'frame' else self.source
+        columns = None if self.columns is None else tuple(self.columns)
+        return ('scan', self.kind, source,
+                repr(sorted(self.kwargs.items())), columns,
+                tuple(expr.key() for expr in self.predicate), self.limit)
+
+    def _describe(self):
+        if self.kind == 'frame':
+            desc = 'Scan DataFrame'
+        else:
+            desc = 'Scan %s %r' % (self.kind, self.source)
+        if self.columns is not None:
+            desc += ' columns=%r' % (list(self.columns),)
+        if self.predicate:
+            desc += ' predicate=%s' % _describe_predicate(self.predicate)
+        if self.limit is not None:
+            desc += ' limit=%d' % self.limit
+        return desc
+
+
+class _Project(_Node):
+
+    def __init__(self, child, columns):
+        self.children = (child,)
+        self.columns = list(columns)
+
+    def key(self):
+        return ('project', self.children[0].key(), tuple(self.columns))
+
+    def _describe(self):
+        return 'Project %r' % (self.columns,)
+
+
+class _Filter(_Node):
+
+    def __init__(self, child, predicate):
+        self.children = (child,)
+        self.predicate = tuple(predicate)
+
+    def key(self):
+        return ('filter', self.children[0].key(),
+                tuple(expr.key() for expr in self.predicate))
+
+    def _describe(self):
+        return 'Filter %s' % _describe_predicate(self.predicate)
+
+
+class _Assign(_Node):
+    """
+    New columns, all computed on the child frame as ``DataFrame.assign``.
+    Values that are not row-wise expressions (callables, arrays) are opaque
+    to the optimizer.
+    """
+
+    def __init__(self, child, items):
+        self.children = (child,)
+        self.items = list(items)
+
+    @property
+    def names(self):
+        return [name for name, _ in self.items]
+
+    @property
+    def is_rowwise(self):
+        return all(isinstance(value, Expr) and value.is_rowwise
+                   for _, value in self.items)
+
+    def key(self):
+        return ('assign', self.children[0].key(),
+                tuple((name, value.key() if isinstance(value, Expr)
+                       else id(value)) for name, value in self.items))
+
+    def _describe(self):
+        return 'Assign %s' % ', '.join('%s=%r' % item for item in self.items)
+
+
+class _Sort(_Node):
+
+    def __init__(self, child, by, kwargs):
+        self.children = (child,)
+        self.by = by if is_list_like(by) else [by]
+        self.kwargs = kwargs
+
+    def key(self):
+        return ('sort', self.children[0].key(), tuple(self.by),
+                repr(sorted(self.kwargs.items())))
+
+    def _describe(self):
+        return 'Sort by=%r' % (self.by,)
+
+
+class _Head(_Node):
+
+    def __init__(self, child, n):
+        self.children = (child,)
+        self.n = n
+
+    def key(self):
+        return ('head', self.children[0].key(), self.n)
+
+    def _describe(self):
+        return 'Head %d' % self.n
+
+
+class _Aggregate(_Node):
+    """
+    ``frame.groupby(by, **kwargs)[selection].<how>(*args)``, ``how`` being
+    'agg' or the name of a reduction such as 'sum'.
+    """
+
+    def __init__(self, child, by, kwargs, selection, how, args):
+        self.children = (child,)
+        self.by = by
+        self.kwargs = kwargs
+        self.selection = selection
+        self.how = how
+        self.args = args
+
+    @property
+    def by_columns(self):
+        """ The grouping columns, or None if not grouping by labels """
+        by = self.by if isinstance(self.by, list) else [self.by]
+        if all(is_scalar(b) and not callable(b) for b in by):
+            return by
+        return None
+
+    def input_columns(self, required):
+        """ The columns of the child needed for ``required`` output """
+        by = self.by_columns
+        if by is None:
+            return None
+        if self.selection is not None:
+            values = (self.selection if isinstance(self.selection, list)
+                      else [self.selection])
+        elif self.how == 'agg' and isinstance(self.args[0], dict):
+            values = list(self.args[0])
+        elif self.how == 'agg' and is_list_like(self.args[0]):
+            # the output columns are (column, function) pairs
+            return None
+        elif required is not None:
+            values = list(required)
+        else:
+            return None
+        return _unique(by + values)
+
+    def key(self):
+        return ('aggregate', self.children[0].key(), _grouper_key(self.by),
+                repr(sorted(self.kwargs.items())), repr(self.selection),
+                self.how, repr(self.args))
+
+    def _describe(self):
+        desc = 'Aggregate by=%r %s' % (self.by, self.how)
+        if self.selection is not None:
+            desc += ' %r' % (self.selection,)
+        return desc
+
+
+class _Merge(_Node):
+
+    def __init__(self, left, right, kwargs):
+        self.children = (left, right)
+        self.kwargs = kwargs
+
+    def key(self):
+        return ('merge', self.children[0].key(), self.children[1].key(),
+                repr(sorted(self.kwargs.items())))
+
+    def _describe(self):
+        return 'Merge %s' % ', '.join('%s=%r' % item for item in
+                                      sorted(self.kwargs.items()))
+
+
+def _replace_children(node, children):
+    new = object.__new__(type(node))
+    new.__dict__.update(node.__dict__)
+    new.children = tuple(children)
+    return new
+
+
+# ----------------------------------------------------------------------
+# Optimizer
+
+def _push_predicates(node, predicate=()):
+    """
+    Fuse the filters and push their conjuncts as far down as possible:
+    through projections and sorts, through new columns they do not
+    reference, and into the source.
+    """
+    def wrap(node, predicate):
+        return _Filter(node, predicate) if predicate else node
+
+    if isinstance(node, _Filter):
+        terms = [c for expr in node.predicate for c in _conjuncts(expr)]
+        return _push_predicates(node.children[0], tuple(predicate) +
+                                tuple(terms))
+    elif isinstance(node, _Scan):
+        if not predicate:
+            return node
+        return node.replace(predicate=node.predicate + tuple(predicate))
+    elif isinstance(node, (_Project, _Sort)):
+        # filtering commutes with selecting columns and sorting
+        child = _push_predicates(node.children[0], predicate)
+        return _replace_children(node, [child])
+    elif isinstance(node, _Assign):
+        if node.is_rowwise:
+            names = set(node.names)
+            down = [expr for expr in predicate
+                    if not names.intersection(expr.columns())]
+            stay = [expr for expr in predicate
+                    if names.intersection(expr.columns())]
+        else:
+            down, stay = [], list(predicate)
+        child = _push_predicates(node.children[0], down)
+        return wrap(_replace_children(node, [child]), stay)
+
+    # the rows of the child of head, aggregations and merges differ
+    children = [_push_predicates(child) for child in node.children]
+    return wrap(_replace_children(node, children), predicate)
+
+
+def _prune_columns(node, required=None):
+    """
+    Keep only the columns that are ``required`` downstream (None for all of
+    them), narrowing projections, dropping unused new columns and reading
+    only the needed columns from the source.
+    """
+    if isinstance(node, _Scan):
+        if required is None:
+            return node
+        return node.replace(columns=list(required))
+
+    elif isinstance(node, _Project):
+        columns = node.columns
+        if required is not None:
+            columns = [c for c in columns if c in set(required)]
+        child = _prune_columns(node.children[0], columns)
+        if isinstance(child, _Project) and child.columns == columns:
+            return child
+        return _Project(child, columns)
+
+    elif isinstance(node, (_Filter, _Sort)):
+        if required is None:
+            child_required = None
+        elif isinstance(node, _Filter):
+            child_required = _unique(list(required) +
+                                     _predicate_columns(node.predicate))
+        else:
+            child_required = _unique(list(required) + node.by)
+        child = _prune_columns(node.children[0], child_required)
+        node = _replace_children(node, [child])
+        if required is not None and len(child_required) > len(required):
+            # drop the columns only used by the predicate or sort
+            node = _Project(node, required)
+        return node
+
+    elif isinstance(node, _Assign):
+        items = node.items
+        if required is not None:
+            items = [(name, value) for name, value in items
+                     if name in set(required)]
+            if not items:
+                return _prune_columns(node.children[0], required)
+        node = _Assign(node.children[0], items)
+        if required is None or not node.is_rowwise:
+            child_required = None
+        else:
+            names = set(node.names)
+            child_required = _unique(
+                [c for c in required if c not in names] +
+                [c for _, value in items for c in value.columns()])
+        child = _prune_columns(node.children[0], child_required)
+        return _replace_children(node, [child])
+
+    elif isinstance(node, _Head):
+        child = _prune_columns(node.children[0], required)
+        return _replace_children(node, [child])
+
+    elif isinstance(node, _Aggregate):
+        child = _prune_columns(node.children[0],
+                               node.input_columns(required))
+        return _replace_children(node, [child])
+
+    children = [_prune_columns(child) for child in node.children]
+    return _replace_children(node, children)
+
+
+def _push_limit(node, limit=None):
+    """
+    Push ``head`` into the source through the nodes that keep the rows as
+    they are.
+    """
+    if isinstance(node, _Scan):
+        if limit is None or node.predicate:
+            return node
+        if node.limit is not None:
+            limit = min(limit, node.limit)
+        return node.replace(limit=limit)
+    elif isinstance(node, _Head):
+        n = node.n if limit is None else min(node.n, limit)
+        child = _push_limit(node.children[0], n)
+        return _replace_children(node, [child])
+    elif isinstance(node, _Project) or (isinstance(node, _Assign) and
+                                        node.is_rowwise):
+        child = _push_limit(node.children[0], limit)
+        return _replace_children(node, [child])
+
+    children = [_push_limit(child) for child in node.children]
+    return _replace_children(node, children)
+
+
+def optimize(plan):
+    """ Rewrite a logical plan into an equivalent cheaper one """
+    plan = _push_predicates(plan)
+    plan = _prune_columns(plan)
+    plan = _push_limit(plan)
+    return plan
+
+
+# ----------------------------------------------------------------------
+# Execution
+
+class _Executor(object):
+    """
+    Execute an optimized plan. Every distinct sub-plan is executed once;
+    frames that are not shared with the caller or another consumer are
+    modified in place instead of being copied.
+    """
+
+    def __init__(self, plan):
+        self.results = {}
+        self.refcounts = {}
+        self._count(plan)
+
+    def _count(self, node):
+        key = node.key()
+        self.refcounts[key] = self.refcounts.get(key, 0) + 1
+        if self.refcounts[key] == 1:
+            for child in node.children:
+                self._count(child)
+
+    def execute(self, node):
+        """ Return the result frame of ``node`` and whether it is owned """
+        key = node.key()
+        if key in self.results:
+            return self.results[key], False
+        frame, owned = getattr(self, '_execute_' + type(node).__name__[1:]
+                               .lower())(node)
+        if self.refcounts[key] > 1:
+            self.results[key] = frame
+            owned = False
+        return frame, owned
+
+    def _execute_scan(self, node):
+        predicate = list(node.predicate)
+        columns = node.columns
+        read_columns = None
+        if columns is not None:
+            read_columns = _unique(list(columns) +
+                                   _predicate_columns(predicate))
+
+        if node.kind == 'frame':
+            frame = node.source
+            if not predicate:
+                if columns is None:
+                    return frame, False
+                return _take(frame, None, columns), True
+            mask = _evaluate_mask(frame, predicate)
+            return _take(frame, mask, columns), True
+
+        elif node.kind == 'csv':
+            frame = self._read_csv(node, read_columns, predicate)
+            predicate = []
+        elif node.kind == 'parquet':
+            from pandas.io.parquet import read_parquet
+            kwargs = dict(node.kwargs)
+            if read_columns is not None:
+                kwargs['columns'] = read_columns
+            frame = read_parquet(node.source, **kwargs)
+        else:
+            frame, predicate = self._read_hdf(node, read_columns, predicate)
+
+        if node.limit is not None and len(frame) > node.limit:
+            frame = frame.iloc[:node.limit]
+        mask = _evaluate_mask(frame, predicate) if predicate else None
+        if mask is not None or columns is not None:
+            frame = _take(frame, mask, columns)
+        return frame, True
+
+    def _read_csv(self, node, read_columns, predicate):
+        from pandas.io.parsers import read_csv
+        from pandas.core.reshape.concat import concat
+
+        kwargs = dict(node.kwargs)
+        chunksize = kwargs.pop('chunksize', None)
+        if read_columns is not None:
+            kwargs['usecols'] = read_columns
+        if node.limit is not None:
+            kwargs['nrows'] = node.limit
+        if chunksize is None or not predicate:
+            frame = read_csv(node.source, **kwargs)
+            if predicate:
+                frame = _take(frame, _evaluate_mask(frame, predicate))
+            return frame
+
+        # filter every chunk, so that only the selected rows are kept
+        chunks = []
+        for chunk in read_csv(node.source, chunksize=chunksize, **kwargs):
+            chunks.append(_take(chunk, _evaluate_mask(chunk, predicate)))
+        return concat(chunks)
+
+    def _read_hdf(self, node, read_columns, predicate):
+        from pandas.io.pytables import HDFStore
+
+        kwargs = dict(node.kwargs)
+        key = kwargs.pop('key')
+        store = node.source
+        opened = not isinstance(store, HDFStore)
+        if opened:
+            store = HDFStore(store, mode='r')
+        try:
+            storer = store.get_storer(key)
+            if getattr(storer, 'is_table', False):
+                data_columns = set(storer.data_columns)
+                terms = [expr.to_where(data_columns) for expr in predicate]
+                where = [term for term in terms if term is not None]
+                predicate = [expr for expr, term in zip(predicate, terms)
+                             if term is None]
+                if where:
+                    # keep the terms passed to ``from_hdf``
+                    user_where = kwargs.get('where')
+                    if user_where is not None:
+                        where = (list(user_where) if is_list_like(user_where)
+                                 else [user_where]) + where
+                    kwargs['where'] = where
+                if read_columns is not None:
+                    kwargs['columns'] = read_columns
+                if node.limit is not None and not kwargs.get('where'):
+                    kwargs['stop'] = node.limit
+            frame = store.select(key, **kwargs)
+        finally:
+            if opened:
+                store.close()
+        return frame, predicate
+
+    def _execute_project(self, node):
+        child = node.children[0]
+        if isinstance(child, _Filter):
+            # select the rows and columns at once
+            frame, _ = self.execute(child.children[0])
+            mask = _evaluate_mask(frame, child.predicate)
+            return _take(frame, mask, node.columns), True
+        frame, owned = self.execute(child)
+        if list(frame.columns) == node.columns:
+            return frame, owned
+        return _take(frame, None, node.columns), True
+
+    def _execute_filter(self, node):
+        frame, _ = self.execute(node.children[0])
+        mask = _evaluate_mask(frame, node.predicate)
+        return _take(frame, mask), True
+
+    def _execute_assign(self, node):
+        frame, owned = self.execute(node.children[0])
+        cache = {}
+        results = []
+        for name, value in node.items:
+            if isinstance(value, Expr):
+                value = value.evaluate(frame, cache)
+            elif callable(value):
+                value = value(frame)
+            results.append((name, value))
+        if not owned:
+            frame = frame.copy()
+        for name, value in results:
+            frame[name] = value
+        return frame, True
+
+    def _execute_sort(self, node):
+        frame, _ = self.execute(node.children[0])
+        return frame.sort_values(node.by, **node.kwargs), True
+
+    def _execute_head(self, node):
+        frame, _ = self.execute(node.children[0])
+        # a slice, which may share the data of the child
+        return frame.head(node.n), False
+
+    def _execute_aggregate(self, node):
+        frame, _ = self.execute(node.children[0])
+        grouped = frame.groupby(node.by, **node.kwargs)
+        if node.selection is not None:
+            grouped = grouped[node.selection]
+        return getattr(grouped, node.how)(*node.args), True
+
+    def _execute_merge(self, node):
+        from pandas.core.reshape.merge import merge
+        left, _ = self.execute(node.children[0])
+        right, _ = self.execute(node.children[1])
+        return merge(left, right, **node.kwargs), True
+
+
+# ----------------------------------------------------------------------
+# User interface
+
+class LazyFrame(object):
+    """
+    A lazily evaluated DataFrame pipeline, created with ``DataFrame.lazy``
+    or read from a file with ``LazyFrame.from_csv``, ``from_parquet`` or
+    ``from_hdf``. Operations return a new ``LazyFrame``; ``collect``
+    optimizes the recorded plan and returns the resulting DataFrame.
+
+    .. versionadded:: 0.23.0
+
+    Examples
+    --------
+    >>> lf = df.lazy()
+    >>> lf[lf.a > 0][['b', 'c']].groupby('b').sum().collect()
+
+    only takes the rows where ``a > 0`` of columns ``b`` and ``c``, with a
+    single copy.
+    """
+
+    def __init__(self, data):
+        if isinstance(data, _Node):
+            self._plan = data
+        else:
+            self._plan = _Scan('frame', data)
+
+    @classmethod
+    def from_csv(cls, filepath_or_buffer, chunksize=None, **kwargs):
+        """
+        A lazy ``read_csv``: only the needed columns are parsed (as
+        ``usecols``) and ``head`` is passed as ``nrows``.
+
+        Parameters
+        ----------
+        filepath_or_buffer : str
+        chunksize : int, optional
+            Read the file in chunks of this many rows and filter every
+            chunk, so that the unselected rows are never held in memory at
+            once.
+        kwargs : keywords passed to ``read_csv``
+        """
+        if chunksize is not None:
+            kwargs['chunksize'] = chunksize
+        return cls(_Scan('csv', filepath_or_buffer, kwargs))
+
+    @classmethod
+    def from_parquet(cls, path, **kwargs):
+        """
+        A lazy ``read_parquet``: only the needed columns are read.
+        """
+        return cls(_Scan('parquet', path, kwargs))
+
+    @classmethod
+    def from_hdf(cls, path_or_store, key, **kwargs):
+        """
+        A lazy ``HDFStore.select``. For tables, only the needed columns are
+        read and the comparisons of data columns with scalars are passed as
+        ``where``.
+        """
+        kwargs['key'] = key
+        return cls(_Scan('hdf', path_or_store, kwargs))
+
+    def _wrap(self, node):
+        return type(self)(node)
+
+    # ------------------------------------------------------------------
+    # Operations
+
+    def __getitem__(self, key):
+        if isinstance(key, Expr):
+            return self.filter(key)
+        elif isinstance(key, list):
+            return self.select(key)
+        return _Col(key)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _Col(name)
+
+    def select(self, columns):
+        """ The ``columns`` of the frame """
+        return self._wrap(_Project(self._plan, columns))
+
+    def filter(self, predicate):
+        """ The rows where the boolean ``Expr`` ``predicate`` is True """
+        if not isinstance(predicate, Expr):
+            raise TypeError("the predicate must be an expression of the "
+                            "columns, e.g. lf.a > 0")
+        return self._wrap(_Filter(self._plan, [predicate]))
+
+    def assign(self, **kwargs):
+        """
+        New columns like ``DataFrame.assign``. The values are expressions
+        of the columns, callables of the frame or scalars.
+        """
+        items = list(kwargs.items()) if PY36 else sorted(kwargs.items())
+        items = [(name, _as_expr(value) if is_scalar(value) else value)
+                 for name, value in items]
+        return self._wrap(_Assign(self._plan, items))
+
+    def sort_values(self, by, **kwargs):
+        return self._wrap(_Sort(self._plan, by, kwargs))
+
+    def head(self, n=5):
+        return self._wrap(_Head(self._plan, n))
+
+    def groupby(self, by, **kwargs):
+        """
+        Group by ``by``; the aggregations of the returned ``LazyGroupBy``
+        return a ``LazyFrame``.
+        """
+        return LazyGroupBy(self, by, kwargs)
+
+    def merge(self, right, **kwargs):
+        if not isinstance(right, LazyFrame):
+            right = LazyFrame(right)
+        return self._wrap(_Merge(self._plan, right._plan, kwargs))
+
+    # ------------------------------------------------------------------
+    # Evaluation
+
+    def explain(self, optimized=True):
+        """ A description of the (optimized) plan """
+        plan = optimize(self._plan) if optimized else self._plan
+        return plan.explain()
+
+    def collect(self):
+        """ Optimize and execute the plan, returning a DataFrame """
+        plan = optimize(self._plan)
+        frame, owned = _Executor(plan).execute(plan)
+        if not owned:
+            frame = frame.copy()
+        return frame
+
+    def __repr__(self):
+        return 'LazyFrame\n%s' % self._plan.explain(indent=1)
+
+
+class LazyGroupBy(object):
+    """ A groupby of a ``LazyFrame``, see ``LazyFrame.groupby`` """
+
+    def __init__(self, frame, by, kwargs, selection=None):
+        self._frame = frame
+        self._by = by
+        self._kwargs = kwargs
+        self._selection = selection
+
+    def __getitem__(self, key):
+        return LazyGroupBy(self._frame, self._by, self._kwargs, key)
+
+    def _aggregate(self, how, *args):
+        node = _Aggregate(self._frame._plan, self._by, self._kwargs,
+                          self._selection, how, args)
+        return self._frame._wrap(node)
+
+    def agg(self, func):
+        return self._aggregate('agg', func)
+
+    aggregate = agg
+
+
+def _add_reduction(name):
+    def method(self, *args):
+        return self._aggregate(name, *args)
+    method.__name__ = name
+    return method
+
+
+for _name in ['sum', 'prod', 'mean', 'median', 'min', 'max', 'std', 'var',
+              'count', 'first', 'last', 'nunique']:
+    setattr(LazyGroupBy, _name, _add_reduction(_name))
@@ -117,6 +117,7 @@ class bottleneck_switch(object):
                     return _na_for_min_count(values, axis)
 
                 if (_USE_BOTTLENECK and skipna and
+                        kwds.get('mask') is None and
                         _bn_ok_dtype(values.dtype, bn_name)):
                     result = bn_func(values, axis=axis, **kwds)
 
@@ -180,6 +181,13 @@ def _get_fill_value(dtype, fill_value=None, fill_value_typ=None):
     """ return the correct fill value for the dtype of the values """
     if fill_value is not None:
         return fill_value
+    if is_bool_dtype(dtype) and fill_value_typ is not None:
+        return fill_value_typ == '+inf'
+    if is_integer_dtype(dtype) and fill_value_typ is not None:
+        # the extreme values of the dtype itself, so that masked values
+        # can be filled in place
+        info = np.iinfo(dtype)
+        return info.max if fill_value_typ == '+inf' else info.min
     if _na_ok_dtype(dtype):
         if fill_value_typ is None:
             return np.nan
@@ -200,16 +208,19 @@ def _get_fill_value(dtype, fill_value=None, fill_value_typ=None):
 
 
 def _get_values(values, skipna, fill_value=None, fill_value_typ=None,
-                isfinite=False, copy=True):
+                isfinite=False, copy=True, mask=None):
     """ utility to get the values view, mask, dtype
     if necessary copy and mask using the specified fill_value
     copy = True will force the copy
+
+    a mask of the missing values can be passed for dtypes that cannot hold
+    missing values themselves (the values of a masked array); these are
+    filled in place without upcasting
     """
     values = com._values_from_object(values)
-    if isfinite:
-        mask = _isfinite(values)
-    else:
-        mask = isna(values)
+    masked = mask is not None
+    if not masked:
+        mask = _isfinite(values) if isfinite else isna(values)
 
     dtype = values.dtype
     dtype_ok = _na_ok_dtype(dtype)
@@ -222,7 +233,7 @@ def _get_values(values, skipna, fill_value=None, fill_value_typ=None,
     if skipna:
         if copy:
             values = values.copy()
-        if dtype_ok:
+        if dtype_ok or masked:
             np.putmask(values, mask, fill_value)
 
         # promote if needed
@@ -315,20 +326,23 @@ def _na_for_min_count(values, axis):
         return result
 
 
-def nanany(values, axis=None, skipna=True):
-    values, mask, dtype, _ = _get_values(values, skipna, False, copy=skipna)
+def nanany(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype, _ = _get_values(values, skipna, False, copy=skipna,
+                                         mask=mask)
     return values.any(axis)
 
 
-def nanall(values, axis=None, skipna=True):
-    values, mask, dtype, _ = _get_values(values, skipna, True, copy=skipna)
+def nanall(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype, _ = _get_values(values, skipna, True, copy=skipna,
+                                         mask=mask)
     return values.all(axis)
 
 
 @disallow('M8')
 @bottleneck_switch()
-def nansum(values, axis=None, skipna=True, min_count=0):
-    values, mask, dtype, dtype_max = _get_values(values, skipna, 0)
+def nansum(values, axis=None, skipna=True, min_count=0, mask=None):
+    values, mask, dtype, dtype_max = _get_values(values, skipna, 0,
+                                                 mask=mask)
     dtype_sum = dtype_max
     if is_float_dtype(dtype):
         dtype_sum = dtype
@@ -342,8 +356,9 @@ def nansum(values, axis=None, skipna=True, min_count=0):
 
 @disallow('M8')
 @bottleneck_switch()
-def nanmean(values, axis=None, skipna=True):
-    values, mask, dtype, dtype_max = _get_values(values, skipna, 0)
+def nanmean(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype, dtype_max = _get_values(values, skipna, 0,
+                                                 mask=mask)
 
     dtype_sum = dtype_max
     dtype_count = np.float64
@@ -368,7 +383,7 @@ def nanmean(values, axis=None, skipna=True):
 
 @disallow('M8')
 @bottleneck_switch()
-def nanmedian(values, axis=None, skipna=True):
+def nanmedian(values, axis=None, skipna=True, mask=None):
 
     def get_median(x):
         mask = notna(x)
@@ -376,7 +391,7 @@ def nanmedian(values, axis=None, skipna=True):
             return np.nan
         return np.nanmedian(x[mask])
 
-    values, mask, dtype, dtype_max = _get_values(values, skipna)
+    values, mask, dtype, dtype_max = _get_values(values, skipna, mask=mask)
     if not is_float_dtype(values):
         values = values.astype('f8')
         values[mask] = np.nan
@@ -432,18 +447,20 @@ def _get_counts_nanvar(mask, axis, ddof, dtype=float):
 
 @disallow('M8')
 @bottleneck_switch(ddof=1)
-def nanstd(values, axis=None, skipna=True, ddof=1):
-    result = np.sqrt(nanvar(values, axis=axis, skipna=skipna, ddof=ddof))
+def nanstd(values, axis=None, skipna=True, ddof=1, mask=None):
+    result = np.sqrt(nanvar(values, axis=axis, skipna=skipna, ddof=ddof,
+                            mask=mask))
     return _wrap_results(result, values.dtype)
 
 
 @disallow('M8')
 @bottleneck_switch(ddof=1)
-def nanvar(values, axis=None, skipna=True, ddof=1):
+def nanvar(values, axis=None, skipna=True, ddof=1, mask=None):
 
     values = com._values_from_object(values)
     dtype = values.dtype
-    mask = isna(values)
+    if mask is None:
+        mask = isna(values)
     if is_any_int_dtype(values):
         values = values.astype('f8')
         values[mask] = np.nan
@@ -493,9 +510,9 @@ def nansem(values, axis=None, skipna=True, ddof=1):
 
 def _nanminmax(meth, fill_value_typ):
     @bottleneck_switch()
-    def reduction(values, axis=None, skipna=True):
+    def reduction(values, axis=None, skipna=True, mask=None):
         values, mask, dtype, dtype_max = _get_values(
-            values, skipna, fill_value_typ=fill_value_typ, )
+            values, skipna, fill_value_typ=fill_value_typ, mask=mask)
 
         if ((axis is not None and values.shape[axis] == 0) or
                 values.size == 0):
@@ -668,9 +685,10 @@ def nankurt(values, axis=None, skipna=True):
 
 
 @disallow('M8', 'm8')
-def nanprod(values, axis=None, skipna=True, min_count=0):
-    mask = isna(values)
-    if skipna and not is_any_int_dtype(values):
+def nanprod(values, axis=None, skipna=True, min_count=0, mask=None):
+    if mask is None:
+        mask = isna(values)
+    if skipna and mask.any():
         values = values.copy()
         values[mask] = 1
     result = values.prod(axis)
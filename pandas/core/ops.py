@@ -38,8 +38,9 @@ from pandas.core.dtypes.cast import (
 from pandas.core.dtypes.generic import (
     ABCSeries,
     ABCDataFrame,
-    ABCIndex,
-    ABCSparseSeries, ABCSparseArray)
+    ABCIndex, ABCIndexClass,
+    ABCSparseSeries, ABCSparseArray,
+    ABCMaskedArray)
 
 
 def _gen_eval_kwargs(name):
@@ -452,6 +453,10 @@ def add_methods(cls, new_methods):
         # retain the np.ndarray versions.
         force = not (issubclass(cls, ABCSparseArray) and
                      name.startswith('__i'))
+        if issubclass(cls, ABCMaskedArray) and name.startswith('__i'):
+            # the inplace wrappers realign a pandas object, masked arrays
+            # fall back to the binary operation instead
+            continue
         if force or name not in cls.__dict__:
             bind_method(cls, name, method)
 
@@ -656,6 +661,12 @@ def _arith_method_SERIES(op, name, str_rep):
             raise TypeError("{typ} cannot perform the operation "
                             "{op}".format(typ=type(left).__name__, op=str_rep))
 
+        elif _has_masked_values(left) or _has_masked_values(right):
+            result = dispatch_to_masked_op(op, left, right)
+            return construct_result(left, result,
+                                    index=left.index, name=res_name,
+                                    dtype=None)
+
         lvalues = left.values
         rvalues = right
         if isinstance(rvalues, ABCSeries):
@@ -702,6 +713,46 @@ def dispatch_to_index_op(op, left, right, index_class):
     return result
 
 
+def _has_masked_values(obj):
+    """ Whether obj is a Series holding an IntegerArray or BooleanArray """
+    return isinstance(obj, ABCSeries) and isinstance(obj._values,
+                                                     ABCMaskedArray)
+
+
+def dispatch_to_masked_op(op, left, right):
+    """
+    Apply op to the values of the Series left and right, at least one of
+    which holds an IntegerArray or BooleanArray, letting the masked array
+    implement the operation.
+
+    Parameters
+    ----------
+    op : binary operator (operator.add, operator.eq, ...)
+    left : Series
+    right : object
+
+    Returns
+    -------
+    result : IntegerArray, BooleanArray or ndarray
+    """
+    if isinstance(right, ABCSeries):
+        right = right._values
+    elif isinstance(right, pd.Index):
+        right = right.values
+
+    lvalues = left._values
+    if not isinstance(lvalues, ABCMaskedArray):
+        # a masked array on the right, e.g. ndarray + IntegerArray
+        from pandas.core.arrays import IntegerArray, BooleanArray
+        klass = BooleanArray if is_bool_dtype(lvalues) else IntegerArray
+        try:
+            lvalues = klass(lvalues)
+        except TypeError:
+            # e.g. floats: compute on the floats with NaN
+            return op(lvalues, right.astype(np.float64))
+    return op(lvalues, right)
+
+
 def _get_series_op_result_name(left, right):
     # `left` is always a pd.Series
     if isinstance(right, (ABCSeries, pd.Index)):
@@ -792,6 +843,14 @@ def _comp_method_SERIES(op, name, str_rep):
             # Defer to DataFrame implementation; fail early
             return NotImplemented
 
+        elif _has_masked_values(self) or _has_masked_values(other):
+            name = _get_series_op_result_name(self, other)
+            if isinstance(other, ABCSeries) and not self._indexed_same(other):
+                msg = 'Can only compare identically-labeled Series objects'
+                raise ValueError(msg)
+            res_values = dispatch_to_masked_op(op, self, other)
+            return self._constructor(res_values, index=self.index, name=name)
+
         elif isinstance(other, ABCSeries):
             name = com._maybe_match_name(self, other)
             if not self._indexed_same(other):
@@ -900,6 +959,12 @@ def _bool_method_SERIES(op, name, str_rep):
             # Defer to DataFrame implementation; fail early
             return NotImplemented
 
+        elif _has_masked_values(self) or _has_masked_values(other):
+            name = _get_series_op_result_name(self, other)
+            res_values = dispatch_to_masked_op(op, self, other)
+            return self._constructor(res_values, index=self.index,
+                                     name=name)
+
         elif isinstance(other, ABCSeries):
             name = com._maybe_match_name(self, other)
             is_other_int_dtype = is_integer_dtype(other.dtype)
@@ -1341,3 +1406,104 @@ def _arith_method_SPARSE_ARRAY(op, name, str_rep=None):
         name = name[2:-2]
     wrapper.__name__ = name
     return wrapper
+
+
+def _arith_method_MASKED_ARRAY(op, name, str_rep=None):
+    """
+    Wrapper function for IntegerArray and BooleanArray arithmetic
+    operations: the operation is applied to the values and the result is
+    missing where either operand is missing. Integer division and modulo by
+    zero are missing as well, so that integer results stay integers.
+    """
+
+    def wrapper(self, other):
+        from pandas.core.arrays.masked import (_masked_operand,
+                                               _wrap_masked_result)
+        if isinstance(other, (ABCSeries, ABCDataFrame, ABCIndexClass)):
+            return NotImplemented
+
+        other, other_mask = _masked_operand(other, len(self), 1)
+        values = self._data
+        if is_bool_dtype(values):
+            values = values.astype(np.int64)
+        if is_bool_dtype(other):
+            other = other.astype(np.int64)
+
+        with np.errstate(all='ignore'):
+            result = op(values, other)
+        mask = self._mask | other_mask
+
+        if name in ('floordiv', 'mod', 'rfloordiv', 'rmod'):
+            divisor = other if name in ('floordiv', 'mod') else values
+            if is_integer_dtype(result):
+                mask = mask | (divisor == 0)
+        return _wrap_masked_result(result, mask)
+
+    if name.startswith("__"):
+        name = name[2:-2]
+    wrapper.__name__ = name
+    return wrapper
+
+
+def _comp_method_MASKED_ARRAY(op, name, str_rep=None):
+    """
+    Wrapper function for IntegerArray and BooleanArray comparisons,
+    returning a BooleanArray that is missing where either operand is
+    missing.
+    """
+
+    def wrapper(self, other):
+        from pandas.core.arrays.masked import (_masked_operand,
+                                               _wrap_masked_result)
+        if isinstance(other, (ABCSeries, ABCDataFrame, ABCIndexClass)):
+            return NotImplemented
+
+        other, other_mask = _masked_operand(other, len(self), 0)
+        with np.errstate(all='ignore'):
+            result = op(self._data, other)
+        if is_scalar(result):
+            # numpy could not compare elementwise, e.g. against a string
+            if op not in (operator.eq, operator.ne):
+                raise TypeError("invalid type comparison")
+            result = np.empty(len(self), dtype=bool)
+            result.fill(op is operator.ne)
+        return _wrap_masked_result(result, self._mask | other_mask)
+
+    if name.startswith("__"):
+        name = name[2:-2]
+    wrapper.__name__ = name
+    return wrapper
+
+
+def _bool_method_MASKED_ARRAY(op, name, str_rep=None):
+    """
+    Wrapper function for IntegerArray and BooleanArray logical operations.
+    For booleans ``&`` and ``|`` follow three-valued logic: a missing value
+    does not make the result missing if the other operand decides it
+    (``False & NA`` is False, ``True | NA`` is True).
+    """
+
+    def wrapper(self, other):
+        from pandas.core.arrays.masked import (_masked_operand,
+                                               _wrap_masked_result)
+        if isinstance(other, (ABCSeries, ABCDataFrame, ABCIndexClass)):
+            return NotImplemented
+
+        other, other_mask = _masked_operand(other, len(self), False)
+        result = op(self._data, other)
+        mask = self._mask | other_mask
+
+        if is_bool_dtype(result) and is_bool_dtype(other):
+            left = self._data
+            if name in ('and', 'rand'):
+                decided = (~left & ~self._mask) | (~other & ~other_mask)
+                mask = mask & ~decided
+            elif name in ('or', 'ror'):
+                decided = (left & ~self._mask) | (other & ~other_mask)
+                mask = mask & ~decided
+        return _wrap_masked_result(result, mask)
+
+    if name.startswith("__"):
+        name = name[2:-2]
+    wrapper.__name__ = name
+    return wrapper
@@ -0,0 +1,588 @@
+"""
+Out-of-core groupby aggregation
+
+Aggregating data whose groups, or whose factorization, do not fit in memory
+is done with a grace hash partitioning: the rows are hash-partitioned on the
+group keys into temporary files on disk, so that every group lives in
+exactly one partition, and each partition is then aggregated on its own with
+the regular (cython) groupby machinery.
+
+Data that only arrives in chunks (``read_csv(..., chunksize=...)``,
+``HDFStore.select(..., iterator=True)``, ``read_sql(..., chunksize=...)``)
+can also be aggregated incrementally with ``StreamingGroupBy``, which keeps
+mergeable per-group partial states instead of the rows.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import range, cPickle as pkl
+from pandas.core.dtypes.common import is_list_like, is_categorical_dtype
+from pandas.core.dtypes.dtypes import CategoricalDtype
+from pandas.core.arrays import Categorical
+from pandas.core.index import MultiIndex, CategoricalIndex
+from pandas.core.frame import DataFrame
+from pandas.core.reshape.concat import concat
+from pandas.core.util.hashing import hash_pandas_object
+
+
+# default amount of row data aggregated in memory at once, in bytes
+_DEFAULT_MEMORY_BUDGET = 1 << 30
+
+# number of partitions used when the size of the input is not known upfront
+_DEFAULT_FANOUT = 32
+
+# partitions that are still larger than the memory budget are split again
+# with a different hash key, at most this many times
+_MAX_DEPTH = 4
+
+
+def _hash_key(level):
+    # hash_pandas_object requires a 16 byte key
+    return 'pandas-spill-%03d' % level
+
+
+def _frame_nbytes(frame):
+    return int(frame.memory_usage(index=False, deep=True).sum())
+
+
+def _categorical_dtypes(frame, by, dtypes=None):
+    """
+    Return a dict of the categorical ``by`` columns to their dtype, with the
+    categories of ``frame`` appended to those of the previous chunks in
+    ``dtypes``.
+    """
+    result = dict(dtypes or {})
+    for col in by:
+        if not is_categorical_dtype(frame[col]):
+            continue
+        dtype = frame[col].dtype
+        if col in result:
+            previous = result[col]
+            new = dtype.categories[
+                ~dtype.categories.isin(previous.categories)]
+            dtype = CategoricalDtype(previous.categories.append(new),
+                                     previous.ordered)
+        result[col] = dtype
+    return result
+
+
+def _aggregate(frame, by, func, groupby_kwargs, dtypes):
+    """
+    Group ``frame`` by the ``by`` columns and aggregate it with ``func``.
+
+    The categorical keys of ``dtypes`` are grouped by their codes, so that
+    a partition only forms the groups of the categories it holds rather
+    than a group for every category; see _restore_categorical_keys.
+    """
+    if dtypes:
+        frame = frame.copy(deep=False)
+        missing = np.zeros(len(frame), dtype=bool)
+        for col, dtype in compat.iteritems(dtypes):
+            codes = frame[col].astype(dtype).cat.codes.values
+            frame[col] = codes
+            missing |= codes == -1
+        if missing.any():
+            # like the missing keys of a groupby
+            frame = frame[~missing]
+    return frame.groupby(by, **groupby_kwargs).agg(func)
+
+
+def _restore_categorical_keys(result, dtypes, as_index):
+    """
+    Turn the codes of the categorical keys of an aggregated ``result`` back
+    into categoricals of ``dtypes``.
+    """
+    if not dtypes:
+        return result
+
+    def restore(values, name):
+        if name not in dtypes:
+            return values
+        dtype = dtypes[name]
+        return Categorical.from_codes(np.asarray(values), dtype.categories,
+                                      ordered=dtype.ordered)
+
+    if not as_index:
+        for col in dtypes:
+            result[col] = restore(result[col].values, col)
+    elif isinstance(result.index, MultiIndex):
+        index = result.index
+        result.index = MultiIndex.from_arrays(
+            [restore(index.get_level_values(i), name)
+             for i, name in enumerate(index.names)], names=index.names)
+    else:
+        result.index = CategoricalIndex(
+            restore(result.index, result.index.name),
+            name=result.index.name)
+    return result
+
+
+def _iter_slices(frame, memory_budget):
+    """
+    Split ``frame`` into row slices of at most ``memory_budget`` bytes.
+    """
+    nbytes = _frame_nbytes(frame)
+    if nbytes <= memory_budget or len(frame) == 0:
+        yield frame
+        return
+
+    nslices = int(np.ceil(nbytes / float(memory_budget)))
+    step = max(len(frame) // nslices, 1)
+    for start in range(0, len(frame), step):
+        yield frame.iloc[start:start + step]
+
+
+class _SpilledPartitions(object):
+    """
+    Hash-partition frames on the ``by`` columns into ``npartitions`` files
+    below ``directory``. Every written chunk of a partition is appended to
+    that partition's file as a separate pickle.
+    """
+
+    def __init__(self, directory, by, npartitions, level=0):
+        self.directory = directory
+        self.by = by
+        self.npartitions = npartitions
+        self.level = level
+        self.paths = [os.path.join(directory, 'part-%d-%d.pkl' % (level, i))
+                      for i in range(npartitions)]
+        self.nbytes = [0] * npartitions
+        self._handles = [None] * npartitions
+
+    def write(self, frame):
+        if len(frame) == 0:
+            return
+
+        hashed = hash_pandas_object(frame[self.by], index=False,
+                                    hash_key=_hash_key(self.level))
+        codes = (hashed.values % np.uint64(self.npartitions)).astype(np.intp)
+
+        # group the rows of each partition together with a single take
+        indexer = np.argsort(codes, kind='mergesort')
+        counts = np.bincount(codes, minlength=self.npartitions)
+        frame = frame.take(indexer)
+
+        start = 0
+        for i, count in enumerate(counts):
+            if count == 0:
+                continue
+            piece = frame.iloc[start:start + count]
+            start += count
+
+            if self._handles[i] is None:
+                self._handles[i] = open(self.paths[i], 'wb')
+            pkl.dump(piece, self._handles[i], protocol=pkl.HIGHEST_PROTOCOL)
+            self.nbytes[i] += _frame_nbytes(piece)
+
+    def close(self):
+        for i, handle in enumerate(self._handles):
+            if handle is not None:
+                handle.close()
+                self._handles[i] = None
+
+    def iter_pieces(self, i):
+        """
+        Yield the chunks written to partition ``i``.
+        """
+        if not self.nbytes[i]:
+            return
+        with open(self.paths[i], 'rb') as handle:
+            while True:
+                try:
+                    yield pkl.load(handle)
+                except EOFError:
+                    break
+
+    def remove(self, i):
+        if os.path.exists(self.paths[i]):
+            os.remove(self.paths[i])
+
+
+def _aggregate_partitions(spilled, func, memory_budget, groupby_kwargs,
+                          dtypes, results):
+    """
+    Aggregate every partition of ``spilled`` into ``results``; partitions
+    that exceed the memory budget are partitioned again one level deeper.
+    """
+    for i in range(spilled.npartitions):
+        if not spilled.nbytes[i]:
+            continue
+
+        if (spilled.nbytes[i] > memory_budget and
+                spilled.level + 1 < _MAX_DEPTH):
+            child = _SpilledPartitions(spilled.directory, spilled.by,
+                                       spilled.npartitions,
+                                       level=spilled.level + 1)
+            try:
+                for piece in spilled.iter_pieces(i):
+                    child.write(piece)
+            finally:
+                child.close()
+            spilled.remove(i)
+
+            # a skewed partition (e.g. a single very large group) cannot be
+            # split any further, aggregate it in memory
+            if sum(1 for nbytes in child.nbytes if nbytes) == 1:
+                child.level = _MAX_DEPTH
+
+            _aggregate_partitions(child, func, memory_budget,
+                                  groupby_kwargs, dtypes, results)
+            continue
+
+        frame = concat(list(spilled.iter_pieces(i)), ignore_index=True)
+        spilled.remove(i)
+        results.append(_aggregate(frame, spilled.by, func, groupby_kwargs,
+                                  dtypes))
+
+
+def spill_groupby(data, by, func, memory_budget=None, npartitions=None,
+                  sort=True, as_index=True, tmpdir=None):
+    """
+    Group ``data`` by the ``by`` columns and aggregate it with ``func``,
+    spilling hash partitions of the rows to disk so that no more than
+    ``memory_budget`` bytes of row data are aggregated at once.
+
+    The result is the same as ``data.groupby(by).agg(func)``, but data that
+    is several times larger than memory, or that has a very large number of
+    groups, can be aggregated. Categorical keys only form the groups of the
+    categories that occur in ``data``; their categories are those of the
+    chunks of ``data``, in the order in which they are first seen.
+
+    Parameters
+    ----------
+    data : DataFrame or iterable of DataFrames
+        The frame to aggregate, or chunks of it, e.g. the ``TextFileReader``
+        returned by ``read_csv(..., chunksize=...)``.
+    by : label or list of labels
+        Column(s) to group by.
+    func : function, string, dictionary, or list of string/functions
+        Aggregation(s) to apply, as accepted by ``DataFrameGroupBy.agg``.
+    memory_budget : int, optional
+        Maximum number of bytes of row data aggregated in memory at once.
+        Defaults to 1 GiB.
+    npartitions : int, optional
+        Number of hash partitions to spill to. By default this is derived
+        from the size of ``data`` and ``memory_budget``; partitions that turn
+        out larger than the budget are partitioned again.
+    sort : boolean, default True
+        Sort the result by the group keys.
+    as_index : boolean, default True
+        Return the group keys as the index of the result.
+    tmpdir : string, optional
+        Directory in which the temporary partitions are created. Defaults
+        to the system temporary directory.
+
+    Returns
+    -------
+    aggregated : DataFrame
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('events.csv', chunksize=10 ** 6)
+    >>> spill_groupby(reader, ['customer', 'day'], {'amount': 'sum'},
+    ...               memory_budget=2 ** 30)  # doctest: +SKIP
+    """
+    if memory_budget is None:
+        memory_budget = _DEFAULT_MEMORY_BUDGET
+    if memory_budget <= 0:
+        raise ValueError("memory_budget must be a positive number of bytes")
+    if npartitions is not None and npartitions < 1:
+        raise ValueError("npartitions must be at least 1")
+
+    by = list(by) if is_list_like(by) else [by]
+    groupby_kwargs = dict(sort=False, as_index=as_index)
+
+    if isinstance(data, DataFrame):
+        nbytes = _frame_nbytes(data)
+        if nbytes <= memory_budget and npartitions is None:
+            dtypes = _categorical_dtypes(data, by)
+            result = _aggregate(data, by, func,
+                                dict(sort=sort, as_index=as_index), dtypes)
+            return _restore_categorical_keys(result, dtypes, as_index)
+        if npartitions is None:
+            npartitions = max(int(np.ceil(nbytes / float(memory_budget))), 2)
+        chunks = _iter_slices(data, memory_budget)
+    else:
+        if npartitions is None:
+            npartitions = _DEFAULT_FANOUT
+        chunks = iter(data)
+
+    directory = tempfile.mkdtemp(prefix='pandas-spill-', dir=tmpdir)
+    try:
+        template = None
+        dtypes = {}
+        spilled = _SpilledPartitions(directory, by, npartitions)
+        try:
+            for chunk in chunks:
+                if template is None:
+                    template = chunk.iloc[:0]
+                dtypes = _categorical_dtypes(chunk, by, dtypes)
+                spilled.write(chunk)
+        finally:
+            spilled.close()
+
+        if template is None:
+            raise ValueError("No objects to aggregate")
+
+        results = []
+        _aggregate_partitions(spilled, func, memory_budget, groupby_kwargs,
+                              dtypes, results)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if not results:
+        result = _aggregate(template, by, func,
+                            dict(sort=sort, as_index=as_index), dtypes)
+        return _restore_categorical_keys(result, dtypes, as_index)
+
+    # the categorical keys are still codes, which sort in the order of the
+    # categories
+    result = concat(results, ignore_index=not as_index)
+    if sort:
+        if as_index:
+            result = result.sort_index()
+        else:
+            result = result.sort_values(by).reset_index(drop=True)
+    return _restore_categorical_keys(result, dtypes, as_index)
+
+
+# reductions supported by StreamingGroupBy, mapped to the partial states they
+# are computed from
+_STREAMING_STATES = {
+    'sum': ('sum',),
+    'count': ('count',),
+    'mean': ('sum', 'count'),
+    'var': ('moments',),
+    'std': ('moments',),
+    'min': ('min',),
+    'max': ('max',),
+    'first': ('first',),
+    'last': ('last',),
+    'nunique': ('unique',),
+}
+
+# reductions that only apply to numeric columns when not selected explicitly
+_NUMERIC_ONLY = {'sum', 'mean', 'var', 'std'}
+
+
+class StreamingGroupBy(object):
+    """
+    Incremental groupby aggregation over a stream of DataFrame chunks.
+
+    Every chunk is reduced with the cython groupby kernels to per-group
+    partial states (sums, counts, running moments, extrema, first / last
+    values and distinct values), which are merged into the states of the
+    previous chunks; the rows of a chunk are not retained.
+
+    Parameters
+    ----------
+    by : label or list of labels
+        Column(s) to group by.
+    func : string, list of strings or dict
+        The reductions to compute, among 'sum', 'count', 'mean', 'var',
+        'std', 'min', 'max', 'first', 'last' and 'nunique'. A string or list
+        applies to every non-key column (the numeric ones for 'sum', 'mean',
+        'var' and 'std'), a dict maps column names to a string or a list.
+    sort : boolean, default True
+        Sort the result by the group keys.
+
+    Examples
+    --------
+    >>> agg = StreamingGroupBy('symbol', {'price': ['mean', 'max'],
+    ...                                   'size': 'sum'})
+    >>> for chunk in pd.read_csv('trades.csv', chunksize=10 ** 6):
+    ...     agg.update(chunk)  # doctest: +SKIP
+    >>> agg.result()  # doctest: +SKIP
+
+    See also
+    --------
+    aggregate_chunks
+    """
+
+    def __init__(self, by, func, sort=True):
+        self.by = list(by) if is_list_like(by) else [by]
+        self.func = func
+        self.sort = sort
+        self._spec = None
+        self._states = {}
+
+    def _make_spec(self, chunk):
+        """
+        Resolve ``func`` against the columns of the first chunk into a list
+        of (column, reduction, output label) triples.
+        """
+        columns = [c for c in chunk.columns if c not in self.by]
+        numeric = set(chunk[columns]._get_numeric_data().columns)
+
+        if isinstance(self.func, dict):
+            multi = any(is_list_like(v) for v in self.func.values())
+            items = [(col, how) for col, how in compat.iteritems(self.func)]
+        else:
+            multi = is_list_like(self.func)
+            items = [(col, self.func) for col in columns]
+
+        spec = []
+        for col, hows in items:
+            if col not in columns:
+                raise KeyError("Column '{col}' does not exist".format(col=col))
+            for how in (hows if is_list_like(hows) else [hows]):
+                if how not in _STREAMING_STATES:
+                    raise ValueError("'{how}' cannot be computed "
+                                     "incrementally".format(how=how))
+                if (not isinstance(self.func, dict) and
+                        how in _NUMERIC_ONLY and col not in numeric):
+                    continue
+                spec.append((col, how, (col, how) if multi else col))
+        return spec
+
+    def _state_columns(self, state):
+        return list(compat.OrderedDict(
+            (col, None) for col, how, _ in self._spec
+            if state in _STREAMING_STATES[how]))
+
+    def update(self, chunk):
+        """
+        Reduce ``chunk`` and merge it into the current partial states.
+
+        Parameters
+        ----------
+        chunk : DataFrame
+
+        Returns
+        -------
+        self : StreamingGroupBy
+        """
+        if self._spec is None:
+            self._spec = self._make_spec(chunk)
+            self._template = chunk.iloc[:0]
+
+        grouped = chunk.groupby(self.by, sort=False)
+        for state in set(s for _, how, _ in self._spec
+                         for s in _STREAMING_STATES[how]):
+            columns = self._state_columns(state)
+            if state == 'unique':
+                for col in columns:
+                    key = ('unique', col)
+                    part = chunk[self.by + [col]].drop_duplicates()
+                    if key in self._states:
+                        part = concat([self._states[key], part],
+                                      ignore_index=True).drop_duplicates()
+                    self._states[key] = part
+            elif state == 'moments':
+                part = grouped[columns]
+                count = part.count()
+                moments = (count, part.mean().fillna(0),
+                           part.var(ddof=0).fillna(0) * count)
+                if state in self._states:
+                    moments = _merge_moments(self._states[state], moments)
+                self._states[state] = moments
+            else:
+                part = getattr(grouped[columns], state)()
+                if state in self._states:
+                    merge = 'sum' if state == 'count' else state
+                    part = concat([self._states[state], part])
+                    part = getattr(part.groupby(level=_levels(part.index)),
+                                   merge)()
+                self._states[state] = part
+        return self
+
+    def _finalize(self, col, how):
+        states = self._states
+        if how in ('sum', 'count', 'min', 'max', 'first', 'last'):
+            return states[how][col]
+        elif how == 'mean':
+            return states['sum'][col] / states['count'][col]
+        elif how in ('var', 'std'):
+            count, _, m2 = (s[col] for s in states['moments'])
+            result = (m2 / (count - 1)).where(count > 1)
+            return np.sqrt(result) if how == 'std' else result
+        elif how == 'nunique':
+            unique = states[('unique', col)]
+            return unique.groupby(self.by)[col].nunique()
+
+    def result(self):
+        """
+        Combine the partial states into the aggregated DataFrame.
+
+        Returns
+        -------
+        aggregated : DataFrame
+        """
+        if self._spec is None:
+            raise ValueError("No objects to aggregate")
+
+        if not self._spec:
+            return self._template.groupby(self.by,
+                                          sort=self.sort).agg(self.func)
+
+        labels = [label for _, _, label in self._spec]
+        data = [self._finalize(col, how) for col, how, _ in self._spec]
+        result = concat(data, axis=1)
+        if isinstance(labels[0], tuple):
+            result.columns = MultiIndex.from_tuples(labels)
+        else:
+            result.columns = labels
+        if self.sort:
+            result = result.sort_index()
+        return result
+
+
+def _levels(index):
+    return list(range(index.nlevels)) if index.nlevels > 1 else 0
+
+
+def _merge_moments(left, right):
+    """
+    Merge two (count, mean, M2) triples of per-group moments, using the
+    pairwise update of Chan et al.
+    """
+    lcount, lmean, lm2 = left
+    rcount, rmean, rm2 = right
+
+    lcount, rcount = lcount.align(rcount, join='outer', fill_value=0)
+    lmean, rmean = lmean.align(rmean, join='outer', fill_value=0)
+    lm2, rm2 = lm2.align(rm2, join='outer', fill_value=0)
+
+    count = lcount + rcount
+    delta = rmean - lmean
+    mean = (lmean + delta * rcount / count).fillna(0)
+    m2 = (lm2 + rm2 + delta ** 2 * lcount * rcount / count).fillna(0)
+    return count, mean, m2
+
+
+def aggregate_chunks(chunks, by, func, sort=True):
+    """
+    Group and aggregate a stream of DataFrame chunks, keeping only mergeable
+    per-group partial states in memory.
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrames
+        E.g. ``read_csv(..., chunksize=...)``,
+        ``HDFStore.select(..., iterator=True)``,
+        ``read_sql(..., chunksize=...)`` or
+        ``read_json(..., lines=True, chunksize=...)``.
+    by : label or list of labels
+        Column(s) to group by.
+    func : string, list of strings or dict
+        See ``StreamingGroupBy``.
+    sort : boolean, default True
+        Sort the result by the group keys.
+
+    Returns
+    -------
+    aggregated : DataFrame
+
+    See also
+    --------
+    StreamingGroupBy, spill_groupby
+    """
+    aggregator = StreamingGroupBy(by, func, sort=sort)
+    for chunk in chunks:
+        aggregator.update(chunk)
+    return aggregator.result()
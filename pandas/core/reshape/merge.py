@@ -4,10 +4,10 @@ SQL-style merge routines
 
 import copy
 import warnings
-import string
+from functools import partial
 
 import numpy as np
-from pandas.compat import range, lzip, zip, map, filter
+from pandas.compat import range, zip, map, filter
 import pandas.compat as compat
 
 from pandas import (Categorical, DataFrame,
@@ -27,22 +27,30 @@ from pandas.core.dtypes.common import (
     is_int_or_datetime_dtype,
     is_dtype_equal,
     is_bool,
+    is_bool_dtype,
+    is_complex_dtype,
+    is_object_dtype,
     is_list_like,
     is_datetimelike,
     _ensure_int64,
     _ensure_float64,
     _ensure_object,
     _get_dtype)
-from pandas.core.dtypes.missing import na_value_for_dtype
+from pandas.core.dtypes.missing import na_value_for_dtype, isna
 from pandas.core.internals import (items_overlap_with_suffix,
                                    concatenate_block_managers)
 from pandas.util._decorators import Appender, Substitution
 
+from pandas.core.config import get_option
 from pandas.core.sorting import is_int64_overflow_possible
+from pandas._libs.tslib import iNaT
 import pandas.core.algorithms as algos
 import pandas.core.sorting as sorting
 import pandas.core.common as com
-from pandas._libs import hashtable as libhashtable, join as libjoin, lib
+from pandas.core.util.hashing import (hash_array, _combine_hash_arrays,
+                                      _default_hash_key)
+from pandas._libs import (hashtable as libhashtable, join as libjoin, lib,
+                          algos as libalgos, hashing as libhashing)
 from pandas.errors import MergeError
 
 
@@ -51,12 +59,13 @@ from pandas.errors import MergeError
 def merge(left, right, how='inner', on=None, left_on=None, right_on=None,
           left_index=False, right_index=False, sort=False,
           suffixes=('_x', '_y'), copy=True, indicator=False,
-          validate=None):
+          validate=None, algorithm='hash', assume_sorted=False):
     op = _MergeOperation(left, right, how=how, on=on, left_on=left_on,
                          right_on=right_on, left_index=left_index,
                          right_index=right_index, sort=sort, suffixes=suffixes,
                          copy=copy, indicator=indicator,
-                         validate=validate)
+                         validate=validate, algorithm=algorithm,
+                         assume_sorted=assume_sorted)
     return op.get_result()
 
 
@@ -490,7 +499,7 @@ class _MergeOperation(object):
                  left_on=None, right_on=None, axis=1,
                  left_index=False, right_index=False, sort=True,
                  suffixes=('_x', '_y'), copy=True, indicator=False,
-                 validate=None):
+                 validate=None, algorithm='hash', assume_sorted=False):
         self.left = self.orig_left = left
         self.right = self.orig_right = right
         self.how = how
@@ -509,6 +518,12 @@ class _MergeOperation(object):
 
         self.indicator = indicator
 
+        if algorithm not in ('hash', 'radix'):
+            raise ValueError("algorithm must be either 'hash' or 'radix', "
+                             "got {algorithm!r}".format(algorithm=algorithm))
+        self.algorithm = algorithm
+        self.assume_sorted = assume_sorted
+
         if isinstance(self.indicator, compat.string_types):
             self.indicator_name = self.indicator
         elif isinstance(self.indicator, bool):
@@ -749,6 +764,18 @@ class _MergeOperation(object):
 
     def _get_join_indexers(self):
         """ return the join indexers """
+        if self.assume_sorted:
+            indexers = _get_sorted_join_indexers(self.left_join_keys,
+                                                 self.right_join_keys,
+                                                 sort=self.sort,
+                                                 how=self.how)
+            if indexers is not None:
+                return indexers
+        if self.algorithm == 'radix':
+            return _get_radix_join_indexers(self.left_join_keys,
+                                            self.right_join_keys,
+                                            sort=self.sort,
+                                            how=self.how)
         return _get_join_indexers(self.left_join_keys,
                                   self.right_join_keys,
                                   sort=self.sort,
@@ -1137,6 +1164,266 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
     return join_func(lkey, rkey, count, **kwargs)
 
 
+# target number of rows per partition of a radix join, small enough for the
+# hash table of a partition to fit in the CPU cache
+_RADIX_PARTITION_SIZE = 1 << 16
+_RADIX_MAX_BITS = 12
+
+
+def _radix_bits(nrows):
+    nbits = 0
+    while (nrows >> nbits) > _RADIX_PARTITION_SIZE and nbits < _RADIX_MAX_BITS:
+        nbits += 1
+    return nbits
+
+
+def _radix_hash_keys(lk, rk):
+    """
+    Hash a pair of join key arrays such that equal keys get equal hashes on
+    both sides. Returns None if the key dtypes cannot be hashed consistently.
+    """
+    lvals = np.asarray(com._values_from_object(lk))
+    rvals = np.asarray(com._values_from_object(rk))
+
+    if needs_i8_conversion(lvals) and needs_i8_conversion(rvals):
+        lvals, rvals = lvals.view('i8'), rvals.view('i8')
+    elif ((is_integer_dtype(lvals) or is_bool_dtype(lvals)) and
+            (is_integer_dtype(rvals) or is_bool_dtype(rvals))):
+        lvals, rvals = lvals.astype('i8'), rvals.astype('i8')
+    elif (is_numeric_dtype(lvals) and is_numeric_dtype(rvals) and
+            not is_complex_dtype(lvals) and not is_complex_dtype(rvals)):
+        # -0.0 == 0.0 and all NaN match each other, give them the same bits
+        lvals, rvals = lvals.astype('f8') + 0.0, rvals.astype('f8') + 0.0
+        lvals[np.isnan(lvals)] = np.nan
+        rvals[np.isnan(rvals)] = np.nan
+    elif is_object_dtype(lvals) and is_object_dtype(rvals):
+        # only strings (and nulls) hash consistently with their equality
+        lvals, rvals = lvals.copy(), rvals.copy()
+        lvals[isna(lvals)] = np.nan
+        rvals[isna(rvals)] = np.nan
+        try:
+            return (libhashing.hash_object_array(lvals, _default_hash_key),
+                    libhashing.hash_object_array(rvals, _default_hash_key))
+        except TypeError:
+            return None
+    else:
+        return None
+
+    return hash_array(lvals), hash_array(rvals)
+
+
+def _take_positions(positions, indexer):
+    # map partition-local indexers back to row positions, keeping -1
+    result = np.full(len(indexer), -1, dtype=np.int64)
+    mask = indexer != -1
+    result[mask] = positions.take(indexer[mask])
+    return result
+
+
+def _get_radix_join_indexers(left_keys, right_keys, sort=False, how='inner'):
+    """
+    Radix-partitioned variant of ``_get_join_indexers``.
+
+    Both sides are partitioned on the high bits of the hash of their keys, so
+    that equal keys always fall in the same partition, and the partitions
+    are joined one at a time with hash tables small enough to stay in the
+    CPU cache. The resulting indexers are reordered to be identical to the
+    ones returned by ``_get_join_indexers``.
+    """
+    nleft, nright = len(left_keys[0]), len(right_keys[0])
+    nbits = _radix_bits(max(nleft, nright))
+
+    hashes = [_radix_hash_keys(lk, rk) for lk, rk in zip(left_keys,
+                                                           right_keys)]
+    if nbits == 0 or any(h is None for h in hashes):
+        return _get_join_indexers(left_keys, right_keys, sort=sort, how=how)
+
+    lhash = _combine_hash_arrays(iter(h[0] for h in hashes), len(hashes))
+    rhash = _combine_hash_arrays(iter(h[1] for h in hashes), len(hashes))
+
+    npartitions = 1 << nbits
+    shift = np.uint64(64 - nbits)
+    lsorter, lcounts = libalgos.groupsort_indexer(
+        (lhash >> shift).astype('i8'), npartitions)
+    rsorter, rcounts = libalgos.groupsort_indexer(
+        (rhash >> shift).astype('i8'), npartitions)
+    lbounds = np.cumsum(lcounts)
+    rbounds = np.cumsum(rcounts)
+
+    left_keys = [getattr(k, '_values', k) for k in left_keys]
+    right_keys = [getattr(k, '_values', k) for k in right_keys]
+
+    join_kwargs = {'sort': False} if how == 'left' else {}
+    join_func = _join_functions[how]
+
+    left_indexers, right_indexers, group_firsts = [], [], []
+    for i in range(npartitions):
+        lidx = lsorter[lbounds[i]:lbounds[i + 1]]
+        ridx = rsorter[rbounds[i]:rbounds[i + 1]]
+        if ((len(lidx) == 0 and how in ('inner', 'left')) or
+                (len(ridx) == 0 and how in ('inner', 'right')) or
+                (len(lidx) == 0 and len(ridx) == 0)):
+            continue
+
+        # factorize the keys of the partition as _get_join_indexers does,
+        # labels are numbered in order of first appearance (left, then right)
+        fkeys = partial(_factorize_keys, sort=False)
+        llab, rlab, shape = map(list, zip(*map(
+            fkeys, [k.take(lidx) for k in left_keys],
+            [k.take(ridx) for k in right_keys])))
+        lkey, rkey = _get_join_keys(llab, rlab, shape, False)
+        lkey, rkey, count = fkeys(lkey, rkey)
+
+        lindexer, rindexer = join_func(lkey, rkey, count, **join_kwargs)
+
+        # position of the first occurrence of every group, counting the
+        # right rows after all the left ones
+        first = np.empty(count, dtype=np.int64)
+        for labels, idx, offset in [(rkey, ridx, nleft), (lkey, lidx, 0)]:
+            sorter, counts = libalgos.groupsort_indexer(labels, count)
+            counts = counts[1:]
+            present = counts > 0
+            starts = (np.cumsum(counts) - counts)[present]
+            first[present] = idx.take(sorter.take(starts)) + offset
+
+        lmask = lindexer != -1
+        labels = np.empty(len(lindexer), dtype=np.int64)
+        labels[lmask] = lkey.take(lindexer[lmask])
+        labels[~lmask] = rkey.take(rindexer[~lmask])
+
+        left_indexers.append(_take_positions(lidx, lindexer))
+        right_indexers.append(_take_positions(ridx, rindexer))
+        group_firsts.append(first.take(labels))
+
+    if not left_indexers:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty.copy()
+
+    left_indexer = np.concatenate(left_indexers)
+    right_indexer = np.concatenate(right_indexers)
+    group_first = np.concatenate(group_firsts)
+
+    if sort:
+        # rank the groups on their keys, nulls last
+        uniques, inverse = np.unique(group_first, return_inverse=True)
+        values = [Index(lk).append(Index(rk)).take(uniques)
+                  for lk, rk in zip(left_keys, right_keys)]
+        rank = np.empty(len(uniques), dtype=np.int64)
+        rank[sorting.lexsort_indexer(values)] = np.arange(len(uniques))
+        sort_key = rank.take(inverse)
+    elif how == 'left':
+        # preserve the order of the left frame
+        sort_key = left_indexer
+    else:
+        sort_key = group_first
+
+    # stable counting sort, keeps the order of the rows within a group
+    order, _ = libalgos.groupsort_indexer(_ensure_int64(sort_key),
+                                          nleft + nright)
+    return left_indexer.take(order), right_indexer.take(order)
+
+
+def _sorted_key_values(key):
+    """
+    Return the values of a join key as an ndarray that can be compared and
+    searched, or None if its nulls cannot be ordered.
+    """
+    values = np.asarray(com._values_from_object(key))
+    if needs_i8_conversion(values):
+        values = values.view('i8')
+        if (values == iNaT).any():
+            return None
+    return values
+
+
+# the dtypes of the libjoin.merge_join_indexer kernels
+_merge_join_dtypes = ['float64', 'float32', 'object', 'int32', 'int64',
+                      'uint64']
+
+
+def _merge_join_values(left, right):
+    """
+    Return the first key columns of both sides with the dtype of a
+    libjoin.merge_join_indexer kernel, and the name of that dtype.
+    """
+    if left.dtype == right.dtype and left.dtype.name in _merge_join_dtypes:
+        return left, right, left.dtype.name
+
+    kinds = {left.dtype.kind, right.dtype.kind}
+    if kinds == {'u'}:
+        name = 'uint64'
+    elif kinds <= {'i', 'b'}:
+        name = 'int64'
+    elif kinds <= {'i', 'u', 'b', 'f'} and 'f' in kinds:
+        name = 'float64'
+    else:
+        # e.g. mixed signed and unsigned integers, compared exactly
+        name = 'object'
+    return (left.astype(name, copy=False), right.astype(name, copy=False),
+            name)
+
+
+def _merge_join_codes(left_keys, right_keys):
+    """
+    Factorize the key columns of both sides after the first one to int64
+    codes in the order of their values, for the libjoin.merge_join_indexer
+    kernels to compare them as integers. Return an array of the codes of
+    each side, with a column per key.
+    """
+    lcodes = np.empty((len(left_keys[0]), len(left_keys) - 1),
+                      dtype=np.int64)
+    rcodes = np.empty((len(right_keys[0]), len(right_keys) - 1),
+                      dtype=np.int64)
+    for k, (lk, rk) in enumerate(zip(left_keys[1:], right_keys[1:])):
+        lcodes[:, k], rcodes[:, k], _ = _factorize_keys(lk, rk, sort=True)
+    return lcodes, rcodes
+
+
+def _get_sorted_join_indexers(left_keys, right_keys, sort=False, how='inner'):
+    """
+    Merge-join variant of ``_get_join_indexers`` for keys that are already
+    sorted in ascending (lexicographic) order on both sides.
+
+    The libjoin.merge_join_indexer kernel walks the first key columns of
+    both sides in step, comparing the other key columns on ties only; no
+    hash table is built for the first key columns, the other ones are
+    factorized to int64 codes in the order of their values. The indexers
+    are identical to the ones returned by ``_get_join_indexers``.
+
+    Returns None if the keys are not sorted, have nulls or cannot be
+    compared, in which case the caller should fall back to the hash join.
+    """
+    left_keys = [_sorted_key_values(k) for k in left_keys]
+    right_keys = [_sorted_key_values(k) for k in right_keys]
+    if any(k is None for k in left_keys + right_keys):
+        return None
+
+    lvalues, rvalues, name = _merge_join_values(left_keys[0], right_keys[0])
+    merge_join = getattr(libjoin, 'merge_join_indexer_{name}'.format(
+        name=name))
+    try:
+        lcodes, rcodes = _merge_join_codes(left_keys, right_keys)
+        if how == 'right':
+            right_indexer, left_indexer = merge_join(
+                rvalues, lvalues, rcodes, lcodes, 'left')
+        else:
+            left_indexer, right_indexer = merge_join(
+                lvalues, rvalues, lcodes, rcodes, how)
+    except (TypeError, ValueError):
+        # unsorted keys, nulls or keys that cannot be ordered
+        return None
+
+    if not sort and how in ('right', 'outer'):
+        # as with the hash join, the keys only found on the right come last
+        missing = left_indexer == -1
+        if missing.any():
+            order = np.concatenate([np.flatnonzero(~missing),
+                                    np.flatnonzero(missing)])
+            left_indexer = left_indexer.take(order)
+            right_indexer = right_indexer.take(order)
+    return left_indexer, right_indexer
+
+
 class _OrderedMerge(_MergeOperation):
     _merge_type = 'ordered_merge'
 
@@ -1240,6 +1527,56 @@ def _get_cython_type_upcast(dtype):
         return 'object'
 
 
+def _factorize_by_keys(left_keys, right_keys):
+    """
+    Factorize the 'by' columns of both sides of an asof merge to dense int64
+    group ids, returned with the number of groups.
+    """
+    llab, rlab, shape = map(list, zip(* map(_factorize_keys,
+                                            left_keys, right_keys)))
+    lkey, rkey = _get_join_keys(llab, rlab, shape, sort=False)
+    lkey, rkey, count = _factorize_keys(lkey, rkey, sort=False)
+    return _ensure_int64(lkey), _ensure_int64(rkey), count
+
+
+def _asof_join_groups_parallel(func, left_values, right_values, left_by,
+                               right_by, ngroups, allow_exact_matches,
+                               tolerance, nthreads):
+    """
+    Run the asof join ``func`` (without 'by') separately for every group of
+    ``left_by`` / ``right_by`` ids, distributing the groups over a thread
+    pool. The asof kernels release the GIL.
+    """
+    # stable, so the 'on' values stay sorted within each group
+    lsorter, lcounts = libalgos.groupsort_indexer(left_by, ngroups)
+    rsorter, rcounts = libalgos.groupsort_indexer(right_by, ngroups)
+    lsorter, rsorter = lsorter.astype(np.int64), rsorter.astype(np.int64)
+    lstarts = np.cumsum(lcounts) - lcounts
+    rstarts = np.cumsum(rcounts) - rcounts
+
+    left_indexer = np.arange(len(left_values), dtype=np.int64)
+    right_indexer = np.full(len(left_values), -1, dtype=np.int64)
+
+    # the counts are offset by one, slot 0 counts the missing (-1) ids
+    groups = np.flatnonzero((lcounts > 0) & (rcounts > 0))
+    groups = groups[groups > 0]
+
+    def _join_groups(groups):
+        for i in groups:
+            lrows = lsorter[lstarts[i]:lstarts[i] + lcounts[i]]
+            rrows = rsorter[rstarts[i]:rstarts[i] + rcounts[i]]
+            _, rindexer = func(left_values.take(lrows),
+                               right_values.take(rrows),
+                               allow_exact_matches, tolerance)
+            right_indexer[lrows] = np.where(rindexer == -1, -1,
+                                            rrows.take(rindexer))
+
+    nchunks = max(min(nthreads, len(groups)), 1)
+    com._thread_map(_join_groups, np.array_split(groups, nchunks), nchunks)
+
+    return left_indexer, right_indexer
+
+
 class _AsOfMerge(_OrderedMerge):
     _merge_type = 'asof_merge'
 
@@ -1369,13 +1706,6 @@ class _AsOfMerge(_OrderedMerge):
     def _get_join_indexers(self):
         """ return the join indexers """
 
-        def flip(xs):
-            """ unlike np.transpose, this returns an array of tuples """
-            labels = list(string.ascii_lowercase[:len(xs)])
-            dtypes = [x.dtype for x in xs]
-            labeled_dtypes = list(zip(labels, dtypes))
-            return np.array(lzip(*xs), labeled_dtypes)
-
         # values to compare
         left_values = (self.left.index.values if self.left_index else
                        self.left_join_keys[-1])
@@ -1407,13 +1737,23 @@ class _AsOfMerge(_OrderedMerge):
                 left_by_values = self.left_join_keys[0:-1]
                 right_by_values = self.right_join_keys[0:-1]
 
-            # get tuple representation of values if more than one
-            if len(left_by_values) == 1:
+            nthreads = get_option('compute.merge_asof_nthreads')
+            if len(left_by_values) == 1 and nthreads <= 1:
                 left_by_values = left_by_values[0]
                 right_by_values = right_by_values[0]
             else:
-                left_by_values = flip(left_by_values)
-                right_by_values = flip(right_by_values)
+                # factorize multiple 'by' columns to int64 group ids
+                # instead of hashing tuples of objects
+                left_by_values, right_by_values, ngroups = \
+                    _factorize_by_keys(left_by_values, right_by_values)
+
+                if nthreads > 1:
+                    on_type = _get_cython_type(left_values.dtype)
+                    func = _asof_function(self.direction, on_type)
+                    return _asof_join_groups_parallel(
+                        func, left_values, right_values, left_by_values,
+                        right_by_values, ngroups, self.allow_exact_matches,
+                        tolerance, nthreads)
 
             # upcast 'by' parameter because HashTable is limited
             by_type = _get_cython_type_upcast(left_by_values.dtype)
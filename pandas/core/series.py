@@ -31,7 +31,9 @@ from pandas.core.dtypes.common import (
     _ensure_platform_int,
     pandas_dtype)
 from pandas.core.dtypes.generic import (
-    ABCSparseArray, ABCDataFrame, ABCIndexClass)
+    ABCSparseArray, ABCDataFrame, ABCIndexClass, ABCMaskedArray)
+from pandas.core.dtypes.dtypes import (
+    StringDtype, IntegerDtype, BooleanDtype)
 from pandas.core.dtypes.cast import (
     maybe_upcast, infer_dtype_from_scalar,
     maybe_convert_platform,
@@ -44,6 +46,8 @@ from pandas.core.index import (Index, MultiIndex, InvalidIndexError,
 from pandas.core.indexing import check_bool_indexer, maybe_convert_indices
 from pandas.core import generic, base
 from pandas.core.internals import SingleBlockManager
+from pandas.core.arrays import (ExtensionArray, StringArray, IntegerArray,
+                                BooleanArray)
 from pandas.core.arrays.categorical import Categorical, CategoricalAccessor
 from pandas.core.indexes.accessors import CombinedDatetimelikeProperties
 from pandas.core.indexes.datetimes import DatetimeIndex
@@ -841,6 +845,9 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
 
         # do the setitem
         cacher_needs_updating = self._check_is_chained_assignment_possible()
+
+        # copy-on-write: the values may be shared with a copy
+        self._data._ensure_own_values()
         setitem(key, value)
         if cacher_needs_updating:
             self._maybe_update_cacher()
@@ -976,6 +983,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self._set_value(label, value, takeable=takeable)
 
     def _set_value(self, label, value, takeable=False):
+        self._data._ensure_own_values()
         try:
             if takeable:
                 self._values[label] = value
@@ -2570,7 +2578,11 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             return self
 
         # be subclass-friendly
-        new_values = algorithms.take_1d(self.get_values(), indexer)
+        if isinstance(self._values, ABCMaskedArray):
+            # stays masked, -1 in the indexer is a missing value
+            new_values = self._values.take(indexer)
+        else:
+            new_values = algorithms.take_1d(self.get_values(), indexer)
         return self._constructor(new_values, index=new_index)
 
     def _needs_reindex_multi(self, axes, method, level):
@@ -3140,6 +3152,13 @@ def _sanitize_array(data, index, dtype=None, copy=False,
     if dtype is not None:
         dtype = pandas_dtype(dtype)
 
+    if isinstance(dtype, StringDtype) and not isinstance(data, StringArray):
+        data = StringArray(data)
+    elif isinstance(dtype, IntegerDtype):
+        data = IntegerArray(data, dtype=dtype)
+    elif isinstance(dtype, BooleanDtype):
+        data = BooleanArray(data)
+
     if isinstance(data, ma.MaskedArray):
         mask = ma.getmaskarray(data)
         if mask.any():
@@ -3201,6 +3220,13 @@ def _sanitize_array(data, index, dtype=None, copy=False,
             subarr = data.copy()
         return subarr
 
+    elif isinstance(data, ExtensionArray):
+        subarr = data
+
+        if copy:
+            subarr = data.copy(deep=True)
+        return subarr
+
     elif isinstance(data, (list, tuple)) and len(data) > 0:
         if dtype is not None:
             try:
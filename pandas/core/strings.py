@@ -12,8 +12,10 @@ from pandas.core.dtypes.common import (
     is_scalar,
     is_integer,
     is_re)
+from pandas.core.dtypes.dtypes import StringDtype
 
 import pandas.core.common as com
+from pandas.core.arrays import StringArray
 from pandas.core.algorithms import take_1d
 import pandas.compat as compat
 from pandas.core.base import NoNewAttributesMixin
@@ -33,6 +35,9 @@ _cpython_optimized_decoders = _cpython_optimized_encoders + (
 
 _shared_docs = dict()
 
+# characters that give a pattern a meaning as a regular expression
+_regex_special = frozenset('.^$*+?{}[]\\|()')
+
 
 def _get_array_list(arr, others):
     from pandas.core.series import Series
@@ -151,6 +156,19 @@ def _length_check(others):
     return n
 
 
+def _string_array(arr):
+    """ the StringArray holding the values of ``arr``, if any """
+    values = getattr(arr, '_values', arr)
+    if isinstance(values, StringArray):
+        return values
+    return None
+
+
+def _is_literal(pat):
+    return (isinstance(pat, compat.string_types) and
+            not any(c in _regex_special for c in pat))
+
+
 def _na_map(f, arr, na_result=np.nan, dtype=object):
     # should really _check_ for NA
     return _map(f, arr, na_mask=True, na_value=na_result, dtype=dtype)
@@ -242,6 +260,10 @@ def str_contains(arr, pat, case=True, flags=0, na=np.nan, regex=True):
     match : analogous, but stricter, relying on re.match instead of re.search
 
     """
+    values = _string_array(arr)
+    if values is not None and (not regex or (not flags and _is_literal(pat))):
+        return values._str_contains(pat, case=case, na=na)
+
     if regex:
         if not case:
             flags |= re.IGNORECASE
@@ -281,6 +303,10 @@ def str_startswith(arr, pat, na=np.nan):
     -------
     startswith : Series/array of boolean values
     """
+    values = _string_array(arr)
+    if values is not None and isinstance(pat, compat.string_types):
+        return values._str_startswith(pat, na=na)
+
     f = lambda x: x.startswith(pat)
     return _na_map(f, arr, na, dtype=bool)
 
@@ -301,6 +327,10 @@ def str_endswith(arr, pat, na=np.nan):
     -------
     endswith : Series/array of boolean values
     """
+    values = _string_array(arr)
+    if values is not None and isinstance(pat, compat.string_types):
+        return values._str_endswith(pat, na=na)
+
     f = lambda x: x.endswith(pat)
     return _na_map(f, arr, na, dtype=bool)
 
@@ -1078,6 +1108,10 @@ def str_slice(arr, start=None, stop=None, step=None):
     -------
     sliced : Series/Index of objects
     """
+    values = _string_array(arr)
+    if values is not None:
+        return values._str_slice(start, stop, step)
+
     obj = slice(start, stop, step)
     f = lambda x: x[obj]
     return _na_map(f, arr)
@@ -1309,9 +1343,14 @@ def str_encode(arr, encoding, errors="strict"):
     return _na_map(f, arr)
 
 
-def _noarg_wrapper(f, docstring=None, **kargs):
+def _noarg_wrapper(f, docstring=None, name=None, **kargs):
     def wrapper(self):
-        result = _na_map(f, self._data, **kargs)
+        values = _string_array(self._data)
+        if name is not None and values is not None:
+            # vectorized StringArray implementation
+            result = getattr(values, '_str_' + name)()
+        else:
+            result = _na_map(f, self._data, **kargs)
         return self._wrap_result(result)
 
     wrapper.__name__ = f.__name__
@@ -1383,7 +1422,8 @@ class StringMethods(NoNewAttributesMixin):
         if (isinstance(data, ABCSeries) and
                 not ((is_categorical_dtype(data.dtype) and
                       is_object_dtype(data.values.categories)) or
-                     (is_object_dtype(data.dtype)))):
+                     (is_object_dtype(data.dtype)) or
+                     StringDtype.is_dtype(data.dtype))):
             # it's neither a string series not a categorical series with
             # strings inside the categories.
             # this really should exclude all series with any non-string values
@@ -1507,6 +1547,15 @@ class StringMethods(NoNewAttributesMixin):
 
     @copy(str_split)
     def split(self, pat=None, n=-1, expand=False):
+        values = _string_array(self._data)
+        if (expand and values is not None and
+                isinstance(pat, compat.string_types) and len(pat) == 1):
+            # the parts are sliced from the buffers of the StringArray
+            columns = values._str_split(pat, n=n)
+            return self._orig._constructor_expanddim(
+                dict(enumerate(columns)), index=self._orig.index,
+                columns=list(range(len(columns))))
+
         result = str_split(self._data, pat, n=n)
         return self._wrap_result(result, expand=expand)
 
@@ -1847,7 +1896,8 @@ class StringMethods(NoNewAttributesMixin):
     -------
     lengths : Series/Index of integer values
     """)
-    len = _noarg_wrapper(len, docstring=_shared_docs['len'], dtype=int)
+    len = _noarg_wrapper(len, docstring=_shared_docs['len'], name='len',
+                         dtype=int)
 
     _shared_docs['casemethods'] = ("""
     Convert strings in the Series/Index to %(type)s.
@@ -1865,10 +1915,10 @@ class StringMethods(NoNewAttributesMixin):
     _shared_docs['swapcase'] = dict(type='be swapcased', method='swapcase')
     lower = _noarg_wrapper(lambda x: x.lower(),
                            docstring=_shared_docs['casemethods'] %
-                           _shared_docs['lower'])
+                           _shared_docs['lower'], name='lower')
     upper = _noarg_wrapper(lambda x: x.upper(),
                            docstring=_shared_docs['casemethods'] %
-                           _shared_docs['upper'])
+                           _shared_docs['upper'], name='upper')
     title = _noarg_wrapper(lambda x: x.title(),
                            docstring=_shared_docs['casemethods'] %
                            _shared_docs['title'])
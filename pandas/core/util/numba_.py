@@ -0,0 +1,159 @@
+"""
+compile user defined functions with numba, for the ``engine='numba'``
+paths of the window and groupby functions
+"""
+import numpy as np
+
+_engines = ('cython', 'numba')
+_engine_kwargs = ('nopython', 'nogil', 'parallel')
+
+# compiled kernels, keyed by the user function, the kind of kernel and the
+# arguments passed to numba.jit
+_kernel_cache = {}
+
+
+def import_numba():
+    try:
+        import numba
+    except ImportError:
+        raise ImportError("engine='numba' requires numba to be installed")
+    return numba
+
+
+def validate_engine(engine, engine_kwargs, kwargs):
+    """
+    Check the ``engine`` and ``engine_kwargs`` arguments of a function
+    accepting a user defined function.
+
+    Parameters
+    ----------
+    engine : str or None
+    engine_kwargs : dict or None
+    kwargs : dict
+        keyword arguments for the user defined function
+
+    Returns
+    -------
+    engine : str
+    """
+    if engine is None:
+        engine = 'cython'
+    if engine not in _engines:
+        raise ValueError("engine must be either 'numba' or 'cython'")
+    if engine == 'cython':
+        if engine_kwargs is not None:
+            raise ValueError("cython engine does not accept engine_kwargs")
+        return engine
+
+    invalid = set(engine_kwargs or {}) - set(_engine_kwargs)
+    if invalid:
+        raise ValueError("invalid engine_kwargs: {invalid}, valid are "
+                         "{valid}".format(invalid=sorted(invalid),
+                                          valid=list(_engine_kwargs)))
+    if kwargs:
+        raise ValueError("numba does not support keyword arguments for the "
+                         "function, pass them positionally with args")
+    return engine
+
+
+def _get_jit_arguments(engine_kwargs):
+    engine_kwargs = engine_kwargs or {}
+    nopython = engine_kwargs.get('nopython', True)
+    # the kernels release the GIL by default, so that columns can be
+    # computed on several threads
+    nogil = engine_kwargs.get('nogil', True)
+    parallel = engine_kwargs.get('parallel', False)
+    return nopython, nogil, parallel
+
+
+def _jit_user_function(numba, func, nopython, nogil, parallel):
+    if hasattr(func, 'py_func'):
+        # already compiled by the user
+        return func
+    return numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)(func)
+
+
+def generate_apply_kernel(func, engine_kwargs):
+    """
+    Compile a kernel applying ``func`` to the windows ``[begin[i], end[i])``
+    of a float64 ndarray.
+
+    The kernel has the signature ``kernel(values, begin, end, minp, *args)``
+    and returns an ndarray of the result of each window, or NaN if the
+    window has less than ``minp`` finite values.
+
+    Parameters
+    ----------
+    func : function
+        takes a float64 ndarray and returns a scalar
+    engine_kwargs : dict or None
+        nopython, nogil and parallel arguments of numba.jit
+
+    Returns
+    -------
+    kernel : numba function
+    """
+    nopython, nogil, parallel = _get_jit_arguments(engine_kwargs)
+    key = func, 'apply', nopython, nogil, parallel
+    if key in _kernel_cache:
+        return _kernel_cache[key]
+
+    numba = import_numba()
+    numba_func = _jit_user_function(numba, func, nopython, nogil, parallel)
+    loop_range = numba.prange if parallel else range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def apply_kernel(values, begin, end, minp, *args):
+        result = np.empty(len(begin))
+        for i in loop_range(len(begin)):
+            window = values[begin[i]:end[i]]
+            if np.sum(np.isfinite(window)) >= minp:
+                result[i] = numba_func(window, *args)
+            else:
+                result[i] = np.nan
+        return result
+
+    _kernel_cache[key] = apply_kernel
+    return apply_kernel
+
+
+def generate_transform_kernel(func, engine_kwargs):
+    """
+    Compile a kernel replacing the slices ``[begin[i], end[i])`` of a
+    float64 ndarray by the result of ``func`` on them.
+
+    The kernel has the signature ``kernel(values, begin, end, *args)``; the
+    values outside of all the slices are NaN in the result.
+
+    Parameters
+    ----------
+    func : function
+        takes a float64 ndarray and returns a scalar or an ndarray of the
+        same length
+    engine_kwargs : dict or None
+        nopython, nogil and parallel arguments of numba.jit
+
+    Returns
+    -------
+    kernel : numba function
+    """
+    nopython, nogil, parallel = _get_jit_arguments(engine_kwargs)
+    key = func, 'transform', nopython, nogil, parallel
+    if key in _kernel_cache:
+        return _kernel_cache[key]
+
+    numba = import_numba()
+    numba_func = _jit_user_function(numba, func, nopython, nogil, parallel)
+    loop_range = numba.prange if parallel else range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def transform_kernel(values, begin, end, *args):
+        result = np.empty(len(values))
+        result[:] = np.nan
+        for i in loop_range(len(begin)):
+            result[begin[i]:end[i]] = numba_func(values[begin[i]:end[i]],
+                                                 *args)
+        return result
+
+    _kernel_cache[key] = transform_kernel
+    return transform_kernel
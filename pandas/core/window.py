@@ -28,12 +28,15 @@ from pandas.core.dtypes.common import (
     is_timedelta64_dtype,
     is_list_like,
     _ensure_float64,
+    _ensure_int64,
     is_scalar)
 
 from pandas.core.base import (PandasObject, SelectionMixin,
                               GroupByMixin)
 import pandas.core.common as com
 import pandas._libs.window as _window
+from pandas.core.config import get_option
+from pandas.core.util import numba_
 
 from pandas import compat
 from pandas.compat.numpy import function as nv
@@ -347,7 +350,9 @@ class Window(_Window):
         (otherwise result is NA). For a window that is specified by an offset,
         this will default to 1.
     center : boolean, default False
-        Set the labels at the center of the window.
+        Set the labels at the center of the window. For a window that is
+        specified by an offset, the window spans half of the offset on each
+        side of the label (new in 0.23.0).
     win_type : string, default None
         Provide a window type. If ``None``, all points are evenly weighted.
         See the notes below for further information.
@@ -468,6 +473,9 @@ class Window(_Window):
     * ``general_gaussian`` (needs power, width)
     * ``slepian`` (needs width).
 
+    The weights of all of these types but ``slepian`` are generated without
+    scipy, which is needed for the other types of scipy.signal.
+
     If ``win_type=None`` all points are evenly weighted. To learn more about
     different window types see `scipy.signal window functions
     <https://docs.scipy.org/doc/scipy/reference/signal.html#window-functions>`__.
@@ -487,14 +495,17 @@ class Window(_Window):
         elif is_integer(window):
             if window < 0:
                 raise ValueError("window must be non-negative")
+            if not isinstance(self.win_type, compat.string_types):
+                raise ValueError('Invalid win_type {0}'.format(self.win_type))
+            if self.win_type in _window_weights:
+                return
+
             try:
                 import scipy.signal as sig
             except ImportError:
                 raise ImportError('Please install scipy to generate window '
                                   'weight')
 
-            if not isinstance(self.win_type, compat.string_types):
-                raise ValueError('Invalid win_type {0}'.format(self.win_type))
             if getattr(sig, self.win_type, None) is None:
                 raise ValueError('Invalid win_type {0}'.format(self.win_type))
         else:
@@ -510,7 +521,6 @@ class Window(_Window):
         if isinstance(window, (list, tuple, np.ndarray)):
             return com._asarray_tuplesafe(window).astype(float)
         elif is_integer(window):
-            import scipy.signal as sig
 
             # the below may pop from kwargs
             def _validate_win_type(win_type, kwargs):
@@ -534,6 +544,12 @@ class Window(_Window):
                 return all_args
 
             win_type = _validate_win_type(self.win_type, kwargs)
+            if self.win_type in _window_weights:
+                args = win_type[1:] if isinstance(win_type, tuple) else ()
+                return _get_window_weights(self.win_type, window, *args)
+
+            import scipy.signal as sig
+
             # GH #15662. `False` makes symmetric window, rather than periodic.
             return sig.get_window(win_type, window, False).astype(float)
 
@@ -567,17 +583,26 @@ class Window(_Window):
                 results.append(values.copy())
                 continue
 
-            offset = _offset(window, center)
-            additional_nans = np.array([np.NaN] * offset)
+            # roll all the columns of the block at once, along axis 0
+            ndim = values.ndim
+            if ndim == 1:
+                values = values.reshape(-1, 1)
+            elif self.axis == 1:
+                values = values.T
 
-            def f(arg, *args, **kwargs):
-                minp = _use_window(self.min_periods, len(window))
-                return _window.roll_window(np.concatenate((arg,
-                                                           additional_nans))
-                                           if center else arg, window, minp,
-                                           avg=mean)
+            if center:
+                offset = _offset(window, center)
+                additional_nans = np.empty((offset, values.shape[1]))
+                additional_nans.fill(np.NaN)
+                values = np.concatenate((values, additional_nans))
+
+            minp = _use_window(self.min_periods, len(window))
+            result = _roll_weighted(values, window, minp, avg=mean)
 
-            result = np.apply_along_axis(f, self.axis, values)
+            if ndim == 1:
+                result = result.ravel()
+            elif self.axis == 1:
+                result = result.T
 
             if center:
                 result = self._center_window(result, window)
@@ -718,6 +743,10 @@ class _Rolling(_Window):
         if window is None:
             window = self._get_window()
 
+        # offset windows are centered by their bounds, see _get_index
+        if self.is_freq_type:
+            center = False
+
         if check_minp is None:
             check_minp = _use_window
 
@@ -766,7 +795,7 @@ class _Rolling(_Window):
 
             with np.errstate(all='ignore'):
                 if values.ndim > 1:
-                    result = np.apply_along_axis(calc, self.axis, values)
+                    result = _apply_along_axis(calc, self.axis, values)
                 else:
                     result = calc(values)
 
@@ -808,21 +837,53 @@ class _Rolling_and_Expanding(_Rolling):
     ----------
     func : function
         Must produce a single value from an ndarray input
-        \*args and \*\*kwargs are passed to the function""")
-
-    def apply(self, func, args=(), kwargs={}):
+        \*args and \*\*kwargs are passed to the function
+    args : tuple, default ()
+        Positional arguments passed to ``func``
+    kwargs : dict, default {}
+        Keyword arguments passed to ``func``, not supported by the numba
+        engine
+    engine : {'cython', 'numba'}, default 'cython'
+        * ``'cython'`` calls ``func`` from the cython window loop
+        * ``'numba'`` compiles ``func`` and the window loop with numba,
+          ``func`` then receives float64 ndarrays and must be compilable
+          in nopython mode (unless ``engine_kwargs`` disables it)
+
+        .. versionadded:: 0.23.0
+    engine_kwargs : dict, default None
+        The ``nopython``, ``nogil`` and ``parallel`` arguments passed to
+        ``numba.jit``, defaulting to ``True``, ``True`` and ``False``.
+        Only valid for the numba engine.
+
+        .. versionadded:: 0.23.0""")
+
+    def apply(self, func, args=(), kwargs={}, engine='cython',
+              engine_kwargs=None):
         # TODO: _level is unused?
         _level = kwargs.pop('_level', None)  # noqa
+        engine = numba_.validate_engine(engine, engine_kwargs, kwargs)
         window = self._get_window()
-        offset = _offset(window, self.center)
+        offset = _offset(window, self.center and not self.is_freq_type)
         index, indexi = self._get_index()
 
-        def f(arg, window, min_periods, closed):
-            minp = _use_window(min_periods, window)
-            return _window.roll_generic(arg, window, minp, indexi, closed,
-                                        offset, func, args, kwargs)
+        if engine == 'numba':
+            kernel = numba_.generate_apply_kernel(func, engine_kwargs)
+
+            def f(arg, window, min_periods, closed):
+                minp = _use_window(min_periods, window)
+                begin, end, minp = _get_window_bounds(arg, window, minp,
+                                                      indexi, closed, offset)
+                return kernel(arg, begin, end, minp, *args)
+        else:
+
+            def f(arg, window, min_periods, closed):
+                minp = _use_window(min_periods, window)
+                return _window.roll_generic(arg, window, minp, indexi,
+                                            closed, offset, func, args,
+                                            kwargs)
 
         return self._apply(f, func, args=args, kwargs=kwargs,
+                           engine=engine, engine_kwargs=engine_kwargs,
                            center=False)
 
     def sum(self, *args, **kwargs):
@@ -948,15 +1009,30 @@ class _Rolling_and_Expanding(_Rolling):
         observations will be used.
     ddof : int, default 1
         Delta Degrees of Freedom.  The divisor used in calculations
-        is ``N - ddof``, where ``N`` represents the number of elements.""")
+        is ``N - ddof``, where ``N`` represents the number of elements.
+    as_array : bool, default False
+        If True, return the pairwise covariances of DataFrames as a 3-d
+        ndarray of shape ``(len(index), len(columns), len(other.columns))``
+        instead of a MultiIndexed DataFrame.
 
-    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
+        .. versionadded:: 0.23.0""")
+
+    def cov(self, other=None, pairwise=None, ddof=1, as_array=False,
+            **kwargs):
         if other is None:
             other = self._selected_obj
             # only default unset
             pairwise = True if pairwise is None else pairwise
         other = self._shallow_copy(other)
 
+        if pairwise:
+            result = self._pairwise_matrix(other, ddof=ddof)
+            if result is not None:
+                return self._wrap_pairwise_matrix(result, other, as_array)
+        if as_array:
+            raise ValueError("as_array is only supported for the pairwise "
+                             "covariance of DataFrames with the same index")
+
         # GH 16058: offset window
         if self.is_freq_type:
             window = self.win_freq
@@ -991,15 +1067,33 @@ class _Rolling_and_Expanding(_Rolling):
         If True then all pairwise combinations will be calculated and the
         output will be a MultiIndex DataFrame in the case of DataFrame inputs.
         In the case of missing elements, only complete pairwise observations
-        will be used.""")
+        will be used.
+    as_array : bool, default False
+        If True, return the pairwise correlations of DataFrames as a 3-d
+        ndarray of shape ``(len(index), len(columns), len(other.columns))``
+        instead of a MultiIndexed DataFrame.
 
-    def corr(self, other=None, pairwise=None, **kwargs):
+        .. versionadded:: 0.23.0""")
+
+    def corr(self, other=None, pairwise=None, as_array=False, **kwargs):
         if other is None:
             other = self._selected_obj
             # only default unset
             pairwise = True if pairwise is None else pairwise
         other = self._shallow_copy(other)
-        window = self._get_window(other)
+
+        if pairwise:
+            result = self._pairwise_matrix(other, corr=True)
+            if result is not None:
+                return self._wrap_pairwise_matrix(result, other, as_array)
+        if as_array:
+            raise ValueError("as_array is only supported for the pairwise "
+                             "correlation of DataFrames with the same index")
+
+        if self.is_freq_type:
+            window = self.win_freq
+        else:
+            window = self._get_window(other)
 
         def _get_corr(a, b):
             a = a.rolling(window=window, min_periods=self.min_periods,
@@ -1012,6 +1106,74 @@ class _Rolling_and_Expanding(_Rolling):
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
                                    _get_corr, pairwise=bool(pairwise))
 
+    def _pairwise_matrix(self, other, corr=False, ddof=1):
+        """
+        The pairwise covariances, or correlations, of the columns of the
+        object with the columns of other, computed in a single pass by
+        _window.roll_cov_matrix rather than one pair of columns at a time.
+
+        Returns
+        -------
+        3-d ndarray indexed by (row, column, column of other), or None if
+        the objects are not DataFrames with the same index and numeric
+        columns
+        """
+        arg1 = self._selected_obj
+        arg2 = other._selected_obj
+        if not (isinstance(arg1, ABCDataFrame) and
+                isinstance(arg2, ABCDataFrame)):
+            return None
+        if (self.axis != 0 or self.on is not None or not len(arg1) or
+                arg1.index.nlevels > 1 or arg2.columns.nlevels > 1 or
+                not arg1.index.equals(arg2.index)):
+            return None
+
+        try:
+            x = self._prep_values(arg1.values)
+            y = x if arg2 is arg1 else self._prep_values(arg2.values)
+        except (TypeError, NotImplementedError):
+            return None
+
+        if self.is_freq_type:
+            window = self._get_window()
+            index, indexi = self._get_index()
+            offset = 0
+        else:
+            window = self._get_window(other)
+            indexi = None
+            offset = _offset(window, self.center)
+        minp = _use_window(self.min_periods, window)
+
+        if offset:
+            def pad(v):
+                return np.concatenate((v, np.full((offset, v.shape[1]),
+                                                  np.NaN)))
+
+            # only half of the matrix is computed if y is x
+            padded = pad(x)
+            y = padded if y is x else pad(y)
+            x = padded
+
+        with np.errstate(all='ignore'):
+            result = _window.roll_cov_matrix(x, y, window, minp, indexi,
+                                             self.closed, ddof=ddof,
+                                             corr=corr)
+        return result[offset:]
+
+    def _wrap_pairwise_matrix(self, result, other, as_array=False):
+        """ wrap the result of _pairwise_matrix like _flex_binary_moment """
+        if as_array:
+            return result
+
+        from pandas import DataFrame, MultiIndex
+        arg1 = self._selected_obj
+        arg2 = other._selected_obj
+        index = MultiIndex.from_product(
+            [arg1.index, arg2.columns],
+            names=list(arg1.index.names) + list(arg2.columns.names))
+        values = result.transpose(0, 2, 1).reshape(-1, len(arg1.columns))
+        return DataFrame(values, index=index, columns=arg1.columns)
+
 
 class Rolling(_Rolling_and_Expanding):
 
@@ -1047,12 +1209,6 @@ class Rolling(_Rolling_and_Expanding):
             self._validate_monotonic()
             freq = self._validate_freq()
 
-            # we don't allow center
-            if self.center:
-                raise NotImplementedError("center is not implemented "
-                                          "for datetimelike and offset "
-                                          "based windows")
-
             # this will raise ValueError on non-fixed freqs
             self.win_freq = self.window
             self.window = freq.nanos
@@ -1071,6 +1227,15 @@ class Rolling(_Rolling_and_Expanding):
             raise ValueError("closed only implemented for datetimelike "
                              "and offset based windows")
 
+    def _get_index(self, index=None):
+        index, indexi = super(Rolling, self)._get_index(index=index)
+
+        # the bounds of the centered offset windows are passed as the index
+        if self.is_freq_type and self.center:
+            indexi = _window.get_centered_window_bounds(indexi, self.window,
+                                                        self.closed)
+        return index, indexi
+
     def _validate_monotonic(self):
         """ validate on is monotonic """
         if not self._on.is_monotonic:
@@ -1163,8 +1328,11 @@ class Rolling(_Rolling_and_Expanding):
     @Substitution(name='rolling')
     @Appender(_doc_template)
     @Appender(_shared_docs['apply'])
-    def apply(self, func, args=(), kwargs={}):
-        return super(Rolling, self).apply(func, args=args, kwargs=kwargs)
+    def apply(self, func, args=(), kwargs={}, engine='cython',
+              engine_kwargs=None):
+        return super(Rolling, self).apply(func, args=args, kwargs=kwargs,
+                                          engine=engine,
+                                          engine_kwargs=engine_kwargs)
 
     @Substitution(name='rolling')
     @Appender(_doc_template)
@@ -1235,16 +1403,58 @@ class Rolling(_Rolling_and_Expanding):
     @Substitution(name='rolling')
     @Appender(_doc_template)
     @Appender(_shared_docs['cov'])
-    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
+    def cov(self, other=None, pairwise=None, ddof=1, as_array=False,
+            **kwargs):
         return super(Rolling, self).cov(other=other, pairwise=pairwise,
-                                        ddof=ddof, **kwargs)
+                                        ddof=ddof, as_array=as_array,
+                                        **kwargs)
 
     @Substitution(name='rolling')
     @Appender(_doc_template)
     @Appender(_shared_docs['corr'])
-    def corr(self, other=None, pairwise=None, **kwargs):
+    def corr(self, other=None, pairwise=None, as_array=False, **kwargs):
         return super(Rolling, self).corr(other=other, pairwise=pairwise,
-                                         **kwargs)
+                                         as_array=as_array, **kwargs)
+
+    def online(self, func, *args, **kwargs):
+        """
+        Rolling statistic of a stream of batches of rows, each batch
+        resuming from the rows of the previous ones that its windows reach.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        func : string
+            name of the statistic, e.g. ``'sum'`` or ``'quantile'``
+        *args, **kwargs
+            arguments of the statistic
+
+        Returns
+        -------
+        OnlineWindow
+            with the statistic of the rolled object as ``result``, whose
+            ``update`` computes the statistic of the following batches
+        """
+        if func not in _online_rolling_funcs:
+            raise ValueError("func must be one of {funcs}".format(
+                funcs=list(_online_rolling_funcs)))
+        if self.center:
+            raise NotImplementedError("center is not implemented for "
+                                      "online windows")
+        if self.on is not None or self.axis != 0:
+            raise NotImplementedError("online windows are only implemented "
+                                      "over the index")
+
+        obj = self._selected_obj
+        window = self.win_freq if self.is_freq_type else self.window
+        online = OnlineWindow(dict(kind='rolling', func=func, args=args,
+                                   kwargs=kwargs, window=window,
+                                   min_periods=self.min_periods,
+                                   closed=self.closed,
+                                   template=obj.iloc[:0], tail=obj.iloc[:0]))
+        online.update(obj)
+        return online
 
 
 class RollingGroupby(_GroupByMixin, Rolling):
@@ -1268,6 +1478,10 @@ class RollingGroupby(_GroupByMixin, Rolling):
             self.on = None
         return super(RollingGroupby, self)._gotitem(key, ndim, subset=subset)
 
+    def online(self, func, *args, **kwargs):
+        raise NotImplementedError("online is not implemented for "
+                                  "groupby.rolling")
+
     def _validate_monotonic(self):
         """
         validate that on is monotonic;
@@ -1277,6 +1491,103 @@ class RollingGroupby(_GroupByMixin, Rolling):
         """
         pass
 
+    @cache_readonly
+    def _grouped_windows(self):
+        """
+        Roll all of the groups in a single pass of the window functions.
+
+        Returns
+        -------
+        tuple of (sorter, bounds, index) or None
+            sorter : the rows of the selected object sorted by group
+            bounds : tuple of the start & end of the window of each sorted
+                     row, which never cross the boundary of its group
+            index : the (group keys, index) MultiIndex of the result
+            None if the groups must be rolled one at a time
+        """
+        from pandas import MultiIndex
+        from pandas.core.groupby import BinGrouper
+        from pandas.core.sorting import get_group_index_sorter
+
+        groupby = self._groupby
+        grouper = groupby.grouper
+        obj = self._selected_obj
+
+        if (self.center or self.on is not None or self.axis != 0 or
+                groupby.axis != 0 or not groupby.group_keys or
+                not groupby.as_index or isinstance(grouper, BinGrouper) or
+                not len(obj)):
+            return None
+
+        ids, _, ngroups = grouper.group_info
+        sorter = get_group_index_sorter(ids, ngroups)
+        ids = ids.take(sorter)
+
+        # rows with a NaN key (-1) sort first and are not in any group
+        skip = ids.searchsorted(0)
+        sorter, ids = sorter[skip:], ids[skip:]
+
+        labels = np.arange(ngroups)
+        group_start = _ensure_int64(ids.searchsorted(labels, side='left'))
+        group_end = _ensure_int64(ids.searchsorted(labels, side='right'))
+
+        index = obj.index.take(sorter)
+        indexi = None
+        if self.is_freq_type:
+            indexi = index.asi8
+
+            # each group must be monotonic, as when rolling them one at a
+            # time, where the error is raised
+            within = ids[1:] == ids[:-1]
+            if (np.diff(indexi)[within] < 0).any():
+                return None
+
+        bounds = _window.get_grouped_window_bounds(
+            group_start, group_end, self.window, indexi, self.closed)
+
+        keys = grouper.result_index.take(ids)
+        arrays = [keys.get_level_values(i) for i in range(keys.nlevels)]
+        arrays.extend(index.get_level_values(i)
+                      for i in range(index.nlevels))
+        names = list(keys.names) + list(index.names)
+        index = MultiIndex.from_arrays(arrays, names=names)
+
+        return sorter, bounds, index
+
+    def _create_blocks(self):
+        grouped = self._grouped_windows
+        if grouped is None:
+            return super(RollingGroupby, self)._create_blocks()
+
+        obj = self._selected_obj.take(grouped[0])
+        blocks = obj._to_dict_of_blocks(copy=False).values()
+        return blocks, obj, None
+
+    def _get_index(self, index=None):
+        grouped = self._grouped_windows
+        if grouped is None:
+            return super(RollingGroupby, self)._get_index(index=index)
+        return index, grouped[1]
+
+    def _apply(self, func, name, window=None, center=None,
+               check_minp=None, **kwargs):
+        """
+        Rolling statistical measure of each group; computed for all the
+        groups at once by passing the window bounds of the rows sorted by
+        group to the window functions, else dispatched to each group.
+        """
+        grouped = self._grouped_windows
+        if grouped is None:
+            return super(RollingGroupby, self)._apply(
+                func, name, window=window, center=center,
+                check_minp=check_minp, **kwargs)
+
+        result = _Rolling._apply(self, func, name, window=window,
+                                 center=center, check_minp=check_minp,
+                                 **kwargs)
+        result.index = grouped[2]
+        return result
+
 
 class Expanding(_Rolling_and_Expanding):
     """
@@ -1403,8 +1714,11 @@ class Expanding(_Rolling_and_Expanding):
     @Substitution(name='expanding')
     @Appender(_doc_template)
     @Appender(_shared_docs['apply'])
-    def apply(self, func, args=(), kwargs={}):
-        return super(Expanding, self).apply(func, args=args, kwargs=kwargs)
+    def apply(self, func, args=(), kwargs={}, engine='cython',
+              engine_kwargs=None):
+        return super(Expanding, self).apply(func, args=args, kwargs=kwargs,
+                                            engine=engine,
+                                            engine_kwargs=engine_kwargs)
 
     @Substitution(name='expanding')
     @Appender(_doc_template)
@@ -1475,16 +1789,18 @@ class Expanding(_Rolling_and_Expanding):
     @Substitution(name='expanding')
     @Appender(_doc_template)
     @Appender(_shared_docs['cov'])
-    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
+    def cov(self, other=None, pairwise=None, ddof=1, as_array=False,
+            **kwargs):
         return super(Expanding, self).cov(other=other, pairwise=pairwise,
-                                          ddof=ddof, **kwargs)
+                                          ddof=ddof, as_array=as_array,
+                                          **kwargs)
 
     @Substitution(name='expanding')
     @Appender(_doc_template)
     @Appender(_shared_docs['corr'])
-    def corr(self, other=None, pairwise=None, **kwargs):
+    def corr(self, other=None, pairwise=None, as_array=False, **kwargs):
         return super(Expanding, self).corr(other=other, pairwise=pairwise,
-                                           **kwargs)
+                                           as_array=as_array, **kwargs)
 
 
 class ExpandingGroupby(_GroupByMixin, Expanding):
@@ -1713,7 +2029,7 @@ class EWM(_Rolling):
                     return cfunc(arg, self.com, int(self.adjust),
                                  int(self.ignore_na), int(self.min_periods))
 
-            results.append(np.apply_along_axis(func, self.axis, values))
+            results.append(_apply_along_axis(func, self.axis, values))
 
         return self._wrap_results(results, blocks, obj)
 
@@ -1803,6 +2119,171 @@ class EWM(_Rolling):
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
                                    _get_corr, pairwise=bool(pairwise))
 
+    def online(self, func='mean', bias=False):
+        """
+        Exponential weighted statistic of a stream of batches of rows, each
+        batch resuming from the weighted state of the previous ones.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        func : {'mean', 'var', 'std'}, default 'mean'
+        bias : boolean, default False
+            Use a standard estimation bias correction, for var and std
+
+        Returns
+        -------
+        OnlineWindow
+            with the statistic of the weighted object as ``result``, whose
+            ``update`` computes the statistic of the following batches
+        """
+        if func not in ['mean', 'var', 'std']:
+            raise ValueError("func must be one of ['mean', 'var', 'std']")
+        if self.axis != 0:
+            raise NotImplementedError("online windows are only implemented "
+                                      "over the index")
+
+        obj = self._selected_obj
+        ncols = 1 if obj.ndim == 1 else obj.shape[1]
+        if func == 'mean':
+            kernel_state = _window.ewma_state()
+        else:
+            kernel_state = _window.ewmcov_state()
+
+        online = OnlineWindow(dict(kind='ewm', func=func, bias=bias,
+                                   com=self.com, adjust=self.adjust,
+                                   ignore_na=self.ignore_na,
+                                   min_periods=self.min_periods,
+                                   template=obj.iloc[:0],
+                                   kernel_states=np.tile(kernel_state,
+                                                         (ncols, 1))))
+        online.update(obj)
+        return online
+
+
+_online_rolling_funcs = ('count', 'sum', 'mean', 'median', 'var', 'std',
+                         'min', 'max', 'skew', 'kurt', 'quantile', 'apply')
+
+
+class OnlineWindow(object):
+    """
+    Provides rolling and exponential weighted statistics over a stream of
+    batches of rows, returned by :meth:`Rolling.online` and
+    :meth:`EWM.online`.
+
+    An update only processes the rows of the new batch, with the rows of
+    the previous batches that a rolling window can still reach, or the
+    weighted moments of the previous batches for ewm.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    state : dict
+        the ``state`` of an OnlineWindow to resume from
+
+    Attributes
+    ----------
+    state : dict
+        the state after the last batch, which can be pickled to resume the
+        stream later, as long as the arguments of the statistic can be
+    result : Series or DataFrame
+        the statistic of the rows of the last batch
+
+    Examples
+    --------
+    >>> online = df.ewm(com=0.5).online('mean')
+    >>> online.result  # same as df.ewm(com=0.5).mean()
+    >>> online.update(batch)  # the ewm mean of the rows of batch
+    >>> state = pickle.dumps(online.state)
+    >>> OnlineWindow(pickle.loads(state)).update(next_batch)
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.result = None
+
+    def update(self, batch):
+        """
+        Compute the statistic of the rows of a new batch, following the
+        rows of the previous ones.
+
+        Parameters
+        ----------
+        batch : Series or DataFrame
+            of the same type and columns as the previous batches
+
+        Returns
+        -------
+        same type as batch
+        """
+        template = self.state['template']
+        if batch.ndim != template.ndim or (
+                batch.ndim == 2 and not batch.columns.equals(
+                    template.columns)):
+            raise ValueError("batch must be a {klass} with the same columns "
+                             "as the previous batches".format(
+                                 klass=type(template).__name__))
+
+        if self.state['kind'] == 'ewm':
+            result = self._update_ewm(batch)
+        else:
+            result = self._update_rolling(batch)
+        self.result = result
+        return result
+
+    def _update_rolling(self, batch):
+        from pandas import concat
+
+        state = self.state
+        tail = state['tail']
+        data = concat([tail, batch]) if len(tail) else batch
+
+        r = Rolling(data, window=state['window'],
+                    min_periods=state['min_periods'], closed=state['closed'])
+        result = getattr(r, state['func'])(*state['args'], **state['kwargs'])
+        result = result.iloc[len(tail):]
+
+        # keep the rows that the windows of the next batches can reach
+        if not len(data):
+            state['tail'] = data
+        elif r.is_freq_type:
+            indexi = data.index.asi8
+            start = indexi.searchsorted(indexi[-1] - r.window)
+            state['tail'] = data.iloc[start:]
+        else:
+            state['tail'] = data.iloc[max(len(data) - r.window + 1, 0):]
+        return result
+
+    def _update_ewm(self, batch):
+        state = self.state
+        ewm = EWM(batch, com=state['com'], min_periods=state['min_periods'],
+                  adjust=state['adjust'], ignore_na=state['ignore_na'])
+        values = ewm._prep_values()
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+
+        output = np.empty(values.shape, dtype=float)
+        args = (ewm.com, int(ewm.adjust), int(ewm.ignore_na),
+                int(ewm.min_periods))
+        for i, kernel_state in enumerate(state['kernel_states']):
+            x = values[:, i]
+            if state['func'] == 'mean':
+                output[:, i] = _window.ewma(x, *args, state=kernel_state)
+            else:
+                output[:, i] = _window.ewmcov(x, x, *args, bias=int(
+                    state['bias']), state=kernel_state)
+
+        if state['func'] == 'std':
+            output = _zsqrt(output)
+
+        if batch.ndim == 1:
+            return batch._constructor(output[:, 0], index=batch.index,
+                                      name=batch.name)
+        return batch._constructor(output, index=batch.index,
+                                  columns=batch.columns)
+
 # Helper Funcs
 
 
@@ -1960,6 +2441,220 @@ def _offset(window, center):
         return offset.astype(int)
 
 
+def _get_window_bounds(arg, window, minp, index, closed, offset):
+    """
+    The bounds ``[begin[i], end[i])`` of the windows of ``arg``, matching
+    the windows of _window.roll_generic, and the checked minimum periods.
+    """
+    if index is None:
+        N = len(arg)
+        minp = _window._check_minp(window, minp, N, floor=0)
+        end = np.arange(offset + 1, offset + N + 1, dtype=np.int64)
+        begin = end - window
+        return np.clip(begin, 0, N), np.clip(end, 0, N), minp
+
+    if offset != 0:
+        raise ValueError("unable to roll_generic with a non-zero offset")
+    begin, end, _, _, minp, _ = _window.get_window_indexer(arg, window, minp,
+                                                           index, closed,
+                                                           floor=0)
+    return begin, end, minp
+
+
+def _apply_along_axis(func, axis, values):
+    """
+    np.apply_along_axis, distributing the columns of a 2-d ``values`` over
+    ``compute.window_nthreads`` threads. The cython window kernels and the
+    numba compiled ones release the GIL.
+    """
+    nthreads = get_option('compute.window_nthreads')
+    if values.ndim == 1 or nthreads <= 1:
+        return np.apply_along_axis(func, axis, values)
+
+    def _apply_column(i):
+        # the error state of numpy is per thread
+        with np.errstate(all='ignore'):
+            return func(values[:, i] if axis == 0 else values[i])
+
+    results = com._thread_map(_apply_column, range(values.shape[1 - axis]),
+                              nthreads)
+
+    if axis == 0:
+        return np.column_stack(results)
+    return np.vstack(results)
+
+
+def _use_fft(nrows, nweights):
+    """
+    Whether convolving ``nrows`` with ``nweights`` weights by FFT takes
+    fewer operations than the direct convolution.
+    """
+    # short windows are always convolved directly, and exactly
+    if nweights < 64:
+        return False
+    nfft = 1 << int(np.ceil(np.log2(nrows + nweights - 1)))
+
+    # the six transforms of a column cost about 5 / 2 * nfft * log2(nfft)
+    # operations each, versus nrows * nweights multiply-adds
+    return nrows * nweights > 15 * nfft * np.log2(nfft)
+
+
+def _roll_weighted_fft(values, weights, minp, avg):
+    """
+    _window.roll_window_2d by FFT, numerically equivalent up to the
+    rounding errors of the transforms.
+    """
+    nrows = len(values)
+    nweights = len(weights)
+    minp = _window._check_minp(nweights, minp, nrows)
+    nfft = 1 << int(np.ceil(np.log2(nrows + nweights - 1)))
+
+    # the window ending at row i weighs the row i - k by weights[-1 - k]:
+    # a convolution with the reversed weights
+    weights = weights[::-1]
+    has_weight = ~np.isnan(weights)
+    weights = np.where(has_weight, weights, 0.)
+
+    def _convolve(x, y):
+        fx = np.fft.rfft(x, nfft, axis=0)
+        fy = np.fft.rfft(y, nfft)
+        return np.fft.irfft(fx * fy[:, None], nfft, axis=0)[:nrows]
+
+    observed = values == values
+    output = _convolve(np.where(observed, values, 0.), weights)
+    observed = observed.astype(float)
+    counts = np.round(_convolve(observed, has_weight.astype(float)))
+
+    if avg:
+        # the windows whose observations all have a zero weight are NaN
+        tot_wgt = _convolve(observed, weights)
+        nonzero = np.round(_convolve(observed,
+                                     (weights != 0).astype(float)))
+        with np.errstate(all='ignore'):
+            output /= tot_wgt
+        output[nonzero == 0] = np.NaN
+
+    output[counts < minp] = np.NaN
+    return output
+
+
+def _roll_weighted(values, weights, minp, avg):
+    """
+    Weighted sum or mean of the windows of the columns of a 2-d float64
+    ``values``, as _window.roll_window of each column.
+
+    The columns are rolled in chunks, distributed over
+    ``compute.window_nthreads`` threads, with a blocked direct convolution
+    or by FFT for the windows long enough for it to be cheaper.
+    """
+    nrows, ncols = values.shape
+    use_fft = (_use_fft(nrows, len(weights)) and
+               not np.isinf(weights).any())
+
+    # about 32MB of values by chunk
+    chunksize = max((1 << 22) // max(nrows, 1), 1)
+
+    def _roll_chunk(start):
+        chunk = np.ascontiguousarray(values[:, start:start + chunksize])
+        if not use_fft:
+            return _window.roll_window_2d(chunk, weights, minp, avg=avg)
+
+        # an infinite value would spread over the whole column through the
+        # transforms, rather than over the windows holding it
+        direct = (~np.isfinite(chunk) & ~np.isnan(chunk)).any(axis=0)
+        if not direct.any():
+            return _roll_weighted_fft(chunk, weights, minp, avg)
+        output = np.empty_like(chunk)
+        output[:, direct] = _window.roll_window_2d(chunk[:, direct], weights,
+                                                   minp, avg=avg)
+        if not direct.all():
+            output[:, ~direct] = _roll_weighted_fft(chunk[:, ~direct],
+                                                    weights, minp, avg)
+        return output
+
+    starts = range(0, ncols, chunksize)
+    nthreads = get_option('compute.window_nthreads')
+    return np.hstack(com._thread_map(_roll_chunk, starts, nthreads))
+
+
+def _get_window_weights(win_type, window, *args):
+    """
+    The symmetric weights of a window of type ``win_type`` of size
+    ``window``, as scipy.signal.get_window(..., fftbins=False).
+    """
+    if window <= 1:
+        return np.ones(window)
+    return _window_weights[win_type](window, *args).astype(float)
+
+
+def _general_cosine(window, coefs):
+    fac = np.linspace(-np.pi, np.pi, window)
+    weights = np.zeros(window)
+    for k, coef in enumerate(coefs):
+        weights += coef * np.cos(k * fac)
+    return weights
+
+
+def _triang(window):
+    n = np.arange(1, (window + 1) // 2 + 1)
+    if window % 2 == 0:
+        weights = (2 * n - 1.0) / window
+        return np.r_[weights, weights[::-1]]
+    weights = 2 * n / (window + 1.0)
+    return np.r_[weights, weights[-2::-1]]
+
+
+def _parzen(window):
+    n = np.arange(-(window - 1) / 2.0, (window - 1) / 2.0 + 0.5, 1.0)
+    na = n[n < -(window - 1) / 4.0]
+    nb = n[np.abs(n) <= (window - 1) / 4.0]
+    wa = 2 * (1 - np.abs(na) / (window / 2.0)) ** 3.0
+    wb = (1 - 6 * (np.abs(nb) / (window / 2.0)) ** 2.0 +
+          6 * (np.abs(nb) / (window / 2.0)) ** 3.0)
+    return np.r_[wa, wb, wa[::-1]]
+
+
+def _bohman(window):
+    fac = np.abs(np.linspace(-1, 1, window)[1:-1])
+    weights = (1 - fac) * np.cos(np.pi * fac) + np.sin(np.pi * fac) / np.pi
+    return np.r_[0, weights, 0]
+
+
+def _barthann(window):
+    fac = np.abs(np.arange(window) / (window - 1.0) - 0.5)
+    return 0.62 - 0.48 * fac + 0.38 * np.cos(2 * np.pi * fac)
+
+
+def _gaussian(window, std):
+    n = np.arange(window) - (window - 1.0) / 2.0
+    return np.exp(-n ** 2 / (2 * std * std))
+
+
+def _general_gaussian(window, power, width):
+    n = np.arange(window) - (window - 1.0) / 2.0
+    return np.exp(-0.5 * np.abs(n / width) ** (2 * power))
+
+
+# the window types whose weights are generated without scipy
+_window_weights = {
+    'boxcar': np.ones,
+    'triang': _triang,
+    'blackman': np.blackman,
+    'hamming': np.hamming,
+    'bartlett': np.bartlett,
+    'parzen': _parzen,
+    'bohman': _bohman,
+    'blackmanharris': lambda window: _general_cosine(
+        window, [0.35875, 0.48829, 0.14128, 0.01168]),
+    'nuttall': lambda window: _general_cosine(
+        window, [0.3635819, 0.4891775, 0.1365995, 0.0106411]),
+    'barthann': _barthann,
+    'kaiser': np.kaiser,
+    'gaussian': _gaussian,
+    'general_gaussian': _general_gaussian,
+}
+
+
 def _require_min_periods(p):
     def _check_func(minp, window):
         if minp is None:
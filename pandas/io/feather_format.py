@@ -1,8 +1,10 @@
 """ feather-format compat """
 
+import warnings
 from distutils.version import LooseVersion
+from multiprocessing import cpu_count
 from pandas import DataFrame, RangeIndex, Int64Index
-from pandas.compat import range
+from pandas.compat import range, string_types
 from pandas.io.common import _stringify_path
 
 
@@ -83,7 +85,7 @@ def to_feather(df, path):
     feather.write_dataframe(df, path)
 
 
-def read_feather(path, nthreads=1):
+def read_feather(path, nthreads=None, use_threads=True, memory_map=False):
     """
     Load a feather-format object from the file path
 
@@ -92,10 +94,26 @@ def read_feather(path, nthreads=1):
     Parameters
     ----------
     path : string file path, or file-like object
-    nthreads : int, default 1
+    nthreads : int, default None
         Number of CPU threads to use when reading to pandas.DataFrame
 
        .. versionadded 0.21.0
+       .. deprecated 0.23.0
+          Use ``use_threads`` instead.
+    use_threads : boolean, default True
+        Whether to read the columns with as many threads as CPUs, or with a
+        single one.
+
+        .. versionadded:: 0.23.0
+    memory_map : boolean, default False
+        If ``path`` is a file path, map the file into memory instead of
+        reading it. With pyarrow >= 0.10.0 the numeric columns without
+        missing values are then read-only views of the mapped file, each in
+        a block of its own, so that opening the file costs no copy of them;
+        they are copied when they are modified in place. Requires
+        feather-format >= 0.4.0.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -106,7 +124,27 @@ def read_feather(path, nthreads=1):
     feather = _try_import()
     path = _stringify_path(path)
 
+    if nthreads is not None:
+        warnings.warn("the 'nthreads' keyword is deprecated, "
+                      "use 'use_threads' instead",
+                      FutureWarning, stacklevel=2)
+    else:
+        nthreads = cpu_count() if use_threads else 1
+
     if LooseVersion(feather.__version__) < LooseVersion('0.4.0'):
+        if memory_map:
+            raise ValueError("memory_map requires feather-format >= 0.4.0")
         return feather.read_dataframe(path)
 
+    if memory_map and isinstance(path, string_types):
+        import pyarrow
+        from pyarrow.feather import FeatherReader
+        from pandas.io.parquet import _arrow_to_pandas
+
+        path = pyarrow.memory_map(path, 'r')
+        reader = FeatherReader(path)
+        if hasattr(reader, 'read_table'):
+            return _arrow_to_pandas(reader.read_table(), zero_copy=True,
+                                    nthreads=nthreads)
+
     return feather.read_dataframe(path, nthreads=nthreads)
@@ -1,10 +1,19 @@
 """ parquet compat """
 
+import os
+import json
+from functools import partial
+from multiprocessing import cpu_count
 from warnings import catch_warnings
 from distutils.version import LooseVersion
-from pandas import DataFrame, RangeIndex, Int64Index, get_option
+
+import numpy as np
+
+from pandas import (DataFrame, RangeIndex, Int64Index, Index, Categorical,
+                    Timestamp, get_option)
 from pandas.compat import string_types
 import pandas.core.common as com
+from pandas.core.reshape.concat import concat
 from pandas.io.common import get_filepath_or_buffer, is_s3_url
 
 
@@ -40,6 +49,229 @@ def get_engine(engine):
         return FastParquetImpl()
 
 
+_FILTER_OPS = ['=', '==', '!=', '<', '<=', '>', '>=', 'in', 'not in']
+
+
+def _validate_filters(filters):
+    """ return ``filters`` as a list of (column, op, value) tuples """
+    if filters is None:
+        return []
+
+    filters = [tuple(f) for f in filters]
+    for f in filters:
+        if len(f) != 3 or f[1] not in _FILTER_OPS:
+            raise ValueError("filters must be a list of (column, op, value) "
+                             "tuples with op one of {ops}, got {f!r}"
+                             .format(ops=_FILTER_OPS, f=f))
+    return filters
+
+
+def _range_matches(bounds, op, value):
+    """
+    Whether a column whose values lie in the closed range ``bounds`` can
+    hold a value satisfying ``op value``.
+    """
+    lo, hi = bounds
+    try:
+        if op in ('=', '=='):
+            return lo <= value <= hi
+        elif op == '!=':
+            return not lo == hi == value
+        elif op == '<':
+            return lo < value
+        elif op == '<=':
+            return lo <= value
+        elif op == '>':
+            return hi > value
+        elif op == '>=':
+            return hi >= value
+        elif op == 'in':
+            return any(lo <= v <= hi for v in value)
+        else:
+            return not (lo == hi and lo in value)
+    except TypeError:
+        # not comparable, e.g. a string bound against a number;
+        # we cannot rule the data out
+        return True
+
+
+def _filters_match(filters, bounds):
+    """
+    Whether data with the column ranges ``bounds`` may satisfy all of the
+    ``filters``; the filters on a column without bounds always match.
+    """
+    return all(_range_matches(bounds[name], op, value)
+               for name, op, value in filters if name in bounds)
+
+
+def _discover_partitions(path):
+    """
+    Find the data files under ``path``.
+
+    Returns a list of (file path, [(key, value), ...]) pairs, the key=value
+    directories of a hive partitioned dataset between ``path`` and the
+    file, and a dict of the partition key to an Index of all of its values.
+    The values of a key are converted to int or float if they all can be.
+    """
+    if not (isinstance(path, string_types) and os.path.isdir(path)):
+        return [(path, [])], {}
+
+    pieces = []
+    for root, dirs, files in os.walk(path):
+        # skip metadata and hidden files, e.g. _SUCCESS and .crc files
+        dirs[:] = sorted(d for d in dirs if not d.startswith(('_', '.')))
+        partitions = []
+        relpath = os.path.relpath(root, path)
+        if relpath != os.curdir:
+            for name in relpath.split(os.sep):
+                if '=' in name:
+                    partitions.append(tuple(name.split('=', 1)))
+        pieces.extend((os.path.join(root, name), partitions)
+                      for name in sorted(files)
+                      if not name.startswith(('_', '.')))
+
+    values = {}
+    for _, partitions in pieces:
+        for key, value in partitions:
+            values.setdefault(key, set()).add(value)
+
+    converters = {}
+    for key in values:
+        converters[key] = lambda v: v
+        for converter in (int, float):
+            try:
+                converted = sorted(converter(v) for v in values[key])
+            except ValueError:
+                continue
+            values[key] = converted
+            converters[key] = converter
+            break
+        else:
+            values[key] = sorted(values[key])
+
+    pieces = [(piece, [(key, converters[key](value))
+                       for key, value in partitions])
+              for piece, partitions in pieces]
+    categories = {key: Index(values[key]) for key in values}
+    return pieces, categories
+
+
+def _statistics_value(value, logical_type):
+    """ convert a min or max of the parquet statistics to a python value """
+    if isinstance(value, bytes):
+        return value.decode('utf8')
+    if logical_type == 'TIMESTAMP_MILLIS':
+        return Timestamp(value, unit='ms')
+    elif logical_type == 'TIMESTAMP_MICROS':
+        return Timestamp(value, unit='us')
+    elif logical_type == 'DATE':
+        return Timestamp(value, unit='D')
+    return value
+
+
+def _row_group_bounds(metadata, i):
+    """
+    Return a dict of column name to the (min, max) of its values in row
+    group ``i``, from the statistics of the file ``metadata``. The columns
+    without statistics are left out.
+    """
+    row_group = metadata.row_group(i)
+    bounds = {}
+    for j in range(row_group.num_columns):
+        try:
+            column = row_group.column(j)
+            statistics = column.statistics
+            if (statistics is None or
+                    not getattr(statistics, 'has_min_max', True)):
+                continue
+            schema = metadata.schema.column(j)
+            logical_type = str(getattr(schema, 'converted_type',
+                                       schema.logical_type))
+            bounds[column.path_in_schema] = (
+                _statistics_value(statistics.min, logical_type),
+                _statistics_value(statistics.max, logical_type))
+        except (AttributeError, TypeError, ValueError):
+            # statistics not written, or of a type we cannot convert
+            continue
+    return bounds
+
+
+def _zero_copy_values(data):
+    """
+    Return a read-only ndarray viewing the buffer of the numeric pyarrow
+    ChunkedArray ``data``, or None if it cannot be viewed: it has nulls,
+    several chunks or another type.
+    """
+    import pyarrow
+
+    if data.num_chunks != 1 or data.null_count:
+        return None
+    try:
+        values = np.asarray(data.chunk(0).to_pandas(zero_copy_only=True))
+    except (pyarrow.ArrowException, TypeError):
+        return None
+    if values.dtype.kind not in 'iuf':
+        return None
+    return values
+
+
+def _arrow_to_pandas(table, string_array=False, zero_copy=False,
+                     nthreads=None):
+    """
+    Convert the pyarrow ``table`` to a DataFrame.
+
+    With ``string_array``, the string columns are StringArrays sharing the
+    Arrow buffers rather than Python objects. With ``zero_copy``, the
+    numeric columns without nulls are read-only views of the Arrow buffers,
+    each in a block of its own, rather than copied into consolidated blocks.
+    """
+    import pyarrow
+    from pandas.core.arrays import StringArray
+
+    if not (string_array or zero_copy):
+        return table.to_pandas(nthreads=nthreads)
+
+    metadata = table.schema.metadata or {}
+    index_columns = set()
+    if b'pandas' in metadata:
+        pandas_metadata = json.loads(metadata[b'pandas'].decode('utf8'))
+        index_columns = {name for name in pandas_metadata['index_columns']
+                         if isinstance(name, string_types)}
+
+    names = [name for name in table.schema.names
+             if name not in index_columns]
+    nrows = table.num_rows
+    arrays = {}
+    for i in reversed(range(table.num_columns)):
+        field = table.schema[i]
+        if field.name in index_columns:
+            continue
+        column = table.column(i)
+        data = getattr(column, 'data', column)
+        if string_array and field.type == pyarrow.string():
+            arrays[field.name] = StringArray._from_arrow(data)
+        elif zero_copy:
+            values = _zero_copy_values(data)
+            if values is None:
+                continue
+            arrays[field.name] = values.reshape(1, -1)
+        else:
+            continue
+        table = table.remove_column(i)
+
+    if table.num_columns:
+        result = table.to_pandas(nthreads=nthreads)
+    else:
+        result = DataFrame(index=RangeIndex(nrows))
+
+    # insert the arrays into the block manager directly, in the order of
+    # the columns, as DataFrame.insert would copy them
+    for loc, name in enumerate(names):
+        if name in arrays:
+            result._data.insert(loc, name, arrays[name])
+    return result
+
+
 class BaseImpl(object):
 
     api = None  # module
@@ -66,7 +298,8 @@ class BaseImpl(object):
     def write(self, df, path, compression, **kwargs):
         raise com.AbstractMethodError(self)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, iterator=False,
+             **kwargs):
         raise com.AbstractMethodError(self)
 
 
@@ -120,14 +353,101 @@ class PyArrowImpl(BaseImpl):
                 table, path, compression=compression,
                 coerce_timestamps=coerce_timestamps, **kwargs)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, string_array=False, filters=None,
+             iterator=False, memory_map=False, use_threads=True, **kwargs):
         path, _, _ = get_filepath_or_buffer(path)
+        filters = _validate_filters(filters)
+        nthreads = kwargs.setdefault('nthreads',
+                                     cpu_count() if use_threads else 1)
+        convert = partial(_arrow_to_pandas, string_array=string_array,
+                          zero_copy=memory_map, nthreads=nthreads)
+        if (filters or iterator or
+                isinstance(path, string_types) and os.path.isdir(path)):
+            frames = self._read_row_groups(path, columns, filters, convert,
+                                           memory_map, **kwargs)
+            if iterator:
+                return frames
+            frames = list(frames)
+            if len(frames) == 1:
+                return frames[0]
+            # without an index in the pandas metadata, every frame has a
+            # default index of its own
+            ignore_index = all(isinstance(frame.index, RangeIndex)
+                               for frame in frames)
+            return concat(frames, ignore_index=ignore_index)
+
+        source = self._open(path, memory_map)
         if self._pyarrow_lt_070:
-            return self.api.parquet.read_pandas(path, columns=columns,
-                                                **kwargs).to_pandas()
-        kwargs['use_pandas_metadata'] = True
-        return self.api.parquet.read_table(path, columns=columns,
-                                           **kwargs).to_pandas()
+            table = self.api.parquet.read_pandas(source, columns=columns,
+                                                 **kwargs)
+        else:
+            kwargs['use_pandas_metadata'] = True
+            table = self.api.parquet.read_table(source, columns=columns,
+                                                **kwargs)
+        return convert(table)
+
+    def _open(self, path, memory_map):
+        """ return a memory map of the file ``path`` if ``memory_map`` """
+        if memory_map and isinstance(path, string_types):
+            return self.api.memory_map(path, 'r')
+        return path
+
+    def _read_row_groups(self, path, columns, filters, convert, memory_map,
+                         **kwargs):
+        """
+        Yield a DataFrame for each row group of the files under ``path``,
+        skipping the partitions and row groups that the ``filters`` rule
+        out. If none is left an empty frame is yielded, so that the result
+        keeps the columns of the data.
+        """
+        pieces, categories = _discover_partitions(path)
+        if not self._pyarrow_lt_070:
+            kwargs['use_pandas_metadata'] = True
+        file_columns = columns
+        if columns is not None:
+            file_columns = [c for c in columns if c not in categories]
+
+        first = None
+        read_any = False
+        for piece, partitions in pieces:
+            if not _filters_match(filters,
+                                  {key: (value, value)
+                                   for key, value in partitions}):
+                continue
+            parquet_file = self.api.parquet.ParquetFile(
+                self._open(piece, memory_map))
+            metadata = parquet_file.metadata
+            for i in range(metadata.num_row_groups):
+                if first is None:
+                    first = (parquet_file, i, partitions)
+                if not _filters_match(filters,
+                                      _row_group_bounds(metadata, i)):
+                    continue
+                read_any = True
+                yield self._read_row_group(parquet_file, i, file_columns,
+                                           columns, partitions, categories,
+                                           convert, **kwargs)
+
+        if first is None:
+            yield DataFrame(columns=columns)
+        elif not read_any:
+            parquet_file, i, partitions = first
+            yield self._read_row_group(parquet_file, i, file_columns,
+                                       columns, partitions, categories,
+                                       convert, **kwargs).iloc[:0]
+
+    def _read_row_group(self, parquet_file, i, file_columns, columns,
+                        partitions, categories, convert, **kwargs):
+        table = parquet_file.read_row_group(i, columns=file_columns,
+                                            **kwargs)
+        result = convert(table)
+
+        for key, value in partitions:
+            codes = np.repeat(categories[key].get_loc(value), len(result))
+            result[key] = Categorical.from_codes(codes, categories[key])
+        if columns is not None:
+            result = result[columns]
+        return result
 
     def _validate_write_lt_070(self, df):
         # Compatibility shim for pyarrow < 0.7.0
@@ -209,7 +529,14 @@ class FastParquetImpl(BaseImpl):
             self.api.write(path, df,
                            compression=compression, **kwargs)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, iterator=False,
+             **kwargs):
+        for option in ['string_array', 'memory_map', 'use_threads']:
+            if option in kwargs:
+                raise ValueError("the '{option}' option is only supported "
+                                 "by the 'pyarrow' engine"
+                                 .format(option=option))
+        filters = _validate_filters(filters)
         if is_s3_url(path):
             # When path is s3:// an S3File is returned.
             # We need to retain the original path(str) while also
@@ -223,7 +550,11 @@ class FastParquetImpl(BaseImpl):
             path, _, _ = get_filepath_or_buffer(path)
             parquet_file = self.api.ParquetFile(path)
 
-        return parquet_file.to_pandas(columns=columns, **kwargs)
+        if iterator:
+            return parquet_file.iter_row_groups(columns=columns,
+                                                filters=filters, **kwargs)
+        return parquet_file.to_pandas(columns=columns, filters=filters,
+                                      **kwargs)
 
 
 def to_parquet(df, path, engine='auto', compression='snappy', **kwargs):
@@ -248,7 +579,8 @@ def to_parquet(df, path, engine='auto', compression='snappy', **kwargs):
     return impl.write(df, path, compression=compression, **kwargs)
 
 
-def read_parquet(path, engine='auto', columns=None, **kwargs):
+def read_parquet(path, engine='auto', columns=None, filters=None,
+                 iterator=False, **kwargs):
     """
     Load a parquet object from the file path, returning a DataFrame.
 
@@ -257,22 +589,58 @@ def read_parquet(path, engine='auto', columns=None, **kwargs):
     Parameters
     ----------
     path : string
-        File path
+        File path, or with the 'pyarrow' engine the path of a directory of
+        parquet files, which may be partitioned in ``key=value``
+        subdirectories. The partition keys are read as categorical columns.
     columns: list, default=None
         If not None, only these columns will be read from the file.
 
         .. versionadded 0.21.1
+    filters : list of tuples, default None
+        Skip the partitions and row groups whose values cannot satisfy all
+        of these ``(column, op, value)`` filters, with ``op`` one of
+        ``'=', '==', '!=', '<', '<=', '>', '>=', 'in', 'not in'``. The
+        row groups are skipped by the min and max values of their column
+        statistics; the rows of a row group which is read are not filtered.
+
+        .. versionadded:: 0.23.0
+    iterator : boolean, default False
+        Return an iterator yielding a DataFrame for each row group which is
+        read, to process a dataset larger than memory.
+
+        .. versionadded:: 0.23.0
     engine : {'auto', 'pyarrow', 'fastparquet'}, default 'auto'
         Parquet reader library to use. If 'auto', then the option
         'io.parquet.engine' is used. If 'auto', then the first
         library to be installed is used.
+    string_array : boolean, default False
+        Read the string columns as :class:`~pandas.core.arrays.StringArray`,
+        sharing the memory of the Arrow string buffers instead of creating a
+        Python object for every value. Only supported by the 'pyarrow'
+        engine.
+
+        .. versionadded:: 0.23.0
+    memory_map : boolean, default False
+        Memory-map the file. The numeric columns without missing values are
+        then read-only views of the mapped file instead of copies; they are
+        copied when they are modified in place. Only supported by the
+        'pyarrow' engine.
+
+        .. versionadded:: 0.23.0
+    use_threads : boolean, default True
+        Convert the columns in parallel, with as many threads as CPUs.
+        Only supported by the 'pyarrow' engine.
+
+        .. versionadded:: 0.23.0
+
     kwargs are passed to the engine
 
     Returns
     -------
-    DataFrame
+    DataFrame, or an iterator of DataFrames if ``iterator`` is True
 
     """
 
     impl = get_engine(engine)
-    return impl.read(path, columns=columns, **kwargs)
+    return impl.read(path, columns=columns, filters=filters,
+                     iterator=iterator, **kwargs)
@@ -3,6 +3,7 @@ Module contains tools for processing files into DataFrames or other objects
 """
 from __future__ import print_function
 from collections import defaultdict
+import os
 import re
 import csv
 import sys
@@ -290,6 +291,18 @@ memory_map : boolean, default False
     If a filepath is provided for `filepath_or_buffer`, map the file object
     directly onto memory and access the data directly from there. Using this
     option can improve performance because there is no longer any I/O overhead.
+nthreads : int, default None
+    Number of threads used to tokenize and convert the data rows. When
+    greater than 1 and `filepath_or_buffer` is the path of an uncompressed
+    local file, the file is memory-mapped, split into chunks at record
+    boundaries (respecting quoting) and the chunks are parsed in parallel.
+    As with `low_memory`, column types are inferred per chunk, so specify
+    the `dtype` parameter to avoid mixed types. The rows are read serially
+    when `nrows`, `chunksize`, `iterator`, `skiprows`, `comment` or
+    `escapechar` is given, or when `header` is a list.
+    (Only valid with C parser)
+
+    .. versionadded:: 0.23.0
 
 Returns
 -------
@@ -499,7 +512,8 @@ _c_parser_defaults = {
     'error_bad_lines': True,
     'warn_bad_lines': True,
     'tupleize_cols': False,
-    'float_precision': None
+    'float_precision': None,
+    'nthreads': None
 }
 
 _fwf_defaults = {
@@ -511,6 +525,7 @@ _c_unsupported = {'skipfooter'}
 _python_unsupported = {
     'low_memory',
     'float_precision',
+    'nthreads',
 }
 
 _deprecated_defaults = {
@@ -590,7 +605,8 @@ def _make_parser_function(name, sep=','):
                  delim_whitespace=False,
                  low_memory=_c_parser_defaults['low_memory'],
                  memory_map=False,
-                 float_precision=None):
+                 float_precision=None,
+                 nthreads=None):
 
         # Alias sep -> delimiter.
         if delimiter is None:
@@ -650,6 +666,7 @@ def _make_parser_function(name, sep=','):
                     squeeze=squeeze,
                     memory_map=memory_map,
                     float_precision=float_precision,
+                    nthreads=nthreads,
 
                     na_filter=na_filter,
                     delim_whitespace=delim_whitespace,
@@ -1684,6 +1701,12 @@ class CParserWrapper(ParserBase):
         # #2442
         kwds['allow_leading_cols'] = self.index_col is not False
 
+        self.nthreads = _validate_integer('nthreads',
+                                          kwds.pop('nthreads', None), 1)
+        self._parallel_read = False
+        self._src = src
+        self._reader_kwds = kwds
+
         self._reader = parsers.TextReader(src, **kwds)
 
         # XXX
@@ -1826,9 +1849,108 @@ class CParserWrapper(ParserBase):
     def set_error_bad_lines(self, status):
         self._reader.set_error_bad_lines(int(status))
 
+    def _can_read_parallel(self, nrows):
+        kwds = self._reader_kwds
+        return (self.nthreads is not None and self.nthreads > 1 and
+                nrows is None and self._first_chunk and
+                isinstance(self._src, compat.string_types) and
+                os.path.isfile(self._src) and
+                not kwds.get('compression') and
+                kwds.get('skiprows') is None and
+                kwds.get('comment') is None and
+                kwds.get('escapechar') is None and
+                not isinstance(kwds.get('header'), (list, tuple, np.ndarray)))
+
+    def _read_parallel(self):
+        """
+        Tokenize and convert the data rows on ``self.nthreads`` threads.
+
+        The file is memory-mapped and cut into record-aligned byte ranges.
+        Each range is parsed by its own ``TextReader`` (the tokenizer and the
+        numeric converters release the GIL) and the resulting columns are
+        merged with ``_concatenate_chunks``, as done for ``low_memory``.
+
+        Returns None if the file could not be split, in which case the caller
+        reads it serially.
+        """
+        import mmap
+
+        kwds = self._reader_kwds
+
+        quotechar = kwds.get('quotechar')
+        if kwds.get('quoting') == csv.QUOTE_NONE or not quotechar:
+            quotechar = None
+        else:
+            quotechar = ord(quotechar)
+
+        lineterminator = kwds.get('lineterminator') or b'\n'
+        if isinstance(lineterminator, compat.text_type):
+            lineterminator = lineterminator.encode('utf-8')
+
+        header = kwds.get('header')
+        nheader = 0 if header is None else header + 1
+
+        with open(self._src, 'rb') as fh:
+            try:
+                buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError):
+                # e.g. an empty file, which cannot be mapped
+                return None
+
+        try:
+            ranges = _split_record_ranges(
+                buf, self.nthreads, nheader, quotechar, lineterminator,
+                kwds.get('skip_blank_lines', True))
+            if ranges is None or len(ranges) < 2:
+                return None
+
+            # the header has already been parsed by the main reader, so the
+            # chunk readers are handed the resulting column names
+            chunk_kwds = dict(kwds, header=None, skiprows=None,
+                              memory_map=False)
+            if self._reader.header is not None:
+                chunk_kwds['names'] = list(self._reader.header[0])
+            noconvert = list(self._reader.noconvert)
+
+            def _read_range(bounds):
+                start, end = bounds
+                try:
+                    reader = parsers.TextReader(
+                        _RecordRangeReader(buf, start, end), **chunk_kwds)
+                except EmptyDataError:
+                    return None
+                try:
+                    for i in noconvert:
+                        reader.set_noconvert(i)
+                    return reader.read()
+                except StopIteration:
+                    return None
+                finally:
+                    reader.close()
+
+            chunks = com._thread_map(_read_range, ranges, self.nthreads)
+        finally:
+            buf.close()
+
+        chunks = [chunk for chunk in chunks if chunk]
+        if len(chunks) == 0:
+            raise StopIteration
+
+        # destructive to chunks
+        return parsers._concatenate_chunks(chunks)
+
     def read(self, nrows=None):
         try:
-            data = self._reader.read(nrows)
+            if self._parallel_read:
+                # the parallel path consumes all rows at once
+                raise StopIteration
+
+            data = None
+            if self._can_read_parallel(nrows):
+                self._parallel_read = True
+                data = self._read_parallel()
+            if data is None:
+                data = self._reader.read(nrows)
         except StopIteration:
             if self._first_chunk:
                 self._first_chunk = False
@@ -1933,6 +2055,107 @@ class CParserWrapper(ParserBase):
         return values
 
 
+def _count_byte(data, start, end, byte, blocksize=1 << 22):
+    """
+    Count the occurrences of ``byte`` in ``data[start:end]``, where ``data``
+    is a uint8 view of the buffer, without materializing a full-size mask.
+    """
+    count = 0
+    for i in range(start, end, blocksize):
+        block = data[i:min(i + blocksize, end)]
+        count += int(np.count_nonzero(block == byte))
+    return count
+
+
+def _find_record_end(buf, data, start, pos, quotechar, lineterminator):
+    """
+    Return the offset just past the first record terminator at or after
+    ``pos`` that is not inside a quoted field, or ``len(buf)`` if there is
+    none. ``start`` must be the offset at which a record begins.
+
+    Escaped quotes (``doublequote``) come in pairs, so the quoting state at
+    any offset is the parity of the number of quote characters since the
+    start of the record.
+    """
+    in_quotes = False
+    if quotechar is not None:
+        in_quotes = _count_byte(data, start, pos, quotechar) % 2 == 1
+
+    while True:
+        end = buf.find(lineterminator, pos)
+        if end < 0:
+            return len(buf)
+        if quotechar is not None:
+            in_quotes ^= _count_byte(data, pos, end, quotechar) % 2 == 1
+        pos = end + len(lineterminator)
+        if not in_quotes:
+            return pos
+
+
+def _split_record_ranges(buf, nchunks, nheader, quotechar, lineterminator,
+                         skip_blank_lines=True):
+    """
+    Split ``buf`` into at most ``nchunks`` byte ranges of roughly equal size
+    that start and end on record boundaries, after skipping the ``nheader``
+    records that make up the header.
+
+    Returns a list of (start, end) tuples, or None if the header could not
+    be located.
+    """
+    size = len(buf)
+    data = np.frombuffer(buf, dtype=np.uint8)
+    try:
+        start = 0
+        while nheader > 0:
+            if start >= size:
+                return None
+            end = _find_record_end(buf, data, start, start, quotechar,
+                                   lineterminator)
+            # blank lines are not counted by the tokenizer
+            if not (skip_blank_lines and not buf[start:end].strip(b'\r\n')):
+                nheader -= 1
+            start = end
+
+        step = max((size - start) // nchunks, 1)
+        bounds = [start]
+        for i in range(1, nchunks):
+            pos = max(start + i * step, bounds[-1])
+            if pos >= size:
+                break
+            end = _find_record_end(buf, data, bounds[-1], pos, quotechar,
+                                   lineterminator)
+            if end >= size:
+                break
+            bounds.append(end)
+        bounds.append(size)
+    finally:
+        # release the buffer export so that the map can be closed
+        del data
+
+    return [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+class _RecordRangeReader(object):
+    """
+    Minimal file-like view of ``buf[start:end]``. The C tokenizer pulls data
+    through ``read`` one block at a time, so a range is never copied whole.
+    """
+
+    def __init__(self, buf, start, end):
+        self.buf = buf
+        self.pos = start
+        self.end = end
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            stop = self.end
+        else:
+            stop = min(self.pos + size, self.end)
+        chunk = self.buf[self.pos:stop]
+        self.pos = stop
+        return chunk
+
+
 def TextParser(*args, **kwds):
     """
     Converts lists of lists/tuples into DataFrames with proper type inference
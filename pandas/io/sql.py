@@ -6,6 +6,7 @@ retrieval and to reduce dependency on DB-specific API.
 
 from __future__ import print_function, division
 from datetime import datetime, date, time
+from functools import partial
 
 import warnings
 import re
@@ -15,13 +16,14 @@ import pandas._libs.lib as lib
 from pandas.core.dtypes.missing import isna
 from pandas.core.dtypes.dtypes import DatetimeTZDtype
 from pandas.core.dtypes.common import (
-    is_list_like, is_dict_like,
-    is_datetime64tz_dtype)
+    is_list_like, is_dict_like, is_integer, is_number,
+    is_datetime64tz_dtype, pandas_dtype)
 
 from pandas.compat import (map, zip, raise_with_traceback,
                            string_types, text_type)
-from pandas.core.api import DataFrame, Series
+from pandas.core.api import DataFrame, Series, Timestamp
 from pandas.core.base import PandasObject
+import pandas.core.common as com
 from pandas.core.tools.datetimes import to_datetime
 
 from contextlib import contextmanager
@@ -98,7 +100,10 @@ def _handle_date_column(col, utc=None, format=None):
             return (to_datetime(col, errors='coerce')
                     .astype('datetime64[ns, UTC]'))
         else:
-            return to_datetime(col, errors='coerce', format=format, utc=utc)
+            # the dates of a result set typically repeat, parse each of the
+            # distinct values once
+            return to_datetime(col, errors='coerce', format=format, utc=utc,
+                               cache=True)
 
 
 def _parse_date_columns(data_frame, parse_dates):
@@ -131,12 +136,170 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
+# number of rows fetched at a time to build the columns of a result set
+_FETCH_SIZE = 10000
+
+# SQLite binds at most 999 variables in a statement
+_SQLITE_MAX_VARIABLES = 999
+
+
+def _get_result_dtypes(columns, dtype=None):
+    """
+    The dtype of each of the columns of a result set, None where unknown.
+
+    Parameters
+    ----------
+    columns : list of column names
+    dtype : dtype or dict of column name to dtype, optional
+    """
+    if dtype is None:
+        return [None] * len(columns)
+    if not is_dict_like(dtype):
+        return [pandas_dtype(dtype)] * len(columns)
+    return [pandas_dtype(dtype[col]) if col in dtype else None
+            for col in columns]
+
+
+def _convert_result_column(values, dtype=None, coerce_float=True):
+    """
+    Convert a column of a result set, a sequence of python objects, to an
+    ndarray. A column known to be numeric is converted by numpy at once,
+    with NULL values as NaN; the others are inferred from the objects like
+    DataFrame.from_records does.
+    """
+    if dtype is not None and dtype.kind in 'fiu':
+        try:
+            if dtype.kind == 'f':
+                return np.array(values, dtype=dtype)
+            arr = np.array(values)
+            if arr.dtype.kind in 'iu':
+                return arr.astype(dtype, copy=False)
+            # e.g. NULL values in an integer column, as NaN
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return lib.maybe_convert_objects(arr, try_float=coerce_float)
+
+
+def _concat_result_column(chunks, coerce_float=True):
+    """Concatenate the converted chunks of a column of a result set."""
+    if not chunks:
+        return np.empty(0, dtype=object)
+    if len(chunks) == 1:
+        return chunks[0]
+
+    kinds = set(chunk.dtype.kind for chunk in chunks)
+    if len(kinds) > 1 and not kinds <= set('fiu'):
+        # the chunks were inferred apart, e.g. a chunk of only NULL values
+        # is left as objects; infer the whole column once, like a column
+        # inferred at once
+        arr = np.concatenate([chunk.astype(object) for chunk in chunks])
+        return lib.maybe_convert_objects(arr, try_float=coerce_float)
+    return np.concatenate(chunks)
+
+
+def _convert_result_chunks(data, dtypes, coerce_float=True):
+    """
+    Convert the rows of a result set to the ndarrays of each column.
+
+    Parameters
+    ----------
+    data : list of rows, or a result set to fetch the rows from in chunks
+        of _FETCH_SIZE rows, converting the columns of each chunk before
+        fetching the next one
+    dtypes : list of the dtype of each column, None where unknown
+    coerce_float : boolean, default True
+
+    Returns
+    -------
+    list of the list of the converted chunks of each column
+    """
+    if isinstance(data, (list, tuple)):
+        batches = [data]
+    else:
+        batches = iter(lambda: data.fetchmany(_FETCH_SIZE), [])
+
+    chunks = [[] for _ in dtypes]
+    for rows in batches:
+        if not len(rows):
+            # some drivers return an empty tuple once exhausted
+            break
+        for i, values in enumerate(zip(*rows)):
+            chunks[i].append(_convert_result_column(
+                values, dtypes[i], coerce_float=coerce_float))
+    return chunks
+
+
+def _result_frame(data, columns, coerce_float=True, dtypes=None):
+    """
+    Build a DataFrame from the columns of a list of rows, or of a result
+    set, see _convert_result_chunks.
+    """
+    if dtypes is None:
+        dtypes = [None] * len(columns)
+
+    chunks = _convert_result_chunks(data, dtypes, coerce_float=coerce_float)
+    arrays = [_concat_result_column(c, coerce_float=coerce_float)
+              for c in chunks]
+    return DataFrame._from_arrays(arrays, columns, None)
+
+
+def _get_partition_bounds(lower_bound, upper_bound, num_partitions):
+    """
+    The boundaries splitting the values of a partition column between
+    lower_bound and upper_bound in num_partitions strides of equal width,
+    like the JDBC reader of Spark. The bounds only decide the stride, the
+    first and last partitions also hold the values out of them.
+
+    Returns
+    -------
+    list of the num_partitions - 1 boundaries between the partitions, less
+    if the range of integer bounds is smaller than num_partitions
+    """
+    if not is_integer(num_partitions) or num_partitions < 1:
+        raise ValueError("num_partitions must be a positive integer")
+
+    if is_number(lower_bound) and is_number(upper_bound):
+        if lower_bound > upper_bound:
+            raise ValueError("lower_bound must be lower than upper_bound")
+        if is_integer(lower_bound) and is_integer(upper_bound):
+            lower_bound, upper_bound = int(lower_bound), int(upper_bound)
+            width = upper_bound - lower_bound
+            num_partitions = max(min(num_partitions, width), 1)
+            return [lower_bound + i * width // num_partitions
+                    for i in range(1, num_partitions)]
+        width = float(upper_bound - lower_bound)
+        return [lower_bound + i * width / num_partitions
+                for i in range(1, num_partitions)]
+
+    try:
+        lower, upper = Timestamp(lower_bound), Timestamp(upper_bound)
+    except (TypeError, ValueError):
+        raise ValueError("lower_bound and upper_bound must be numbers or "
+                         "dates")
+    if lower > upper:
+        raise ValueError("lower_bound must be lower than upper_bound")
+    stride = (upper - lower) / num_partitions
+    bounds = [(lower + i * stride).to_pydatetime()
+              for i in range(1, num_partitions)]
+    if isinstance(lower_bound, date) and not isinstance(lower_bound,
+                                                        datetime):
+        # compare with the values of a DATE column
+        bounds = [bound.date() for bound in bounds]
+    return bounds
+
+
 def _wrap_result(data, columns, index_col=None, coerce_float=True,
-                 parse_dates=None):
+                 parse_dates=None, dtype=None):
     """Wrap result set of query in a DataFrame."""
 
-    frame = DataFrame.from_records(data, columns=columns,
-                                   coerce_float=coerce_float)
+    frame = _result_frame(data, columns, coerce_float=coerce_float,
+                          dtypes=_get_result_dtypes(columns, dtype))
+    if dtype is not None:
+        frame = frame.astype(dtype)
 
     _parse_date_columns(frame, parse_dates)
 
@@ -179,7 +342,8 @@ def execute(sql, con, cur=None, params=None):
 
 def read_sql_table(table_name, con, schema=None, index_col=None,
                    coerce_float=True, parse_dates=None, columns=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None, lower_bound=None,
+                   upper_bound=None, num_partitions=None):
     """Read SQL database table into a DataFrame.
 
     Given a table name and a SQLAlchemy connectable, returns a DataFrame.
@@ -213,6 +377,26 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     chunksize : int, default None
         If specified, returns an iterator where `chunksize` is the number of
         rows to include in each chunk.
+    partition_column : string, optional
+        Name of a numeric or date column to read the table in
+        `num_partitions` range queries over, which run concurrently on the
+        connections of the pool of the engine, on at most as many threads
+        as the pool can check out connections (its size and overflow).
+        Like the JDBC reader of Spark, the range between `lower_bound` and
+        `upper_bound` is split in strides of equal width; the bounds don't
+        filter the rows, the first partition also reads the values lower
+        than the stride and NULL, the last one the values greater than it.
+
+        .. versionadded:: 0.23.0
+    lower_bound, upper_bound : number or date, optional
+        Bounds of the values of `partition_column` to split in strides.
+
+        .. versionadded:: 0.23.0
+    num_partitions : int, optional
+        Number of partitions, at most the width of integer bounds.
+        With a `chunksize`, the partitions are read one after another.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -244,7 +428,9 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     pandas_sql = SQLDatabase(con, meta=meta)
     table = pandas_sql.read_table(
         table_name, index_col=index_col, coerce_float=coerce_float,
-        parse_dates=parse_dates, columns=columns, chunksize=chunksize)
+        parse_dates=parse_dates, columns=columns, chunksize=chunksize,
+        partition_column=partition_column, lower_bound=lower_bound,
+        upper_bound=upper_bound, num_partitions=num_partitions)
 
     if table is not None:
         return table
@@ -253,7 +439,7 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
 
 
 def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
-                   parse_dates=None, chunksize=None):
+                   parse_dates=None, chunksize=None, dtype=None):
     """Read SQL query into a DataFrame.
 
     Returns a DataFrame corresponding to the result set of the query
@@ -291,7 +477,15 @@ def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
           such as SQLite.
     chunksize : int, default None
         If specified, return an iterator where `chunksize` is the number of
-        rows to include in each chunk.
+        rows to include in each chunk, fetched from a server side cursor
+        where the SQLAlchemy dialect supports it.
+    dtype : Type name or dict of columns
+        Data type for data or columns. E.g. np.float64 or
+        {'a': np.float64, 'b': np.int32}. The numeric columns are
+        converted from the rows of the result set by numpy at once,
+        rather than inferred from the python objects.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -311,11 +505,11 @@ def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
     pandas_sql = pandasSQL_builder(con)
     return pandas_sql.read_query(
         sql, index_col=index_col, params=params, coerce_float=coerce_float,
-        parse_dates=parse_dates, chunksize=chunksize)
+        parse_dates=parse_dates, chunksize=chunksize, dtype=dtype)
 
 
 def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
-             parse_dates=None, columns=None, chunksize=None):
+             parse_dates=None, columns=None, chunksize=None, dtype=None):
     """
     Read SQL query or database table into a DataFrame.
 
@@ -361,6 +555,16 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
     chunksize : int, default None
         If specified, return an iterator where `chunksize` is the
         number of rows to include in each chunk.
+    dtype : Type name or dict of columns
+        Data type for data or columns. E.g. np.float64 or
+        {'a': np.float64, 'b': np.int32}. The numeric columns are
+        converted from the rows of the result set by numpy at once,
+        rather than inferred from the python objects.
+
+        Only used when reading a query, the dtypes of a table are
+        given by its SQL types.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -378,7 +582,7 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
         return pandas_sql.read_query(
             sql, index_col=index_col, params=params,
             coerce_float=coerce_float, parse_dates=parse_dates,
-            chunksize=chunksize)
+            chunksize=chunksize, dtype=dtype)
 
     try:
         _is_table_name = pandas_sql.has_table(sql)
@@ -394,11 +598,11 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
         return pandas_sql.read_query(
             sql, index_col=index_col, params=params,
             coerce_float=coerce_float, parse_dates=parse_dates,
-            chunksize=chunksize)
+            chunksize=chunksize, dtype=dtype)
 
 
 def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
-           index_label=None, chunksize=None, dtype=None):
+           index_label=None, chunksize=None, dtype=None, method=None):
     """
     Write records stored in a DataFrame to a SQL database.
 
@@ -432,6 +636,18 @@ def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
         Optional specifying the datatype for columns. The SQL type should
         be a SQLAlchemy type, or a string for sqlite3 fallback connection.
         If all columns are of the same type, one single value can be used.
+    method : {None, 'multi', callable}, default None
+        Controls the SQL insertion clause used:
+
+        - None : Uses standard SQL ``INSERT`` clause (one per row).
+        - 'multi': Pass multiple values in a single ``INSERT`` clause.
+        - callable with signature ``(pd_table, conn, keys, data_iter)``,
+          e.g. to load the rows with a bulk loader of the database.
+
+        Details and a sample callable implementation can be found in the
+        section :ref:`insert method <io.sql.method>`.
+
+        .. versionadded:: 0.23.0
 
     """
     if if_exists not in ('fail', 'replace', 'append'):
@@ -447,7 +663,7 @@ def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
 
     pandas_sql.to_sql(frame, name, if_exists=if_exists, index=index,
                       index_label=index_label, schema=schema,
-                      chunksize=chunksize, dtype=dtype)
+                      chunksize=chunksize, dtype=dtype, method=method)
 
 
 def has_table(table_name, con, schema=None):
@@ -594,7 +810,19 @@ class SQLTable(PandasObject):
 
         for i in range(len(blocks)):
             b = blocks[i]
-            if b.is_datetime:
+            if ((b.is_float or b.is_integer or b.is_bool) and
+                    not b.is_timedelta):
+                # numeric columns are converted to lists of python scalars
+                # at once, rather than boxed into object arrays
+                for col_loc, col in zip(b.mgr_locs, b.values):
+                    d = col.tolist()
+                    if b.is_float:
+                        # replace NaN with None
+                        for j in np.flatnonzero(isna(col)):
+                            d[j] = None
+                    data_list[col_loc] = d
+                continue
+            elif b.is_datetime:
                 # convert to microsecond resolution so this yields
                 # datetime.datetime
                 d = b.values.astype('M8[us]').astype(object)
@@ -612,10 +840,45 @@ class SQLTable(PandasObject):
         return column_names, data_list
 
     def _execute_insert(self, conn, keys, data_iter):
-        data = [{k: v for k, v in zip(keys, row)} for row in data_iter]
+        """Execute SQL statement inserting data
+
+        Parameters
+        ----------
+        conn : sqlalchemy.engine.Engine or sqlalchemy.engine.Connection
+        keys : list of str
+           Column names
+        data_iter : generator of list
+           Each item contains a list of values to be inserted
+        """
+        data = [dict(zip(keys, row)) for row in data_iter]
         conn.execute(self.insert_statement(), data)
 
-    def insert(self, chunksize=None):
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        """Alternative to _execute_insert for DBs support multivalue INSERT.
+
+        Note: multi-value insert is usually faster for analytics DBs
+        and tables containing a few columns
+        but performance degrades quickly with increase of columns.
+        """
+        data = [dict(zip(keys, row)) for row in data_iter]
+        num_rows = max(1, len(data))
+        if conn.dialect.name == 'sqlite':
+            num_rows = max(1, _SQLITE_MAX_VARIABLES // len(keys))
+        for start in range(0, len(data), num_rows):
+            conn.execute(self.table.insert(data[start:start + num_rows]))
+
+    def insert(self, chunksize=None, method=None):
+
+        # set insert method
+        if method is None:
+            exec_insert = self._execute_insert
+        elif method == 'multi':
+            exec_insert = self._execute_insert_multi
+        elif callable(method):
+            exec_insert = partial(method, self)
+        else:
+            raise ValueError('Invalid parameter `method`: {}'.format(method))
+
         keys, data_list = self.insert_data()
 
         nrows = len(self.frame)
@@ -638,19 +901,30 @@ class SQLTable(PandasObject):
                     break
 
                 chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
-                self._execute_insert(conn, keys, chunk_iter)
+                exec_insert(conn, keys, chunk_iter)
+
+    def _get_numeric_dtypes(self, columns):
+        """The numeric dtypes of the columns of the table, or None"""
+        dtypes = {}
+        for sql_col in self.table.columns:
+            col_type = self._get_dtype(sql_col.type)
+            if col_type is float or col_type is np.dtype('int64'):
+                dtypes[sql_col.name] = np.dtype(col_type)
+        return [dtypes.get(col) for col in columns]
 
     def _query_iterator(self, result, chunksize, columns, coerce_float=True,
                         parse_dates=None):
         """Return generator through chunked result set."""
 
+        dtypes = self._get_numeric_dtypes(columns)
         while True:
             data = result.fetchmany(chunksize)
             if not data:
                 break
             else:
-                self.frame = DataFrame.from_records(
-                    data, columns=columns, coerce_float=coerce_float)
+                self.frame = _result_frame(data, columns,
+                                           coerce_float=coerce_float,
+                                           dtypes=dtypes)
 
                 self._harmonize_columns(parse_dates=parse_dates)
 
@@ -659,8 +933,76 @@ class SQLTable(PandasObject):
 
                 yield self.frame
 
+    def _partition_selects(self, sql_select, partition_column, lower_bound,
+                           upper_bound, num_partitions):
+        """
+        The queries of the partitions of the rows of sql_select, over the
+        ranges of the values of partition_column, see _get_partition_bounds.
+        """
+        from sqlalchemy import and_, or_
+
+        if (lower_bound is None or upper_bound is None or
+                num_partitions is None):
+            raise ValueError("lower_bound, upper_bound and num_partitions "
+                             "are required to partition the table")
+        try:
+            col = self.table.c[partition_column]
+        except KeyError:
+            raise ValueError("partition_column {col} is not a column of the "
+                             "table".format(col=partition_column))
+
+        bounds = _get_partition_bounds(lower_bound, upper_bound,
+                                       num_partitions)
+        if not bounds:
+            return [sql_select]
+
+        # NULL values are in the first partition
+        clauses = [or_(col < bounds[0], col.is_(None))]
+        clauses.extend(and_(col >= lower, col < upper)
+                       for lower, upper in zip(bounds[:-1], bounds[1:]))
+        clauses.append(col >= bounds[-1])
+        return [sql_select.where(clause) for clause in clauses]
+
+    def _partitions_iterator(self, selects, chunksize, coerce_float=True,
+                             parse_dates=None):
+        """Return generator through the chunked result sets of the
+        partitions, one after another."""
+
+        for sql_select in selects:
+            result = self.pd_sql.execute(sql_select, stream_results=True)
+            for frame in self._query_iterator(result, chunksize,
+                                              result.keys(),
+                                              coerce_float=coerce_float,
+                                              parse_dates=parse_dates):
+                yield frame
+
+    def _read_partitions(self, selects, coerce_float=True):
+        """
+        Read the result sets of the partitions concurrently, each on its own
+        connection of the pool of the engine, on at most as many threads as
+        the pool holds connections, and build the frame from the
+        concatenated columns of all of them.
+        """
+        def _read_partition(sql_select):
+            result = self.pd_sql.execute(sql_select)
+            column_names = result.keys()
+            dtypes = self._get_numeric_dtypes(column_names)
+            return column_names, _convert_result_chunks(
+                result, dtypes, coerce_float=coerce_float)
+
+        nthreads = self.pd_sql._max_concurrent_reads() or len(selects)
+        results = com._thread_map(_read_partition, selects, nthreads)
+
+        column_names = results[0][0]
+        arrays = [_concat_result_column([chunk for _, chunks in results
+                                         for chunk in chunks[i]],
+                                        coerce_float=coerce_float)
+                  for i in range(len(column_names))]
+        return DataFrame._from_arrays(arrays, column_names, None)
+
     def read(self, coerce_float=True, parse_dates=None, columns=None,
-             chunksize=None):
+             chunksize=None, partition_column=None, lower_bound=None,
+             upper_bound=None, num_partitions=None):
 
         if columns is not None and len(columns) > 0:
             from sqlalchemy import select
@@ -671,7 +1013,33 @@ class SQLTable(PandasObject):
         else:
             sql_select = self.table.select()
 
-        result = self.pd_sql.execute(sql_select)
+        if partition_column is not None:
+            selects = self._partition_selects(sql_select, partition_column,
+                                              lower_bound, upper_bound,
+                                              num_partitions)
+        elif (lower_bound is not None or upper_bound is not None or
+                num_partitions is not None):
+            raise ValueError("partition_column is required to partition "
+                             "the table")
+        else:
+            selects = [sql_select]
+
+        if len(selects) > 1:
+            if chunksize is not None:
+                return self._partitions_iterator(selects, chunksize,
+                                                 coerce_float=coerce_float,
+                                                 parse_dates=parse_dates)
+            self.frame = self._read_partitions(selects,
+                                               coerce_float=coerce_float)
+            self._harmonize_columns(parse_dates=parse_dates)
+
+            if self.index is not None:
+                self.frame.set_index(self.index, inplace=True)
+
+            return self.frame
+
+        result = self.pd_sql.execute(sql_select,
+                                     stream_results=chunksize is not None)
         column_names = result.keys()
 
         if chunksize is not None:
@@ -679,9 +1047,9 @@ class SQLTable(PandasObject):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            self.frame = DataFrame.from_records(
-                data, columns=column_names, coerce_float=coerce_float)
+            self.frame = _result_frame(
+                result, column_names, coerce_float=coerce_float,
+                dtypes=self._get_numeric_dtypes(column_names))
 
             self._harmonize_columns(parse_dates=parse_dates)
 
@@ -950,12 +1318,52 @@ class SQLDatabase(PandasSQL):
                 yield self.connectable
 
     def execute(self, *args, **kwargs):
-        """Simple passthrough to SQLAlchemy connectable"""
+        """Simple passthrough to SQLAlchemy connectable
+
+        With ``stream_results=True``, the rows are fetched from a server side
+        cursor as they are consumed, where the dialect supports it.
+        """
+        if kwargs.pop('stream_results', False):
+            return self.connectable.execution_options(
+                stream_results=True).execute(*args, **kwargs)
         return self.connectable.execute(*args, **kwargs)
 
+    def _max_concurrent_reads(self):
+        """
+        The number of queries that can run at once on threads, each checking
+        out its own connection from the pool of the engine: the size of the
+        pool and its overflow, None if the pool is not bounded, 1 if the
+        queries can't run on threads.
+        """
+        from sqlalchemy.engine import Engine
+        from sqlalchemy.pool import QueuePool, NullPool, SingletonThreadPool
+
+        engine = self.connectable
+        if not isinstance(engine, Engine):
+            # a connection, or its transaction, can't be shared by threads
+            return 1
+        if (engine.dialect.name == 'sqlite' and
+                engine.url.database in (None, '', ':memory:')):
+            # each thread would connect to its own in-memory sqlite database
+            return 1
+
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            # more threads would wait for a connection, up to the timeout
+            # of the pool
+            max_overflow = getattr(pool, '_max_overflow', 0)
+            if max_overflow < 0:
+                return None
+            return max(pool.size() + max_overflow, 1)
+        elif isinstance(pool, (NullPool, SingletonThreadPool)):
+            return None
+        # e.g. a StaticPool, sharing a single connection
+        return 1
+
     def read_table(self, table_name, index_col=None, coerce_float=True,
                    parse_dates=None, columns=None, schema=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None, lower_bound=None,
+                   upper_bound=None, num_partitions=None):
         """Read SQL database table into a DataFrame.
 
         Parameters
@@ -986,6 +1394,11 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If specified, return an iterator where `chunksize` is the number
             of rows to include in each chunk.
+        partition_column, lower_bound, upper_bound, num_partitions : optional
+            Read the table in num_partitions range queries over the values
+            of partition_column, see :func:`pandas.read_sql_table`.
+
+            .. versionadded:: 0.23.0
 
         Returns
         -------
@@ -1000,11 +1413,14 @@ class SQLDatabase(PandasSQL):
         table = SQLTable(table_name, self, index=index_col, schema=schema)
         return table.read(coerce_float=coerce_float,
                           parse_dates=parse_dates, columns=columns,
-                          chunksize=chunksize)
+                          chunksize=chunksize,
+                          partition_column=partition_column,
+                          lower_bound=lower_bound, upper_bound=upper_bound,
+                          num_partitions=num_partitions)
 
     @staticmethod
     def _query_iterator(result, chunksize, columns, index_col=None,
-                        coerce_float=True, parse_dates=None):
+                        coerce_float=True, parse_dates=None, dtype=None):
         """Return generator through chunked result set"""
 
         while True:
@@ -1014,10 +1430,10 @@ class SQLDatabase(PandasSQL):
             else:
                 yield _wrap_result(data, columns, index_col=index_col,
                                    coerce_float=coerce_float,
-                                   parse_dates=parse_dates)
+                                   parse_dates=parse_dates, dtype=dtype)
 
     def read_query(self, sql, index_col=None, coerce_float=True,
-                   parse_dates=None, params=None, chunksize=None):
+                   parse_dates=None, params=None, chunksize=None, dtype=None):
         """Read SQL query into a DataFrame.
 
         Parameters
@@ -1046,7 +1462,15 @@ class SQLDatabase(PandasSQL):
               without native Datetime support, such as SQLite.
         chunksize : int, default None
             If specified, return an iterator where `chunksize` is the number
-            of rows to include in each chunk.
+            of rows to include in each chunk, fetched from a server side
+            cursor where the dialect supports it.
+        dtype : Type name or dict of columns
+            Data type for data or columns. E.g. np.float64 or
+            {'a': np.float64, 'b': np.int32}. The numeric columns are
+            converted from the rows of the result set by numpy at once,
+            rather than inferred from the python objects.
+
+            .. versionadded:: 0.23.0
 
         Returns
         -------
@@ -1060,25 +1484,25 @@ class SQLDatabase(PandasSQL):
         """
         args = _convert_params(sql, params)
 
-        result = self.execute(*args)
+        result = self.execute(*args, stream_results=chunksize is not None)
         columns = result.keys()
 
         if chunksize is not None:
             return self._query_iterator(result, chunksize, columns,
                                         index_col=index_col,
                                         coerce_float=coerce_float,
-                                        parse_dates=parse_dates)
+                                        parse_dates=parse_dates, dtype=dtype)
         else:
-            data = result.fetchall()
-            frame = _wrap_result(data, columns, index_col=index_col,
+            frame = _wrap_result(result, columns, index_col=index_col,
                                  coerce_float=coerce_float,
-                                 parse_dates=parse_dates)
+                                 parse_dates=parse_dates, dtype=dtype)
             return frame
 
     read_sql = read_query
 
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None, dtype=None):
+               index_label=None, schema=None, chunksize=None, dtype=None,
+               method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1108,6 +1532,18 @@ class SQLDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a SQLAlchemy type. If all columns are of the same type, one
             single value can be used.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            - None : Uses standard SQL ``INSERT`` clause (one per row).
+            - 'multi': Pass multiple values in a single ``INSERT`` clause.
+            - callable with signature ``(pd_table, conn, keys, data_iter)``,
+              e.g. to load the rows with a bulk loader of the database.
+
+            Details and a sample callable implementation can be found in the
+            section :ref:`insert method <io.sql.method>`.
+
+            .. versionadded:: 0.23.0
 
         """
         if dtype and not is_dict_like(dtype):
@@ -1124,7 +1560,7 @@ class SQLDatabase(PandasSQL):
                          if_exists=if_exists, index_label=index_label,
                          schema=schema, dtype=dtype)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
         if (not name.isdigit() and not name.islower()):
             # check for potentially case sensitivity issues (GH7815)
             # Only check when name is not a number and name is not lower case
@@ -1250,7 +1686,7 @@ class SQLiteTable(SQLTable):
             for stmt in self.table:
                 conn.execute(stmt)
 
-    def insert_statement(self):
+    def insert_statement(self, num_rows=1):
         names = list(map(text_type, self.frame.columns))
         wld = '?'  # wildcard char
         escape = _get_valid_sqlite_name
@@ -1260,8 +1696,9 @@ class SQLiteTable(SQLTable):
 
         bracketed_names = [escape(column) for column in names]
         col_names = ','.join(bracketed_names)
-        wildcards = ','.join([wld] * len(names))
-        insert_statement = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        row_wildcards = '(%s)' % ','.join([wld] * len(names))
+        wildcards = ','.join([row_wildcards] * num_rows)
+        insert_statement = 'INSERT INTO %s (%s) VALUES %s' % (
             escape(self.name), col_names, wildcards)
         return insert_statement
 
@@ -1269,6 +1706,16 @@ class SQLiteTable(SQLTable):
         data_list = list(data_iter)
         conn.executemany(self.insert_statement(), data_list)
 
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        data_list = list(data_iter)
+
+        num_rows = max(1, _SQLITE_MAX_VARIABLES // len(keys))
+        for start in range(0, len(data_list), num_rows):
+            rows = data_list[start:start + num_rows]
+            flattened_data = [x for row in rows for x in row]
+            conn.execute(self.insert_statement(num_rows=len(rows)),
+                         flattened_data)
+
     def _create_table_setup(self):
         """
         Return a list of SQL statements that creates a table reflecting the
@@ -1391,7 +1838,7 @@ class SQLiteDatabase(PandasSQL):
 
     @staticmethod
     def _query_iterator(cursor, chunksize, columns, index_col=None,
-                        coerce_float=True, parse_dates=None):
+                        coerce_float=True, parse_dates=None, dtype=None):
         """Return generator through chunked result set"""
 
         while True:
@@ -1404,10 +1851,10 @@ class SQLiteDatabase(PandasSQL):
             else:
                 yield _wrap_result(data, columns, index_col=index_col,
                                    coerce_float=coerce_float,
-                                   parse_dates=parse_dates)
+                                   parse_dates=parse_dates, dtype=dtype)
 
     def read_query(self, sql, index_col=None, coerce_float=True, params=None,
-                   parse_dates=None, chunksize=None):
+                   parse_dates=None, chunksize=None, dtype=None):
 
         args = _convert_params(sql, params)
         cursor = self.execute(*args)
@@ -1417,24 +1864,19 @@ class SQLiteDatabase(PandasSQL):
             return self._query_iterator(cursor, chunksize, columns,
                                         index_col=index_col,
                                         coerce_float=coerce_float,
-                                        parse_dates=parse_dates)
+                                        parse_dates=parse_dates, dtype=dtype)
         else:
-            data = self._fetchall_as_list(cursor)
-            cursor.close()
-
-            frame = _wrap_result(data, columns, index_col=index_col,
-                                 coerce_float=coerce_float,
-                                 parse_dates=parse_dates)
+            try:
+                frame = _wrap_result(cursor, columns, index_col=index_col,
+                                     coerce_float=coerce_float,
+                                     parse_dates=parse_dates, dtype=dtype)
+            finally:
+                cursor.close()
             return frame
 
-    def _fetchall_as_list(self, cur):
-        result = cur.fetchall()
-        if not isinstance(result, list):
-            result = list(result)
-        return result
-
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None, dtype=None):
+               index_label=None, schema=None, chunksize=None, dtype=None,
+               method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1463,6 +1905,18 @@ class SQLiteDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a string. If all columns are of the same type, one single value
             can be used.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            - None : Uses standard SQL ``INSERT`` clause (one per row).
+            - 'multi': Pass multiple values in a single ``INSERT`` clause.
+            - callable with signature ``(pd_table, conn, keys, data_iter)``,
+              e.g. to load the rows with a bulk loader of the database.
+
+            Details and a sample callable implementation can be found in the
+            section :ref:`insert method <io.sql.method>`.
+
+            .. versionadded:: 0.23.0
 
         """
         if dtype and not is_dict_like(dtype):
@@ -1478,7 +1932,7 @@ class SQLiteDatabase(PandasSQL):
                             if_exists=if_exists, index_label=index_label,
                             dtype=dtype)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
 
     def has_table(self, name, schema=None):
         # TODO(wesm): unused?
@@ -35,7 +35,10 @@ class TestTypes(Base):
                'pandas_dtype', 'union_categoricals', 'infer_dtype']
     deprecated = ['is_any_int_dtype', 'is_floating_dtype', 'is_sequence']
     dtypes = ['CategoricalDtype', 'DatetimeTZDtype',
-              'PeriodDtype', 'IntervalDtype']
+              'PeriodDtype', 'IntervalDtype', 'StringDtype',
+              'Int8Dtype', 'Int16Dtype', 'Int32Dtype', 'Int64Dtype',
+              'UInt8Dtype', 'UInt16Dtype', 'UInt32Dtype', 'UInt64Dtype',
+              'BooleanDtype']
 
     def test_types(self):
 
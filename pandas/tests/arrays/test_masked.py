@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+
+import pandas as pd
+import pandas.util.testing as tm
+from pandas import Series
+from pandas.core.arrays import IntegerArray, BooleanArray
+from pandas.core.dtypes.dtypes import (Int8Dtype, Int64Dtype, UInt8Dtype,
+                                       BooleanDtype)
+
+
+def make_int(values, dtype='Int64'):
+    return IntegerArray(np.array(values, dtype=object), dtype=dtype)
+
+
+def make_bool(values):
+    return BooleanArray(np.array(values, dtype=object))
+
+
+def assert_masked_equal(result, expected):
+    assert type(result) == type(expected)
+    assert result.dtype == expected.dtype
+    tm.assert_numpy_array_equal(result.isna(), expected.isna())
+    tm.assert_numpy_array_equal(result._data[~result._mask],
+                                expected._data[~expected._mask])
+
+
+class TestIntegerArray(object):
+
+    def test_constructor(self):
+        arr = make_int([1, None, 3])
+        assert arr.dtype == Int64Dtype()
+        assert arr.dtype == 'Int64'
+        assert arr._data.dtype == np.int64
+        tm.assert_numpy_array_equal(arr.isna(),
+                                    np.array([False, True, False]))
+
+        arr = IntegerArray([1., np.nan, 3.], dtype='Int8')
+        assert arr.dtype == Int8Dtype()
+        assert arr._data.dtype == np.int8
+
+        arr = IntegerArray(np.array([1, 2, 3], dtype=np.uint8))
+        assert arr.dtype == UInt8Dtype()
+        assert not arr.isna().any()
+
+        arr = IntegerArray([1, 2, 3], mask=[False, True, False])
+        tm.assert_numpy_array_equal(arr.isna(),
+                                    np.array([False, True, False]))
+
+    def test_constructor_invalid(self):
+        with tm.assert_raises_regex(TypeError, 'must be integers'):
+            IntegerArray([1.5, 2.])
+        with tm.assert_raises_regex(TypeError, 'must be integers'):
+            IntegerArray(np.array(['a', 1], dtype=object))
+        with tm.assert_raises_regex(TypeError, 'cannot safely cast'):
+            IntegerArray([1, 1000], dtype='Int8')
+        with tm.assert_raises_regex(ValueError, 'same length'):
+            IntegerArray([1, 2], mask=[False])
+
+    def test_large_values_are_exact(self):
+        # float64 cannot represent these
+        big = 2 ** 62 + 1
+        arr = make_int([big, None, 1])
+        assert arr[0] == big
+        s = Series(arr)
+        assert s.sum() == big + 1
+        assert s.max() == big
+
+    def test_getitem_take(self):
+        arr = make_int([1, None, 3, 4])
+        assert arr[0] == 1
+        assert np.isnan(arr[1])
+        assert_masked_equal(arr[1:3], make_int([None, 3]))
+        assert_masked_equal(arr[[3, 0]], make_int([4, 1]))
+        assert_masked_equal(arr[make_bool([True, None, False, True])],
+                            make_int([1, 4]))
+
+        assert_masked_equal(arr.take([0, -1, 2]), make_int([1, None, 3]))
+        assert_masked_equal(arr.take([0, -1], allow_fill=False),
+                            make_int([1, 4]))
+        with pytest.raises(IndexError):
+            arr.take([5])
+
+    def test_setitem(self):
+        arr = make_int([1, 2, 3])
+        arr[0] = np.nan
+        arr[2] = 5
+        assert_masked_equal(arr, make_int([None, 2, 5]))
+
+    def test_astype(self):
+        arr = make_int([1, None, 3])
+        tm.assert_numpy_array_equal(arr.astype('float64'),
+                                    np.array([1., np.nan, 3.]))
+        assert_masked_equal(arr.astype('Int8'), make_int([1, None, 3],
+                                                         dtype='Int8'))
+        with tm.assert_raises_regex(ValueError, 'missing values'):
+            arr.astype('int64')
+        tm.assert_numpy_array_equal(make_int([1, 2]).astype('int64'),
+                                    np.array([1, 2], dtype=np.int64))
+
+    @pytest.mark.parametrize('op, expected', [
+        ('__add__', [2, None, None, 8]),
+        ('__sub__', [0, None, None, 0]),
+        ('__mul__', [1, None, None, 16]),
+        ('__floordiv__', [1, None, None, 1]),
+        ('__pow__', [1, None, None, 256])])
+    def test_arithmetic(self, op, expected):
+        left = make_int([1, None, 3, 4])
+        right = make_int([1, 2, None, 4])
+        assert_masked_equal(getattr(left, op)(right), make_int(expected))
+
+    def test_arithmetic_scalar_and_ndarray(self):
+        arr = make_int([1, None, 3])
+        assert_masked_equal(arr + 1, make_int([2, None, 4]))
+        assert_masked_equal(1 + arr, make_int([2, None, 4]))
+        assert_masked_equal(arr + np.array([1, 1, 1]), make_int([2, None, 4]))
+        assert_masked_equal(arr + np.nan, make_int([None, None, None]))
+
+        result = arr / 2
+        tm.assert_numpy_array_equal(result, np.array([0.5, np.nan, 1.5]))
+
+        with tm.assert_raises_regex(ValueError, 'Lengths must match'):
+            arr + np.array([1, 2])
+
+    def test_division_by_zero(self):
+        arr = make_int([1, None, 3])
+        assert_masked_equal(arr // make_int([0, 1, 2]),
+                            make_int([None, None, 1]))
+        assert_masked_equal(arr % 0, make_int([None, None, None]))
+
+    def test_comparison(self):
+        arr = make_int([1, None, 3])
+        assert_masked_equal(arr == 1, make_bool([True, None, False]))
+        assert_masked_equal(arr > make_int([0, 1, None]),
+                            make_bool([True, None, None]))
+        assert_masked_equal(arr != 'a', make_bool([True, None, True]))
+        with tm.assert_raises_regex(TypeError, 'invalid type comparison'):
+            arr < 'a'
+
+    @pytest.mark.parametrize('method, skipna, expected', [
+        ('sum', True, 4), ('sum', False, np.nan),
+        ('min', True, 1), ('max', True, 3), ('prod', True, 3),
+        ('mean', True, 2.), ('median', True, 2.)])
+    def test_reductions(self, method, skipna, expected):
+        s = Series(make_int([1, None, 3]))
+        result = getattr(s, method)(skipna=skipna)
+        if np.isnan(expected):
+            assert np.isnan(result)
+        else:
+            assert result == expected
+
+    def test_reductions_all_missing(self):
+        s = Series(make_int([None, None]))
+        assert s.sum() == 0
+        assert np.isnan(s.max())
+        assert np.isnan(s.mean())
+
+
+class TestBooleanArray(object):
+
+    def test_constructor(self):
+        arr = make_bool([True, None, False])
+        assert arr.dtype == BooleanDtype()
+        assert arr.dtype == 'boolean'
+        assert arr._data.dtype == np.bool_
+        tm.assert_numpy_array_equal(arr.isna(),
+                                    np.array([False, True, False]))
+        assert_masked_equal(BooleanArray([1, 0]), make_bool([True, False]))
+        with tm.assert_raises_regex(TypeError, 'must be booleans'):
+            BooleanArray([1, 2])
+
+    def test_kleene_logic(self):
+        left = make_bool([True, True, True, False, False, False,
+                          None, None, None])
+        right = make_bool([True, False, None, True, False, None,
+                           True, False, None])
+        assert_masked_equal(left & right,
+                            make_bool([True, False, None, False, False, False,
+                                       None, False, None]))
+        assert_masked_equal(left | right,
+                            make_bool([True, True, True, True, False, None,
+                                       True, None, None]))
+        assert_masked_equal(left ^ right,
+                            make_bool([False, True, None, True, False, None,
+                                       None, None, None]))
+        assert_masked_equal(~make_bool([True, None, False]),
+                            make_bool([False, None, True]))
+
+    def test_scalar_logic(self):
+        arr = make_bool([True, None, False])
+        assert_masked_equal(arr & False, make_bool([False, False, False]))
+        assert_masked_equal(arr | True, make_bool([True, True, True]))
+        assert_masked_equal(arr & np.nan, make_bool([None, None, False]))
+
+    def test_reductions(self):
+        s = Series(make_bool([True, None, False]))
+        assert s.any()
+        assert not s.all()
+        assert s.sum() == 1
+
+
+class TestSeriesWithMaskedArrays(object):
+
+    def test_constructor(self):
+        s = Series([1, None, 3], dtype='Int64')
+        assert isinstance(s.values, IntegerArray)
+        assert s.dtype == Int64Dtype()
+
+        s = Series([True, None], dtype=BooleanDtype())
+        assert isinstance(s.values, BooleanArray)
+        tm.assert_series_equal(s.isna(), Series([False, True]))
+
+    def test_ops(self):
+        s = Series([1, None, 3], dtype='Int64')
+        result = s + 1
+        assert isinstance(result.values, IntegerArray)
+        assert_masked_equal(result.values, make_int([2, None, 4]))
+
+        result = s > 1
+        assert isinstance(result.values, BooleanArray)
+        assert_masked_equal(result.values, make_bool([False, None, True]))
+
+        result = s + Series([1, 1, 1], dtype='Int64')
+        assert_masked_equal(result.values, make_int([2, None, 4]))
+
+    def test_reindex(self):
+        s = Series([1, 2, 3], dtype='Int64')
+        result = s.reindex([0, 5, 2])
+        assert_masked_equal(result.values, make_int([1, None, 3]))
+
+    def test_groupby(self):
+        big = 2 ** 62
+        s = Series(make_int([big, 1, None, 2, None, 5]))
+        keys = ['a', 'a', 'b', 'b', 'c', 'c']
+
+        result = s.groupby(keys).sum()
+        assert_masked_equal(result.values, make_int([big + 1, 2, 5]))
+
+        result = s.groupby(keys).sum(min_count=2)
+        assert_masked_equal(result.values, make_int([big + 1, None, None]))
+
+        result = s.groupby(keys).max()
+        assert_masked_equal(result.values, make_int([big, 2, 5]))
+
+        result = s.groupby(keys).min()
+        assert_masked_equal(result.values, make_int([1, 2, 5]))
+
+        result = s.groupby(keys).mean()
+        tm.assert_numpy_array_equal(result.values,
+                                    np.array([big / 2., 2., 5.]))
+
+        s = Series(make_int([None, None, 1]))
+        result = s.groupby(['a', 'a', 'b']).max()
+        assert_masked_equal(result.values, make_int([None, 1]))
+
+    def test_groupby_narrow_dtype(self):
+        # the sums of narrow dtypes don't overflow
+        s = Series([100, 100, None, 1], dtype='Int8')
+        grouped = s.groupby(['a', 'a', 'b', 'b'])
+
+        result = grouped.sum()
+        assert result.dtype == Int64Dtype()
+        assert_masked_equal(result.values, make_int([200, 1]))
+
+        result = grouped.max()
+        assert result.dtype == Int8Dtype()
+        assert_masked_equal(result.values,
+                            make_int([100, 1], dtype='Int8'))
+
+    def test_groupby_boolean(self):
+        s = Series(make_bool([True, None, True, False]))
+        result = s.groupby(['a', 'a', 'b', 'b']).sum()
+        assert_masked_equal(result.values, make_int([1, 1]))
+
+
+def test_isna():
+    arr = make_int([1, None])
+    tm.assert_numpy_array_equal(pd.isna(arr), np.array([False, True]))
+    tm.assert_series_equal(pd.isna(Series(arr)), Series([False, True]))
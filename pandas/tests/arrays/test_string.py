@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+
+import pandas as pd
+import pandas.util.testing as tm
+from pandas import Series, DataFrame
+from pandas.compat import u, StringIO
+from pandas.core.arrays import StringArray
+from pandas.core.dtypes.dtypes import StringDtype
+
+
+@pytest.fixture
+def values():
+    return np.array([u('foo'), np.nan, u('Bar'), u(''), u('b\xe4z qux'),
+                     u('FOO_bar'), np.nan, u('a_b_c')], dtype=object)
+
+
+def assert_string_series_equal(result, expected):
+    assert isinstance(result.values, StringArray)
+    result = Series(np.asarray(result.values), index=result.index,
+                    name=result.name)
+    tm.assert_series_equal(result, expected)
+
+
+class TestStringArray(object):
+
+    def test_constructor(self, values):
+        arr = StringArray(values)
+        assert len(arr) == len(values)
+        assert arr.dtype == StringDtype()
+        assert arr.dtype == 'string'
+        tm.assert_numpy_array_equal(arr.isna(), pd.isna(values))
+        tm.assert_numpy_array_equal(np.asarray(arr), values)
+
+        tm.assert_numpy_array_equal(np.asarray(StringArray(arr, copy=True)),
+                                    values)
+
+        with tm.assert_raises_regex(TypeError, 'can only hold strings'):
+            StringArray([u('a'), 1])
+
+    def test_getitem(self, values):
+        arr = StringArray(values)
+        assert arr[0] == u('foo')
+        assert arr[4] == u('b\xe4z qux')
+        assert arr[-1] == u('a_b_c')
+        assert np.isnan(arr[1])
+        with pytest.raises(IndexError):
+            arr[len(values)]
+
+        # slices share the buffers
+        result = arr[2:5]
+        assert result._data is arr._data
+        tm.assert_numpy_array_equal(np.asarray(result), values[2:5])
+
+        for key in [slice(None, None, -2), values == u('foo'), [0, 3, -1]]:
+            tm.assert_numpy_array_equal(np.asarray(arr[key]), values[key])
+
+    def test_take(self, values):
+        arr = StringArray(values)
+
+        result = arr.take([4, -1, 0])
+        expected = np.array([values[4], np.nan, values[0]], dtype=object)
+        tm.assert_numpy_array_equal(np.asarray(result), expected)
+
+        result = arr.take([4, -1, 0], fill_value=u('x'))
+        expected[1] = u('x')
+        tm.assert_numpy_array_equal(np.asarray(result), expected)
+
+        result = StringArray([]).take([-1, -1])
+        assert result.isna().all()
+
+        with pytest.raises(IndexError):
+            arr.take([len(values)])
+
+    def test_concat_same_type(self, values):
+        arr = StringArray(values)
+        result = StringArray._concat_same_type([arr[5:], arr[:3]])
+        expected = np.concatenate([values[5:], values[:3]])
+        tm.assert_numpy_array_equal(np.asarray(result), expected)
+
+    def test_series(self, values):
+        s = Series(StringArray(values), name='x')
+        assert s.dtype == StringDtype()
+        assert isinstance(s.values, StringArray)
+
+        s = Series(values, dtype=StringDtype())
+        assert isinstance(s.values, StringArray)
+        tm.assert_numpy_array_equal(s.isna().values, pd.isna(values))
+
+        df = DataFrame({'a': StringArray(values), 'b': 1})
+        assert isinstance(df['a'].values, StringArray)
+        df['c'] = StringArray(values)
+        assert isinstance(df['c'].values, StringArray)
+
+    def test_string_alias(self, values):
+        assert pd.api.types.pandas_dtype('string') == StringDtype()
+
+        s = Series(values, dtype='string')
+        assert s.dtype == StringDtype()
+        assert_string_series_equal(s, Series(values))
+
+        result = Series(values).astype('string')
+        assert_string_series_equal(result, Series(values))
+        assert result.astype('string').dtype == StringDtype()
+
+        result = Series([1, np.nan, 3]).astype('string')
+        assert_string_series_equal(
+            result, Series([u('1.0'), np.nan, u('3.0')], dtype=object))
+
+        df = DataFrame({'a': values, 'b': values, 'c': 1})
+        result = df.astype({'a': 'string'})
+        assert isinstance(result['a'].values, StringArray)
+        assert result['b'].dtype == object
+        result = df[['a', 'b']].astype('string')
+        assert_string_series_equal(result['b'], Series(values, name='b'))
+
+        data = u('a,b\nfoo,1\n,2\nbar,3\n')
+        result = pd.read_csv(StringIO(data), dtype={'a': 'string'})
+        assert_string_series_equal(
+            result['a'], Series([u('foo'), np.nan, u('bar')], name='a'))
+        tm.assert_series_equal(result['b'], Series([1, 2, 3], name='b'))
+
+
+class TestStringMethods(object):
+
+    @pytest.mark.parametrize('method, args, kwargs', [
+        ('len', (), {}),
+        ('contains', ('o',), {}),
+        ('contains', ('_b',), {'regex': False, 'na': False}),
+        ('contains', ('fo',), {'case': False}),
+        ('contains', (u('\xe4z'),), {}),
+        ('contains', ('',), {'regex': False}),
+        ('contains', ('o.',), {}),
+        ('startswith', ('FO',), {}),
+        ('startswith', ('',), {'na': True}),
+        ('endswith', ('ar',), {'na': False}),
+        ('endswith', ('c',), {}),
+        ('count', ('o',), {}),
+    ])
+    def test_reductions(self, values, method, args, kwargs):
+        expected = getattr(Series(values).str, method)(*args, **kwargs)
+        result = getattr(Series(StringArray(values)).str,
+                         method)(*args, **kwargs)
+        tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize('method, args', [
+        ('lower', ()),
+        ('upper', ()),
+        ('slice', (1, 3)),
+        ('slice', (-3,)),
+        ('slice', (None, -1)),
+        ('slice', (5, 2)),
+        ('slice', (None, None, 2)),
+    ])
+    @pytest.mark.parametrize('ascii', [True, False])
+    def test_transforms(self, values, method, args, ascii):
+        if ascii:
+            values = values.copy()
+            values[4] = u('baz qux')
+
+        expected = getattr(Series(values).str, method)(*args)
+        result = getattr(Series(StringArray(values)).str, method)(*args)
+        assert_string_series_equal(result, expected)
+
+    @pytest.mark.parametrize('n', [-1, 1])
+    @pytest.mark.parametrize('pat', ['_', 'z', u('\xe4')])
+    def test_split_expand(self, values, pat, n):
+        expected = Series(values).str.split(pat, n=n, expand=True)
+        result = Series(StringArray(values)).str.split(pat, n=n, expand=True)
+
+        assert len(result.columns) == len(expected.columns)
+        for i in expected.columns:
+            assert isinstance(result[i].values, StringArray)
+            # missing parts are None in the object result
+            tm.assert_numpy_array_equal(
+                np.asarray(result[i].values),
+                expected[i].fillna(np.nan).values)
+
+    def test_split(self, values):
+        expected = Series(values).str.split('_')
+        result = Series(StringArray(values)).str.split('_')
+        tm.assert_series_equal(result, expected)
+
+    def test_not_vectorized(self, values):
+        expected = Series(values).str.replace('o', 'x')
+        result = Series(StringArray(values)).str.replace('o', 'x')
+        tm.assert_series_equal(result, expected)
+
+
+def test_from_arrow(values):
+    pa = pytest.importorskip('pyarrow')
+
+    array = pa.array(list(values), type=pa.string(), from_pandas=True)
+    result = StringArray._from_arrow(array)
+    tm.assert_numpy_array_equal(np.asarray(result), values)
+
+    result = StringArray._from_arrow(array.slice(2, 4))
+    tm.assert_numpy_array_equal(np.asarray(result), values[2:6])
@@ -1908,6 +1908,139 @@ def test_negate_lt_eq_le(engine, parser):
         tm.assert_frame_equal(result, expected)
 
 
+class TestBlockedEngine(object):
+
+    @pytest.fixture(autouse=True, params=[1, 3])
+    def blocks(self, request, monkeypatch):
+        # evaluate a row at a time
+        from pandas.core.computation import engines
+        monkeypatch.setattr(engines, '_BLOCK_BYTES', 1)
+        with pd.option_context('compute.eval_nthreads', request.param):
+            yield
+
+    @pytest.fixture
+    def df(self):
+        np.random.seed(1234)
+        dt = date_range('2018-01-01', periods=10).values
+        dt[3] = np.datetime64('NaT')
+        return DataFrame({'a': np.arange(10), 'b': randn(10),
+                          'dt': dt, 'dt2': date_range('2018-02-01',
+                                                      periods=10),
+                          's': list('abcdeabcde'),
+                          'c': pd.Categorical(list('xyzxyzxyzx'))})
+
+    @pytest.mark.parametrize('ex', [
+        'a + b * 2', '(a > 3) & (b < 0)', 'sin(b) + a', 'a / 3', 'a // 3',
+        'a % 3', 'a ** 2', '-b', '~(a > 2)',
+        'dt2 - dt', 'dt > "2018-01-05"', 'dt != dt2', 'dt == dt',
+        's == "a"', 's >= "c"', 's in ["a", "b"]', 's not in ["a"]',
+        'c == "x"', 'c in ["x", "z"]', 'a in b', 'a in [1, 3]'])
+    def test_matches_python_engine(self, df, ex, parser):
+        if parser == 'python' and 'in' in ex.split():
+            pytest.skip("membership tests need the pandas parser")
+        result = df.eval(ex, engine='blocked', parser=parser)
+        expected = df.eval(ex, engine='python', parser=parser)
+        tm.assert_series_equal(result, expected, check_names=False)
+
+    def test_query(self, df):
+        result = df.query('dt > "2018-01-02" and s in ["a", "d"] and b < 1',
+                          engine='blocked')
+        expected = df[(df.dt > '2018-01-02') & df.s.isin(['a', 'd']) &
+                      (df.b < 1)]
+        tm.assert_frame_equal(result, expected)
+
+    def test_frame(self):
+        df = DataFrame(randn(10, 3))
+        other = DataFrame(randn(10, 3))
+        s = Series(randn(3))
+        for ex in ['df + other * 2', 'df + s', 'df > 0']:
+            result = pd.eval(ex, engine='blocked')
+            expected = pd.eval(ex, engine='python')
+            tm.assert_frame_equal(result, expected)
+
+
+class TestExprCache(object):
+
+    @pytest.fixture(autouse=True)
+    def clear(self):
+        expr.cache_clear()
+        yield
+        expr.cache_clear()
+
+    @pytest.fixture
+    def df(self):
+        return DataFrame({'a': np.arange(5), 'b': randn(5),
+                          's': list('abcab'),
+                          'dt': date_range('2018-01-01', periods=5)})
+
+    @pytest.mark.parametrize('ex', [
+        'a > 2', 'a + b * 2 > 1', 'b / a', 'sin(b) > 0 and -a < -1',
+        's == "a"', 's in ["a", "b"]', 'dt > "2018-01-02"', 'a > @x'])
+    def test_hits(self, df, ex, engine, parser):
+        if parser == 'python' and any(x in ex for x in [' in ', 'and', '@']):
+            pytest.skip("not supported by the python parser")
+        x = 1  # noqa
+        expected = df.eval(ex, engine='python', parser=parser)
+        expr.cache_clear()
+        for _ in range(3):
+            result = df.eval(ex, engine=engine, parser=parser)
+            tm.assert_series_equal(result, expected, check_names=False)
+
+        info = expr.cache_info()
+        assert info.currsize == 1
+        assert (info.hits, info.misses) == (2, 1)
+
+        # the names are resolved again
+        other = df.iloc[::-1].reset_index(drop=True)
+        x = 3  # noqa
+        result = other.eval(ex, engine=engine, parser=parser)
+        expected = other.eval(ex, engine='python', parser=parser)
+        tm.assert_series_equal(result, expected, check_names=False)
+
+    def test_dtype_change(self, engine, parser):
+        df = DataFrame({'a': [1, 2, 3]})
+        result = df.eval('a * 2', engine=engine, parser=parser)
+        tm.assert_series_equal(result, Series([2, 4, 6]), check_names=False)
+
+        # the plan of the int column is not reused
+        df = DataFrame({'a': [1., 2., 3.]})
+        result = df.eval('a * 2', engine=engine, parser=parser)
+        tm.assert_series_equal(result, Series([2., 4., 6.]),
+                               check_names=False)
+        assert expr.cache_info().hits == 0
+
+        df.eval('a * 2', engine=engine, parser=parser)
+        assert expr.cache_info().hits == 1
+
+    def test_not_cached(self, engine, parser):
+        df = DataFrame({'a': [1, 2, 3]})
+        for _ in range(2):
+            df.query('a > a[0]', engine=engine, parser=parser)
+        assert expr.cache_info().currsize == 0
+
+    def test_assign(self, engine, parser):
+        df = DataFrame({'a': [1, 2, 3]})
+        for _ in range(2):
+            result = df.eval('b = a + 1', engine=engine, parser=parser)
+            tm.assert_frame_equal(result, df.assign(b=df.a + 1))
+        assert expr.cache_info().hits == 1
+
+        with tm.assert_raises_regex(ValueError, 'without a target'):
+            pd.eval('b = a + 1', engine=engine, parser=parser)
+
+    def test_size(self):
+        df = DataFrame({'a': [1, 2, 3]})
+        with pd.option_context('compute.eval_cache_size', 2):
+            for i in range(4):
+                df.query('a > {i}'.format(i=i))
+            assert expr.cache_info().currsize == 2
+            assert expr.cache_info().maxsize == 2
+
+        with pd.option_context('compute.eval_cache_size', 0):
+            df.query('a > 1')
+            assert expr.cache_info().currsize == 0
+
+
 class TestValidate(object):
 
     def test_validate_bool_args(self):
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+
+import pandas as pd
+import pandas.util.testing as tm
+from pandas import DataFrame
+from pandas.core.lazy import LazyFrame, col, optimize
+import pandas.core.lazy as lazy
+
+
+@pytest.fixture
+def df():
+    np.random.seed(1234)
+    n = 100
+    return DataFrame({'a': np.random.randn(n),
+                      'b': np.random.choice(['x', 'y', 'z'], n),
+                      'c': np.arange(n),
+                      'd': np.random.randn(n),
+                      'e': np.random.randint(0, 5, n)})
+
+
+class TestLazyFrame(object):
+
+    def test_lazy(self, df):
+        lf = df.lazy()
+        assert isinstance(lf, LazyFrame)
+        result = lf.collect()
+        tm.assert_frame_equal(result, df)
+        assert result is not df
+
+    def test_filter_project_groupby(self, df):
+        lf = df.lazy()
+        result = lf[lf.a > 0][['b', 'c']].groupby('b').sum().collect()
+        expected = df[df.a > 0][['b', 'c']].groupby('b').sum()
+        tm.assert_frame_equal(result, expected)
+
+    def test_filters_are_fused_and_pushed_down(self, df):
+        lf = df.lazy()
+        lf = lf[lf.a > 0][['a', 'b', 'c']][col('c') < 50]
+        plan = optimize(lf._plan)
+        assert isinstance(plan, lazy._Project)
+        scan = plan.children[0]
+        assert isinstance(scan, lazy._Scan)
+        assert len(scan.predicate) == 2
+        assert scan.columns == ['a', 'b', 'c']
+
+        expected = df[df.a > 0][['a', 'b', 'c']]
+        expected = expected[expected.c < 50]
+        tm.assert_frame_equal(lf.collect(), expected)
+
+    def test_conjuncts(self, df):
+        lf = df.lazy()
+        result = lf[(lf.a > 0) & (lf.e == 2) | (lf.c < 3)]
+        expected = df[(df.a > 0) & (df.e == 2) | (df.c < 3)]
+        tm.assert_frame_equal(result.collect(), expected)
+
+        result = lf[(lf.a > 0) & ~lf.b.isin(['x'])]
+        expected = df[(df.a > 0) & ~df.b.isin(['x'])]
+        tm.assert_frame_equal(result.collect(), expected)
+        assert len(optimize(result._plan).predicate) == 2
+
+    def test_assign(self, df):
+        lf = df.lazy()
+        lf = lf.assign(f=lf.a + lf.d, g=1)
+        result = lf[lf.e > 1].collect()
+
+        expected = df.assign(f=df.a + df.d, g=1)
+        expected = expected[expected.e > 1]
+        tm.assert_frame_equal(result, expected)
+
+        # the filter does not reference the new columns
+        plan = optimize(lf[lf.e > 1]._plan)
+        assert isinstance(plan, lazy._Assign)
+        assert isinstance(plan.children[0], lazy._Scan)
+
+        # a filter on a new column stays above it
+        plan = optimize(lf[lf.f > 1]._plan)
+        assert isinstance(plan, lazy._Filter)
+        result = lf[lf.f > 1].collect()
+        expected = df.assign(f=df.a + df.d, g=1)
+        tm.assert_frame_equal(result, expected[expected.f > 1])
+
+        # callables are not reordered with filters
+        lf = df.lazy().assign(f=lambda x: x.a - x.a.mean())
+        result = lf[lf.e > 1].collect()
+        expected = df.assign(f=df.a - df.a.mean())
+        tm.assert_frame_equal(result, expected[expected.e > 1])
+
+    def test_unused_columns_are_pruned(self, df):
+        lf = df.lazy().assign(f=col('a') * 2, g=col('d') * 2)
+        lf = lf.sort_values('c')[['f']]
+        plan = optimize(lf._plan)
+        assign = plan.children[0].children[0]
+        assert isinstance(assign, lazy._Assign)
+        assert assign.names == ['f']
+        assert assign.children[0].columns == ['c', 'a']
+
+        expected = df.assign(f=df.a * 2).sort_values('c')[['f']]
+        tm.assert_frame_equal(lf.collect(), expected)
+
+    def test_head(self, df):
+        lf = df.lazy()
+        result = lf[['a', 'b']].head(3).collect()
+        tm.assert_frame_equal(result, df[['a', 'b']].head(3))
+
+        result = lf[lf.a > 0].head(3).collect()
+        tm.assert_frame_equal(result, df[df.a > 0].head(3))
+
+    def test_agg_dict_and_selection(self, df):
+        lf = df.lazy()
+        result = lf.groupby('b').agg({'a': 'sum', 'e': 'max'}).collect()
+        expected = df.groupby('b').agg({'a': 'sum', 'e': 'max'})
+        tm.assert_frame_equal(result, expected)
+
+        result = lf.groupby(['b', 'e'])['a'].mean().collect()
+        expected = df.groupby(['b', 'e'])['a'].mean()
+        tm.assert_series_equal(result, expected)
+
+        lf = lf.groupby('b', as_index=False).sum()[['b', 'c']]
+        plan = optimize(lf._plan)
+        assert plan.children[0].children[0].columns == ['b', 'c']
+        expected = df.groupby('b', as_index=False).sum()[['b', 'c']]
+        tm.assert_frame_equal(lf.collect(), expected)
+
+    def test_common_subplans(self, df):
+        calls = []
+
+        def f(x):
+            calls.append(1)
+            return x.a * 2
+
+        lf = df.lazy().assign(f=f)
+        result = lf.merge(lf, on='c').collect()
+        expected = df.assign(f=df.a * 2)
+        expected = expected.merge(expected, on='c')
+        tm.assert_frame_equal(result, expected)
+        assert len(calls) == 1
+
+    def test_array_groupers_are_not_shared(self):
+        # the reprs of the two groupers are the same
+        df = DataFrame({'a': np.arange(2000.)})
+        left = np.zeros(2000, dtype='int64')
+        left[1000] = 1
+        right = np.zeros(2000, dtype='int64')
+        assert repr(left) == repr(right)
+
+        lf = df.lazy()
+        result = lf.groupby(left).sum().merge(
+            lf.groupby(right).sum(), left_index=True, right_index=True)
+        expected = df.groupby(left).sum().merge(
+            df.groupby(right).sum(), left_index=True, right_index=True)
+        tm.assert_frame_equal(result.collect(), expected)
+
+    def test_common_subexpressions(self, df):
+        calls = []
+
+        class Counted(lazy._Col):
+
+            def _evaluate(self, frame, cache):
+                calls.append(self.name)
+                return frame[self.name]
+
+        total = Counted('a') + Counted('d')
+        lf = df.lazy()
+        result = lf[(total > 0) & (total < 1)].collect()
+        total = df.a + df.d
+        tm.assert_frame_equal(result, df[(total > 0) & (total < 1)])
+        assert sorted(calls) == ['a', 'd']
+
+    def test_source_is_not_modified(self, df):
+        original = df.copy()
+        lf = df.lazy().assign(a=col('a') * 2)
+        lf.collect()
+        tm.assert_frame_equal(df, original)
+
+    def test_invalid(self, df):
+        lf = df.lazy()
+        with tm.assert_raises_regex(TypeError, 'ambiguous'):
+            if lf.a > 0:
+                pass
+        with tm.assert_raises_regex(TypeError, 'expression of the columns'):
+            lf.filter(df.a > 0)
+
+    def test_explain(self, df):
+        lf = df.lazy()
+        lf = lf[lf.a > 0][['b']]
+        result = lf.explain()
+        assert 'Scan DataFrame' in result
+        assert 'predicate' in result
+        assert 'Filter' in lf.explain(optimized=False)
+        assert 'LazyFrame' in repr(lf)
+
+
+class TestLazyFrameSources(object):
+
+    def test_csv(self, df):
+        with tm.ensure_clean('__lazy__.csv') as path:
+            df.to_csv(path, index=False)
+
+            lf = LazyFrame.from_csv(path)
+            lf = lf[lf.a > 0][['b', 'c']]
+            scan = optimize(lf._plan).children[0]
+            assert scan.columns == ['b', 'c']
+
+            expected = pd.read_csv(path)
+            expected = expected[expected.a > 0][['b', 'c']]
+            tm.assert_frame_equal(lf.collect(), expected)
+
+            # the chunks are filtered as they are read
+            lf = LazyFrame.from_csv(path, chunksize=7)
+            tm.assert_frame_equal(lf[lf.a > 0][['b', 'c']].collect(),
+                                  expected)
+
+            lf = LazyFrame.from_csv(path)[['c']].head(4)
+            assert optimize(lf._plan).children[0].children[0].limit == 4
+            tm.assert_frame_equal(lf.collect(), df[['c']].head(4))
+
+    def test_csv_list_and_dict_arguments(self, df):
+        df = df.assign(f=pd.date_range('2000-01-01', periods=len(df)))
+        with tm.ensure_clean('__lazy__.csv') as path:
+            df.to_csv(path, index=False)
+
+            kwargs = dict(usecols=['a', 'c', 'f'], parse_dates=['f'],
+                          dtype={'c': 'float64'})
+            lf = LazyFrame.from_csv(path, **kwargs)
+            lf = lf[lf.a > 0]
+            expected = pd.read_csv(path, **kwargs)
+            expected = expected[expected.a > 0]
+            tm.assert_frame_equal(lf.collect(), expected)
+
+    def test_hdf(self, df):
+        pytest.importorskip('tables')
+        with tm.ensure_clean('__lazy__.h5') as path:
+            df.to_hdf(path, 'df', format='table', data_columns=['a', 'e'])
+
+            lf = LazyFrame.from_hdf(path, 'df')
+            lf = lf[(lf.a > 0) & (lf.e == 2) & (lf.d > 0)][['b', 'c']]
+            expected = df[(df.a > 0) & (df.e == 2) & (df.d > 0)][['b', 'c']]
+            tm.assert_frame_equal(lf.collect(), expected)
+
+            where = lf._plan.children[0].predicate[0].to_where({'a', 'e'})
+            assert where is None
+            where = (col('a') > 0).to_where({'a', 'e'})
+            assert where == '(a > 0)'
+
+    def test_hdf_list_arguments(self, df):
+        pytest.importorskip('tables')
+        with tm.ensure_clean('__lazy__.h5') as path:
+            df.to_hdf(path, 'df', format='table', data_columns=['a', 'e'])
+
+            lf = LazyFrame.from_hdf(path, 'df', where=['e == 2'])
+            result = lf[lf.a > 0][['b', 'c']].collect()
+            expected = df[(df.e == 2) & (df.a > 0)][['b', 'c']]
+            tm.assert_frame_equal(result, expected)
@@ -187,3 +187,18 @@ def test_cython_agg_empty_buckets_nanops():
         {"a": [1, 1, 1716, 1]},
         index=pd.CategoricalIndex(intervals, name='a', ordered=True))
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('op', ['sum', 'prod', 'mean', 'var', 'std', 'min',
+                                'max', 'first', 'last', 'median', 'count'])
+@pytest.mark.parametrize('nthreads', [2, 3, 16])
+def test_cython_agg_parallel(op, nthreads):
+    df = DataFrame(np.random.randn(1000, 10), columns=list('abcdefghij'))
+    df.iloc[::7, 3] = nan
+    df['i'] = np.arange(1000)
+    df['key'] = np.random.randint(0, 20, 1000)
+
+    expected = getattr(df.groupby('key'), op)()
+    with pd.option_context('compute.groupby_nthreads', nthreads):
+        result = getattr(df.groupby('key'), op)()
+    tm.assert_frame_equal(result, expected)
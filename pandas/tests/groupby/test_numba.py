@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+
+import pandas.util.testing as tm
+import pandas.util._test_decorators as td
+from pandas import DataFrame
+
+
+@pytest.fixture
+def df():
+    np.random.seed(1234)
+    return DataFrame({'key': ['a', 'b', 'c', 'a', None, 'b', 'a', 'c'],
+                      'x': np.random.randn(8),
+                      'y': np.arange(8),
+                      's': list('abcdefgh')})
+
+
+def agg_func(values, offset):
+    return values.mean() + offset
+
+
+def transform_func(values, offset):
+    return values - values.mean() + offset
+
+
+@td.skip_if_no('numba')
+class TestNumbaGroupBy(object):
+
+    @pytest.mark.parametrize('parallel', [True, False])
+    def test_aggregate(self, df, parallel):
+        kwargs = {'engine': 'numba', 'engine_kwargs': {'parallel': parallel}}
+        grouped = df.groupby('key')
+        result = grouped.agg(agg_func, 1, **kwargs)
+        expected = grouped[['x', 'y']].agg(lambda x: x.mean() + 1)
+        tm.assert_frame_equal(result, expected.astype(float))
+
+        result = grouped['x'].agg(agg_func, 1, **kwargs)
+        tm.assert_series_equal(result, expected['x'])
+
+        result = df.groupby('key', as_index=False).agg(agg_func, 1, **kwargs)
+        assert list(result.columns) == ['key', 'x', 'y']
+
+    def test_transform(self, df):
+        grouped = df.dropna().groupby('key')
+        result = grouped.transform(transform_func, 1, engine='numba')
+        expected = DataFrame({
+            'x': grouped['x'].transform(lambda x: x - x.mean() + 1),
+            'y': grouped['y'].transform(lambda x: x - x.mean() + 1.)},
+            columns=['x', 'y'])
+        tm.assert_frame_equal(result, expected, check_dtype=False)
+
+        result = grouped['x'].transform(transform_func, 1, engine='numba')
+        tm.assert_series_equal(result, expected['x'])
+
+        # rows with a missing key are not part of any group
+        result = df.groupby('key')['x'].transform(transform_func, 1,
+                                                  engine='numba')
+        assert result.isna().tolist() == [False] * 4 + [True] + [False] * 3
+
+    def test_invalid(self, df):
+        grouped = df.groupby('key')
+        with tm.assert_raises_regex(ValueError, 'keyword arguments'):
+            grouped.agg(agg_func, offset=1, engine='numba')
+        with tm.assert_raises_regex(TypeError, 'numeric'):
+            grouped['s'].agg(agg_func, 1, engine='numba')
+
+
+def test_cython_engine(df):
+    result = df.groupby('key')['x'].agg(np.mean, engine='cython')
+    tm.assert_series_equal(result, df.groupby('key')['x'].mean())
+    with tm.assert_raises_regex(ValueError, 'does not accept'):
+        df.groupby('key')['x'].agg(np.mean, engine_kwargs={})
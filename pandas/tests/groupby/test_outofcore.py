@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+test out-of-core groupby aggregations
+"""
+
+import pytest
+
+import numpy as np
+
+from pandas import (DataFrame, MultiIndex, CategoricalIndex, Categorical,
+                    concat, read_csv)
+from pandas.core.outofcore import (spill_groupby, StreamingGroupBy,
+                                   aggregate_chunks)
+import pandas.util.testing as tm
+
+
+@pytest.fixture
+def frame():
+    np.random.seed(1234)
+    n = 5000
+    return DataFrame({'key1': np.random.randint(0, 500, n),
+                      'key2': np.random.choice(['a', 'b', 'c'], n),
+                      'x': np.random.randn(n),
+                      'y': np.random.randint(0, 100, n)})
+
+
+def _chunks(frame, size=700):
+    return [frame.iloc[i:i + size] for i in range(0, len(frame), size)]
+
+
+@pytest.mark.parametrize('func', ['sum', 'mean', 'min', 'median', 'nunique',
+                                  {'x': ['sum', 'var'], 'y': 'max'}])
+@pytest.mark.parametrize('by', ['key1', ['key1', 'key2']])
+def test_spill_groupby_frame(frame, func, by):
+    expected = frame.groupby(by).agg(func)
+    result = spill_groupby(frame, by, func, memory_budget=10000)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_spill_groupby_chunks(frame):
+    chunks = _chunks(frame)
+
+    expected = frame.groupby(['key1', 'key2']).agg('sum')
+    result = spill_groupby(iter(chunks), ['key1', 'key2'], 'sum',
+                           memory_budget=20000, npartitions=4)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_spill_groupby_as_index_false(frame):
+    expected = frame.groupby('key1', as_index=False).agg('sum')
+    result = spill_groupby(frame, 'key1', 'sum', memory_budget=10000,
+                           as_index=False)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_spill_groupby_skewed(frame):
+    # a single group that is larger than the budget cannot be split
+    skewed = concat([frame.assign(key1=0), frame], ignore_index=True)
+
+    expected = skewed.groupby('key1').agg('sum')
+    result = spill_groupby(skewed, 'key1', 'sum', memory_budget=5000)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_spill_groupby_in_memory(frame):
+    expected = frame.groupby('key1').mean()
+    result = spill_groupby(frame, 'key1', 'mean')
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('memory_budget', [None, 10000])
+def test_spill_groupby_categorical(frame, memory_budget):
+    # every partition only forms the groups of the categories it holds,
+    # so the unobserved category 'd' is left out
+    strings = frame.copy()
+    frame['key2'] = Categorical(frame['key2'], categories=list('abcd'))
+
+    def categorical(values):
+        return Categorical(values, categories=list('abcd'))
+
+    result = spill_groupby(_chunks(frame), 'key2', 'sum',
+                           memory_budget=memory_budget, npartitions=3)
+    expected = strings.groupby('key2').agg('sum')
+    expected.index = CategoricalIndex(categorical(expected.index),
+                                      name='key2')
+    tm.assert_frame_equal(result, expected)
+
+    result = spill_groupby(frame, ['key1', 'key2'], 'sum',
+                           memory_budget=memory_budget)
+    expected = strings.groupby(['key1', 'key2']).agg('sum')
+    expected.index = MultiIndex.from_arrays(
+        [expected.index.get_level_values(0),
+         categorical(expected.index.get_level_values(1))],
+        names=['key1', 'key2'])
+    tm.assert_frame_equal(result, expected)
+
+    result = spill_groupby(frame, 'key2', 'sum',
+                           memory_budget=memory_budget, as_index=False)
+    expected = strings.groupby('key2', as_index=False).agg('sum')
+    expected['key2'] = categorical(expected['key2'])
+    tm.assert_frame_equal(result, expected)
+
+
+def test_spill_groupby_invalid(frame):
+    with tm.assert_raises_regex(ValueError, 'memory_budget'):
+        spill_groupby(frame, 'key1', 'sum', memory_budget=0)
+    with tm.assert_raises_regex(ValueError, 'npartitions'):
+        spill_groupby(frame, 'key1', 'sum', npartitions=0)
+    with tm.assert_raises_regex(ValueError, 'No objects'):
+        spill_groupby(iter([]), 'key1', 'sum')
+
+
+@pytest.mark.parametrize('func', ['sum', 'count', 'mean', 'var', 'std', 'min',
+                                  'max', 'first', 'last', {'y': 'nunique'},
+                                  {'x': ['sum', 'mean', 'nunique'],
+                                   'key2': 'nunique'},
+                                  {'x': 'var', 'y': 'max'},
+                                  {'x': ['min', 'max'], 'key2': 'first'}])
+def test_streaming_groupby(frame, func):
+    frame.loc[::13, 'x'] = np.nan
+
+    expected = frame.groupby('key1').agg(func)
+    result = aggregate_chunks(_chunks(frame), 'key1', func)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_streaming_groupby_multiple_keys(frame):
+    func = {'x': ['mean', 'std'], 'y': ['sum', 'count']}
+
+    expected = frame.groupby(['key2', 'key1']).agg(func)
+    aggregator = StreamingGroupBy(['key2', 'key1'], func)
+    for chunk in _chunks(frame, 333):
+        aggregator.update(chunk)
+    tm.assert_frame_equal(aggregator.result(), expected)
+
+
+def test_streaming_groupby_csv_reader(frame):
+    with tm.ensure_clean() as path:
+        frame.to_csv(path, index=False)
+
+        expected = frame.groupby('key2').agg({'x': 'sum', 'y': 'max'})
+        reader = read_csv(path, chunksize=1000)
+        result = aggregate_chunks(reader, 'key2', {'x': 'sum', 'y': 'max'})
+        tm.assert_frame_equal(result, expected)
+
+
+def test_streaming_groupby_invalid(frame):
+    with tm.assert_raises_regex(ValueError, 'incrementally'):
+        aggregate_chunks(_chunks(frame), 'key1', 'median')
+    with tm.assert_raises_regex(KeyError, 'does not exist'):
+        aggregate_chunks(_chunks(frame), 'key1', {'z': 'sum'})
+    with tm.assert_raises_regex(ValueError, 'No objects'):
+        aggregate_chunks([], 'key1', 'sum')
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+
+import pandas as pd
+import pandas.util.testing as tm
+from pandas import DataFrame, Series
+
+
+@pytest.fixture
+def copy_on_write():
+    with pd.option_context('mode.copy_on_write', True):
+        yield
+
+
+@pytest.fixture
+def df():
+    return DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6],
+                      'c': [1.5, 2.5, 3.5]})
+
+
+def shares_values(left, right, column):
+    return np.may_share_memory(left[column].values, right[column].values)
+
+
+@pytest.mark.usefixtures('copy_on_write')
+class TestCopyOnWrite(object):
+
+    def test_copy_shares_until_modified(self, df):
+        original = df.copy(deep=False)
+        result = df.copy()
+        assert shares_values(result, df, 'a')
+        assert result._data.is_shared
+        assert df._data.is_shared
+
+        result.loc[0, 'a'] = 10
+        assert not shares_values(result, df, 'a')
+        assert result.loc[0, 'a'] == 10
+        tm.assert_frame_equal(df, original)
+
+        # the float block is still shared
+        assert shares_values(result, df, 'c')
+
+    def test_original_modified(self, df):
+        result = df.copy()
+        expected = result.copy()
+        df.iloc[1, 2] = 10.
+        df['b'] = 0
+        assert df.iloc[1, 2] == 10.
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('method', ['at', 'iat', 'loc',
+                                        'fillna', 'replace'])
+    def test_modify_copy(self, df, method):
+        df.loc[1, 'c'] = np.nan
+        original = df.copy(deep=False)
+        expected = df.copy(deep=True)
+        result = df.copy()
+
+        if method == 'at':
+            result.at[0, 'c'] = 10.
+        elif method == 'iat':
+            result.iat[0, 2] = 10.
+        elif method == 'loc':
+            result.loc[result.c > 3, 'c'] = 10.
+        elif method == 'fillna':
+            result.fillna(10., inplace=True)
+        elif method == 'replace':
+            result.replace(1.5, 10., inplace=True)
+
+        assert 10. in result['c'].values
+        tm.assert_frame_equal(df, expected)
+        tm.assert_frame_equal(df, original)
+
+    def test_column_selection(self, df):
+        result = df.reindex(columns=['a', 'b'])
+        assert shares_values(result, df, 'a')
+
+        result.loc[0, 'a'] = 10
+        assert df.loc[0, 'a'] == 1
+        assert result.loc[0, 'a'] == 10
+
+        result = df.reindex(columns=['a', 'b'])
+        df.loc[0, 'b'] = 10
+        assert result.loc[0, 'b'] == 4
+
+    def test_cached_column(self):
+        df = DataFrame({'a': [1., 2., 3.]})
+        result = df.copy()
+        result['a'][0] = 10.
+        assert result.loc[0, 'a'] == 10.
+        assert df.loc[0, 'a'] == 1.
+
+    def test_series_copy(self):
+        s = Series([1., 2., 3.])
+        result = s.copy()
+        assert np.may_share_memory(s.values, result.values)
+
+        result[0] = 10.
+        assert s[0] == 1.
+        assert result[0] == 10.
+
+        result = s.copy()
+        s.fillna(0, inplace=True)
+        s[1] = 10.
+        tm.assert_series_equal(result, Series([1., 2., 3.]))
+
+    def test_copies_are_released(self, df):
+        result = df.copy()
+        assert df._data.is_shared
+        del result
+        assert not df._data.is_shared
+
+
+def test_default(df):
+    assert not pd.get_option('mode.copy_on_write')
+    result = df.copy()
+    assert not shares_values(result, df, 'a')
+    assert not result._data.is_shared
@@ -15,6 +15,7 @@ from pandas import (Index, MultiIndex, DataFrame, DatetimeIndex,
 from pandas.compat import OrderedDict, lrange
 from pandas.core.internals import (BlockPlacement, SingleBlockManager,
                                    make_block, BlockManager)
+import pandas.core.internals as internals
 import pandas.core.algorithms as algos
 import pandas.util.testing as tm
 import pandas as pd
@@ -689,6 +690,62 @@ class TestBlockManager(object):
         tm.assert_numpy_array_equal(cons.blocks[0].mgr_locs.as_array,
                                     np.arange(len(cons.items), dtype=np.int64))
 
+    def test_consolidate_cost(self, monkeypatch):
+        mgr = create_mgr('a: f8-1; b: f8-2; c: i8')
+        assert mgr._should_consolidate()
+        assert mgr.is_mixed_type
+        assert not create_mgr('a: f8-1; b: f8-2').is_mixed_type
+
+        # the blocks are too large to be worth merging
+        monkeypatch.setattr(internals, '_BLOCK_OVERHEAD_SIZE', 1)
+        assert not mgr._should_consolidate()
+        assert mgr.apply('copy').nblocks == 3
+        assert mgr.reindex_axis(['c', 'b', 'a'], axis=0).nblocks == 3
+
+        # unless the values are needed as a single array
+        mgr = create_mgr('a: f8-1; b: f8-2')
+        expected = np.vstack([mgr.get('a', fastpath=False),
+                              mgr.get('b', fastpath=False)])
+        tm.assert_numpy_array_equal(mgr.as_array(), expected)
+        assert mgr.nblocks == 1
+
+    def test_single_dtype_tall_frame(self):
+        # a tall frame of one dtype is left with several blocks by the cost
+        # model, but the single block paths need them merged
+        df = DataFrame(index=range(10 ** 6))
+        df['a'] = 1.0
+        df['b'] = 2.0
+        assert df._data.nblocks == 2
+        assert not df._data._should_consolidate()
+
+        df.iloc[0, 0] = 5
+        assert df.iloc[0, 0] == 5
+        assert df._data.nblocks == 1
+
+        df = DataFrame({'a': [1., 2.]}, index=range(2))
+        df['b'] = [3., 4.]
+        df.index = MultiIndex.from_tuples([('x', 1), ('x', 2)])
+        expected = DataFrame([[1., 2., 3., 4.]], index=['x'],
+                             columns=MultiIndex.from_product([['a', 'b'],
+                                                              [1, 2]]))
+        tm.assert_frame_equal(df.unstack(), expected)
+
+    def test_insert_consolidates_geometrically(self, monkeypatch):
+        calls = []
+        consolidate = internals._consolidate
+
+        def counted(blocks):
+            calls.append(len(blocks))
+            return consolidate(blocks)
+
+        monkeypatch.setattr(internals, '_consolidate', counted)
+        df = DataFrame(index=range(3))
+        for i in range(2000):
+            df[i] = np.arange(3.)
+        assert len(calls) == 5
+        tm.assert_numpy_array_equal(df.values,
+                                    np.tile(np.arange(3.), (2000, 1)).T)
+
     def test_reindex_index(self):
         pass
 
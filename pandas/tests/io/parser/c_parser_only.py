@@ -485,3 +485,79 @@ No,No,No"""
             ['x' * (1 << 20) for _ in range(2100)]))
         df = self.read_csv(csv, low_memory=False)
         assert not df.empty
+
+    @pytest.mark.parametrize("nthreads", [2, 3, 8])
+    def test_nthreads_matches_serial(self, nthreads):
+        df = DataFrame({'a': np.arange(1000),
+                        'b': np.arange(1000) * 0.5,
+                        'c': ['x,"y"\nz' if i % 7 == 0 else 'w%d' % i
+                              for i in range(1000)],
+                        'd': pd.date_range('2018-01-01', periods=1000,
+                                           freq='H')})
+
+        with tm.ensure_clean('__nthreads__.csv') as path:
+            df.to_csv(path, index=False)
+
+            expected = self.read_csv(path, parse_dates=['d'])
+            result = self.read_csv(path, parse_dates=['d'],
+                                   nthreads=nthreads)
+            tm.assert_frame_equal(result, expected)
+
+            expected = self.read_csv(path, usecols=[0, 2], header=None)
+            result = self.read_csv(path, usecols=[0, 2], header=None,
+                                   nthreads=nthreads)
+            tm.assert_frame_equal(result, expected)
+
+    def test_nthreads_index_col(self):
+        data = 'a,b\n' + '\n'.join('%d,%d,%d' % (i, i * 2, i * 3)
+                                   for i in range(500))
+
+        with tm.ensure_clean('__nthreads__.csv') as path:
+            with open(path, 'w') as fh:
+                fh.write(data)
+
+            expected = self.read_csv(path)
+            result = self.read_csv(path, nthreads=4)
+            tm.assert_frame_equal(result, expected)
+
+    def test_nthreads_invalid(self):
+        with tm.assert_raises_regex(ValueError, "'nthreads' must be"):
+            self.read_csv(StringIO('a\n1'), nthreads=0)
+
+    def test_dtype_string_array(self):
+        from pandas.api.types import StringDtype
+        from pandas.core.arrays import StringArray
+
+        data = 'a,b\nfoo,1\n,2\nbar,3\nNA,4\n'
+        result = self.read_csv(StringIO(data), dtype={'a': StringDtype()})
+        assert isinstance(result['a'].values, StringArray)
+
+        expected = self.read_csv(StringIO(data))
+        tm.assert_numpy_array_equal(np.asarray(result['a'].values),
+                                    expected['a'].values)
+        tm.assert_series_equal(result['b'], expected['b'])
+
+        # chunks are concatenated
+        result = self.read_csv(StringIO(data * 50), dtype=StringDtype(),
+                               low_memory=True, buffer_lines=2)
+        assert isinstance(result['b'].values, StringArray)
+        assert len(result) == 50 * 5 - 1
+
+    def test_dtype_masked_array(self):
+        from pandas.core.arrays import IntegerArray, BooleanArray
+
+        data = 'a,b\n1,True\n,False\n9007199254740993,\n'
+        result = self.read_csv(StringIO(data),
+                               dtype={'a': 'Int64', 'b': 'boolean'})
+        assert isinstance(result['a'].values, IntegerArray)
+        assert isinstance(result['b'].values, BooleanArray)
+        tm.assert_numpy_array_equal(result['a'].isna().values,
+                                    np.array([False, True, False]))
+        # exact, float64 would round this
+        assert result['a'][2] == 9007199254740993
+        tm.assert_numpy_array_equal(result['b'].isna().values,
+                                    np.array([False, False, True]))
+        assert result['b'][0]
+
+        with tm.assert_raises_regex(ValueError, 'Unable to parse column'):
+            self.read_csv(StringIO('a\n1.5\n'), dtype='Int64')
@@ -105,7 +105,52 @@ class TestFeather(object):
     def test_rw_nthreads(self):
 
         df = pd.DataFrame({'A': np.arange(100000)})
-        self.check_round_trip(df, nthreads=2)
+        with ensure_clean() as path:
+            to_feather(df, path)
+            # deprecated in favor of use_threads
+            with tm.assert_produces_warning(FutureWarning):
+                result = read_feather(path, nthreads=2)
+        assert_frame_equal(result, df)
+
+    def test_rw_use_threads(self):
+
+        df = pd.DataFrame({'A': np.arange(100000)})
+        self.check_round_trip(df, use_threads=True)
+        self.check_round_trip(df, use_threads=False)
+
+    @pytest.mark.skipif(fv < LooseVersion('0.4.0'), reason='new in 0.4.0')
+    def test_rw_memory_map(self):
+
+        df = pd.DataFrame({'int': np.arange(5),
+                           'float': np.arange(5.0),
+                           'float_with_null': [1., np.nan, 3, 4, 5],
+                           'string': list('abcde')})
+        self.check_round_trip(df, memory_map=True)
+
+        pyarrow = pytest.importorskip('pyarrow')
+        import pyarrow.feather  # noqa
+        if not hasattr(pyarrow.feather.FeatherReader, 'read_table'):
+            pytest.skip('zero-copy reads need pyarrow >= 0.10.0')
+
+        # the numeric columns without nulls are views of the mapped file,
+        # each in a block of its own
+        with ensure_clean() as path:
+            to_feather(df, path)
+            result = read_feather(path, memory_map=True)
+            for name in ['int', 'float']:
+                assert result[name].values.flags.writeable is False
+            assert result['float_with_null'].values.flags.writeable
+            locs = [result.columns.get_loc(name)
+                    for name in ['int', 'float', 'float_with_null']]
+            assert len(set(result._data._blknos[locs])) == 3
+            assert_frame_equal(result, df)
+
+            # writing in place copies the read-only columns
+            result.fillna(0, inplace=True)
+            result.loc[0, 'int'] = 10
+            expected = df.fillna(0)
+            expected.loc[0, 'int'] = 10
+            assert_frame_equal(result, expected)
 
     def test_write_with_index(self):
 
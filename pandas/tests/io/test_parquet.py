@@ -432,6 +432,114 @@ class TestParquetPyArrow(Base):
         df = pd.DataFrame({'a': pd.Categorical(list('abc'))})
         self.check_error_on_write(df, pa, NotImplementedError)
 
+    def test_string_array(self, pa_ge_070):
+        from pandas.core.arrays import StringArray
+
+        df = pd.DataFrame({'a': ['foo', np.nan, 'bar'], 'b': [1, 2, 3],
+                           'c': list('xyz')}, index=list('pqr'))
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, engine=pa_ge_070)
+            result = read_parquet(path, engine=pa_ge_070, string_array=True)
+
+        assert list(result.columns) == ['a', 'b', 'c']
+        tm.assert_index_equal(result.index, df.index)
+        for name in ['a', 'c']:
+            assert isinstance(result[name].values, StringArray)
+            tm.assert_numpy_array_equal(np.asarray(result[name].values),
+                                        df[name].values)
+        tm.assert_series_equal(result['b'], df['b'])
+
+    def test_filter_row_groups(self, pa):
+        df = pd.DataFrame({'a': range(6), 'b': list('aabbcc')})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, pa, compression=None, row_group_size=2)
+            result = read_parquet(path, pa, filters=[('a', '>=', 3)])
+            tm.assert_frame_equal(result, df.iloc[2:])
+
+            result = read_parquet(path, pa, filters=[('b', 'in', ['a']),
+                                                     ('a', '!=', 0)])
+            tm.assert_frame_equal(result, df.iloc[:2])
+
+            result = read_parquet(path, pa, filters=[('a', '>', 10)])
+            tm.assert_frame_equal(result, df.iloc[:0])
+
+            with pytest.raises(ValueError, match='filters'):
+                read_parquet(path, pa, filters=[('a', 'like', 3)])
+
+    def test_iterator(self, pa):
+        df = pd.DataFrame({'a': range(5)})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, pa, compression=None, row_group_size=2)
+            chunks = list(read_parquet(path, pa, iterator=True,
+                                       columns=['a']))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        tm.assert_frame_equal(pd.concat(chunks), df)
+
+    def test_partitioned_directory(self, pa, tmpdir):
+        df = pd.DataFrame({'a': range(4), 'b': list('wxyz')})
+        for year in [2016, 2017]:
+            partition = tmpdir.mkdir('year={}'.format(year))
+            df.to_parquet(str(partition.join('part.parquet')), pa,
+                          compression=None)
+        tmpdir.join('_SUCCESS').write('')
+
+        result = read_parquet(str(tmpdir), pa)
+        assert len(result) == 8
+        tm.assert_index_equal(result['year'].cat.categories,
+                              pd.Index([2016, 2017]))
+        tm.assert_index_equal(result.index, pd.Index(list(range(4)) * 2))
+
+        result = read_parquet(str(tmpdir), pa, columns=['b', 'year'],
+                              filters=[('year', '>', 2016)])
+        expected = df[['b']].assign(
+            year=pd.Categorical([2017] * 4, categories=[2016, 2017]))
+        tm.assert_frame_equal(result, expected)
+
+    def test_partitioned_directory_without_index(self, pa, tmpdir):
+        # files written without the pandas metadata have no stored index
+        import pyarrow
+        import pyarrow.parquet
+        df = pd.DataFrame({'a': range(4), 'b': list('wxyz')})
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        for year in [2016, 2017]:
+            partition = tmpdir.mkdir('year={}'.format(year))
+            pyarrow.parquet.write_table(table,
+                                        str(partition.join('part.parquet')))
+
+        result = read_parquet(str(tmpdir), pa)
+        expected = pd.concat([df, df], ignore_index=True).assign(
+            year=pd.Categorical([2016] * 4 + [2017] * 4))
+        tm.assert_frame_equal(result, expected)
+
+    def test_memory_map(self, pa):
+        df = pd.DataFrame({'a': np.arange(5), 'b': np.arange(5.0),
+                           'c': [1., np.nan, 3, 4, 5], 'd': list('abcde')})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, pa)
+            result = read_parquet(path, pa, memory_map=True,
+                                  use_threads=False)
+
+            # the numeric columns without nulls are views of the Arrow
+            # buffers, each in a block of its own
+            for name in ['a', 'b']:
+                assert result[name].values.flags.writeable is False
+            assert result['c'].values.flags.writeable
+            locs = [result.columns.get_loc(name) for name in ['a', 'b', 'c']]
+            assert len(set(result._data._blknos[locs])) == 3
+            tm.assert_frame_equal(result, df)
+
+            # writing in place copies the read-only columns
+            result.fillna(0, inplace=True)
+            result.loc[0, 'a'] = 10
+            result.loc[1, 'b'] = 10.
+            expected = df.fillna(0)
+            expected.loc[0, 'a'] = 10
+            expected.loc[1, 'b'] = 10.
+            tm.assert_frame_equal(result, expected)
+
+            result = read_parquet(path, pa, memory_map=True, iterator=True)
+            tm.assert_frame_equal(pd.concat(result), df)
+
     def test_s3_roundtrip(self, df_compat, s3_resource, pa):
         # GH #19134
         check_round_trip(df_compat, pa,
@@ -498,6 +606,25 @@ class TestParquetFastParquet(Base):
             result = read_parquet(path, fp, filters=[('a', '==', 0)])
         assert len(result) == 1
 
+    def test_iterator(self, fp):
+        df = pd.DataFrame({'a': range(5)})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, fp, compression=None,
+                          row_group_offsets=2)
+            chunks = list(read_parquet(path, fp, iterator=True,
+                                       filters=[('a', '<', 2)]))
+        assert len(chunks) == 1
+        tm.assert_frame_equal(chunks[0], df.iloc[:2])
+
+    @pytest.mark.parametrize('option', ['string_array', 'memory_map',
+                                        'use_threads'])
+    def test_pyarrow_options(self, fp, option):
+        df = pd.DataFrame({'a': range(5)})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, fp, compression=None)
+            with tm.assert_raises_regex(ValueError, option):
+                read_parquet(path, fp, **{option: True})
+
     def test_s3_roundtrip(self, df_compat, s3_resource, fp):
         # GH #19134
         check_round_trip(df_compat, fp,
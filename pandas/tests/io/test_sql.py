@@ -372,12 +372,36 @@ class PandasSQLTest(object):
         iris_frame = self.pandasSQL.read_query(query, params=params)
         self._check_iris_loaded_frame(iris_frame)
 
-    def _to_sql(self):
+    def _to_sql(self, method=None):
         self.drop_table('test_frame1')
 
-        self.pandasSQL.to_sql(self.test_frame1, 'test_frame1')
+        self.pandasSQL.to_sql(self.test_frame1, 'test_frame1', method=method)
         assert self.pandasSQL.has_table('test_frame1')
 
+        num_entries = len(self.test_frame1)
+        num_rows = self._count_rows('test_frame1')
+        assert num_rows == num_entries
+
+        # Nuke table
+        self.drop_table('test_frame1')
+
+    def _to_sql_method_callable(self):
+        check = []  # used to double check function below is really being used
+
+        def sample(pd_table, conn, keys, data_iter):
+            check.append(1)
+            pd_table._execute_insert(conn, keys, data_iter)
+
+        self.drop_table('test_frame1')
+
+        self.pandasSQL.to_sql(self.test_frame1, 'test_frame1', method=sample)
+        assert self.pandasSQL.has_table('test_frame1')
+
+        assert check == [1]
+        num_entries = len(self.test_frame1)
+        num_rows = self._count_rows('test_frame1')
+        assert num_rows == num_entries
+
         # Nuke table
         self.drop_table('test_frame1')
 
@@ -431,9 +455,10 @@ class PandasSQLTest(object):
         assert num_rows == num_entries
         self.drop_table('test_frame1')
 
-    def _roundtrip(self):
+    def _roundtrip(self, method=None):
         self.drop_table('test_frame_roundtrip')
-        self.pandasSQL.to_sql(self.test_frame1, 'test_frame_roundtrip')
+        self.pandasSQL.to_sql(self.test_frame1, 'test_frame_roundtrip',
+                              method=method)
         result = self.pandasSQL.read_query(
             'SELECT * FROM test_frame_roundtrip')
 
@@ -601,6 +626,62 @@ class _TestSQLApi(PandasSQLTest):
             con=self.conn)
         tm.assert_frame_equal(result, self.test_frame1)
 
+    def test_to_sql_invalid_method(self):
+        with tm.assert_raises_regex(ValueError, 'method'):
+            sql.to_sql(self.test_frame1, 'test_frame_invalid_method',
+                       self.conn, method='single')
+
+    def test_read_sql_dtype(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1.5, np.nan, 2.5],
+                        'c': ['x', None, 'z']}, columns=['a', 'b', 'c'])
+        sql.to_sql(df, 'test_dtype', self.conn, index=False)
+        expected = df.astype({'a': 'float32'})
+
+        result = sql.read_sql_query('SELECT * FROM test_dtype', self.conn,
+                                    dtype={'a': 'float32'})
+        tm.assert_frame_equal(result, expected)
+
+        result = sql.read_sql_query('SELECT * FROM test_dtype', self.conn,
+                                    dtype={'a': 'float32'}, chunksize=2)
+        result = concat(list(result), ignore_index=True)
+        tm.assert_frame_equal(result, expected)
+
+    def test_read_sql_fetched_in_chunks(self, monkeypatch):
+        # the columns of each chunk of fetched rows are converted on their
+        # own, and concatenated like a column inferred at once
+        monkeypatch.setattr(sql, '_FETCH_SIZE', 2)
+        df = DataFrame({'i': [1, 2, None, 4, 5],
+                        's': ['a', 'b', None, 'd', 'e']},
+                       columns=['i', 's'], dtype=object)
+        sql.to_sql(df, 'test_fetch', self.conn, index=False)
+
+        result = sql.read_sql_query('SELECT * FROM test_fetch', self.conn)
+        expected = DataFrame({'i': [1., 2., np.nan, 4., 5.],
+                              's': ['a', 'b', None, 'd', 'e']},
+                             columns=['i', 's'])
+        tm.assert_frame_equal(result, expected)
+
+        result = sql.read_sql_query('SELECT * FROM test_fetch', self.conn,
+                                    dtype={'i': 'float64'})
+        tm.assert_frame_equal(result, expected)
+
+    def test_read_sql_fetched_chunk_all_null(self, monkeypatch):
+        # a chunk of only NULL values is left as objects, but the column
+        # is inferred as a whole
+        monkeypatch.setattr(sql, '_FETCH_SIZE', 2)
+        df = DataFrame({'i': [None, None, 3, 4],
+                        'f': [np.nan, np.nan, 1.5, np.nan]},
+                       columns=['i', 'f'])
+        df['i'] = df['i'].astype(object)
+        sql.to_sql(df, 'test_fetch_null', self.conn, index=False)
+
+        result = sql.read_sql_query('SELECT * FROM test_fetch_null',
+                                    self.conn)
+        expected = DataFrame({'i': [np.nan, np.nan, 3., 4.],
+                              'f': [np.nan, np.nan, 1.5, np.nan]},
+                             columns=['i', 'f'])
+        tm.assert_frame_equal(result, expected)
+
     def test_execute_sql(self):
         # drop_sql = "DROP TABLE IF EXISTS test"  # should already be done
         iris_results = sql.execute("SELECT * FROM iris", con=self.conn)
@@ -1189,8 +1270,12 @@ class _TestSQLAlchemy(SQLAlchemyMixIn, PandasSQLTest):
     def test_read_sql_named_parameter(self):
         self._read_sql_iris_named_parameter()
 
-    def test_to_sql(self):
-        self._to_sql()
+    @pytest.mark.parametrize('method', [None, 'multi'])
+    def test_to_sql(self, method):
+        self._to_sql(method=method)
+
+    def test_to_sql_method_callable(self):
+        self._to_sql_method_callable()
 
     def test_to_sql_empty(self):
         self._to_sql_empty()
@@ -1229,8 +1314,9 @@ class _TestSQLAlchemy(SQLAlchemyMixIn, PandasSQLTest):
 
         assert not temp_conn.has_table('temp_frame')
 
-    def test_roundtrip(self):
-        self._roundtrip()
+    @pytest.mark.parametrize('method', [None, 'multi'])
+    def test_roundtrip(self, method):
+        self._roundtrip(method=method)
 
     def test_execute_sql(self):
         self._execute_sql()
@@ -1704,6 +1790,15 @@ class _TestSQLiteAlchemy(object):
         # Non-native Bool column with NA values stays as float
         assert issubclass(df.BoolColWithNull.dtype.type, np.floating)
 
+    def test_to_sql_method_multi_chunks(self):
+        # more values than a SQLite statement can bind
+        df = DataFrame(np.random.randn(300, 4), columns=list('abcd'))
+        df.iloc[::7, 1] = np.nan
+        df.to_sql('test_multi_chunks', self.conn, index=False,
+                  method='multi')
+        result = sql.read_sql_table('test_multi_chunks', self.conn)
+        tm.assert_frame_equal(result, df)
+
     def test_default_date_load(self):
         df = sql.read_sql_table("types_test_data", self.conn)
 
@@ -1720,6 +1815,99 @@ class _TestSQLiteAlchemy(object):
             sql.read_sql_table('test_bigintwarning', self.conn)
             assert len(w) == 0
 
+    @pytest.mark.parametrize('kwargs', [
+        dict(partition_column='id', lower_bound=3, upper_bound=15,
+             num_partitions=4),
+        dict(partition_column='id', lower_bound=0, upper_bound=2,
+             num_partitions=10),
+        dict(partition_column='id', lower_bound=5, upper_bound=5,
+             num_partitions=3),
+        dict(partition_column='x', lower_bound=-1., upper_bound=1.,
+             num_partitions=3),
+        dict(partition_column='d', lower_bound=datetime(2018, 1, 5),
+             upper_bound='2018-01-15', num_partitions=3)])
+    @pytest.mark.parametrize('chunksize', [None, 4])
+    def test_read_sql_table_partitioned(self, kwargs, chunksize):
+        # a file backed database, for the partitions to be read on several
+        # connections
+        df = DataFrame({'id': np.arange(20),
+                        'x': np.linspace(-2, 2, 20),
+                        'd': date_range('2018-01-01', periods=20)},
+                       columns=['id', 'x', 'd'])
+
+        with tm.ensure_clean() as name:
+            engine = sqlalchemy.create_engine('sqlite:///' + name)
+            df.to_sql('test_partitions', engine, index=False)
+            result = sql.read_sql_table('test_partitions', engine,
+                                        chunksize=chunksize, **kwargs)
+            if chunksize is not None:
+                result = concat(list(result), ignore_index=True)
+            engine.dispose()
+
+        tm.assert_frame_equal(result, df)
+
+    def test_read_sql_table_partitioned_pool_size(self):
+        # no more partitions are read at once than the pool has connections
+        df = DataFrame({'id': np.arange(40)})
+
+        with tm.ensure_clean() as name:
+            engine = sqlalchemy.create_engine(
+                'sqlite:///' + name, poolclass=sqlalchemy.pool.QueuePool,
+                pool_size=2, max_overflow=1, pool_timeout=0.5)
+            assert sql.SQLDatabase(engine)._max_concurrent_reads() == 3
+
+            df.to_sql('test_partitions_pool', engine, index=False)
+            result = sql.read_sql_table('test_partitions_pool', engine,
+                                        partition_column='id',
+                                        lower_bound=0, upper_bound=40,
+                                        num_partitions=20)
+            engine.dispose()
+
+        tm.assert_frame_equal(result, df)
+
+    def test_read_sql_table_partitioned_null(self):
+        # NULL values are read by the first partition
+        df = DataFrame({'id': [np.nan, 1., 2., 3., np.nan, 5.]})
+        df.to_sql('test_partitions_null', self.conn, index=False)
+        result = sql.read_sql_table('test_partitions_null', self.conn,
+                                    partition_column='id', lower_bound=0,
+                                    upper_bound=6, num_partitions=3)
+        expected = df.iloc[[0, 1, 4, 2, 3, 5]].reset_index(drop=True)
+        tm.assert_frame_equal(result, expected)
+
+    def test_read_sql_table_partitioned_invalid(self):
+        df = DataFrame({'id': [1, 2, 3]})
+        df.to_sql('test_partitions_invalid', self.conn, index=False)
+
+        def read(**kwargs):
+            return sql.read_sql_table('test_partitions_invalid', self.conn,
+                                      **kwargs)
+
+        with tm.assert_raises_regex(ValueError, 'required'):
+            read(partition_column='id', num_partitions=2)
+        with tm.assert_raises_regex(ValueError, 'partition_column'):
+            read(lower_bound=0, upper_bound=3, num_partitions=2)
+        with tm.assert_raises_regex(ValueError, 'not a column'):
+            read(partition_column='a', lower_bound=0, upper_bound=3,
+                 num_partitions=2)
+        with tm.assert_raises_regex(ValueError, 'lower_bound'):
+            read(partition_column='id', lower_bound=3, upper_bound=0,
+                 num_partitions=2)
+        with tm.assert_raises_regex(ValueError, 'num_partitions'):
+            read(partition_column='id', lower_bound=0, upper_bound=3,
+                 num_partitions=0)
+
+    def test_partition_bounds(self):
+        assert sql._get_partition_bounds(0, 10, 3) == [3, 6]
+        assert sql._get_partition_bounds(0, 2, 5) == [1]
+        assert sql._get_partition_bounds(4, 4, 5) == []
+        assert sql._get_partition_bounds(0., 1., 4) == [0.25, 0.5, 0.75]
+        assert (sql._get_partition_bounds(date(2018, 1, 1),
+                                          date(2018, 1, 5), 2) ==
+                [date(2018, 1, 3)])
+        assert (sql._get_partition_bounds('2018-01-01', '2018-01-02', 2) ==
+                [datetime(2018, 1, 1, 12)])
+
 
 class _TestMySQLAlchemy(object):
     """
@@ -1934,8 +2122,12 @@ class TestSQLiteFallback(SQLiteMixIn, PandasSQLTest):
     def test_read_sql_named_parameter(self):
         self._read_sql_iris_named_parameter()
 
-    def test_to_sql(self):
-        self._to_sql()
+    @pytest.mark.parametrize('method', [None, 'multi'])
+    def test_to_sql(self, method):
+        self._to_sql(method=method)
+
+    def test_to_sql_method_callable(self):
+        self._to_sql_method_callable()
 
     def test_to_sql_empty(self):
         self._to_sql_empty()
@@ -1961,8 +2153,18 @@ class TestSQLiteFallback(SQLiteMixIn, PandasSQLTest):
 
         assert not self.pandasSQL.has_table('drop_test_frame')
 
-    def test_roundtrip(self):
-        self._roundtrip()
+    @pytest.mark.parametrize('method', [None, 'multi'])
+    def test_roundtrip(self, method):
+        self._roundtrip(method=method)
+
+    def test_to_sql_method_multi_chunks(self):
+        # more values than a SQLite statement can bind
+        df = DataFrame(np.random.randn(1000, 3), columns=list('abc'))
+        df.iloc[::7, 1] = np.nan
+        self.pandasSQL.to_sql(df, 'test_multi_chunks', index=False,
+                              method='multi')
+        result = self.pandasSQL.read_query('SELECT * FROM test_multi_chunks')
+        tm.assert_frame_equal(result, df)
 
     def test_execute_sql(self):
         self._execute_sql()
@@ -1802,3 +1802,150 @@ class TestMergeOnIndexes(object):
                           how=how,
                           sort=sort)
         tm.assert_frame_equal(result, expected)
+
+
+@pytest.fixture
+def radix_partitions(monkeypatch):
+    # force small inputs through the partitioned code path
+    import pandas.core.reshape.merge as merge_module
+    monkeypatch.setattr(merge_module, '_RADIX_PARTITION_SIZE', 8)
+
+
+@pytest.mark.usefixtures('radix_partitions')
+class TestMergeRadix(object):
+
+    def setup_method(self, method):
+        np.random.seed(2)
+        self.left = DataFrame({'key1': np.random.randint(0, 30, 200),
+                               'key2': np.random.choice(list('abcd'), 200),
+                               'lvalue': np.random.randn(200)})
+        self.right = DataFrame({'key1': np.random.randint(10, 40, 150),
+                                'key2': np.random.choice(list('abce'), 150),
+                                'rvalue': np.random.randn(150)})
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    @pytest.mark.parametrize('on', ['key1', 'key2', ['key1', 'key2']])
+    def test_radix_matches_hash(self, how, sort, on):
+        expected = merge(self.left, self.right, on=on, how=how, sort=sort)
+        result = merge(self.left, self.right, on=on, how=how, sort=sort,
+                       algorithm='radix')
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('how', ['inner', 'outer'])
+    def test_radix_float_and_null_keys(self, how):
+        left = self.left.assign(key1=self.left.key1.astype(float))
+        left.loc[::9, 'key1'] = np.nan
+        left.loc[::11, 'key1'] = -0.0
+        right = self.right.copy()
+        right.loc[::7, 'key1'] = 0
+        right.loc[::5, 'key2'] = None
+
+        for on in ['key1', ['key1', 'key2']]:
+            expected = merge(left, right, on=on, how=how)
+            result = merge(left, right, on=on, how=how, algorithm='radix')
+            assert_frame_equal(result, expected)
+
+    def test_radix_datetime_keys(self):
+        left = self.left.assign(
+            key1=pd.to_datetime(self.left.key1, unit='D'))
+        right = self.right.assign(
+            key1=pd.to_datetime(self.right.key1, unit='D'))
+
+        expected = left.merge(right, on='key1', how='left')
+        result = left.merge(right, on='key1', how='left', algorithm='radix')
+        assert_frame_equal(result, expected)
+
+    def test_radix_empty_result(self):
+        right = self.right.assign(key1=self.right.key1 + 100)
+
+        expected = merge(self.left, right, on='key1')
+        result = merge(self.left, right, on='key1', algorithm='radix')
+        assert_frame_equal(result, expected)
+
+    def test_radix_invalid(self):
+        with tm.assert_raises_regex(ValueError, "algorithm must be"):
+            merge(self.left, self.right, on='key1', algorithm='sort')
+
+
+class TestMergeSorted(object):
+
+    def setup_method(self, method):
+        np.random.seed(3)
+        left = DataFrame({'key1': np.random.randint(0, 30, 200),
+                          'key2': np.random.choice(list('abcd'), 200),
+                          'lvalue': np.random.randn(200)})
+        right = DataFrame({'key1': np.random.randint(10, 40, 150),
+                           'key2': np.random.choice(list('abce'), 150),
+                           'rvalue': np.random.randn(150)})
+        self.left = left.sort_values(['key1', 'key2']).reset_index(drop=True)
+        self.right = right.sort_values(['key1', 'key2'])
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    @pytest.mark.parametrize('on', ['key1', ['key1', 'key2']])
+    def test_sorted_matches_hash(self, how, sort, on):
+        expected = merge(self.left, self.right, on=on, how=how, sort=sort)
+        result = merge(self.left, self.right, on=on, how=how, sort=sort,
+                       assume_sorted=True)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    def test_sorted_no_hash_join(self, how, monkeypatch):
+        # sorted keys are merged by the merge join kernel
+        import pandas.core.reshape.merge as merge_module
+
+        expected = merge(self.left, self.right, on=['key1', 'key2'],
+                         how=how)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("hash join used")
+
+        monkeypatch.setattr(merge_module, '_get_join_indexers', fail)
+        result = merge(self.left, self.right, on=['key1', 'key2'], how=how,
+                       assume_sorted=True)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_sorted_null_keys(self, how, sort):
+        left = self.left.assign(key1=self.left.key1.astype(float))
+        left.loc[190:, 'key1'] = np.nan
+        right = self.right.assign(key1=self.right.key1.astype(float))
+        right.loc[right.key1 > 35, 'key1'] = np.nan
+        right = right.sort_values('key1')
+
+        expected = merge(left, right, on='key1', how=how, sort=sort)
+        result = merge(left, right, on='key1', how=how, sort=sort,
+                       assume_sorted=True)
+        assert_frame_equal(result, expected)
+
+    def test_sorted_datetime_and_string_keys(self):
+        left = self.left.assign(
+            key1=pd.to_datetime(self.left.key1, unit='D'))
+        right = self.right.assign(
+            key1=pd.to_datetime(self.right.key1, unit='D'))
+
+        expected = left.merge(right, on=['key1', 'key2'], how='outer')
+        result = left.merge(right, on=['key1', 'key2'], how='outer',
+                            assume_sorted=True)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('how', ['inner', 'outer'])
+    def test_sorted_unsorted_keys(self, how):
+        # falls back to the hash join
+        right = self.right.sample(frac=1, random_state=1)
+
+        expected = merge(self.left, right, on='key1', how=how)
+        result = merge(self.left, right, on='key1', how=how,
+                       assume_sorted=True)
+        assert_frame_equal(result, expected)
+
+    def test_sorted_empty(self):
+        right = self.right.iloc[:0]
+
+        for how in ['inner', 'left', 'right', 'outer']:
+            expected = merge(self.left, right, on='key1', how=how)
+            result = merge(self.left, right, on='key1', how=how,
+                           assume_sorted=True)
+            assert_frame_equal(result, expected)
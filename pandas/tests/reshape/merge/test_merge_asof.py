@@ -985,3 +985,38 @@ class TestAsOfMerge(object):
 
         with tm.assert_raises_regex(MergeError, msg):
             merge_asof(left, right, on='a')
+
+    @pytest.mark.parametrize('nthreads', [1, 4])
+    @pytest.mark.parametrize('direction', ['backward', 'forward', 'nearest'])
+    @pytest.mark.parametrize('tolerance', [None, Timedelta('10ms')])
+    def test_multiby_factorized(self, nthreads, direction, tolerance):
+        np.random.seed(5)
+        trades = self.trades.assign(
+            side=np.random.choice(['B', 'S'], len(self.trades)))
+        quotes = self.quotes.assign(
+            side=np.random.choice(['B', 'S'], len(self.quotes)))
+
+        # a single combined 'by' column gives the expected groups
+        expected = merge_asof(
+            trades.assign(key=trades.ticker + trades.side),
+            quotes.assign(key=quotes.ticker + quotes.side).drop(
+                ['ticker', 'side'], axis=1),
+            on='time', by='key', direction=direction,
+            tolerance=tolerance).drop('key', axis=1)
+
+        with pd.option_context('compute.merge_asof_nthreads', nthreads):
+            result = merge_asof(trades, quotes, on='time',
+                                by=['ticker', 'side'], direction=direction,
+                                tolerance=tolerance)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('allow_exact_matches', [True, False])
+    def test_by_parallel(self, allow_exact_matches):
+        expected = merge_asof(self.trades, self.quotes, on='time',
+                              by='ticker',
+                              allow_exact_matches=allow_exact_matches)
+        with pd.option_context('compute.merge_asof_nthreads', 3):
+            result = merge_asof(self.trades, self.quotes, on='time',
+                                by='ticker',
+                                allow_exact_matches=allow_exact_matches)
+        assert_frame_equal(result, expected)
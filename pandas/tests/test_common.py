@@ -221,3 +221,20 @@ def test_standardize_mapping():
 
     dd = collections.defaultdict(list)
     assert isinstance(com.standardize_mapping(dd), partial)
+
+
+@pytest.mark.parametrize('nthreads', [1, 3, 20])
+def test_thread_map(nthreads):
+    import threading
+
+    threads = set()
+
+    def square(x):
+        threads.add(threading.current_thread())
+        return x * x
+
+    expected = [x * x for x in range(10)]
+    assert com._thread_map(square, range(10), nthreads) == expected
+    assert com._thread_map(square, [], nthreads) == []
+    if nthreads == 1:
+        assert threads == {threading.current_thread()}
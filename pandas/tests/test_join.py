@@ -195,6 +195,46 @@ def test_inner_join_indexer2():
     assert_almost_equal(ridx, exp_ridx)
 
 
+def test_merge_join_indexer():
+    # many-to-many, on two key columns
+    a = np.array([1, 1, 2, 2, 4], dtype=np.int64)
+    b = np.array([0, 1, 1, 2, 2, 3], dtype=np.int64)
+    # the codes of the second key columns 'aabbc' and 'abbbcd'
+    a2 = np.array([[0], [0], [1], [1], [2]], dtype=np.int64)
+    b2 = np.array([[0], [1], [1], [1], [2], [3]], dtype=np.int64)
+
+    def no_others(n):
+        return np.empty((n, 0), dtype=np.int64)
+
+    lidx, ridx = _join.merge_join_indexer_int64(a, b, no_others(5),
+                                                no_others(6), 'inner')
+    tm.assert_numpy_array_equal(lidx, np.array([0, 0, 1, 1, 2, 2, 3, 3],
+                                               dtype=np.int64))
+    tm.assert_numpy_array_equal(ridx, np.array([1, 2, 1, 2, 3, 4, 3, 4],
+                                               dtype=np.int64))
+
+    lidx, ridx = _join.merge_join_indexer_int64(a, b, a2, b2, 'outer')
+    tm.assert_numpy_array_equal(
+        lidx, np.array([-1, 0, 1, -1, -1, 2, 3, -1, -1, 4], dtype=np.int64))
+    tm.assert_numpy_array_equal(
+        ridx, np.array([0, -1, -1, 1, 2, 3, 3, 4, 5, -1], dtype=np.int64))
+
+    lidx, ridx = _join.merge_join_indexer_int64(a, b[:0], no_others(5),
+                                                no_others(0), 'left')
+    tm.assert_numpy_array_equal(lidx, np.arange(5, dtype=np.int64))
+    tm.assert_numpy_array_equal(ridx, np.repeat(-1, 5).astype(np.int64))
+
+    with tm.assert_raises_regex(ValueError, 'not sorted'):
+        _join.merge_join_indexer_int64(a[::-1], b, no_others(5),
+                                       no_others(6), 'inner')
+    with tm.assert_raises_regex(ValueError, 'not sorted'):
+        _join.merge_join_indexer_int64(a, b, a2[::-1].copy(), b2, 'inner')
+    with tm.assert_raises_regex(ValueError, 'ordered'):
+        _join.merge_join_indexer_float64(np.array([1., np.nan, 2.]),
+                                         np.array([1.]), no_others(3),
+                                         no_others(1), 'inner')
+
+
 def test_merge_join_categorical_multiindex():
     # From issue 16627
     a = {'Cat1': Categorical(['a', 'b', 'a', 'c', 'a', 'b'],
@@ -1065,6 +1065,90 @@ class TestMoments(Base):
             rs = Series(vals).rolling(5, win_type=wt, center=True).mean(**k)
             tm.assert_series_equal(xp, rs)
 
+    @td.skip_if_no_scipy
+    @pytest.mark.parametrize('win_type,args', [
+        ('boxcar', ()), ('triang', ()), ('blackman', ()), ('hamming', ()),
+        ('bartlett', ()), ('parzen', ()), ('bohman', ()),
+        ('blackmanharris', ()), ('nuttall', ()), ('barthann', ()),
+        ('kaiser', (1.,)), ('gaussian', (1.5,)),
+        ('general_gaussian', (2., 2.))])
+    def test_window_weights(self, win_type, args):
+        import scipy.signal as sig
+
+        # the weights generated without scipy match those of scipy
+        for window in [0, 1, 2, 5, 10, 101]:
+            result = rwindow._get_window_weights(win_type, window, *args)
+            expected = sig.get_window((win_type,) + args, window, False)
+            tm.assert_almost_equal(result, expected)
+
+    @pytest.mark.parametrize('center', [True, False])
+    @pytest.mark.parametrize('axis', [0, 1])
+    def test_cmov_window_frame_columns(self, center, axis):
+        # all the columns of a block are rolled at once
+        df = DataFrame(randn(30, 20))
+        df.iloc[::7, ::3] = np.nan
+        if axis == 1:
+            df = df.T
+        r = df.rolling(5, win_type='triang', min_periods=2, center=center,
+                       axis=axis)
+
+        for mean in [True, False]:
+            result = r.mean() if mean else r.sum()
+            expected = df.apply(lambda x: getattr(
+                x.rolling(5, win_type='triang', min_periods=2,
+                          center=center), 'mean' if mean else 'sum')(),
+                axis=axis)
+            tm.assert_frame_equal(result, expected)
+
+            with pd.option_context('compute.window_nthreads', 3):
+                result = r.mean() if mean else r.sum()
+            tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('avg', [True, False])
+    @pytest.mark.parametrize('minp', [0, 50, 900])
+    def test_roll_weighted_fft(self, avg, minp):
+        values = randn(20000, 3)
+        values[::13, 0] = np.nan
+        values[1000:7000, 1] = np.nan
+        values[:, 2] = np.nan
+        weights = rwindow._get_window_weights('gaussian', 1000, 100.)
+        weights[[0, 10]] = 0.
+
+        assert rwindow._use_fft(len(values), len(weights))
+        assert not rwindow._use_fft(len(values), 10)
+
+        result = rwindow._roll_weighted_fft(values, weights, minp, avg)
+        expected = rwindow._window.roll_window_2d(values, weights, minp,
+                                                  avg=avg)
+        tm.assert_almost_equal(result, expected)
+
+        expected = rwindow._window.roll_window(values[:, 0], weights, minp,
+                                               avg=avg)
+        tm.assert_almost_equal(result[:, 0], expected)
+
+    @pytest.mark.parametrize('avg', [True, False])
+    def test_roll_weighted_inf(self, avg):
+        # an infinite value only reaches the windows holding it, the columns
+        # with one are rolled by direct convolution
+        values = randn(20000, 3)
+        values[100, 0] = np.inf
+        values[200, 1] = -np.inf
+        weights = rwindow._get_window_weights('gaussian', 1000, 100.)
+        assert rwindow._use_fft(len(values), len(weights))
+
+        result = rwindow._roll_weighted(values, weights, 10, avg)
+        for i in range(3):
+            expected = rwindow._window.roll_window(values[:, i], weights,
+                                                   10, avg=avg)
+            tm.assert_almost_equal(result[:, i], expected)
+        assert np.isfinite(result[1200:, :2]).all()
+
+        df = DataFrame(values)
+        result = df.rolling(1000, win_type='gaussian').sum(std=100.)
+        expected = df.apply(lambda x: x.rolling(
+            1000, win_type='gaussian').sum(std=100.))
+        tm.assert_frame_equal(result, expected)
+
     def test_rolling_median(self):
         self._check_moment_func(np.median, name='median')
 
@@ -1727,6 +1811,49 @@ class TestPairwise(object):
             if i > 0:
                 self.compare(result, results[0])
 
+    @pytest.mark.parametrize('method', ['cov', 'corr'])
+    @pytest.mark.parametrize('kwargs', [dict(window=3),
+                                        dict(window=5, min_periods=2,
+                                             center=True),
+                                        dict(window='3s'),
+                                        dict(window='4s', center=True)])
+    def test_pairwise_matrix(self, method, kwargs):
+
+        # all of the pairs of columns computed by a single kernel
+        index = pd.date_range('20130101', periods=20, freq='s')
+        df = DataFrame(np.random.randn(20, 3), index=index,
+                       columns=list('abc'))
+        df.iloc[2:5, 1] = np.nan
+        other = DataFrame(np.random.randn(20, 2), index=index,
+                          columns=list('xy'))
+        other.iloc[8, 0] = np.nan
+
+        for obj2 in [df, other]:
+            r = df.rolling(**kwargs)
+            result = getattr(r, method)(obj2, pairwise=True, as_array=True)
+            assert result.shape == (20, 3, len(obj2.columns))
+            for i, a in enumerate(df.columns):
+                for j, b in enumerate(obj2.columns):
+                    expected = getattr(df[a].rolling(**kwargs),
+                                       method)(obj2[b])
+                    tm.assert_almost_equal(result[:, i, j], expected.values)
+
+            frame = getattr(r, method)(obj2, pairwise=True)
+            tm.assert_index_equal(frame.columns, df.columns)
+            tm.assert_index_equal(frame.index.levels[0], df.index)
+            tm.assert_index_equal(frame.index.levels[1], obj2.columns)
+            tm.assert_numpy_array_equal(
+                frame.values, result.transpose(0, 2, 1).reshape(-1, 3))
+
+    @pytest.mark.parametrize('method', ['cov', 'corr'])
+    def test_pairwise_matrix_as_array_invalid(self, method):
+        df = DataFrame(np.random.randn(10, 2))
+        r = df.rolling(3)
+        with tm.assert_raises_regex(ValueError, 'as_array'):
+            getattr(r, method)(df, pairwise=False, as_array=True)
+        with tm.assert_raises_regex(ValueError, 'as_array'):
+            getattr(r, method)(df[0], as_array=True)
+
     @pytest.mark.parametrize(
         'f', [lambda x, y: x.expanding().cov(y, pairwise=False),
               lambda x, y: x.expanding().corr(y, pairwise=False),
@@ -3066,6 +3193,55 @@ class TestGrouperGrouping(object):
         expected = g.apply(lambda x: x.rolling(4).apply(lambda y: y.sum()))
         tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('f', ['sum', 'mean', 'median', 'min', 'max',
+                                   'std', 'var', 'skew', 'kurt'])
+    @pytest.mark.parametrize('kwargs', [dict(), dict(sort=False)])
+    def test_rolling_groups_unsorted(self, f, kwargs):
+        # the rows of a group are not contiguous, some keys are NaN
+        df = DataFrame({'A': [2, 1, np.nan, 1, 2, 3, 1, 2, 2, 1] * 3,
+                        'B': np.random.randn(30),
+                        'C': ['a'] * 30})
+        g = df.groupby('A', **kwargs)
+
+        result = getattr(g.rolling(3, min_periods=1), f)()
+        expected = g.apply(lambda x: getattr(x.rolling(3, min_periods=1),
+                                             f)())
+        tm.assert_frame_equal(result, expected)
+
+    def test_rolling_multiple_keys(self):
+        df = DataFrame({'A': [1, 1, 2, 2, 1, 1, 2, 2],
+                        'B': [1, 2, 1, 2, 1, 2, 1, 2],
+                        'C': np.arange(8.)})
+        g = df.groupby(['A', 'B'])
+
+        result = g.rolling(2, min_periods=1).C.sum()
+        expected = g.C.apply(lambda x: x.rolling(2, min_periods=1).sum())
+        tm.assert_series_equal(result, expected)
+
+        result = g.rolling(2).quantile(0.4)
+        expected = g.apply(lambda x: x.rolling(2).quantile(0.4))
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both', 'neither'])
+    def test_rolling_offset(self, closed):
+        index = [Timestamp('20130101 09:00:00'),
+                 Timestamp('20130101 09:00:02'),
+                 Timestamp('20130101 09:00:03'),
+                 Timestamp('20130101 09:00:05'),
+                 Timestamp('20130101 09:00:06'),
+                 Timestamp('20130101 09:00:10')] * 2
+        df = DataFrame({'A': [1] * 6 + [2] * 6,
+                        'B': np.arange(12.)}, index=index)
+        df.index.name = 'date'
+        g = df.groupby('A')
+
+        for f in ['sum', 'mean', 'median', 'max', 'var']:
+            result = getattr(g.rolling('2s', closed=closed), f)()
+            expected = g.apply(lambda x: getattr(x.rolling('2s',
+                                                           closed=closed),
+                                                 f)())
+            tm.assert_frame_equal(result, expected)
+
     def test_expanding(self):
         g = self.frame.groupby('A')
         r = g.expanding()
@@ -3169,9 +3345,8 @@ class TestRollingTS(object):
             with pytest.raises(ValueError):
                 df.rolling(window='1D', min_periods=minp)
 
-        # center is not implemented
-        with pytest.raises(NotImplementedError):
-            df.rolling(window='1D', center=True)
+        # center is implemented
+        df.rolling(window='1D', center=True)
 
     def test_on(self):
 
@@ -3696,6 +3871,77 @@ class TestRollingTS(object):
 
             tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both',
+                                        'neither'])
+    def test_center(self, closed):
+
+        # the centered 3s window holds the previous, current and next
+        # second of a regular index
+        df = DataFrame({'B': np.random.randn(20)},
+                       index=pd.date_range('20130101', periods=20, freq='s'))
+        df.iloc[[3, 4, 10]] = np.nan
+        r = df.rolling(window='3s', center=True, closed=closed)
+        er = df.rolling(window=3, min_periods=1, center=True)
+
+        for f in ['sum', 'mean', 'count', 'median', 'std',
+                  'var', 'min', 'max']:
+
+            result = getattr(r, f)()
+            expected = getattr(er, f)()
+            tm.assert_frame_equal(result, expected)
+
+        result = r.quantile(0.3)
+        expected = er.quantile(0.3)
+        tm.assert_frame_equal(result, expected)
+
+        result = r.apply(np.nansum)
+        expected = er.apply(np.nansum)
+        tm.assert_frame_equal(result, expected)
+
+    def test_center_closed(self):
+
+        # the previous and next seconds are at the bounds of the centered
+        # 2s window
+        df = DataFrame({'B': np.arange(10.)},
+                       index=pd.date_range('20130101', periods=10, freq='s'))
+
+        result = df.rolling(window='2s', center=True, closed='both').sum()
+        expected = df.rolling(window=3, min_periods=1, center=True).sum()
+        tm.assert_frame_equal(result, expected)
+
+        result = df.rolling(window='2s', center=True, closed='neither').sum()
+        tm.assert_frame_equal(result, df)
+
+        result = df.rolling(window='2s', center=True, closed='right').sum()
+        expected = df + df.shift(-1).fillna(0)
+        tm.assert_frame_equal(result, expected)
+
+        result = df.rolling(window='2s', center=True, closed='left').sum()
+        expected = df + df.shift(1).fillna(0)
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('window', ['1s', '3s', '10s'])
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both',
+                                        'neither'])
+    def test_ragged_variable(self, window, closed):
+
+        # windows of offsets with gaps and NaN, some of them empty
+        index = pd.date_range('20130101', periods=100, freq='s')
+        index = index[np.sort(np.random.choice(100, 50, replace=False))]
+        df = DataFrame({'B': np.random.randn(50)}, index=index)
+        df.iloc[[3, 4, 10, 30, 31, 32]] = np.nan
+        r = df.rolling(window=window, closed=closed, min_periods=1)
+
+        for f, g in [('min', np.nanmin), ('max', np.nanmax),
+                     ('median', np.nanmedian)]:
+            result = getattr(r, f)()
+            expected = r.apply(g)
+            tm.assert_frame_equal(result, expected)
+
+        result = r.quantile(0.3)
+        expected = r.apply(lambda x: np.nanpercentile(x, 30))
+        tm.assert_frame_equal(result, expected)
+
     def test_groupby_monotonic(self):
 
         # GH 15130
@@ -3753,3 +3999,168 @@ class TestRollingTS(object):
 
         expected2 = ss.rolling(3, min_periods=1).cov()
         tm.assert_series_equal(result, expected2)
+
+
+class TestOnline(object):
+
+    def setup_method(self, method):
+        self.frame = DataFrame(randn(100, 3), columns=list('abc'),
+                               index=pd.date_range('20130101', periods=100,
+                                                   freq='s'))
+        self.frame.iloc[[0, 1, 10, 11, 12, 50], 1] = np.nan
+
+    def _batches(self, obj):
+        return [obj.iloc[:30], obj.iloc[30:31], obj.iloc[31:31],
+                obj.iloc[31:70], obj.iloc[70:]]
+
+    def _check(self, obj, make_online, expected):
+        first, batches = self._batches(obj)[0], self._batches(obj)[1:]
+        online = make_online(first)
+        results = [online.result]
+        for i, batch in enumerate(batches):
+            if i == 2:
+                # resume from the pickled state
+                state = tm.round_trip_pickle(online.state)
+                online = rwindow.OnlineWindow(state)
+            results.append(online.update(batch))
+            assert online.result is results[-1]
+
+        result = pd.concat(results)
+        if isinstance(expected, Series):
+            tm.assert_series_equal(result, expected)
+        else:
+            tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('func', ['mean', 'var', 'std'])
+    @pytest.mark.parametrize('adjust', [True, False])
+    @pytest.mark.parametrize('ignore_na', [True, False])
+    def test_ewm(self, func, adjust, ignore_na):
+        kwargs = dict(com=3, min_periods=2, adjust=adjust,
+                      ignore_na=ignore_na)
+        for obj in [self.frame, self.frame['b']]:
+            expected = getattr(obj.ewm(**kwargs), func)()
+            self._check(obj, lambda x: x.ewm(**kwargs).online(func),
+                        expected)
+
+        expected = self.frame.ewm(**kwargs).var(bias=True)
+        self._check(self.frame,
+                    lambda x: x.ewm(**kwargs).online('var', bias=True),
+                    expected)
+
+    @pytest.mark.parametrize('window', [5, '5s', '20s'])
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'median', 'std',
+                                      'max', 'count'])
+    def test_rolling(self, window, func):
+        for obj in [self.frame, self.frame['b']]:
+            expected = getattr(obj.rolling(window, min_periods=1), func)()
+            self._check(obj,
+                        lambda x: x.rolling(window,
+                                            min_periods=1).online(func),
+                        expected)
+
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both', 'neither'])
+    def test_rolling_args(self, closed):
+        r = self.frame.rolling('3s', closed=closed)
+
+        expected = r.quantile(0.25)
+        self._check(self.frame,
+                    lambda x: x.rolling('3s', closed=closed).online(
+                        'quantile', 0.25),
+                    expected)
+
+        expected = r.apply(np.nansum)
+        self._check(self.frame,
+                    lambda x: x.rolling('3s', closed=closed).online(
+                        'apply', np.nansum),
+                    expected)
+
+    def test_rolling_tail(self):
+        # only the rows reachable by the next windows are kept
+        online = self.frame.rolling(5).online('sum')
+        assert len(online.state['tail']) == 4
+
+        online = self.frame.rolling('5s').online('sum')
+        tm.assert_frame_equal(online.state['tail'], self.frame.iloc[-6:])
+
+    def test_invalid(self):
+        online = self.frame.ewm(com=3).online()
+        with tm.assert_raises_regex(ValueError, 'same columns'):
+            online.update(self.frame[['a', 'b']])
+        with tm.assert_raises_regex(ValueError, 'same columns'):
+            online.update(self.frame['a'])
+
+        with tm.assert_raises_regex(ValueError, 'func must be'):
+            self.frame.ewm(com=3).online('sum')
+        with tm.assert_raises_regex(ValueError, 'func must be'):
+            self.frame.rolling(3).online('corr')
+        with pytest.raises(NotImplementedError):
+            self.frame.rolling(3, center=True).online('sum')
+
+        # the index of the rows must stay monotonic
+        online = self.frame.rolling('3s').online('sum')
+        with pytest.raises(ValueError):
+            online.update(self.frame.iloc[:3])
+
+
+@td.skip_if_no('numba')
+class TestNumbaApply(object):
+
+    @pytest.mark.parametrize('center', [True, False])
+    @pytest.mark.parametrize('min_periods', [None, 1, 3])
+    @pytest.mark.parametrize('parallel', [True, False])
+    def test_matches_cython(self, center, min_periods, parallel):
+        s = Series(randn(20))
+        s[5] = np.nan
+
+        def f(x, y):
+            return np.nanmean(x) + y
+
+        roll = s.rolling(5, min_periods=min_periods, center=center)
+        result = roll.apply(f, args=(1,), engine='numba',
+                            engine_kwargs={'parallel': parallel})
+        expected = roll.apply(f, args=(1,))
+        tm.assert_series_equal(result, expected)
+
+        result = s.expanding(min_periods=2).apply(f, args=(1,),
+                                                  engine='numba')
+        expected = s.expanding(min_periods=2).apply(f, args=(1,))
+        tm.assert_series_equal(result, expected)
+
+    def test_offset_window(self):
+        idx = pd.date_range('2018-01-01', periods=10, freq='s').delete(4)
+        df = DataFrame({'a': randn(9), 'b': randn(9)}, index=idx)
+        roll = df.rolling('3s', closed='both')
+        result = roll.apply(np.max, engine='numba')
+        tm.assert_frame_equal(result, roll.max())
+
+    @pytest.mark.parametrize('center', [True, False])
+    def test_groupby(self, center):
+        df = DataFrame({'A': [1, 2, 1, 2, 1, 2, 1, 2, 2, 2],
+                        'B': randn(10)})
+        roll = df.groupby('A').rolling(3, min_periods=1, center=center)
+        result = roll.apply(np.nanmean, engine='numba')
+        expected = roll.apply(np.nanmean)
+        tm.assert_frame_equal(result, expected)
+
+    def test_invalid(self):
+        roll = Series(randn(10)).rolling(3)
+        with tm.assert_raises_regex(ValueError, 'engine must be'):
+            roll.apply(np.sum, engine='foo')
+        with tm.assert_raises_regex(ValueError, 'does not accept'):
+            roll.apply(np.sum, engine_kwargs={'nopython': True})
+        with tm.assert_raises_regex(ValueError, 'keyword arguments'):
+            roll.apply(np.sum, kwargs={'axis': 0}, engine='numba')
+
+
+@pytest.mark.parametrize('method', ['sum', 'median', 'std'])
+def test_window_nthreads(method):
+    df = DataFrame(randn(50, 7))
+    expected = getattr(df.rolling(5), method)()
+    expected_ewm = df.ewm(com=3).mean()
+    expected_axis1 = df.T.rolling(5, axis=1).sum()
+    with pd.option_context('compute.window_nthreads', 3):
+        result = getattr(df.rolling(5), method)()
+        tm.assert_frame_equal(result, expected)
+        tm.assert_frame_equal(df.ewm(com=3).mean(), expected_ewm)
+        result = df.T.rolling(5, axis=1).sum()
+        tm.assert_frame_equal(result, expected_axis1)